@@ -0,0 +1,51 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests for decomposing circuits which repeat the same gates many times."""
+
+from __future__ import annotations
+
+import pytest
+
+import cirq
+
+
+def _toffoli_ladder(num_qubits: int, depth: int) -> cirq.Circuit:
+    qubits = cirq.LineQubit.range(num_qubits)
+    return cirq.Circuit(
+        cirq.CCX(*qubits[i : i + 3]) for j in range(depth) for i in range(j % 3, num_qubits - 2, 3)
+    )
+
+
+def _qft_layers(num_qubits: int, depth: int) -> cirq.Circuit:
+    qubits = cirq.LineQubit.range(num_qubits)
+    return cirq.Circuit(
+        cirq.qft(*qubits[i : i + 4]) for _ in range(depth) for i in range(0, num_qubits, 4)
+    )
+
+
+@pytest.mark.parametrize('cached', [False, True])
+@pytest.mark.benchmark(group="decompose_cache")
+def test_decompose_toffoli_ladder(benchmark, cached: bool) -> None:
+    """Benchmark decomposing about 1000 Toffoli gates, with or without a decomposition cache."""
+    circuit = _toffoli_ladder(50, 60)
+    benchmark(lambda: cirq.decompose(circuit, cache=cirq.DecomposeCache() if cached else None))
+
+
+@pytest.mark.parametrize('cached', [False, True])
+@pytest.mark.benchmark(group="decompose_cache")
+def test_decompose_qft_layers(benchmark, cached: bool) -> None:
+    """Benchmark decomposing layers of 4-qubit QFTs, with or without a decomposition cache."""
+    circuit = _qft_layers(40, 20)
+    benchmark(lambda: cirq.decompose(circuit, cache=cirq.DecomposeCache() if cached else None))
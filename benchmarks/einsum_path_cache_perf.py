@@ -0,0 +1,82 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests for the per-gate overhead of einsum contractions.
+
+The `numpy` variants evaluate the same contractions with a single `np.einsum` call without
+`optimize`, as Cirq did before, as a reference.
+"""
+
+import numpy as np
+import pytest
+
+import cirq
+
+BATCH_SIZE = 8
+
+
+def _batched_states(num_qubits: int) -> np.ndarray:
+    states = [
+        cirq.testing.random_superposition(2**num_qubits, random_state=i) for i in range(BATCH_SIZE)
+    ]
+    return np.stack(states).reshape((BATCH_SIZE,) + (2,) * num_qubits)
+
+
+CZ_TENSOR = cirq.unitary(cirq.CZ).reshape((2,) * 4)
+# Applies a two-qubit gate on the first two qubits of a batch of 2- to 6-qubit states.
+SUBSCRIPTS = {n: f'abcd,zcd{"efgh"[:n - 2]}->zab{"efgh"[:n - 2]}' for n in range(2, 7)}
+# Multiplies a chain of four matrices.
+CHAIN_SUBSCRIPTS = 'ij,jk,kl,lm->im'
+
+
+@pytest.mark.parametrize("num_qubits", [2, 3, 4, 6])
+@pytest.mark.benchmark(group="einsum_path_cache")
+def test_batched_targeted_left_multiply(benchmark, num_qubits: int) -> None:
+    """Benchmark applying a gate to a batch of states with `cirq.targeted_left_multiply`."""
+    states = _batched_states(num_qubits)
+    benchmark(cirq.targeted_left_multiply, CZ_TENSOR, states, [0, 1], right_batched=True)
+
+
+@pytest.mark.parametrize("num_qubits", [2, 3, 4, 6])
+@pytest.mark.benchmark(group="einsum_path_cache")
+def test_batched_targeted_left_multiply_numpy(benchmark, num_qubits: int) -> None:
+    """Benchmark applying a gate to a batch of states with a single `np.einsum` call."""
+    states = _batched_states(num_qubits)
+    benchmark(np.einsum, SUBSCRIPTS[num_qubits], CZ_TENSOR, states)
+
+
+@pytest.mark.parametrize("num_qubits", [2, 3, 4])
+@pytest.mark.benchmark(group="einsum_path_cache")
+def test_targeted_conjugate_about(benchmark, num_qubits: int) -> None:
+    """Benchmark conjugating a density matrix by a gate."""
+    rho = cirq.testing.random_density_matrix(2**num_qubits, random_state=1)
+    target = rho.reshape((2,) * (2 * num_qubits))
+    benchmark(cirq.targeted_conjugate_about, CZ_TENSOR, target, [0, 1])
+
+
+@pytest.mark.parametrize("num_qubits", [2, 3, 4])
+@pytest.mark.benchmark(group="einsum_path_cache")
+def test_matrix_chain(benchmark, num_qubits: int) -> None:
+    """Benchmark multiplying a chain of unitaries with a cached contraction plan."""
+    matrices = [cirq.testing.random_unitary(2**num_qubits, random_state=i) for i in range(4)]
+    cache = cirq.EinsumPathCache()
+    benchmark(cache.einsum, CHAIN_SUBSCRIPTS, *matrices)
+
+
+@pytest.mark.parametrize("num_qubits", [2, 3, 4])
+@pytest.mark.benchmark(group="einsum_path_cache")
+def test_matrix_chain_numpy(benchmark, num_qubits: int) -> None:
+    """Benchmark multiplying a chain of unitaries with a single `np.einsum` call."""
+    matrices = [cirq.testing.random_unitary(2**num_qubits, random_state=i) for i in range(4)]
+    benchmark(np.einsum, CHAIN_SUBSCRIPTS, *matrices)
@@ -0,0 +1,61 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests for validating large circuits against gatesets."""
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+def _random_circuit(num_qubits: int, depth: int) -> cirq.Circuit:
+    rs = np.random.RandomState(0)
+    qubits = cirq.LineQubit.range(num_qubits)
+    single_qubit_gates = [
+        cirq.PhasedXZGate(x_exponent=x, z_exponent=z, axis_phase_exponent=a)
+        for x, z, a in rs.choice(np.linspace(0, 1, 5), size=(16, 3))
+    ]
+    circuit = cirq.Circuit()
+    for layer in range(depth):
+        circuit.append(
+            cirq.Moment(
+                single_qubit_gates[i].on(q) for q, i in zip(qubits, rs.randint(16, size=num_qubits))
+            )
+        )
+        circuit.append(
+            cirq.Moment(
+                cirq.CZ(a, b) for a, b in zip(qubits[layer % 2 :: 2], qubits[layer % 2 + 1 :: 2])
+            )
+        )
+    return circuit
+
+
+GATESET = cirq.Gateset(
+    cirq.CZ, cirq.PhasedXZGate, cirq.MeasurementGate, cirq.GlobalPhaseGate, cirq.ZPowGate
+)
+
+
+@pytest.mark.benchmark(group="gateset")
+def test_validate_100k_operations(benchmark) -> None:
+    """Benchmark validating a circuit of 100 qubits with ~150k operations."""
+    circuit = _random_circuit(100, 1000)
+    benchmark(GATESET.validate, circuit)
+
+
+@pytest.mark.benchmark(group="gateset")
+def test_validate_many_circuits(benchmark) -> None:
+    """Benchmark validating 100 circuits of 20 qubits with ~3k operations each."""
+    circuits = [_random_circuit(20, 100)] * 100
+    benchmark(GATESET.validate_many, circuits)
@@ -0,0 +1,52 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests for the startup time of `import cirq`.
+
+Each round imports cirq in a fresh interpreter, so that nothing is already cached in
+`sys.modules`.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run_python(code: str) -> None:
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+@pytest.mark.benchmark(group="import")
+def test_python_startup(benchmark) -> None:
+    """Benchmark starting the interpreter alone, as a reference for the import benchmarks."""
+    benchmark.pedantic(_run_python, args=('pass',), rounds=5)
+
+
+@pytest.mark.benchmark(group="import")
+def test_import_cirq(benchmark) -> None:
+    """Benchmark `python -c "import cirq"`."""
+    benchmark.pedantic(_run_python, args=('import cirq',), rounds=5)
+
+
+@pytest.mark.benchmark(group="import")
+def test_import_cirq_and_simulate(benchmark) -> None:
+    """Benchmark importing cirq and simulating a small circuit, which loads scipy on demand."""
+    code = (
+        'import cirq; q = cirq.LineQubit(0); '
+        'cirq.Simulator().simulate(cirq.Circuit(cirq.H(q), cirq.measure(q)))'
+    )
+    benchmark.pedantic(_run_python, args=(code,), rounds=5)
@@ -0,0 +1,41 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests for sampling from the MPS simulator."""
+
+import numpy as np
+import pytest
+
+import cirq
+import cirq.contrib.quimb as ccq
+
+
+def _mps_state(num_qubits: int, depth: int = 10):
+    qubits = cirq.LineQubit.range(num_qubits)
+    rs = np.random.RandomState(0)
+    circuit = cirq.Circuit()
+    for layer in range(depth):
+        circuit.append(cirq.ry(rs.rand()).on(q) for q in qubits)
+        circuit.append(
+            cirq.CZ(a, b) for a, b in zip(qubits[layer % 2 :: 2], qubits[layer % 2 + 1 :: 2])
+        )
+    return ccq.MPSSimulator().simulate(circuit, qubit_order=qubits).final_state
+
+
+@pytest.mark.parametrize('num_qubits', [20, 60])
+@pytest.mark.benchmark(group="mps_sampling")
+def test_sample_all_qubits(benchmark, num_qubits: int) -> None:
+    """Benchmark drawing 1000 samples of all the qubits of a num_qubits chain."""
+    state = _mps_state(num_qubits)
+    benchmark(state.sample, state.qubits, 1000, 1234)
@@ -0,0 +1,79 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests for adding noise to deep circuits on many qubits."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import cirq
+from cirq.devices.noise_utils import PHYSICAL_GATE_TAG
+
+NUM_QUBITS = 50
+
+
+def _layered_circuit(depth: int) -> cirq.Circuit:
+    """Alternates layers of random single-qubit gates and of CZs on a line of qubits."""
+    rs = np.random.RandomState(0)
+    qubits = cirq.LineQubit.range(NUM_QUBITS)
+    moments = []
+    for i in range(depth):
+        if i % 2 == 0:
+            moments.append(
+                cirq.Moment(
+                    cirq.PhasedXZGate(
+                        x_exponent=0.5, z_exponent=rs.choice([0, 0.25, 0.5]), axis_phase_exponent=0
+                    )
+                    .on(q)
+                    .with_tags(PHYSICAL_GATE_TAG)
+                    for q in qubits
+                )
+            )
+        else:
+            moments.append(
+                cirq.Moment(
+                    cirq.CZ(*qubits[j : j + 2]).with_tags(PHYSICAL_GATE_TAG)
+                    for j in range(i // 2 % 2, NUM_QUBITS - 1, 2)
+                )
+            )
+    return cirq.Circuit(moments)
+
+
+@pytest.mark.parametrize('depth', [100, 1000])
+@pytest.mark.benchmark(group="noise_model")
+def test_thermal_noise(benchmark, depth: int) -> None:
+    """Benchmark adding thermal noise to a circuit on 50 qubits."""
+    circuit = _layered_circuit(depth)
+    qubits = set(circuit.all_qubits())
+
+    def with_noise() -> cirq.Circuit:
+        model = cirq.devices.ThermalNoiseModel(
+            qubits,
+            {cirq.PhasedXZGate: 25.0, cirq.CZPowGate: 32.0},
+            cool_rate_GHz=1e-5,
+            dephase_rate_GHz=2e-5,
+        )
+        return circuit.with_noise(model)
+
+    benchmark(with_noise)
+
+
+@pytest.mark.parametrize('depth', [100, 1000])
+@pytest.mark.benchmark(group="noise_model")
+def test_constant_qubit_noise(benchmark, depth: int) -> None:
+    """Benchmark adding depolarizing noise to every moment of a circuit on 50 qubits."""
+    circuit = _layered_circuit(depth)
+    benchmark(lambda: circuit.with_noise(cirq.ConstantQubitNoiseModel(cirq.depolarize(1e-3))))
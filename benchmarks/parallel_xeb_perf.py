@@ -0,0 +1,121 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests for the analysis of parallel XEB experiments on 100+ qubit devices.
+
+The peak memory of each analysis, measured with `tracemalloc`, is recorded in the
+`extra_info` of the benchmark.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import cirq
+from cirq.experiments.benchmarking import parallel_xeb as xeb
+
+CYCLE_DEPTHS = (5, 25, 50, 100, 200, 300)
+NUM_TEMPLATES = 20
+NUM_COMBINATIONS = 10
+
+
+def _grid_pairs(side: int) -> list[tuple[cirq.GridQubit, cirq.GridQubit]]:
+    qubits = cirq.GridQubit.rect(side, side)
+    return sorted((a, b) for a in qubits for b in qubits if a < b and a.is_adjacent(b))
+
+
+def _synthetic_results(side: int):
+    rs = np.random.RandomState(0)
+    pairs = _grid_pairs(side)
+    simulation_results = [
+        [rs.dirichlet(np.ones(4)) for _ in CYCLE_DEPTHS] for _ in range(NUM_TEMPLATES)
+    ]
+    sampling_results = []
+    wide_circuits_info = []
+    for layer in (pairs[i::4] for i in range(4)):
+        for _ in range(NUM_COMBINATIONS):
+            permutation = rs.randint(NUM_TEMPLATES, size=len(layer))
+            for cycle_depth in CYCLE_DEPTHS:
+                wide_circuits_info.append(
+                    xeb.XEBWideCircuitInfo(cirq.Circuit(), layer, permutation, cycle_depth)
+                )
+                sampling_results.append({str(pair): rs.dirichlet(np.ones(4)) for pair in layer})
+    return pairs, sampling_results, simulation_results, wide_circuits_info
+
+
+def _with_peak_memory(benchmark, func, *args):
+    tracemalloc.start()
+    func(*args)
+    benchmark.extra_info['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    benchmark(func, *args)
+
+
+@pytest.mark.parametrize('side', [11, 16])
+@pytest.mark.benchmark(group="parallel_xeb")
+def test_estimate_fidelities(benchmark, side: int) -> None:
+    """Benchmark estimating the fidelities of all pairs of a side x side grid."""
+    pairs, sampling_results, simulation_results, wide_circuits_info = _synthetic_results(side)
+    _with_peak_memory(
+        benchmark,
+        xeb.estimate_fidelities,
+        sampling_results,
+        simulation_results,
+        CYCLE_DEPTHS,
+        wide_circuits_info,
+        pairs,
+        NUM_TEMPLATES,
+    )
+
+
+@pytest.mark.parametrize('side', [11, 16])
+@pytest.mark.benchmark(group="parallel_xeb")
+def test_estimate_fidelities_from_disk(benchmark, tmp_path, side: int) -> None:
+    """Benchmark estimating the fidelities of a side x side grid from memory-mapped arrays."""
+    pairs, sampling_results, simulation_results, wide_circuits_info = _synthetic_results(side)
+    np.save(
+        tmp_path / 'sampled.npy',
+        xeb._sampled_probabilities_array(
+            sampling_results, CYCLE_DEPTHS, wide_circuits_info, pairs, NUM_TEMPLATES
+        ),
+    )
+    np.save(tmp_path / 'pure.npy', xeb._pure_probabilities_array(simulation_results, pairs))
+    _with_peak_memory(
+        benchmark,
+        xeb.estimate_fidelities_from_arrays,
+        np.load(tmp_path / 'sampled.npy', mmap_mode='r'),
+        np.load(tmp_path / 'pure.npy', mmap_mode='r'),
+        CYCLE_DEPTHS,
+        pairs,
+    )
+
+
+@pytest.mark.benchmark(group="parallel_xeb")
+def test_sample_all_circuits_histograms(benchmark) -> None:
+    """Benchmark turning the measurements of 60 pairs into sampled probabilities."""
+    rs = np.random.RandomState(0)
+    measurements = {f'pair_{i}': rs.randint(2, size=(10_000, 2)).astype(np.int8) for i in range(60)}
+    results = [[cirq.ResultDict(params=cirq.ParamResolver(), measurements=measurements)]]
+
+    class _FixedSampler(cirq.Sampler):
+        def run_sweep(self, program, params, repetitions=1):
+            return results[0]  # pragma: no cover
+
+        def run_batch(self, programs, params_list=None, repetitions=1):
+            return results * len(programs)
+
+    benchmark(xeb.sample_all_circuits, _FixedSampler(), [cirq.Circuit()] * 10, 10_000)
@@ -0,0 +1,70 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests for importing OpenQASM with `cirq.contrib.qasm_import`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cirq.contrib.qasm_import import circuit_from_qasm
+from cirq.contrib.qasm_import._parser import QasmParser
+
+
+def _random_qasm(num_qubits: int, num_gates: int) -> str:
+    """Returns an OpenQASM 2.0 program of random h, rz and cx gates followed by measurements."""
+    rs = np.random.RandomState(0)
+    lines = [
+        'OPENQASM 2.0;',
+        'include "qelib1.inc";',
+        f'qreg q[{num_qubits}];',
+        f'creg m[{num_qubits}];',
+    ]
+    kinds = rs.randint(3, size=num_gates)
+    angles = rs.uniform(0, 2 * np.pi, size=num_gates)
+    for kind, angle in zip(kinds, angles):
+        a, b = rs.choice(num_qubits, size=2, replace=False)
+        if kind == 0:
+            lines.append(f'h q[{a}];')
+        elif kind == 1:
+            lines.append(f'rz({angle:.6f}) q[{a}];')
+        else:
+            lines.append(f'cx q[{a}],q[{b}];')
+    lines.append('measure q -> m;')
+    return '\n'.join(lines)
+
+
+@pytest.mark.benchmark(group="qasm_import")
+def test_construct_parser(benchmark) -> None:
+    """Benchmark constructing a QasmParser, which reuses the lexer and parser tables."""
+    benchmark(QasmParser)
+
+
+@pytest.mark.parametrize("num_qubits", [20, 500])
+@pytest.mark.parametrize("num_gates", [10_000, 100_000])
+@pytest.mark.benchmark(group="qasm_import")
+def test_circuit_from_qasm(benchmark, num_qubits: int, num_gates: int) -> None:
+    """Benchmark parsing an OpenQASM program into a circuit."""
+    qasm = _random_qasm(num_qubits, num_gates)
+    circuit = benchmark.pedantic(circuit_from_qasm, args=(qasm,), rounds=3)
+    assert sum(1 for _ in circuit.all_operations()) == num_gates + num_qubits
+
+
+@pytest.mark.benchmark(group="qasm_import")
+def test_circuit_from_qasm_1m_gates(benchmark) -> None:
+    """Benchmark parsing an OpenQASM program with a million gates."""
+    qasm = _random_qasm(100, 1_000_000)
+    circuit = benchmark.pedantic(circuit_from_qasm, args=(qasm,), rounds=1)
+    assert sum(1 for _ in circuit.all_operations()) == 1_000_100
@@ -0,0 +1,57 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests for repeated tensor network contractions of parameterized circuits."""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+import cirq
+import cirq.contrib.quimb as ccq
+
+
+def _qaoa_circuit(side: int, gamma: float, beta: float) -> cirq.Circuit:
+    graph = nx.grid_2d_graph(side, side)
+    qubits = [cirq.GridQubit(*n) for n in graph]
+    return cirq.Circuit(
+        cirq.H.on_each(qubits),
+        ccq.get_grid_moments(graph, lambda exponent, global_shift: cirq.ZZ**gamma),
+        cirq.Moment(cirq.rx(beta).on_each(qubits)),
+    )
+
+
+@pytest.mark.parametrize('side', [3, 5])
+@pytest.mark.benchmark(group="quimb_expectation_value")
+def test_tensor_expectation_value_new_parameters(benchmark, side: int) -> None:
+    """Benchmark an energy term of a grid QAOA circuit, for new parameters at each call."""
+    rs = np.random.RandomState(0)
+    operator = cirq.Z(cirq.GridQubit(0, 0)) * cirq.Z(cirq.GridQubit(0, 1))
+
+    def expectation_value():
+        gamma, beta = rs.uniform(size=2)
+        return ccq.tensor_expectation_value(_qaoa_circuit(side, gamma, beta), operator)
+
+    benchmark(expectation_value)
+
+
+@pytest.mark.benchmark(group="quimb_expectation_value")
+def test_compiled_network_sliced_contraction(benchmark) -> None:
+    """Benchmark contracting the state vector of a 4x4 grid circuit in 16 slices."""
+    circuit = _qaoa_circuit(4, 0.3, 0.4)
+    qubits = sorted(circuit.all_qubits())
+    tensors, qubit_frontier, _ = ccq.circuit_to_tensors(circuit, qubits)
+    output_inds = [f'i{qubit_frontier[q]}_q{q}' for q in qubits]
+    network = ccq.CompiledNetwork(tensors, output_inds, slice_inds=output_inds[:4])
+    benchmark(network.contract, [t.data for t in tensors])
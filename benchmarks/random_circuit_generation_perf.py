@@ -0,0 +1,59 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Performance tests for generating libraries of random XEB circuits."""
+
+import pytest
+
+import cirq
+import cirq.experiments.random_quantum_circuit_generation as rqcg
+
+
+@pytest.mark.benchmark(group="random_circuit_generation")
+def test_random_rotations_between_grid_interaction_layers_circuit(benchmark) -> None:
+    """Benchmark generating 10 100-qubit circuits one by one."""
+    qubits = cirq.GridQubit.rect(10, 10)
+    benchmark(
+        lambda: [
+            cirq.experiments.random_rotations_between_grid_interaction_layers_circuit(
+                qubits, 20, seed=i
+            )
+            for i in range(10)
+        ]
+    )
+
+
+@pytest.mark.benchmark(group="random_circuit_generation")
+def test_random_rotations_between_grid_interaction_layers_circuits(benchmark) -> None:
+    """Benchmark generating 10 100-qubit circuits at once."""
+    qubits = cirq.GridQubit.rect(10, 10)
+    benchmark(
+        cirq.experiments.random_rotations_between_grid_interaction_layers_circuits,
+        qubits,
+        20,
+        10,
+        seed=0,
+    )
+
+
+@pytest.mark.parametrize('frozen', [False, True])
+@pytest.mark.benchmark(group="random_circuit_generation")
+def test_generate_library_of_2q_circuits(benchmark, frozen: bool) -> None:
+    """Benchmark generating a library of 20 two-qubit circuits of 100 cycles."""
+    generate = (
+        rqcg.generate_frozen_library_of_2q_circuits
+        if frozen
+        else rqcg.generate_library_of_2q_circuits
+    )
+    benchmark(generate, 20, cirq.SQRT_ISWAP, max_cycle_depth=100, random_state=0)
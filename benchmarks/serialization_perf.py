@@ -14,6 +14,7 @@
 
 from collections.abc import Iterable
 
+import numpy as np
 import pytest
 
 import cirq
@@ -85,3 +86,76 @@ def test_json_gzip_serialization(
     # tolerate absolute increase by 1KB or a relative increase by 1 per mille
     allowed_size = expected_gzip_size + max(expected_gzip_size // 1000, 1024)
     assert len(gzip_data) < allowed_size
+
+
+@pytest.mark.parametrize(
+    ["num_qubits", "num_moments", "expected_gzip_size"],
+    _mark_slow(PARAMETERS, {(500, 4000, 5918482), (1000, 1000, 2853094), (1000, 4000, 11412197)}),
+    ids=[f"{nq}-{nm}" for nq, nm, _ in PARAMETERS],
+)
+@pytest.mark.benchmark(group="serialization")
+def test_binary_serialization(
+    benchmark, num_qubits: int, num_moments: int, expected_gzip_size: int
+) -> None:
+    """Benchmark cirq.to_binary and check that it is more compact than gzipped JSON."""
+    circuit = _make_circuit(num_qubits, num_moments)
+    binary_data = benchmark(cirq.to_binary, circuit)
+    assert len(binary_data) < expected_gzip_size
+
+
+@pytest.mark.parametrize(
+    ["num_qubits", "num_moments", "_expected_gzip_size"],
+    _mark_slow(PARAMETERS, {(500, 4000, 5918482), (1000, 1000, 2853094), (1000, 4000, 11412197)}),
+    ids=[f"{nq}-{nm}" for nq, nm, _ in PARAMETERS],
+)
+@pytest.mark.benchmark(group="deserialization")
+def test_json_gzip_deserialization(
+    benchmark, num_qubits: int, num_moments: int, _expected_gzip_size: int
+) -> None:
+    """Benchmark cirq.read_json_gzip."""
+    gzip_data = cirq.to_json_gzip(_make_circuit(num_qubits, num_moments))
+    benchmark(cirq.read_json_gzip, gzip_raw=gzip_data)
+
+
+@pytest.mark.parametrize(
+    ["num_qubits", "num_moments", "_expected_gzip_size"],
+    _mark_slow(PARAMETERS, {(500, 4000, 5918482), (1000, 1000, 2853094), (1000, 4000, 11412197)}),
+    ids=[f"{nq}-{nm}" for nq, nm, _ in PARAMETERS],
+)
+@pytest.mark.benchmark(group="deserialization")
+def test_binary_deserialization(
+    benchmark, num_qubits: int, num_moments: int, _expected_gzip_size: int
+) -> None:
+    """Benchmark cirq.read_binary."""
+    binary_data = cirq.to_binary(_make_circuit(num_qubits, num_moments))
+    benchmark(cirq.read_binary, binary=binary_data)
+
+
+def _write_results(path, num_results: int) -> None:
+    rs = np.random.RandomState(0)
+    results = [
+        cirq.ResultDict(
+            params=cirq.ParamResolver({'theta': i}),
+            measurements={'m': rs.randint(2, size=(1000, 20), dtype=np.int8)},
+        )
+        for i in range(num_results)
+    ]
+    cirq.to_json(results, path)
+
+
+@pytest.mark.parametrize("num_results", [100, 1000])
+@pytest.mark.benchmark(group="results_deserialization")
+def test_read_json_results(benchmark, tmp_path, num_results: int) -> None:
+    """Benchmark cirq.read_json of a list of archived results."""
+    path = tmp_path / 'results.json'
+    _write_results(path, num_results)
+    benchmark(cirq.read_json, path)
+
+
+@pytest.mark.parametrize("num_results", [100, 1000])
+@pytest.mark.benchmark(group="results_deserialization")
+def test_iter_json_results(benchmark, tmp_path, num_results: int) -> None:
+    """Benchmark iterating over a list of archived results with cirq.iter_json."""
+    path = tmp_path / 'results.json'
+    _write_results(path, num_results)
+    benchmark(lambda: sum(1 for _ in cirq.iter_json(path)))
@@ -138,6 +138,8 @@ from cirq.linalg import (
     diagonalize_real_symmetric_and_sorted_diagonal_matrices as diagonalize_real_symmetric_and_sorted_diagonal_matrices,  # noqa: E501
     diagonalize_real_symmetric_matrix as diagonalize_real_symmetric_matrix,
     dot as dot,
+    EINSUM_PATH_CACHE as EINSUM_PATH_CACHE,
+    EinsumPathCache as EinsumPathCache,
     expand_matrix_in_orthogonal_basis as expand_matrix_in_orthogonal_basis,
     hilbert_schmidt_inner_product as hilbert_schmidt_inner_product,
     is_cptp as is_cptp,
@@ -150,6 +152,7 @@ from cirq.linalg import (
     is_unitary as is_unitary,
     kak_canonicalize_vector as kak_canonicalize_vector,
     kak_decomposition as kak_decomposition,
+    kak_decompositions as kak_decompositions,
     kak_vector as kak_vector,
     KakDecomposition as KakDecomposition,
     kron as kron,
@@ -360,6 +363,7 @@ from cirq.transformers import (
     decompose_multi_controlled_x as decompose_multi_controlled_x,
     decompose_multi_controlled_rotation as decompose_multi_controlled_rotation,
     decompose_two_qubit_interaction_into_four_fsim_gates as decompose_two_qubit_interaction_into_four_fsim_gates,  # noqa: E501
+    DecompositionCache as DecompositionCache,
     defer_measurements as defer_measurements,
     dephase_measurements as dephase_measurements,
     drop_diagonal_before_measurement as drop_diagonal_before_measurement,
@@ -410,6 +414,7 @@ from cirq.transformers import (
     TransformerLogger as TransformerLogger,
     three_qubit_matrix_to_operations as three_qubit_matrix_to_operations,
     transformer as transformer,
+    two_qubit_matrices_to_cz_operations as two_qubit_matrices_to_cz_operations,
     two_qubit_matrix_to_cz_isometry as two_qubit_matrix_to_cz_isometry,
     two_qubit_matrix_to_cz_operations as two_qubit_matrix_to_cz_operations,
     two_qubit_matrix_to_diagonal_and_cz_operations as two_qubit_matrix_to_diagonal_and_cz_operations,  # noqa: E501
@@ -588,12 +593,14 @@ from cirq.protocols import (
     ApplyMixtureArgs as ApplyMixtureArgs,
     ApplyUnitaryArgs as ApplyUnitaryArgs,
     approx_eq as approx_eq,
+    BinaryWriter as BinaryWriter,
     circuit_diagram_info as circuit_diagram_info,
     CircuitDiagramInfo as CircuitDiagramInfo,
     CircuitDiagramInfoArgs as CircuitDiagramInfoArgs,
     cirq_type_from_json as cirq_type_from_json,
     commutes as commutes,
     control_keys as control_keys,
+    DecomposeCache as DecomposeCache,
     decompose as decompose,
     decompose_once as decompose_once,
     decompose_once_with_qubits as decompose_once_with_qubits,
@@ -608,6 +615,8 @@ from cirq.protocols import (
     HasJSONNamespace as HasJSONNamespace,
     inverse as inverse,
     is_measurement as is_measurement,
+    iter_binary as iter_binary,
+    iter_json as iter_json,
     is_parameterized as is_parameterized,
     JsonResolver as JsonResolver,
     json_cirq_type as json_cirq_type,
@@ -632,6 +641,7 @@ from cirq.protocols import (
     QasmArgs as QasmArgs,
     qid_shape as qid_shape,
     read_json_gzip as read_json_gzip,
+    read_binary as read_binary,
     read_json as read_json,
     resolve_parameters as resolve_parameters,
     resolve_parameters_once as resolve_parameters_once,
@@ -664,6 +674,7 @@ from cirq.protocols import (
     SupportsTraceDistanceBound as SupportsTraceDistanceBound,
     SupportsUnitary as SupportsUnitary,
     to_json_gzip as to_json_gzip,
+    to_binary as to_binary,
     to_json as to_json,
     obj_to_dict_helper as obj_to_dict_helper,
     trace_distance_bound as trace_distance_bound,
@@ -707,6 +718,24 @@ from cirq.json_resolver_cache import _class_resolver_dictionary
 
 _register_resolver(_class_resolver_dictionary)
 
-# contrib's json resolver cache depends on cirq.DEFAULT_RESOLVER
 
-from cirq import contrib  # noqa: E402
+def _contrib_class_resolver_dictionary():
+    from cirq.contrib.json import _class_resolver_dictionary as _contrib_resolver_dictionary
+
+    return _contrib_resolver_dictionary()
+
+
+# Registers cirq.contrib's public classes for JSON serialization, without importing contrib.
+_register_resolver(_contrib_class_resolver_dictionary)
+
+# Sub-modules which are only imported on first access, because they depend on large packages
+# (e.g. networkx) which most programs do not need.
+_LAZY_SUBMODULES = frozenset({'contrib'})
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        return importlib.import_module(f'cirq.{name}')
+    raise AttributeError(f"module 'cirq' has no attribute {name!r}")
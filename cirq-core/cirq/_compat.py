@@ -32,11 +32,13 @@ from types import ModuleType
 from typing import Any, overload, TypeVar
 
 import numpy as np
-import pandas as pd
 import sympy
 import sympy.printing.repr
 
 from cirq._doc import document
+from cirq._import import LazyLoader
+
+pd = LazyLoader("pd", globals(), "pandas")
 
 ALLOW_DEPRECATION_IN_TEST = 'ALLOW_DEPRECATION_IN_TEST'
 
@@ -134,6 +136,15 @@ def _method_cache_name(func: Callable) -> str:
     return f'_method_cache_{func.__name__}'
 
 
+def _pandas_is_imported() -> bool:
+    """Returns whether pandas was imported, in which case values may be pandas objects.
+
+    pandas is imported lazily, so checking this first avoids importing it only to find out
+    that a value is not a pandas object.
+    """
+    return 'pandas' in sys.modules
+
+
 def proper_repr(value: Any) -> str:
     """Overrides sympy and numpy returning repr strings that don't parse."""
 
@@ -175,26 +186,30 @@ def proper_repr(value: Any) -> str:
     if isinstance(value, np.ndarray):
         return f'np.array({value.tolist()!r}, dtype=np.{value.dtype!r})'
 
-    if isinstance(value, pd.MultiIndex):
-        return f'pd.MultiIndex.from_tuples({repr(list(value))}, names={repr(list(value.names))})'
+    if _pandas_is_imported():
+        if isinstance(value, pd.MultiIndex):
+            return (
+                f'pd.MultiIndex.from_tuples({repr(list(value))}, '
+                f'names={repr(list(value.names))})'
+            )
 
-    if isinstance(value, pd.Index):
-        return (
-            f'pd.Index({repr(list(value))}, '
-            f'name={repr(value.name)}, '
-            f'dtype={repr(str(value.dtype))})'
-        )
+        if isinstance(value, pd.Index):
+            return (
+                f'pd.Index({repr(list(value))}, '
+                f'name={repr(value.name)}, '
+                f'dtype={repr(str(value.dtype))})'
+            )
 
-    if isinstance(value, pd.DataFrame):
-        cols = [value[col].tolist() for col in value.columns]
-        rows = list(zip(*cols))
-        return (
-            f'pd.DataFrame('
-            f'\n    columns={proper_repr(value.columns)}, '
-            f'\n    index={proper_repr(value.index)}, '
-            f'\n    data={repr(rows)}'
-            f'\n)'
-        )
+        if isinstance(value, pd.DataFrame):
+            cols = [value[col].tolist() for col in value.columns]
+            rows = list(zip(*cols))
+            return (
+                f'pd.DataFrame('
+                f'\n    columns={proper_repr(value.columns)}, '
+                f'\n    index={proper_repr(value.index)}, '
+                f'\n    data={repr(rows)}'
+                f'\n)'
+            )
 
     if isinstance(value, dict):
         return '{' + ','.join(f"{proper_repr(k)}: {proper_repr(v)}" for k, v in value.items()) + '}'
@@ -243,7 +258,7 @@ def proper_eq(a: Any, b: Any) -> bool:
     if type(a) == type(b):
         if isinstance(a, np.ndarray):
             return np.array_equal(a, b)
-        if isinstance(a, (pd.DataFrame, pd.Index, pd.MultiIndex)):
+        if _pandas_is_imported() and isinstance(a, (pd.DataFrame, pd.Index, pd.MultiIndex)):
             return a.equals(b)
         if isinstance(a, (tuple, list)):
             return len(a) == len(b) and all(proper_eq(x, y) for x, y in zip(a, b))
@@ -14,8 +14,36 @@
 
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
+
+import pytest
+
 from cirq import _import
 
+# Dependencies which `import cirq` must leave to be loaded on first use.
+_DEFERRED_MODULES = ('matplotlib', 'networkx', 'pandas', 'scipy', 'cirq.contrib')
+# A budget for `import cirq`, which takes well under a second on a laptop. It is generous so
+# that the test doesn't fail on loaded machines, and `benchmarks/import_perf.py` measures the
+# import time itself.
+_IMPORT_BUDGET_SECONDS = 30.0
+
+
+def _import_cirq_in_subprocess() -> dict:
+    code = (
+        'import json, sys, time\n'
+        't = time.perf_counter()\n'
+        'import cirq\n'
+        'elapsed = time.perf_counter() - t\n'
+        f'print(json.dumps({{"elapsed": elapsed, "loaded": '
+        f'[m for m in {_DEFERRED_MODULES!r} if m in sys.modules]}}))\n'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
 
 def test_lazy_loader() -> None:
     linalg = _import.LazyLoader("linalg", globals(), "scipy.linalg")
@@ -30,3 +58,30 @@ def test_lazy_loader() -> None:
     assert "fun" in linalg.__dict__
     assert "LinAlgError" in dir(linalg)
     assert linalg.fun == 1
+
+
+def test_import_cirq_defers_heavy_dependencies() -> None:
+    assert _import_cirq_in_subprocess()['loaded'] == []
+
+
+def test_import_cirq_budget() -> None:
+    result = _import_cirq_in_subprocess()
+    # The heavy dependencies are what made `import cirq` slow, so they must not be loaded.
+    assert result['loaded'] == []
+    assert result['elapsed'] < _IMPORT_BUDGET_SECONDS
+
+
+def test_contrib_is_loaded_on_first_access() -> None:
+    code = (
+        'import sys, cirq\n'
+        'assert "cirq.contrib" not in sys.modules\n'
+        'assert cirq.contrib.json.contrib_class_resolver\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_unknown_attribute_of_cirq_raises() -> None:
+    import cirq
+
+    with pytest.raises(AttributeError, match='not_a_submodule'):
+        _ = cirq.not_a_submodule
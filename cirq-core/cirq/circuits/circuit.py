@@ -40,12 +40,12 @@ from collections.abc import (
 from types import NotImplementedType
 from typing import Any, cast, overload, Self, TYPE_CHECKING, TypeVar, Union
 
-import networkx
 import numpy as np
 
 import cirq._version
 from cirq import _compat, devices, ops, protocols, qis
 from cirq._doc import document
+from cirq._import import LazyLoader
 from cirq.circuits._bucket_priority_queue import BucketPriorityQueue
 from cirq.circuits.circuit_operation import CircuitOperation
 from cirq.circuits.insert_strategy import InsertStrategy
@@ -54,6 +54,8 @@ from cirq.circuits.qasm_output import QasmOutput
 from cirq.circuits.text_diagram_drawer import TextDiagramDrawer
 from cirq.protocols import circuit_diagram_info_protocol
 
+networkx = LazyLoader("networkx", globals(), "networkx")
+
 if TYPE_CHECKING:
     import cirq
 
@@ -2260,8 +2262,8 @@ class Circuit(AbstractCircuit):
             self._placement_cache = None
         mops = list(ops.flatten_to_ops_or_moments(moment_or_operation_tree))
         if self._placement_cache:
-            batches = [mops]  # Any grouping would work here; this just happens to be the fastest.
-        elif strategy is InsertStrategy.NEW:
+            return self._append_with_placement_cache(mops)
+        if strategy is InsertStrategy.NEW:
             batches = [[mop] for mop in mops]  # Each op goes into its own moment.
         else:
             batches = list(_group_into_moment_compatible(mops))
@@ -2272,8 +2274,7 @@ class Circuit(AbstractCircuit):
         for batch in batches:
             # Insert a moment if inline/earliest and _any_ op in the batch requires it.
             if (
-                not self._placement_cache
-                and not isinstance(batch[0], Moment)
+                not isinstance(batch[0], Moment)
                 and strategy in (InsertStrategy.INLINE, InsertStrategy.EARLIEST)
                 and not all(
                     (strategy is InsertStrategy.EARLIEST and self._can_add_op_at(k, op))
@@ -2287,9 +2288,7 @@ class Circuit(AbstractCircuit):
             max_p = 0
             for moment_or_op in batch:
                 # Determine Placement
-                if self._placement_cache:
-                    p = self._placement_cache.append(moment_or_op)
-                elif isinstance(moment_or_op, Moment):
+                if isinstance(moment_or_op, Moment):
                     p = k
                 elif strategy in (InsertStrategy.NEW, InsertStrategy.NEW_THEN_INLINE):
                     self._moments.insert(k, Moment())
@@ -2313,9 +2312,39 @@ class Circuit(AbstractCircuit):
                     strategy = InsertStrategy.INLINE
                     k += 1
             k = max(k, max_p + 1)
-        self._mutated(preserve_placement_cache=True)
+        self._mutated()
         return k
 
+    def _append_with_placement_cache(self, mops: list[_MOMENT_OR_OP]) -> int:
+        """Appends moments and operations with the EARLIEST strategy, using the placement cache.
+
+        Like `_load_contents_with_earliest_strategy`, the operations are grouped by the index of
+        the moment they go into, so that each moment is built once per call rather than once per
+        operation.
+        """
+        placement_cache = cast(_PlacementCache, self._placement_cache)
+        start = len(self._moments)
+        op_lists_by_index: dict[int, list[cirq.Operation]] = defaultdict(list)
+        moments_by_index: dict[int, cirq.Moment] = {}
+        max_p = 0
+        for mop in mops:
+            p = placement_cache.append(mop)
+            if isinstance(mop, Moment):
+                moments_by_index[p] = mop
+            else:
+                op_lists_by_index[p].append(mop)
+            max_p = max(p, max_p)
+        for i, op_list in op_lists_by_index.items():
+            if i < start:
+                self._moments[i] = self._moments[i].with_operations(op_list)
+        for i in range(start, placement_cache._length):
+            if i in moments_by_index:
+                self._moments.append(moments_by_index[i].with_operations(op_lists_by_index[i]))
+            else:
+                self._moments.append(Moment(op_lists_by_index[i]))
+        self._mutated(preserve_placement_cache=True)
+        return max(start, max_p + 1)
+
     def insert_into_range(self, operations: cirq.OP_TREE, start: int, end: int) -> int:
         """Writes operations inline into an area of the circuit.
 
@@ -2631,11 +2660,16 @@ class Circuit(AbstractCircuit):
         """
         noise_model = devices.NoiseModel.from_noise_model_like(noise)
         qubits = sorted(self.all_qubits())
-        c_noisy = Circuit(tags=self.tags)
+        moments: list[cirq.Moment] = []
         for op_tree in noise_model.noisy_moments(self, qubits):
             # Keep moments aligned
-            c_noisy += Circuit(op_tree)
-        return c_noisy
+            if isinstance(op_tree, Moment):
+                moments.append(op_tree)
+            elif isinstance(op_tree, list) and all(isinstance(m, Moment) for m in op_tree):
+                moments.extend(op_tree)
+            else:
+                moments.extend(Circuit(op_tree))
+        return Circuit._from_moments(moments, self.tags)
 
 
 def _pick_inserted_ops_moment_indices(
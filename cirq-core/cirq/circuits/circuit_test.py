@@ -4931,6 +4931,29 @@ def test_append_speed() -> None:
     assert duration < 5
 
 
+def test_append_batch_matches_appending_one_at_a_time() -> None:
+    qubits = cirq.LineQubit.range(6)
+    prefix = cirq.testing.random_circuit(qubits, n_moments=5, op_density=0.5, random_state=1)
+    batch = [
+        *cirq.testing.random_circuit(
+            qubits, n_moments=10, op_density=0.5, random_state=2
+        ).all_operations(),
+        cirq.measure(qubits[0], key='a'),
+        cirq.Moment(cirq.Y(qubits[1])),
+        cirq.X(qubits[2]).with_classical_controls('a'),
+        cirq.X(qubits[3]).with_classical_controls('b'),
+        cirq.measure(qubits[4], key='b'),
+        cirq.Z(qubits[5]),
+    ]
+
+    one_at_a_time = cirq.Circuit(prefix.all_operations())
+    indices = [one_at_a_time.insert(len(one_at_a_time), mop) for mop in batch]
+    batched = cirq.Circuit(prefix.all_operations())
+    assert batched.insert(len(batched), batch) == max(indices)
+    assert batched == one_at_a_time
+    assert batched.insert(len(batched), []) == len(batched)
+
+
 def test_tagged_circuits() -> None:
     q = cirq.LineQubit(0)
     ops = [cirq.X(q), cirq.H(q)]
@@ -6,7 +6,7 @@ from __future__ import annotations
 import functools
 
 from cirq import _compat
-from cirq.protocols.json_serialization import _register_resolver, DEFAULT_RESOLVERS, ObjectFactory
+from cirq.protocols.json_serialization import DEFAULT_RESOLVERS, ObjectFactory
 
 
 def contrib_class_resolver(cirq_type: str) -> ObjectFactory | None:
@@ -40,8 +40,6 @@ def _class_resolver_dictionary() -> dict[str, ObjectFactory]:
     return {cls.__name__: cls for cls in classes}
 
 
-_register_resolver(_class_resolver_dictionary)
-
 DEFAULT_CONTRIB_RESOLVERS = [contrib_class_resolver, *DEFAULT_RESOLVERS]
 
 _compat.deprecate_attributes(
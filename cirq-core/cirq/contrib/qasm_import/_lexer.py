@@ -20,10 +20,19 @@ import ply.lex as lex
 
 from cirq.contrib.qasm_import.exception import QasmException
 
+# Lexer templates by class. Building a PLY lexer compiles the master regular expression of all
+# the token rules, so it is done once per class and cloned for each instance. Templates are
+# built on a bare instance, so that they keep no input alive.
+_LEXER_TEMPLATES: dict[type, lex.Lexer] = {}
+
 
 class QasmLexer:
     def __init__(self):
-        self.lex = lex.lex(object=self, debug=False)
+        template = _LEXER_TEMPLATES.get(type(self))
+        if template is None:
+            template = lex.lex(object=type(self).__new__(type(self)), debug=False)
+            _LEXER_TEMPLATES[type(self)] = template
+        self.lex = template.clone(self)
 
     literals = "{}[]();,+/*-^="
 
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import copy
 import dataclasses
 import functools
 import operator
@@ -32,6 +33,14 @@ from cirq.contrib.qasm_import.exception import QasmException
 if TYPE_CHECKING:
     import cirq
 
+# The number of operations that the parser collects before appending them to the circuit.
+_OPERATION_BATCH_SIZE = 4096
+
+# Parser templates by class. Generating the LALR tables of the grammar is the most expensive
+# part of constructing a parser, so it is done once per class and copied for each instance.
+# Templates are built on a bare instance, so that they keep no parsed circuit alive.
+_PARSER_TEMPLATES: dict[type, yacc.LRParser] = {}
+
 
 class Qasm:
     """Qasm stores the final result of the Qasm parsing."""
@@ -61,6 +70,11 @@ def _generate_op_qubits(args: list[list[ops.Qid]], lineno: int) -> list[list[ops
     used as arguments, we generate reg_size GateOperations via iterating
     through each qubit of the registers 0 to n-1 and use the same one
     qubit from the "single-qubit registers" for each operation."""
+    if all(len(reg) == 1 for reg in args):
+        op_qubits = [[reg[0] for reg in args]]
+        if len(set(op_qubits[0])) < len(args):
+            raise QasmException(f"Overlapping qubits in arguments at line {lineno}")
+        return op_qubits
     reg_sizes = np.unique([len(reg) for reg in args])
     if len(reg_sizes) > 2 or (len(reg_sizes) > 1 and reg_sizes[0] != 1):
         raise QasmException(
@@ -176,8 +190,10 @@ class QasmParser:
     """
 
     def __init__(self) -> None:
-        self.parser = yacc.yacc(module=self, debug=False, write_tables=False)
+        self.parser = self._build_parser()
         self.circuit = Circuit()
+        self._pending_operations: list[ops.Operation] = []
+        """Parsed operations that have not been appended to the circuit yet."""
         self.qregs: dict[str, int] = {}
         self.cregs: dict[str, int] = {}
         self.gate_set: dict[str, CustomGate | QasmGateStatement] = {**self.basic_gates}
@@ -217,6 +233,22 @@ class QasmParser:
             '^': operator.pow,
         }
 
+    def _build_parser(self) -> yacc.LRParser:
+        """Returns a parser bound to this instance, sharing the parse tables of its class."""
+        template = _PARSER_TEMPLATES.get(type(self))
+        if template is None:
+            template = yacc.yacc(
+                module=type(self).__new__(type(self)), debug=False, write_tables=False
+            )
+            _PARSER_TEMPLATES[type(self)] = template
+        parser = copy.copy(template)
+        parser.productions = [copy.copy(production) for production in template.productions]
+        for production in parser.productions:
+            if production.func:
+                production.callable = getattr(self, production.func)
+        parser.errorfunc = self.p_error
+        return parser
+
     basic_gates: dict[str, QasmGateStatement] = {
         'CX': QasmGateStatement(qasm_gate='CX', cirq_gate=CX, num_params=0, num_args=2),
         'U': QasmGateStatement(
@@ -849,9 +881,17 @@ class QasmParser:
         |  circuit measurement
         |  circuit reset
         |  circuit if"""
-        self.circuit.append(p[2])
+        # Operations are appended to the circuit in batches, which is much faster than appending
+        # them one at a time. The batch is flushed at the end of `parse`.
+        self._pending_operations.extend(p[2])
+        if len(self._pending_operations) >= _OPERATION_BATCH_SIZE:
+            self._flush_operations()
         p[0] = self.circuit
 
+    def _flush_operations(self) -> None:
+        self.circuit.append(self._pending_operations)
+        self._pending_operations = []
+
     def p_circuit_empty(self, p):
         """circuit : empty"""
         p[0] = self.circuit
@@ -1201,6 +1241,7 @@ at line {p.lineno}, column {self.find_column(p)}""")
             self.qasm = qasm
             self.lexer.input(self.qasm)
             self.parsedQasm = self.parser.parse(lexer=self.lexer)
+            self._flush_operations()
         return self.parsedQasm
 
     def debug_context(self, p):
@@ -383,6 +383,18 @@ def test_CX_gate_arg_overlap() -> None:
         parser.parse(qasm)
 
 
+def test_CX_gate_register_overlap() -> None:
+    qasm = """OPENQASM 2.0;
+     qreg q1[2];
+     qreg q2[3];
+     CX q1, q1;
+"""
+    parser = QasmParser()
+
+    with pytest.raises(QasmException, match=r"Overlapping.*at line 4"):
+        parser.parse(qasm)
+
+
 def test_U_gate() -> None:
     qasm = """
      OPENQASM 2.0;
@@ -2437,3 +2449,59 @@ def test_all_qelib_gates_unitary_equivalence(
     U_import = cirq.unitary(imported)
     assert np.allclose(U_import, U_native, atol=1e-8)
     assert parsed_qasm.qregs == {'q': num_args}
+
+
+def test_parsers_share_tables_but_not_state() -> None:
+    first, second = QasmParser(), QasmParser()
+    assert first.parser.action is second.parser.action
+    assert first.lexer.lex.lexre is second.lexer.lex.lexre
+
+    q0, q1 = cirq.NamedQubit('q_0'), cirq.NamedQubit('q_1')
+    first_qasm = first.parse('OPENQASM 2.0; qreg q[2]; CX q[0], q[1];')
+    second_qasm = second.parse('OPENQASM 2.0; qreg q[1]; U(0, 0, 0) q[0];')
+    assert first_qasm.circuit == Circuit(cirq.CX(q0, q1))
+    assert second_qasm.circuit == Circuit(QasmUGate(0, 0, 0)(q0))
+    assert first_qasm.qregs == {'q': 2}
+    assert second_qasm.qregs == {'q': 1}
+
+
+def test_operations_are_appended_in_batches(monkeypatch) -> None:
+    monkeypatch.setattr(cirq.contrib.qasm_import._parser, '_OPERATION_BATCH_SIZE', 3)
+    qasm = """OPENQASM 2.0;
+        include "qelib1.inc";
+        qreg q[2];
+        creg m[1];
+        h q[0];
+        cx q[0], q[1];
+        x q;
+        measure q[1] -> m[0];
+        if (m == 1) z q[0];
+        reset q;
+        h q[1];
+    """
+    q0, q1 = cirq.NamedQubit('q_0'), cirq.NamedQubit('q_1')
+    expected = Circuit(
+        cirq.H(q0),
+        cirq.CX(q0, q1),
+        cirq.X(q0),
+        cirq.X(q1),
+        cirq.measure(q1, key='m_0'),
+        cirq.Z(q0).with_classical_controls(sympy.Eq(sympy.Symbol('m_0'), 1)),
+        cirq.ResetChannel().on(q0),
+        cirq.ResetChannel().on(q1),
+        cirq.H(q1),
+    )
+    assert QasmParser().parse(qasm).circuit == expected
+
+
+def test_error_after_a_batch_of_operations(monkeypatch) -> None:
+    monkeypatch.setattr(cirq.contrib.qasm_import._parser, '_OPERATION_BATCH_SIZE', 2)
+    qasm = """OPENQASM 2.0;
+        include "qelib1.inc";
+        qreg q[2];
+        h q;
+        h q;
+        cx q[0], q[0];
+    """
+    with pytest.raises(QasmException, match=r"Overlapping.*at line 6"):
+        QasmParser().parse(qasm)
@@ -1,4 +1,9 @@
 # pylint: disable=wrong-or-nonexistent-copyright-notice
+from cirq.contrib.quimb.compiled_network import (
+    CompiledNetwork as CompiledNetwork,
+    compile_network as compile_network,
+)
+
 from cirq.contrib.quimb.state_vector import (
     circuit_for_expectation_value as circuit_for_expectation_value,
     tensor_expectation_value as tensor_expectation_value,
@@ -0,0 +1,192 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tensor networks whose contraction path is optimized once and reused."""
+
+from __future__ import annotations
+
+import collections
+import functools
+import itertools
+from collections.abc import Hashable, Sequence
+from typing import Any, TYPE_CHECKING
+
+import cotengra as ctg
+import numpy as np
+import quimb.tensor as qtn
+
+if TYPE_CHECKING:
+    import multiprocessing.pool
+
+
+class CompiledNetwork:
+    """A tensor network whose contraction path is optimized once, for contracting new data.
+
+    Searching for a good contraction path of a large tensor network can take longer than the
+    contraction itself. The path only depends on the structure of the network, i.e. on the
+    indices and the shapes of its tensors, so a `CompiledNetwork` searches for it once and
+    then contracts arrays of the same shapes along it. For example, the tensor networks of a
+    parameterized circuit all have the same structure, whatever the values of the parameters.
+
+    The contraction can optionally be sliced: the given `slice_inds`, and then more indices
+    if needed to keep the intermediate tensors below `max_intermediate_size` entries, are
+    fixed to each of their values in turn. Each slice is then contracted independently, which
+    caps the peak memory of the contraction, and the slices can be contracted in parallel.
+    """
+
+    def __init__(
+        self,
+        tensors: Sequence[qtn.Tensor],
+        output_inds: Sequence[str] = (),
+        *,
+        optimize: Any = None,
+        slice_inds: Sequence[str] = (),
+        max_intermediate_size: int | None = None,
+    ):
+        """Inits CompiledNetwork.
+
+        Args:
+            tensors: The tensors of the network. Only their indices and shapes are used.
+            output_inds: The indices left open by the contraction, in the order of the axes of
+                the result.
+            optimize: The contraction path optimizer, passed to
+                `cotengra.array_contract_tree`. If None, quimb's default strategy is used.
+            slice_inds: Indices to slice the contraction over.
+            max_intermediate_size: If specified, more indices are sliced until no intermediate
+                tensor of a slice has more than this number of entries.
+        """
+        self._inds = tuple(tuple(t.inds) for t in tensors)
+        self._shapes = tuple(tuple(t.shape) for t in tensors)
+        self._output_inds = tuple(output_inds)
+        # Name the indices with single characters, as einsum does.
+        symbols: dict[str, str] = {}
+        for ind in (*itertools.chain.from_iterable(self._inds), *self._output_inds):
+            symbols.setdefault(ind, ctg.get_symbol(len(symbols)))
+        tree = ctg.array_contract_tree(
+            [tuple(symbols[ind] for ind in inds) for inds in self._inds],
+            tuple(symbols[ind] for ind in self._output_inds),
+            shapes=self._shapes,
+            optimize=qtn.get_contract_strategy() if optimize is None else optimize,
+            canonicalize=False,
+        )
+        for ind in slice_inds:
+            tree.remove_ind_(symbols[ind])
+        if max_intermediate_size is not None and tree.max_size() > max_intermediate_size:
+            tree.slice_(target_size=max_intermediate_size)
+        self._tree = tree
+
+    @property
+    def output_inds(self) -> tuple[str, ...]:
+        """The indices left open by the contraction."""
+        return self._output_inds
+
+    @property
+    def num_slices(self) -> int:
+        """The number of slices of the contraction."""
+        return self._tree.nslices
+
+    @property
+    def largest_intermediate(self) -> int:
+        """The number of entries of the largest intermediate tensor of a slice."""
+        return int(self._tree.max_size())
+
+    def contract(
+        self, arrays: Sequence[np.ndarray], pool: multiprocessing.pool.Pool | None = None
+    ) -> np.ndarray:
+        """Contracts the network along the compiled path.
+
+        Args:
+            arrays: The data of the tensors, in the order and with the shapes of the tensors
+                the network was compiled from.
+            pool: An optional multiprocessing pool in which to contract the slices.
+
+        Returns:
+            The contracted array, whose axes are the output indices.
+
+        Raises:
+            ValueError: If the shapes of the arrays do not match the network.
+        """
+        if tuple(np.shape(a) for a in arrays) != self._shapes:
+            raise ValueError('The shapes of the arrays do not match the compiled network.')
+        if self._tree.nslices == 1:
+            return np.asarray(self._tree.contract(arrays))
+        contract_slice = functools.partial(_contract_slice, self._tree, arrays)
+        if pool is None:
+            slices = [contract_slice(i) for i in range(self._tree.nslices)]
+        else:
+            slices = pool.map(contract_slice, range(self._tree.nslices))
+        return np.asarray(self._tree.gather_slices(slices))
+
+    def __repr__(self) -> str:
+        return (
+            f'cirq.contrib.quimb.CompiledNetwork(<{len(self._inds)} tensors>, '
+            f'output_inds={self._output_inds!r})'
+        )
+
+
+def _contract_slice(tree: Any, arrays: Sequence[np.ndarray], i: int) -> np.ndarray:
+    return tree.contract_slice(arrays, i)
+
+
+_MAX_CACHED_NETWORKS = 64
+_compiled_networks: collections.OrderedDict[Hashable, CompiledNetwork] = collections.OrderedDict()
+
+
+def compile_network(
+    tensors: Sequence[qtn.Tensor],
+    output_inds: Sequence[str] = (),
+    *,
+    optimize: str | None = None,
+    slice_inds: Sequence[str] = (),
+    max_intermediate_size: int | None = None,
+) -> CompiledNetwork:
+    """Returns a `CompiledNetwork` of the tensors, reusing one of the same structure if cached.
+
+    The most recently used compiled networks are cached, keyed on the indices and shapes of
+    the tensors and on the compilation options.
+
+    Args:
+        tensors: The tensors of the network.
+        output_inds: The indices left open by the contraction.
+        optimize: The name of the contraction path optimizer. If None, quimb's default strategy
+            is used.
+        slice_inds: Indices to slice the contraction over.
+        max_intermediate_size: If specified, more indices are sliced until no intermediate
+            tensor of a slice has more than this number of entries.
+
+    Returns:
+        The compiled network.
+    """
+    key = (
+        tuple(tuple(t.inds) for t in tensors),
+        tuple(tuple(t.shape) for t in tensors),
+        tuple(output_inds),
+        optimize,
+        tuple(slice_inds),
+        max_intermediate_size,
+    )
+    network = _compiled_networks.get(key)
+    if network is None:
+        network = CompiledNetwork(
+            tensors,
+            output_inds,
+            optimize=optimize,
+            slice_inds=slice_inds,
+            max_intermediate_size=max_intermediate_size,
+        )
+    _compiled_networks[key] = network
+    _compiled_networks.move_to_end(key)
+    while len(_compiled_networks) > _MAX_CACHED_NETWORKS:
+        _compiled_networks.popitem(last=False)
+    return network
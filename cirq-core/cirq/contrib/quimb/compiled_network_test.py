@@ -0,0 +1,124 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import multiprocessing
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+import cirq.contrib.quimb as ccq
+from cirq.contrib.quimb import compiled_network
+
+
+def _circuit_tensors(qubits, theta: float):
+    circuit = cirq.Circuit(
+        cirq.H.on_each(qubits),
+        [cirq.CZ(a, b) ** theta for a, b in zip(qubits, qubits[1:])],
+        cirq.Moment(cirq.rx(theta).on_each(qubits)),
+        [cirq.ISWAP(a, b) ** theta for a, b in zip(qubits[1:], qubits[2:])],
+    )
+    tensors, qubit_frontier, _ = ccq.circuit_to_tensors(circuit, qubits)
+    output_inds = [f'i{qubit_frontier[q]}_q{q}' for q in qubits]
+    return circuit, tensors, output_inds
+
+
+def test_compiled_network_contracts_new_data() -> None:
+    qubits = cirq.LineQubit.range(5)
+    _, tensors, output_inds = _circuit_tensors(qubits, 0.3)
+    network = ccq.CompiledNetwork(tensors, output_inds)
+    assert network.output_inds == tuple(output_inds)
+    assert network.num_slices == 1
+    assert network.largest_intermediate >= 2**5
+    for theta in [0.1, 0.7]:
+        circuit, tensors, _ = _circuit_tensors(qubits, theta)
+        np.testing.assert_allclose(
+            network.contract([t.data for t in tensors]).reshape(-1),
+            cirq.final_state_vector(circuit, qubit_order=qubits),
+            atol=1e-6,
+        )
+
+
+def test_compiled_network_wrong_shapes() -> None:
+    _, tensors, output_inds = _circuit_tensors(cirq.LineQubit.range(3), 0.3)
+    network = ccq.CompiledNetwork(tensors, output_inds)
+    with pytest.raises(ValueError, match='do not match'):
+        _ = network.contract([t.data for t in tensors[1:]])
+    assert repr(network) == (
+        f'cirq.contrib.quimb.CompiledNetwork(<{len(tensors)} tensors>, '
+        f'output_inds={tuple(output_inds)!r})'
+    )
+
+
+@pytest.mark.parametrize('use_pool', [False, True])
+def test_compiled_network_sliced(use_pool) -> None:
+    qubits = cirq.LineQubit.range(6)
+    circuit, tensors, output_inds = _circuit_tensors(qubits, 0.4)
+    arrays = [t.data for t in tensors]
+    expected = cirq.final_state_vector(circuit, qubit_order=qubits)
+
+    inner_ind = next(ind for t in tensors for ind in t.inds if ind not in output_inds)
+    sliced = ccq.CompiledNetwork(tensors, output_inds, slice_inds=[output_inds[0], inner_ind])
+    assert sliced.num_slices == 4
+    capped = ccq.CompiledNetwork(tensors, output_inds, max_intermediate_size=8)
+    assert capped.num_slices > 1
+    assert capped.largest_intermediate <= 8
+
+    for network in [sliced, capped]:
+        if use_pool:
+            with multiprocessing.Pool(2) as pool:
+                result = network.contract(arrays, pool=pool)
+        else:
+            result = network.contract(arrays)
+        np.testing.assert_allclose(result.reshape(-1), expected, atol=1e-6)
+
+
+def test_compile_network_cache(monkeypatch) -> None:
+    monkeypatch.setattr(
+        compiled_network, '_compiled_networks', type(compiled_network._compiled_networks)()
+    )
+    monkeypatch.setattr(compiled_network, '_MAX_CACHED_NETWORKS', 2)
+    qubits = cirq.LineQubit.range(4)
+    _, tensors_1, output_inds = _circuit_tensors(qubits, 0.1)
+    _, tensors_2, _ = _circuit_tensors(qubits, 0.2)
+    network = ccq.compile_network(tensors_1, output_inds)
+    assert ccq.compile_network(tensors_2, output_inds) is network
+    assert ccq.compile_network(tensors_2, output_inds, max_intermediate_size=4) is not network
+
+    _, tensors_3, output_inds_3 = _circuit_tensors(cirq.LineQubit.range(5), 0.1)
+    _ = ccq.compile_network(tensors_3, output_inds_3)
+    assert len(compiled_network._compiled_networks) == 2
+    assert ccq.compile_network(tensors_1, output_inds) is not network
+
+
+def test_tensor_expectation_value_parameter_sweep() -> None:
+    qubits = cirq.GridQubit.rect(2, 3)
+    theta = sympy.Symbol('theta')
+    circuit = cirq.Circuit(
+        cirq.H.on_each(qubits),
+        [cirq.ZZ(a, b) ** theta for a in qubits for b in qubits if a < b and a.is_adjacent(b)],
+        cirq.Moment(cirq.rx(0.3).on_each(qubits)),
+    )
+    operator = cirq.Z(qubits[0]) * cirq.Z(qubits[1])
+    for value in [0.1, 0.5, 0.9]:
+        resolved = cirq.resolve_parameters(circuit, {theta: value})
+        expected = operator.expectation_from_state_vector(
+            cirq.final_state_vector(resolved), {q: i for i, q in enumerate(sorted(qubits))}
+        ).real
+        np.testing.assert_allclose(
+            ccq.tensor_expectation_value(resolved, operator), expected, atol=1e-6
+        )
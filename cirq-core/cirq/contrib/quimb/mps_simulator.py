@@ -52,6 +52,13 @@ class MPSOptions:
     # Because the computation is approximate, the sum of the probabilities is not 1.0. This
     # parameter is the absolute deviation from 1.0 that is allowed.
     sum_prob_atol: float = 1e-3
+    # If set, the maximum number of singular values to keep while simulating each moment of the
+    # circuit, overriding ``max_bond``. The last entry applies to all the later moments.
+    max_bond_schedule: Sequence[int | None] | None = None
+
+    def __post_init__(self):
+        if self.max_bond_schedule is not None and not self.max_bond_schedule:
+            raise ValueError('max_bond_schedule must not be empty.')
 
 
 class MPSSimulator(
@@ -118,6 +125,8 @@ class MPSSimulator(
         )
 
     def _create_step_result(self, sim_state: cirq.SimulationStateBase[MPSState]):
+        # A step result is created after each moment, so the next moment starts here.
+        sim_state.create_merged_state()._state.advance_moment()
         return MPSSimulatorStepResult(sim_state)
 
     def _create_simulator_trial_result(
@@ -219,6 +228,9 @@ class _MPSHandler(qis.QuantumStateRepresentation):
         format_i: str,
         estimated_gate_error_list: list[float],
         simulation_options: MPSOptions = MPSOptions(),
+        center: int | None = None,
+        discarded_weights: dict[tuple[int, int], float] | None = None,
+        moment: int = 0,
     ):
         """Creates an MPSQuantumState
 
@@ -229,6 +241,14 @@ class _MPSHandler(qis.QuantumStateRepresentation):
             format_i: A string for formatting the group labels.
             estimated_gate_error_list: The error estimations.
             simulation_options: Numerical options for the simulation.
+            center: The group which is the orthogonality centre of the MPS, if the groups form a
+                chain in mixed-canonical form: the tensors of the groups on its left are left
+                isometries, and the ones on its right are right isometries. None if the MPS is
+                not in canonical form.
+            discarded_weights: The relative weights discarded by the truncations of each bond,
+                keyed on the pairs of groups it connects.
+            moment: The index of the moment being simulated, which selects the maximum bond
+                dimension of `simulation_options.max_bond_schedule`.
         """
         self._qid_shape = qid_shape
         self._grouping = grouping
@@ -237,6 +257,9 @@ class _MPSHandler(qis.QuantumStateRepresentation):
         self._format_mu = 'mu_{}_{}'
         self._simulation_options = simulation_options
         self._estimated_gate_error_list = estimated_gate_error_list
+        self._center = center
+        self._discarded_weights = {} if discarded_weights is None else discarded_weights
+        self._moment = moment
 
     @classmethod
     def create(
@@ -292,6 +315,8 @@ class _MPSHandler(qis.QuantumStateRepresentation):
             format_i=format_i,
             estimated_gate_error_list=[],
             simulation_options=simulation_options,
+            # A product state is in canonical form around any of its groups.
+            center=0,
         )
 
     def i_str(self, i: int) -> str:
@@ -327,6 +352,9 @@ class _MPSHandler(qis.QuantumStateRepresentation):
             M=[x.copy() for x in self._M],
             estimated_gate_error_list=self._estimated_gate_error_list.copy(),
             format_i=self._format_i,
+            center=self._center,
+            discarded_weights=self._discarded_weights.copy(),
+            moment=self._moment,
         )
 
     def state_vector(self) -> np.ndarray:
@@ -355,6 +383,15 @@ class _MPSHandler(qis.QuantumStateRepresentation):
         Returns:
             An array that contains the partial trace.
         """
+        groups = {self._grouping[axis] for axis in keep_axes}
+        if self._center is not None and len(groups) == 1:
+            # In canonical form, the other groups only contribute identities once the
+            # orthogonality centre is moved to the group of the kept axes.
+            (n,) = groups
+            self._move_center(n)
+            kept_inds = {self.i_str(axis): 'conj_' + self.i_str(axis) for axis in keep_axes}
+            rho = self._M[n] @ self._M[n].conj().reindex(kept_inds)
+            return rho.to_dense(list(kept_inds.keys()), list(kept_inds.values()))
 
         contracted_inds = set(map(self.i_str, set(range(len(self._qid_shape))) - keep_axes))
 
@@ -425,30 +462,44 @@ class _MPSHandler(qis.QuantumStateRepresentation):
                 if mu_ind not in self._M[p].inds:
                     self._M[p].new_ind(mu_ind)
 
+                if abs(n - p) != 1:
+                    # The groups no longer form a chain, so there is no canonical form.
+                    self._center = None
+                # Move the orthogonality centre to the nearest of the two groups. The split
+                # below then leaves it on the farthest one, so that sweeps of gates along the
+                # chain only move it by one group between gates.
+                near, far = n, p
+                if self._center is not None:
+                    if abs(self._center - p) < abs(self._center - n):
+                        near, far = p, n
+                    self._move_center(near)
+
                 T = U @ self._M[n] @ self._M[p]
 
                 left_inds = (*set(T.inds).intersection(self._M[n].inds), new_inds[0])
                 X, Y = T.split(
                     left_inds,
                     method=self._simulation_options.method,
-                    max_bond=self._simulation_options.max_bond,
+                    max_bond=self._max_bond(),
                     cutoff=self._simulation_options.cutoff,
                     cutoff_mode=self._simulation_options.cutoff_mode,
                     get='tensors',
-                    absorb='both',
+                    absorb='both' if self._center is None else ('right' if far == p else 'left'),
                     bond_ind=mu_ind,
                 )
 
                 # Equations (13), (14), and (15):
-                # TODO(tonybruguier): When Quimb 2.0.0 is released, the split()
-                # function should have a 'renorm' that, when set to None, will
-                # allow to compute e_n exactly as:
-                # np.sum(abs((X @ Y).data) ** 2).real / np.sum(abs(T) ** 2).real
-                #
-                # The renormalization would then have to be done manually.
-                #
-                # However, for now, e_n are just the estimated value.
-                e_n = self._simulation_options.cutoff
+                if self._center is None:
+                    # Without a canonical form, e_n is just the estimated value.
+                    e_n = self._simulation_options.cutoff
+                else:
+                    # With the orthogonality centre on the two groups, the norm of the state is
+                    # the norm of T, and after the split, the norm of the non-isometric factor.
+                    kept = Y if far == p else X
+                    e_n = max(0.0, 1.0 - (_norm(kept) / _norm(T)) ** 2)
+                    self._center = far
+                    bond = (min(n, p), max(n, p))
+                    self._discarded_weights[bond] = self._discarded_weights.get(bond, 0.0) + e_n
                 self._estimated_gate_error_list.append(e_n)
 
                 self._M[n] = X.reindex({new_inds[0]: old_inds[0]})
@@ -463,7 +514,53 @@ class _MPSHandler(qis.QuantumStateRepresentation):
             raise ValueError('Can only handle 1 and 2 qubit operations')
         return True
 
-    def estimation_stats(self):  # pragma: no cover
+    def advance_moment(self) -> None:
+        """Moves on to the next moment of the `MPSOptions.max_bond_schedule`."""
+        self._moment += 1
+
+    def discarded_weights(self) -> dict[tuple[int, int], float]:
+        """Returns the weights discarded by the truncations of each bond.
+
+        The weights are only tracked while the MPS is in canonical form, where the discarded
+        weight of each truncation relative to the norm of the state is known exactly.
+
+        Returns:
+            The sum of the relative weights discarded by the truncations of each bond, keyed on
+            the pairs of groups it connects.
+        """
+        return self._discarded_weights.copy()
+
+    def _max_bond(self) -> int | None:
+        schedule = self._simulation_options.max_bond_schedule
+        if schedule is None:
+            return self._simulation_options.max_bond
+        return schedule[min(self._moment, len(schedule) - 1)]
+
+    def _move_center(self, n: int) -> None:
+        """Moves the orthogonality centre to group n, with a QR decomposition per group."""
+        assert self._center is not None
+        while self._center != n:
+            c = self._center
+            p = c + 1 if n > c else c - 1
+            mu_ind = self.mu_str(c, p)
+            if mu_ind not in self._M[c].inds:
+                self._M[c].new_ind(mu_ind)
+            if mu_ind not in self._M[p].inds:
+                self._M[p].new_ind(mu_ind)
+
+            other_inds = tuple(ind for ind in self._M[c].inds if ind != mu_ind)
+            data = self._M[c].transpose(*other_inds, mu_ind).data
+            q, r = np.linalg.qr(data.reshape((-1, data.shape[-1])))
+            self._M[c] = qtn.Tensor(
+                q.reshape(data.shape[:-1] + (q.shape[-1],)), inds=(*other_inds, mu_ind)
+            )
+            old_ind = 'old_' + mu_ind
+            self._M[p] = qtn.Tensor(r, inds=(mu_ind, old_ind)) @ self._M[p].reindex(
+                {mu_ind: old_ind}
+            )
+            self._center = p
+
+    def estimation_stats(self):
         """Returns some statistics about the memory usage and quality of the approximation."""
 
         num_coefs_used = sum(Mi.data.size for Mi in self._M)
@@ -516,7 +613,8 @@ class _MPSHandler(qis.QuantumStateRepresentation):
 
             collapser = qtn.Tensor(collapser, inds=(new_n, old_n))
 
-            state._M[axis] = (collapser @ state._M[axis]).reindex({new_n: old_n})
+            n = state._grouping[axis]
+            state._M[n] = (collapser @ state._M[n]).reindex({new_n: old_n})
 
             results.append(result)
 
@@ -540,6 +638,11 @@ class _MPSHandler(qis.QuantumStateRepresentation):
     ) -> np.ndarray:
         """Samples the MPS.
 
+        When the groups form a chain, all the repetitions are drawn in a single sweep along the
+        chain: the environments to the right of each group are contracted once, and the
+        measured axes are then sampled group by group from their conditional probabilities,
+        for all the repetitions at once.
+
         Args:
             axes: The axes to sample.
             repetitions: The number of samples to make.
@@ -547,14 +650,115 @@ class _MPSHandler(qis.QuantumStateRepresentation):
         Returns:
             The samples in order.
         """
-
-        measurements: list[list[int]] = []
         prng = value.parse_random_state(seed)
 
-        for _ in range(repetitions):
-            measurements.append(self._measure(axes, prng, collapse_state_vector=False))
+        chain = self._chain_tensors(axes)
+        if chain is None:
+            measurements: list[list[int]] = []
+            for _ in range(repetitions):
+                measurements.append(self._measure(axes, prng, collapse_state_vector=False))
+            return np.array(measurements, dtype=int)
+
+        # Draw the uniform samples in the order in which `_measure` would consume them.
+        uniforms = prng.random_sample((repetitions, len(axes)))
+        results = np.zeros((repetitions, len(axes)), dtype=int)
+
+        # The right environments R[n][r, q] of each group n, with r the ket and q the bra bond.
+        # They are identities right of the orthogonality centre.
+        right_envs = [np.ones((1, 1))]
+        for n in reversed(range(1, len(chain))):
+            A = chain[n][0]
+            a, m, u, r = A.shape
+            if self._center is not None and n > self._center:
+                right_envs.append(np.eye(a))
+                continue
+            AR = A.reshape((a * m * u, r)) @ right_envs[-1]
+            right_envs.append(AR.reshape((a, -1)) @ A.reshape((a, -1)).conj().T)
+        right_envs.reverse()
+
+        shots = np.arange(repetitions)
+        # The left environments L[s, a, b] of each repetition s, collapsed onto its samples.
+        L = np.ones((repetitions, 1, 1))
+        for (A, columns), R in zip(chain, right_envs):
+            a, m, u, r = A.shape
+            A_conj = A.conj()
+            # T[s, b, m, u, r] is the contraction of L[s, a, b] with the ket A[a, m, u, r], and
+            # AR_conj[b, m, u, r] the contraction of the bra conj(A)[b, m, u, q] with R[r, q].
+            T = (L.swapaxes(1, 2) @ A.reshape((a, -1))).reshape((repetitions, a, m, u * r))
+            AR_conj = (A_conj.reshape((-1, r)) @ R.T).reshape((a, m, u * r))
+            probs = np.sum(T * AR_conj, axis=(1, 3)).real
+            sum_probs = probs.sum(axis=1)
+            # Because the computation is approximate, the probabilities do not necessarily add
+            # up to 1.0, and thus we re-normalize them.
+            deviation = np.abs(sum_probs - 1.0)
+            if np.any(deviation > self._simulation_options.sum_prob_atol):
+                raise ValueError(
+                    f'Sum of probabilities exceeds tolerance: {sum_probs[np.argmax(deviation)]}'
+                )
+            probs = probs / sum_probs[:, np.newaxis]
+
+            # Sample the measured axes of the group one after the other.
+            index = np.zeros(repetitions, dtype=int)
+            remaining = probs
+            for column in columns:
+                d = self._qid_shape[axes[column]]
+                remaining = remaining.reshape((repetitions, d, -1))
+                cdf = np.cumsum(remaining.sum(axis=2), axis=1)
+                cdf /= cdf[:, -1:]
+                result = np.minimum(np.sum(cdf <= uniforms[:, column, np.newaxis], axis=1), d - 1)
+                remaining = remaining[shots, result]
+                results[:, column] = result
+                index = index * d + result
+
+            ket = T[shots, :, index].reshape((repetitions, a * u, r))
+            bra = A_conj[:, index].swapaxes(0, 1).reshape((repetitions, a * u, r))
+            L = ket.swapaxes(1, 2) @ bra
+            L /= (probs[shots, index] * sum_probs)[:, np.newaxis, np.newaxis]
+
+        return results
 
-        return np.array(measurements, dtype=int)
+    def _chain_tensors(self, axes: Sequence[int]) -> list[tuple[np.ndarray, list[int]]] | None:
+        """Returns the tensors of the groups as arrays, if the groups form a chain.
+
+        Each tensor of group n is returned as an array A[l, m, u, r], with l the bond to group
+        n - 1, m the flattened measured axes of the group, u its other axes flattened, and r the
+        bond to group n + 1, together with the positions in `axes` of the measured axes of the
+        group. Missing bonds have dimension 1.
+
+        Args:
+            axes: The measured axes.
+
+        Returns:
+            The arrays and positions for each group, or None if some groups which are not
+            neighbours share a bond.
+        """
+        group_axes: dict[int, list[int]] = {}
+        for axis, n in self._grouping.items():
+            group_axes.setdefault(n, []).append(axis)
+        chain = []
+        for n, tensor in enumerate(self._M):
+            left = self.mu_str(n - 1, n)
+            right = self.mu_str(n, n + 1)
+            physical = [self.i_str(axis) for axis in group_axes.get(n, [])]
+            if any(ind not in (left, right, *physical) for ind in tensor.inds):
+                return None
+            columns = [j for j, axis in enumerate(axes) if self._grouping[axis] == n]
+            measured = [self.i_str(axes[j]) for j in columns]
+            unmeasured = [ind for ind in physical if ind not in measured]
+            inds = [ind for ind in (left, *measured, *unmeasured, right) if ind in tensor.inds]
+            data = np.asarray(tensor.transpose(*inds).data)
+            shape = [
+                tensor.ind_size(left) if left in tensor.inds else 1,
+                math.prod(tensor.ind_size(ind) for ind in measured),
+                math.prod(tensor.ind_size(ind) for ind in unmeasured),
+                tensor.ind_size(right) if right in tensor.inds else 1,
+            ]
+            chain.append((data.reshape(shape), columns))
+        return chain
+
+
+def _norm(tensor: qtn.Tensor) -> float:
+    return float(np.linalg.norm(tensor.data))
 
 
 @value.value_equality
@@ -651,6 +855,18 @@ class MPSState(SimulationState[_MPSHandler]):
         """Returns some statistics about the memory usage and quality of the approximation."""
         return self._state.estimation_stats()
 
+    def discarded_weights(self) -> dict[tuple[int, int], float]:
+        """Returns the relative weights discarded by the truncations of each bond.
+
+        The weights are only tracked while the MPS is in canonical form, which is lost after
+        a gate between groups which are not neighbours.
+
+        Returns:
+            The sum of the relative weights discarded by the truncations of each bond, keyed on
+            the pairs of groups it connects.
+        """
+        return self._state.discarded_weights()
+
     @property
     def M(self) -> list[qtn.Tensor]:
         return self._state._M
@@ -107,6 +107,124 @@ def test_grouping() -> None:
             )
 
 
+def _brickwork_circuit(qubits, depth: int, seed: int = 0) -> cirq.Circuit:
+    rs = np.random.RandomState(seed)
+    circuit = cirq.Circuit()
+    for layer in range(depth):
+        circuit.append(
+            cirq.Moment(
+                cirq.PhasedXZGate(
+                    x_exponent=rs.rand(), z_exponent=rs.rand(), axis_phase_exponent=rs.rand()
+                ).on(q)
+                for q in qubits
+            )
+        )
+        circuit.append(
+            cirq.Moment(
+                cirq.FSimGate(0.5, 0.3).on(a, b)
+                for a, b in zip(qubits[layer % 2 :: 2], qubits[layer % 2 + 1 :: 2])
+            )
+        )
+    return circuit
+
+
+def test_canonical_form_is_maintained() -> None:
+    qubits = cirq.LineQubit.range(6)
+    circuit = _brickwork_circuit(qubits, depth=5)
+    simulator = ccq.mps_simulator.MPSSimulator(
+        simulation_options=ccq.mps_simulator.MPSOptions(cutoff=1e-12)
+    )
+    state = simulator.simulate(circuit).final_state
+    handler = state._state
+    assert handler._center is not None
+    for n, tensor in enumerate(state.M):
+        if n == handler._center:
+            continue
+        bond = state.mu_str(n, n + 1) if n < handler._center else state.mu_str(n - 1, n)
+        other = tuple(ind for ind in tensor.inds if ind != bond)
+        matrix = tensor.transpose(*other, bond).data.reshape((-1, tensor.ind_size(bond)))
+        np.testing.assert_allclose(matrix.conj().T @ matrix, np.eye(matrix.shape[1]), atol=1e-6)
+    np.testing.assert_allclose(
+        state.to_numpy(), cirq.final_state_vector(circuit, qubit_order=qubits), atol=1e-4
+    )
+
+
+def test_discarded_weights_estimate_fidelity() -> None:
+    qubits = cirq.LineQubit.range(8)
+    circuit = _brickwork_circuit(qubits, depth=8)
+    simulator = ccq.mps_simulator.MPSSimulator(
+        simulation_options=ccq.mps_simulator.MPSOptions(max_bond=4, cutoff=1e-12)
+    )
+    state = simulator.simulate(circuit, qubit_order=qubits).final_state
+
+    weights = state.discarded_weights()
+    assert set(weights) <= {(i, i + 1) for i in range(7)}
+    assert all(w >= 0 for w in weights.values())
+    assert sum(weights.values()) > 0.001
+
+    mps = state.to_numpy()
+    expected = cirq.final_state_vector(circuit, qubit_order=qubits)
+    fidelity = abs(np.vdot(expected, mps)) ** 2 / np.vdot(mps, mps).real
+    estimated_fidelity = np.prod([1 - e for e in state._state._estimated_gate_error_list])
+    assert fidelity < 0.999
+    np.testing.assert_allclose(estimated_fidelity, fidelity, rtol=0.05)
+    assert state.estimation_stats()['estimated_fidelity'] == round(estimated_fidelity, 3)
+
+
+def test_non_neighboring_groups_are_not_canonical() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.CNOT(q0, q2))
+    simulator = ccq.mps_simulator.MPSSimulator(
+        simulation_options=ccq.mps_simulator.MPSOptions(cutoff=1e-5)
+    )
+    state = simulator.simulate(circuit).final_state
+    assert state._state._center is None
+    assert state._state._estimated_gate_error_list[-1] == 1e-5
+    assert set(state.discarded_weights()) == {(0, 1)}
+    np.testing.assert_allclose(
+        state.partial_trace({q1}), np.diag([0.5, 0.5]).astype(np.complex128), atol=1e-6
+    )
+
+
+def test_max_bond_schedule() -> None:
+    qubits = cirq.LineQubit.range(8)
+    circuit = _brickwork_circuit(qubits, depth=8)
+
+    def max_bond_dimension(schedule):
+        simulator = ccq.mps_simulator.MPSSimulator(
+            simulation_options=ccq.mps_simulator.MPSOptions(
+                max_bond_schedule=schedule, cutoff=1e-12
+            )
+        )
+        dims = []
+        for step in simulator.simulate_moment_steps(circuit):
+            sizes = {ind: size for t in step.state.M for ind, size in zip(t.inds, t.shape)}
+            dims.append(max(sizes.get(step.state.mu_str(i, i + 1), 1) for i in range(7)))
+        return dims
+
+    assert max(max_bond_dimension([4])) == 4
+    dims = max_bond_dimension([None] * 8 + [2])
+    assert max(dims[:8]) > 4
+    assert dims[-1] == 2
+
+    with pytest.raises(ValueError, match='must not be empty'):
+        _ = ccq.mps_simulator.MPSOptions(max_bond_schedule=[])
+
+
+def test_measure_grouped_qubits() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(q0), cirq.CNOT(q0, q1), cirq.CNOT(q1, q2), cirq.measure(q1, key='m'), cirq.X(q2)
+    )
+    simulator = ccq.mps_simulator.MPSSimulator(grouping={q0: 0, q1: 0, q2: 1}, seed=1)
+    for _ in range(5):
+        result = simulator.simulate(circuit)
+        m = result.measurements['m'][0]
+        vector = np.zeros(8)
+        vector[m * 0b110 + (1 - m)] = 1
+        np.testing.assert_allclose(abs(result.final_state.to_numpy()), vector, atol=1e-6)
+
+
 def test_grouping_does_not_overlap() -> None:
     q0, q1 = cirq.LineQubit.range(2)
     mps_simulator = ccq.mps_simulator.MPSSimulator(grouping={q0: 0})
@@ -151,6 +269,8 @@ def test_probs_dont_sum_up_to_one() -> None:
 
     with pytest.raises(ValueError, match="Sum of probabilities exceeds tolerance"):
         simulator.run(circuit, repetitions=1)
+    with pytest.raises(ValueError, match="Sum of probabilities exceeds tolerance"):
+        simulator.simulate(circuit)
 
 
 def test_empty() -> None:
@@ -403,6 +523,83 @@ def test_sample_seed() -> None:
     assert result_string == '01011001110111011011'
 
 
+def _sampled_distribution(samples: np.ndarray, qid_shape: tuple[int, ...]) -> np.ndarray:
+    indices = np.ravel_multi_index(tuple(samples.T), qid_shape)
+    return np.bincount(indices, minlength=math.prod(qid_shape)) / len(samples)
+
+
+@pytest.mark.parametrize(
+    'grouping', [None, {0: 0, 1: 0, 2: 1, 3: 2}, {0: 0, 1: 1, 2: 1, 3: 1}, {0: 0, 1: 0, 2: 0, 3: 0}]
+)
+def test_sample_matches_state_vector(grouping) -> None:
+    qubits = [*cirq.LineQubit.range(3), cirq.LineQid(3, dimension=3)]
+    circuit = cirq.Circuit(
+        cirq.Moment(cirq.ry(0.3 + 0.4 * i).on(q) for i, q in enumerate(qubits[:3])),
+        cirq.CNOT(qubits[0], qubits[1]),
+        cirq.ISWAP(qubits[1], qubits[2]) ** 0.3,
+        cirq.MatrixGate(cirq.testing.random_unitary(6, random_state=1), qid_shape=(2, 3)).on(
+            qubits[2], qubits[3]
+        ),
+    )
+    simulator = ccq.mps_simulator.MPSSimulator(
+        grouping=None if grouping is None else {qubits[k]: v for k, v in grouping.items()}
+    )
+    state = simulator.simulate(circuit, qubit_order=qubits).final_state
+    expected = np.abs(cirq.final_state_vector(circuit, qubit_order=qubits)) ** 2
+
+    axes = [3, 0, 2, 1]
+    samples = state._state.sample(axes, repetitions=20_000, seed=1234)
+    assert samples.shape == (20_000, 4)
+    ordered = samples[:, np.argsort(axes)]
+    np.testing.assert_allclose(
+        _sampled_distribution(ordered, (2, 2, 2, 3)), expected.ravel(), atol=0.01
+    )
+
+    marginal = state._state.sample([2, 3], repetitions=20_000, seed=1234)
+    np.testing.assert_allclose(
+        _sampled_distribution(marginal, (2, 3)), expected.reshape((4, 6)).sum(axis=0), atol=0.01
+    )
+
+
+def test_sample_same_as_sequential_measurements() -> None:
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(
+        cirq.H.on_each(*qubits),
+        [cirq.CZ(a, b) ** 0.5 for a, b in zip(qubits, qubits[1:])],
+        cirq.Moment(cirq.rx(0.2 * i).on(q) for i, q in enumerate(qubits)),
+    )
+    state = ccq.mps_simulator.MPSSimulator().simulate(circuit).final_state._state
+    prng = np.random.RandomState(5)
+    expected = [state._measure(range(4), prng, collapse_state_vector=False) for _ in range(50)]
+    np.testing.assert_equal(state.sample(range(4), repetitions=50, seed=5), expected)
+
+
+def test_sample_non_neighboring_groups() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q2), cirq.X(q1))
+    state = ccq.mps_simulator.MPSSimulator().simulate(circuit).final_state._state
+    assert state._chain_tensors([0, 1, 2]) is None
+    samples = state.sample([0, 1, 2], repetitions=100, seed=1)
+    assert samples.shape == (100, 3)
+    np.testing.assert_equal(samples[:, 0], samples[:, 2])
+    assert np.all(samples[:, 1] == 1)
+    assert 0 < np.sum(samples[:, 0]) < 100
+
+
+def test_run_samples_long_chain() -> None:
+    qubits = cirq.LineQubit.range(40)
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        [cirq.CNOT(a, b) for a, b in zip(qubits, qubits[1:])],
+        cirq.measure(*qubits, key='m'),
+    )
+    result = ccq.mps_simulator.MPSSimulator(seed=1).run(circuit, repetitions=1000)
+    measurements = result.measurements['m']
+    assert measurements.shape == (1000, 40)
+    assert np.all(measurements == measurements[:, :1])
+    assert 400 < np.sum(measurements[:, 0]) < 600
+
+
 def test_run_no_repetitions() -> None:
     q0 = cirq.LineQubit(0)
     simulator = ccq.mps_simulator.MPSSimulator()
@@ -9,6 +9,7 @@ import quimb
 import quimb.tensor as qtn
 
 import cirq
+from cirq.contrib.quimb.compiled_network import compile_network
 
 if TYPE_CHECKING:
     import numpy as np
@@ -79,31 +80,35 @@ def circuit_to_tensors(
 def tensor_state_vector(
     circuit: cirq.Circuit, qubits: Sequence[cirq.Qid] | None = None
 ) -> np.ndarray:
-    """Given a circuit contract a tensor network into a final state vector."""
+    """Given a circuit contract a tensor network into a final state vector.
+
+    The contraction path is cached, and reused for circuits with the same structure.
+    """
     if qubits is None:
         qubits = sorted(circuit.all_qubits())
 
     tensors, qubit_frontier, _ = circuit_to_tensors(circuit=circuit, qubits=qubits)
-    tn = qtn.TensorNetwork(tensors)
     f_inds = tuple(f'i{qubit_frontier[q]}_q{q}' for q in qubits)
-    tn.contract(inplace=True)
-    return tn.to_dense(f_inds)
+    network = compile_network(tensors, f_inds)
+    return network.contract([t.data for t in tensors]).reshape(-1)
 
 
 def tensor_unitary(circuit: cirq.Circuit, qubits: Sequence[cirq.Qid] | None = None) -> np.ndarray:
     """Given a circuit contract a tensor network into a dense unitary
-    of the circuit."""
+    of the circuit.
+
+    The contraction path is cached, and reused for circuits with the same structure.
+    """
     if qubits is None:
         qubits = sorted(circuit.all_qubits())
 
     tensors, qubit_frontier, _ = circuit_to_tensors(
         circuit=circuit, qubits=qubits, initial_state=None
     )
-    tn = qtn.TensorNetwork(tensors)
     i_inds = tuple(f'i0_q{q}' for q in qubits)
     f_inds = tuple(f'i{qubit_frontier[q]}_q{q}' for q in qubits)
-    tn.contract(inplace=True)
-    return tn.to_dense(f_inds, i_inds)
+    network = compile_network(tensors, f_inds + i_inds)
+    return network.contract([t.data for t in tensors]).reshape((2 ** len(qubits),) * 2)
 
 
 def circuit_for_expectation_value(
@@ -135,6 +140,9 @@ def tensor_expectation_value(
     contraction.
 
     This will give up if it looks like the computation will take too much RAM.
+
+    The contraction path is cached, and reused for circuits with the same structure, e.g.
+    for the circuits of a variational algorithm with different parameters.
     """
     circuit_sand = circuit_for_expectation_value(circuit, pauli_string / pauli_string.coefficient)
     qubits = sorted(circuit_sand.all_qubits())
@@ -146,15 +154,12 @@ def tensor_expectation_value(
         )
         for q in qubits
     ]
-    tn = qtn.TensorNetwork(tensors + end_bras)
-    tn.rank_simplify(inplace=True)
-    path_info = tn.contract(get='path-info')
-    ram_gb = path_info.largest_intermediate * 128 / 8 / 1024 / 1024 / 1024
+    tensors += end_bras
+    network = compile_network(tensors)
+    ram_gb = network.largest_intermediate * 128 / 8 / 1024 / 1024 / 1024
     if ram_gb > max_ram_gb:
         raise MemoryError(f"We estimate that this contraction will take too much RAM! {ram_gb} GB")
-    e_val = tn.contract(inplace=True)
-    if isinstance(e_val, qtn.TensorNetwork):
-        e_val = e_val.item()
+    e_val = complex(network.contract([t.data for t in tensors]))
     assert e_val.imag < tol
     assert cast(complex, pauli_string.coefficient).imag < tol
     return e_val.real * pauli_string.coefficient
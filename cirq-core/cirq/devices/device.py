@@ -18,13 +18,16 @@ import abc
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
-import networkx as nx
-
 from cirq import value
+from cirq._import import LazyLoader
 
 if TYPE_CHECKING:
+    import networkx as nx
+
     import cirq
 
+nx = LazyLoader("nx", globals(), "networkx")
+
 
 class Device(metaclass=abc.ABCMeta):
     """Hardware constraints for validating circuits.
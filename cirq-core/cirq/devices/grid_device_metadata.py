@@ -19,11 +19,12 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping
 from typing import cast, TYPE_CHECKING
 
-import networkx as nx
-
 from cirq import value
+from cirq._import import LazyLoader
 from cirq.devices import device
 
+nx = LazyLoader("nx", globals(), "networkx")
+
 if TYPE_CHECKING:
     import cirq
 
@@ -20,6 +20,7 @@ from typing import Any, TYPE_CHECKING
 
 from cirq import devices
 from cirq.devices import noise_utils
+from cirq.devices.noise_model import _NoiseCache
 
 if TYPE_CHECKING:
     import cirq
@@ -50,8 +51,24 @@ class InsertionNoiseModel(devices.NoiseModel):
     )
     prepend: bool = False
     require_physical_tag: bool = True
+    _noise_cache: _NoiseCache = dataclasses.field(
+        default_factory=_NoiseCache, init=False, repr=False, compare=False
+    )
+    _cached_options: tuple | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def noisy_moment(self, moment: cirq.Moment, system_qubits: Sequence[cirq.Qid]) -> cirq.OP_TREE:
+        # The options are public attributes, so discard the cached noise if they were modified.
+        options = (self.prepend, self.require_physical_tag, list(self.ops_added.items()))
+        if options != self._cached_options:
+            self._noise_cache.clear()
+            self._cached_options = options
+        return self._noise_cache.noisy_moment(self._noisy_moment, moment, system_qubits)
+
+    def _noisy_moment(
+        self, moment: cirq.Moment, system_qubits: Sequence[cirq.Qid]
+    ) -> list[cirq.Moment]:
         noise_ops: list[cirq.Operation] = []
         candidate_ops = [
             op
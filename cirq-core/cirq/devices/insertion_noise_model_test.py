@@ -114,3 +114,18 @@ def test_supertype_matching() -> None:
     assert model.noisy_moment(moment_1, system_qubits=[q0]) == [moment_1, cirq.Moment(cirq.T(q0))]
 
     cirq.testing.assert_equivalent_repr(model)
+
+
+def test_noise_of_modified_model() -> None:
+    q0 = cirq.LineQubit(0)
+    model = InsertionNoiseModel(
+        {OpIdentifier(cirq.XPowGate, q0): cirq.T(q0)}, require_physical_tag=False
+    )
+    moment = cirq.Moment(cirq.X(q0))
+    assert model.noisy_moment(moment, [q0]) == [moment, cirq.Moment(cirq.T(q0))]
+    assert model.noisy_moment(moment, [q0]) == [moment, cirq.Moment(cirq.T(q0))]
+
+    model.ops_added = {OpIdentifier(cirq.XPowGate, q0): cirq.H(q0)}
+    assert model.noisy_moment(moment, [q0]) == [moment, cirq.Moment(cirq.H(q0))]
+    model.prepend = True
+    assert model.noisy_moment(moment, [q0]) == [cirq.Moment(cirq.H(q0)), moment]
@@ -20,16 +20,20 @@ from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any, TYPE_CHECKING, Union
 
-import networkx as nx
-from matplotlib import pyplot as plt
-
 from cirq import _compat
+from cirq._import import LazyLoader
 from cirq.devices import GridQubit, LineQubit
 from cirq.protocols.json_serialization import dataclass_json_dict
 
 if TYPE_CHECKING:
+    import networkx as nx
+    from matplotlib import pyplot as plt
+
     import cirq
 
+nx = LazyLoader("nx", globals(), "networkx")
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
+
 
 class NamedTopology(metaclass=abc.ABCMeta):
     """A topology (graph) with a name.
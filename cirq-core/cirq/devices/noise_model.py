@@ -14,8 +14,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Sequence
-from typing import Any, TYPE_CHECKING, Union
+import collections
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Any, TYPE_CHECKING, TypeVar, Union
 
 from cirq import ops, protocols, value
 from cirq._doc import document
@@ -26,6 +27,8 @@ moment_module = LazyLoader("moment_module", globals(), "cirq.circuits.moment")
 if TYPE_CHECKING:
     import cirq
 
+T = TypeVar('T')
+
 
 class NoiseModel(metaclass=value.ABCMetaImplementAnyOneOf):
     """Replaces operations and moments with noisy counterparts.
@@ -175,6 +178,54 @@ class NoiseModel(metaclass=value.ABCMetaImplementAnyOneOf):
         raise NotImplementedError
 
 
+class _NoiseCache:
+    """A bounded memo of the noise added by a stateless noise model, keyed on its inputs.
+
+    Noise models whose noise only depends on the moment and the system qubits use it to build
+    the noisy version of each distinct moment once, and to share the noise operations, and
+    their channels, between the moments.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._entries: collections.OrderedDict[Hashable, Any] = collections.OrderedDict()
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Returns the value cached for `key`, computing and caching it first if missing.
+
+        Values of unhashable keys, e.g. of moments containing unhashable gates, are computed
+        but not cached.
+        """
+        try:
+            cached = key in self._entries
+        except TypeError:
+            return compute()
+        if cached:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        result = compute()
+        self._entries[key] = result
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def noisy_moment(
+        self,
+        noisy_moment: Callable[[cirq.Moment, Sequence[cirq.Qid]], cirq.OP_TREE],
+        moment: cirq.Moment,
+        system_qubits: Sequence[cirq.Qid],
+    ) -> cirq.OP_TREE:
+        """Returns `noisy_moment(moment, system_qubits)`, reusing the result for equal inputs."""
+        result = self.get(
+            (moment, tuple(system_qubits)), lambda: noisy_moment(moment, system_qubits)
+        )
+        # Callers may modify the returned list.
+        return list(result) if isinstance(result, list) else result
+
+
 @value.value_equality
 class _NoNoiseModel(NoiseModel):
     """A default noise model that adds no noise."""
@@ -229,6 +280,7 @@ class ConstantQubitNoiseModel(NoiseModel):
             raise ValueError('noise.num_qubits() != 1')
         self.qubit_noise_gate = qubit_noise_gate
         self._prepend = prepend
+        self._noise_cache = _NoiseCache()
 
     def _value_equality_values_(self) -> Any:
         return self.qubit_noise_gate
@@ -240,12 +292,14 @@ class ConstantQubitNoiseModel(NoiseModel):
         # Noise should not be appended to previously-added noise.
         if self.is_virtual_moment(moment):
             return moment
-        output = [
-            moment,
-            moment_module.Moment(
+        # The noise moment only depends on the system qubits, so it is shared by all moments.
+        noise_moment = self._noise_cache.get(
+            (self.qubit_noise_gate, tuple(system_qubits)),
+            lambda: moment_module.Moment(
                 [self.qubit_noise_gate(q).with_tags(ops.VirtualTag()) for q in system_qubits]
             ),
-        ]
+        )
+        output = [moment, noise_moment]
         return output[::-1] if self._prepend else output
 
     def _json_dict_(self) -> dict[str, Any]:
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from typing import cast
 
 import numpy as np
 import pytest
@@ -147,6 +148,22 @@ def test_constant_qubit_noise_prepend() -> None:
     cirq.testing.assert_equivalent_repr(damp_all)
 
 
+def test_constant_qubit_noise_shares_noise_moments() -> None:
+    a, b = cirq.LineQubit.range(2)
+    damp_all = cirq.ConstantQubitNoiseModel(cirq.amplitude_damp(0.5))
+    first, second = cast(
+        list[list[cirq.Moment]],
+        damp_all.noisy_moments([cirq.Moment([cirq.X(a)]), cirq.Moment()], [a, b]),
+    )
+    assert first[1] is second[1]
+
+    damp_all.qubit_noise_gate = cirq.phase_damp(0.5)
+    third = cast(list[cirq.Moment], damp_all.noisy_moment(cirq.Moment(), [a, b]))
+    assert third[1] == cirq.Moment(
+        op.with_tags(ops.VirtualTag()) for op in cirq.phase_damp(0.5).on_each(a, b)
+    )
+
+
 def test_noise_composition() -> None:
     # Verify that noise models can be composed without regard to ordering, as
     # long as the noise operators commute with one another.
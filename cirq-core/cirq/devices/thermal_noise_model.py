@@ -24,6 +24,7 @@ import sympy
 from cirq import devices, ops, protocols, qis, value
 from cirq._compat import proper_repr
 from cirq._import import LazyLoader
+from cirq.devices.noise_model import _NoiseCache
 from cirq.devices.noise_utils import PHYSICAL_GATE_TAG
 
 if TYPE_CHECKING:
@@ -228,6 +229,11 @@ class ThermalNoiseModel(devices.NoiseModel):
         self.require_physical_tag: bool = require_physical_tag
         self.skip_measurements: bool = skip_measurements
         self._prepend = prepend
+        # [gate type] : duration in ns, or None if the gate type has no duration
+        self._durations_by_type: dict[type, float | None] = {}
+        self._noisy_moments = _NoiseCache()
+        self._noise_moments = _NoiseCache()
+        self._cached_options: tuple | None = None
 
     def _value_equality_values_(self):
         gate_durations_ns_tuple = tuple(
@@ -261,7 +267,50 @@ class ThermalNoiseModel(devices.NoiseModel):
             f"skip_measurements={self.skip_measurements!r}, prepend={self._prepend!r})"
         )
 
+    def _duration_of_gate_type(self, gate_type: type) -> float | None:
+        if gate_type not in self._durations_by_type:
+            self._durations_by_type[gate_type] = next(
+                (
+                    duration
+                    for key, duration in self.gate_durations_ns.items()
+                    # TODO: remove assumption of same time across qubits
+                    if issubclass(gate_type, key)
+                ),
+                None,
+            )
+        return self._durations_by_type[gate_type]
+
+    def _noise_moment(
+        self, system_qubits: tuple[cirq.Qid, ...], moment_ns: float, skipped: frozenset[cirq.Qid]
+    ) -> cirq.Moment | None:
+        noise_ops: list[cirq.Operation] = []
+        for qubit in system_qubits:
+            if qubit in skipped:
+                continue
+            rates = self.rate_matrix_GHz[qubit] * moment_ns
+            kraus_ops = _kraus_ops_from_rates(tuple(rates.reshape(-1)), rates.shape)
+            noise_ops.append(ops.KrausChannel(kraus_ops).on(qubit))
+        return moment_module.Moment(noise_ops) if noise_ops else None
+
     def noisy_moment(self, moment: cirq.Moment, system_qubits: Sequence[cirq.Qid]) -> cirq.OP_TREE:
+        # The options are public attributes, so discard the cached noise if they were modified.
+        options = (
+            self.require_physical_tag,
+            self.skip_measurements,
+            self._prepend,
+            tuple(self.gate_durations_ns.items()),
+            tuple((q, tuple(m.flat)) for q, m in self.rate_matrix_GHz.items()),
+        )
+        if options != self._cached_options:
+            self._durations_by_type.clear()
+            self._noisy_moments.clear()
+            self._noise_moments.clear()
+            self._cached_options = options
+        return self._noisy_moments.noisy_moment(self._noisy_moment, moment, system_qubits)
+
+    def _noisy_moment(
+        self, moment: cirq.Moment, system_qubits: Sequence[cirq.Qid]
+    ) -> list[cirq.Moment]:
         if not moment.operations:
             return [moment]
         if self.require_physical_tag:
@@ -276,19 +325,12 @@ class ThermalNoiseModel(devices.NoiseModel):
                 # Only moments with physical operations should have noise.
                 return [moment]
 
-        noise_ops: list[cirq.Operation] = []
         # Some devices (including Google hardware) require that all gates have
         # the same duration, but this does not. Instead, each moment is assumed
         # to be as long as the longest gate it contains.
         moment_ns: float = 0
         for op in moment:
-            op_duration: float | None = None
-            for key, duration in self.gate_durations_ns.items():
-                if not issubclass(type(op.gate), key):
-                    continue  # gate type doesn't match
-                # TODO: remove assumption of same time across qubits
-                op_duration = duration
-                break
+            op_duration = self._duration_of_gate_type(type(op.gate))
             if op_duration is None and isinstance(op.gate, ops.WaitGate):
                 # special case for wait gates if not predefined
                 nanos = op.gate.duration.total_nanos()
@@ -301,16 +343,22 @@ class ThermalNoiseModel(devices.NoiseModel):
         if moment_ns == 0:
             return [moment]
 
-        for qubit in system_qubits:
-            qubit_op = moment.operation_at(qubit)
-            if self.skip_measurements and protocols.is_measurement(qubit_op):
-                continue
-            rates = self.rate_matrix_GHz[qubit] * moment_ns
-            kraus_ops = _kraus_ops_from_rates(tuple(rates.reshape(-1)), rates.shape)
-            noise_ops.append(ops.KrausChannel(kraus_ops).on(qubit))
-        if not noise_ops:
+        skipped = frozenset(
+            q
+            for op in (moment if self.skip_measurements else ())
+            if protocols.is_measurement(op)
+            for q in op.qubits
+        )
+        # The noise only depends on the duration of the moment and on the measured qubits, so
+        # it is shared by all moments of the same duration.
+        system_qubits = tuple(system_qubits)
+        noise_moment = self._noise_moments.get(
+            (system_qubits, moment_ns, skipped),
+            lambda: self._noise_moment(system_qubits, moment_ns, skipped),
+        )
+        if noise_moment is None:
             return [moment]
-        output = [moment, moment_module.Moment(noise_ops)]
+        output = [moment, noise_moment]
         return output[::-1] if self._prepend else output
 
     def _json_dict_(self) -> dict[str, object]:
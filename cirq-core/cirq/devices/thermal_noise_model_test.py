@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+from typing import cast
+
 import numpy as np
 import pytest
 import sympy
@@ -348,6 +350,41 @@ def test_noisy_moment_two_qubit() -> None:
     )
 
 
+def test_noisy_moments_share_noise() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    model = ThermalNoiseModel(
+        qubits={q0, q1},
+        gate_durations_ns={cirq.PhasedXZGate: 25.0, cirq.CZPowGate: 32.0},
+        cool_rate_GHz=1e-4,
+        require_physical_tag=False,
+    )
+    xz = cirq.PhasedXZGate(x_exponent=0.5, z_exponent=0, axis_phase_exponent=0)
+    moments = [
+        cirq.Moment(xz.on(q0)),
+        cirq.Moment(xz.on(q1)),
+        cirq.Moment(cirq.CZ(q0, q1)),
+        cirq.Moment(xz.on(q0)),
+    ]
+    noisy = cast(list[list[cirq.Moment]], model.noisy_moments(moments, system_qubits=[q0, q1]))
+    # Moments of the same duration share their noise, and equal moments their result.
+    assert noisy[0][1] is noisy[1][1]
+    assert noisy[0][1] is not noisy[2][1]
+    assert noisy[0] == noisy[3] and noisy[0] is not noisy[3]
+
+    model.gate_durations_ns[cirq.PhasedXZGate] = 32.0
+    noisy_moment = cast(list[cirq.Moment], model.noisy_moment(moments[0], system_qubits=[q0, q1]))
+    assert noisy_moment[1] == noisy[2][1]
+
+    model.rate_matrix_GHz[q0] = 2 * model.rate_matrix_GHz[q0]
+    noisy_moment = cast(list[cirq.Moment], model.noisy_moment(moments[0], system_qubits=[q0, q1]))
+    assert noisy_moment[1] != noisy[2][1]
+    assert noisy_moment[1].operation_at(q1) == noisy[2][1].operation_at(q1)
+
+    model.rate_matrix_GHz[q0][:] = model.rate_matrix_GHz[q1]
+    noisy_moment = cast(list[cirq.Moment], model.noisy_moment(moments[0], system_qubits=[q0, q1]))
+    assert noisy_moment[1] == noisy[2][1]
+
+
 def test_repr() -> None:
     q0 = cirq.LineQubit(0)
     model = ThermalNoiseModel(
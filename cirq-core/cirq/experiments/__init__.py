@@ -44,7 +44,9 @@ from cirq.experiments.random_quantum_circuit_generation import (
     GRID_STAGGERED_PATTERN as GRID_STAGGERED_PATTERN,
     HALF_GRID_STAGGERED_PATTERN as HALF_GRID_STAGGERED_PATTERN,
     GridInteractionLayer as GridInteractionLayer,
+    generate_frozen_library_of_2q_circuits as generate_frozen_library_of_2q_circuits,
     random_rotations_between_grid_interaction_layers_circuit as random_rotations_between_grid_interaction_layers_circuit,  # noqa: E501
+    random_rotations_between_grid_interaction_layers_circuits as random_rotations_between_grid_interaction_layers_circuits,  # noqa: E501
 )
 
 from cirq.experiments.readout_confusion_matrix import (
@@ -21,14 +21,16 @@ from concurrent import futures
 from typing import overload, TYPE_CHECKING, Union
 
 import attrs
-import networkx as nx
 import numpy as np
-import pandas as pd
 
 import cirq.experiments.random_quantum_circuit_generation as rqcg
 import cirq.experiments.two_qubit_xeb as tqxeb
 import cirq.experiments.xeb_fitting as xeb_fitting
 from cirq import circuits, devices, ops, protocols, sim, value
+from cirq._import import LazyLoader
+
+nx = LazyLoader("nx", globals(), "networkx")
+pd = LazyLoader("pd", globals(), "pandas")
 
 if TYPE_CHECKING:
     import cirq
@@ -380,72 +382,65 @@ def sample_all_circuits(
     sampling_results = []
     for (result,) in sampler.run_batch(programs=circuits, repetitions=repetitions):
         record = {}
-        for key in result.data.keys():
-            values = result.data[key]
-            sampled_probs = np.bincount(values, minlength=4) / len(values)
-            record[key] = sampled_probs
+        for key, bits in result.measurements.items():
+            # Pack the measured bits of the pair into big endian integers.
+            values = bits.astype(np.intp) @ (1 << np.arange(bits.shape[1] - 1, -1, -1))
+            record[key] = np.bincount(values, minlength=4) / len(values)
         sampling_results.append(record)
     return sampling_results
 
 
-def _reshape_sampling_results(
-    sampling_results: Sequence[dict[str, np.ndarray]],
+def _sampled_probabilities_array(
+    sampling_results: Iterable[Mapping[str, np.ndarray]],
     cycle_depths: Sequence[int],
-    wide_circuits_info: Sequence[XEBWideCircuitInfo],
+    wide_circuits_info: Iterable[XEBWideCircuitInfo],
     pairs: Sequence[_QUBIT_PAIR_T],
     num_templates: int,
-) -> _PROBABILITIES_DICT_T:
+) -> np.ndarray:
+    """Gathers the sampled probabilities into a (pair, cycle depth, template, 4) array.
+
+    The sampling results are consumed one at a time, so they can be streamed. The probabilities
+    of the (pair, cycle depth, template) combinations which were not sampled are NaN.
+    """
     cycle_depth_to_index = {d: i for i, d in enumerate(cycle_depths)}
-    sampled_probabilities = {
-        pair: [[np.empty(0)] * num_templates for _ in range(len(cycle_depths))] for pair in pairs
-    }
+    # [pair] : (index of the pair, measurement key of the pair)
+    pair_to_index_and_key = {pair: (i, str(pair)) for i, pair in enumerate(pairs)}
+    sampled_probabilities = np.full((len(pairs), len(cycle_depths), num_templates, 4), np.nan)
 
     for sampling_result, info in zip(sampling_results, wide_circuits_info, strict=True):
         cycle_depth = info.cycle_depth
         assert cycle_depth is not None
         cycle_idx = cycle_depth_to_index[cycle_depth]
+        # The pairs of `info` are canonized on construction.
         for template_idx, pair in zip(info.narrow_template_indices, info.pairs, strict=True):
-            pair = _canonize_pair(pair)
-            key = str(pair)
-            sampled_prob = sampling_result.get(key, np.empty(0))
-            sampled_probabilities[pair][cycle_idx][template_idx] = sampled_prob
+            if pair not in pair_to_index_and_key:
+                continue
+            pair_idx, key = pair_to_index_and_key[pair]
+            sampled_prob = sampling_result.get(key)
+            if sampled_prob is None:
+                continue
+            assert (
+                len(sampled_prob) == 4
+            ), f'{pair=} {cycle_depth=} {template_idx=}: {sampled_prob=}'
+            sampled_probabilities[pair_idx, cycle_idx, template_idx] = sampled_prob
     return sampled_probabilities
 
 
-def _reshape_simulation_results(
+def _pure_probabilities_array(
     simulation_results: (
         Sequence[Sequence[np.ndarray]] | Mapping[_QUBIT_PAIR_T, Sequence[Sequence[np.ndarray]]]
     ),
-    cycle_depths: Sequence[int],
     pairs: Sequence[_QUBIT_PAIR_T],
-    num_templates: int,
-) -> _PROBABILITIES_DICT_T:
-    cycle_depth_to_index: dict[int, int]
-    cycle_depth_to_index = {d: i for i, d in enumerate(cycle_depths)}
+) -> np.ndarray:
+    """Gathers the simulated probabilities into a (pair, cycle depth, template, 4) array.
 
+    If the simulation results are shared by all pairs, the returned array is a read-only view
+    with a zero stride along the pair axis.
+    """
     if isinstance(simulation_results, Mapping):
-        pure_probabilities = {
-            pair: [[np.empty(0)] * num_templates for _ in range(len(cycle_depths))]
-            for pair in pairs
-        }
-        for pair, simulation_result_for_pair in simulation_results.items():
-            for template_idx, template_simulation_result in enumerate(simulation_result_for_pair):
-                for cycle_depth, pure_probs in zip(
-                    cycle_depths, template_simulation_result, strict=True
-                ):
-                    cycle_idx = cycle_depth_to_index[cycle_depth]
-                    pure_probabilities[pair][cycle_idx][template_idx] = pure_probs
-
-        return pure_probabilities
-    else:
-        common_pure_probs = [[np.empty(0)] * num_templates for _ in range(len(cycle_depths))]
-        for template_idx, template_simulation_result in enumerate(simulation_results):
-            for cycle_depth, pure_probs in zip(
-                cycle_depths, template_simulation_result, strict=True
-            ):
-                cycle_idx = cycle_depth_to_index[cycle_depth]
-                common_pure_probs[cycle_idx][template_idx] = pure_probs
-        return dict.fromkeys(pairs, common_pure_probs)
+        return np.stack([np.swapaxes(np.asarray(simulation_results[pair]), 0, 1) for pair in pairs])
+    common_pure_probs = np.swapaxes(np.asarray(simulation_results), 0, 1)
+    return np.broadcast_to(common_pure_probs, (len(pairs),) + common_pure_probs.shape)
 
 
 @attrs.frozen
@@ -463,25 +458,21 @@ class XEBFidelity:
     fidelity: float
 
 
-def _cross_entropy(p: np.ndarray, q: np.ndarray, eps: float = 1e-60) -> float:
-    q[q <= 0] = eps  # for numerical stability
-    return -np.dot(p, np.log2(q))
-
-
 def estimate_fidelities(
-    sampling_results: Sequence[dict[str, np.ndarray]],
+    sampling_results: Iterable[Mapping[str, np.ndarray]],
     simulation_results: (
         Sequence[Sequence[np.ndarray]] | Mapping[_QUBIT_PAIR_T, Sequence[Sequence[np.ndarray]]]
     ),
     cycle_depths: Sequence[int],
-    wide_circuits_info: Sequence[XEBWideCircuitInfo],
+    wide_circuits_info: Iterable[XEBWideCircuitInfo],
     pairs: Sequence[_QUBIT_PAIR_T],
     num_templates: int,
 ) -> Sequence[XEBFidelity]:
     """Estimates the fidelities from the given sampling and simulation results.
 
     Args:
-        sampling_results: The result of `sample_all_circuits`.
+        sampling_results: The result of `sample_all_circuits`. This may be an iterator, e.g.
+            one reading the results from disk, which is consumed one result at a time.
         simulation_results: The result of `simulate_circuit_library`,
         cycle_depths: The sequence of cycle depths,
         wide_circuits_info: Sequence of XEBWideCircuitInfo detailing describing
@@ -492,42 +483,66 @@ def estimate_fidelities(
     Returns:
         A sequence of XEBFidelity objects.
     """
-
-    sampled_probabilities = _reshape_sampling_results(
+    sampled_probabilities = _sampled_probabilities_array(
         sampling_results, cycle_depths, wide_circuits_info, pairs, num_templates
     )
-
-    pure_probabilities = _reshape_simulation_results(
-        simulation_results, cycle_depths, pairs, num_templates
+    pure_probabilities = _pure_probabilities_array(simulation_results, pairs)
+    return estimate_fidelities_from_arrays(
+        sampled_probabilities, pure_probabilities, cycle_depths, pairs
     )
 
+
+def estimate_fidelities_from_arrays(
+    sampled_probabilities: np.ndarray,
+    pure_probabilities: np.ndarray,
+    cycle_depths: Sequence[int],
+    pairs: Sequence[_QUBIT_PAIR_T],
+    chunk_size: int = 256,
+) -> Sequence[XEBFidelity]:
+    """Estimates the fidelities from arrays of sampled and simulated probabilities.
+
+    The fidelities are computed with vectorized reductions over blocks of `chunk_size` pairs,
+    so the arrays can be memory-mapped from disk, e.g. with `np.load(path, mmap_mode='r')`,
+    without loading them into memory at once.
+
+    Args:
+        sampled_probabilities: A (pair, cycle depth, template, 4) array of the sampled
+            probabilities. Combinations which were not sampled are NaN.
+        pure_probabilities: A (pair, cycle depth, template, 4) array of the simulated
+            probabilities.
+        cycle_depths: The sequence of cycle depths, in the order of the second axis.
+        pairs: The qubit pairs, in the order of the first axis.
+        chunk_size: The number of pairs processed at once.
+
+    Returns:
+        A sequence of XEBFidelity objects.
+    """
     records = []
-    for pair in pairs:
-        for depth_idx, cycle_depth in enumerate(cycle_depths):
-            numerator = 0.0
-            denominator = 0.0
-            for template_idx in range(num_templates):
-                pure_probs = pure_probabilities[pair][depth_idx][template_idx]
-                sampled_probs = sampled_probabilities[pair][depth_idx][template_idx]
-                if len(sampled_probs) == 0:
-                    continue
-                assert (
-                    len(sampled_probs) == 4
-                ), f'{pair=} {cycle_depth=} {template_idx=}: {sampled_probs=}'
-                p_uniform = np.ones_like(pure_probs) / len(pure_probs)
-                pure_probs /= pure_probs.sum()
-                sampled_probs /= sampled_probs.sum()
-
-                h_up = _cross_entropy(p_uniform, pure_probs)  # H[uniform, pure probs]
-                h_sp = _cross_entropy(sampled_probs, pure_probs)  # H[sampled probs, pure probs]
-                h_pp = _cross_entropy(pure_probs, pure_probs)  # H[pure probs]
-
-                y = h_up - h_sp
-                x = h_up - h_pp
-                numerator += x * y
-                denominator += x**2
-            fidelity = numerator / denominator
-            records.append(XEBFidelity(pair=pair, cycle_depth=cycle_depth, fidelity=fidelity))
+    for start in range(0, len(pairs), chunk_size):
+        sampled_probs = np.asarray(sampled_probabilities[start : start + chunk_size])
+        pure_probs = np.asarray(pure_probabilities[start : start + chunk_size])
+        sampled = ~np.isnan(sampled_probs).any(axis=-1)
+        sampled_probs = np.where(sampled[..., np.newaxis], sampled_probs, 0)
+        sampled_probs = (
+            sampled_probs / np.where(sampled, sampled_probs.sum(axis=-1), 1)[..., np.newaxis]
+        )
+        pure_probs = pure_probs / pure_probs.sum(axis=-1, keepdims=True)
+        pure_probs = np.where(pure_probs <= 0, 1e-60, pure_probs)  # for numerical stability
+        log_pure_probs = np.log2(pure_probs)
+
+        h_up = -np.mean(log_pure_probs, axis=-1)  # H[uniform, pure probs]
+        h_sp = -np.sum(sampled_probs * log_pure_probs, axis=-1)  # H[sampled probs, pure probs]
+        h_pp = -np.sum(pure_probs * log_pure_probs, axis=-1)  # H[pure probs]
+        y = h_up - h_sp
+        x = np.where(sampled, h_up - h_pp, 0)
+        with np.errstate(invalid='ignore'):
+            # Pairs which were not sampled at some cycle depth get a NaN fidelity there.
+            fidelities = np.sum(x * y, axis=-1) / np.sum(x**2, axis=-1)
+        for pair, pair_fidelities in zip(pairs[start : start + chunk_size], fidelities):
+            for cycle_depth, fidelity in zip(cycle_depths, pair_fidelities):
+                records.append(
+                    XEBFidelity(pair=pair, cycle_depth=cycle_depth, fidelity=float(fidelity))
+                )
     return records
 
 
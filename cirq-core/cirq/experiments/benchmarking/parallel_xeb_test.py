@@ -328,6 +328,85 @@ def test_estimate_fidelities_with_dict_target() -> None:
     assert xeb_fidelity.fidelity == pytest.approx(0.785, abs=2e-4)
 
 
+def _random_sampling_and_simulation_results(
+    rs: np.random.RandomState, num_templates: int, cycle_depths: tuple[int, ...]
+) -> tuple[list[dict[str, np.ndarray]], list[list[np.ndarray]], list[xeb.XEBWideCircuitInfo]]:
+    simulation_results = [
+        [rs.dirichlet(np.ones(4)) for _ in cycle_depths] for _ in range(num_templates)
+    ]
+    sampling_results = []
+    wide_circuits_info = []
+    for combination in range(num_templates):
+        # Each pair sees each template once.
+        permutation = (np.arange(len(_PAIRS)) + combination) % num_templates
+        for cycle_depth in cycle_depths:
+            wide_circuits_info.append(
+                xeb.XEBWideCircuitInfo(cirq.Circuit(), _PAIRS, permutation, cycle_depth)
+            )
+            # The last pair is never sampled.
+            sampling_results.append({str(p): rs.dirichlet(np.ones(4)) for p in _PAIRS[:-1]})
+    return sampling_results, simulation_results, wide_circuits_info
+
+
+def test_estimate_fidelities_streaming_and_from_arrays(tmp_path) -> None:
+    num_templates = 4
+    cycle_depths = (1, 5, 10)
+    sampling_results, simulation_results, wide_circuits_info = (
+        _random_sampling_and_simulation_results(
+            np.random.RandomState(1), num_templates, cycle_depths
+        )
+    )
+    result = xeb.estimate_fidelities(
+        sampling_results=(r for r in sampling_results),
+        simulation_results=simulation_results,
+        cycle_depths=cycle_depths,
+        wide_circuits_info=iter(wide_circuits_info),
+        pairs=_PAIRS,
+        num_templates=num_templates,
+    )
+    assert [(f.pair, f.cycle_depth) for f in result] == list(
+        itertools.product(_PAIRS, cycle_depths)
+    )
+    fidelities = np.array([f.fidelity for f in result]).reshape((len(_PAIRS), -1))
+    assert np.all(np.isnan(fidelities[-1]))
+    assert np.all(np.isfinite(fidelities[:-1]))
+
+    # The fidelity of a pair at a cycle depth is the least squares fit over the templates.
+    pair, depth_idx = _PAIRS[1], 2
+    xs, ys = [], []
+    for sampled, info in zip(sampling_results, wide_circuits_info):
+        if info.cycle_depth != cycle_depths[depth_idx]:
+            continue
+        template_idx = info.narrow_template_indices[1]
+        pure_probs = simulation_results[template_idx][depth_idx]
+        log_pure_probs = np.log2(pure_probs)
+        h_up = -np.mean(log_pure_probs)
+        ys.append(h_up + np.dot(sampled[str(pair)], log_pure_probs))
+        xs.append(h_up + np.dot(pure_probs, log_pure_probs))
+    assert fidelities[1, depth_idx] == pytest.approx(np.dot(xs, ys) / np.dot(xs, xs))
+
+    sampled_path = tmp_path / 'sampled.npy'
+    pure_path = tmp_path / 'pure.npy'
+    np.save(
+        sampled_path,
+        xeb._sampled_probabilities_array(
+            sampling_results, cycle_depths, wide_circuits_info, _PAIRS, num_templates
+        ),
+    )
+    np.save(pure_path, xeb._pure_probabilities_array(simulation_results, _PAIRS))
+    result_from_disk = xeb.estimate_fidelities_from_arrays(
+        np.load(sampled_path, mmap_mode='r'),
+        np.load(pure_path, mmap_mode='r'),
+        cycle_depths,
+        _PAIRS,
+        chunk_size=2,
+    )
+    assert [(f.pair, f.cycle_depth) for f in result_from_disk] == list(
+        itertools.product(_PAIRS, cycle_depths)
+    )
+    np.testing.assert_allclose([f.fidelity for f in result_from_disk], fidelities.ravel())
+
+
 def _assert_fidelities_approx_equal(fids, expected: float, atol: float):
     fids = np.asarray(fids).tolist()
     fids.sort(reverse=True)
@@ -23,22 +23,23 @@ from typing import Any, cast, Optional, TYPE_CHECKING
 
 import attrs
 import numpy as np
-from matplotlib import pyplot as plt
-
-# this is for older systems with matplotlib <3.2 otherwise 3d projections fail
-from scipy.optimize import curve_fit
 
 import cirq.vis.heatmap as cirq_heatmap
 import cirq.vis.histogram as cirq_histogram
 from cirq import circuits, ops, protocols
 from cirq._compat import deprecated
+from cirq._import import LazyLoader
 from cirq.devices import grid_qubit
 
 if TYPE_CHECKING:
+    from matplotlib import pyplot as plt
     from mpl_toolkits import mplot3d
 
     import cirq
 
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
+optimize = LazyLoader("optimize", globals(), "scipy.optimize")
+
 
 def _canonize_clifford_sequences(
     sequences: list[list[ops.SingleQubitCliffordGate]],
@@ -155,7 +156,7 @@ class RandomizedBenchMarkResult:
 
     def _fit_exponential(self) -> tuple[np.ndarray, np.ndarray]:
         exp_fit = lambda x, A, B, p: A * p**x + B
-        return curve_fit(
+        return optimize.curve_fit(
             f=exp_fit,
             xdata=self._num_cfds_seq,
             ydata=self._gnd_state_probs,
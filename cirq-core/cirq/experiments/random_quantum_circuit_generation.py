@@ -277,6 +277,51 @@ def generate_library_of_2q_circuits(
     ]
 
 
+def generate_frozen_library_of_2q_circuits(
+    n_library_circuits: int,
+    two_qubit_gate: cirq.Gate,
+    *,
+    max_cycle_depth: int = 100,
+    q0: cirq.Qid = devices.LineQubit(0),
+    q1: cirq.Qid = devices.LineQubit(1),
+    random_state: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
+    tags: Sequence[Any] = (),
+) -> list[cirq.FrozenCircuit]:
+    """Generate a library of two-qubit FrozenCircuits with vectorized random choices.
+
+    The circuits have the same structure and distribution as the ones of
+    `generate_library_of_2q_circuits`, but all random single-qubit gate choices are drawn at
+    once and the circuits share their operations and two-qubit moments, which makes generating
+    large libraries much faster. The random choices are drawn in a different order, so the
+    circuits differ from the ones of `generate_library_of_2q_circuits` for the same
+    `random_state`.
+
+    Args:
+        n_library_circuits: The number of circuits to generate.
+        two_qubit_gate: The two qubit gate to use in the circuits.
+        max_cycle_depth: The maximum cycle_depth in the circuits to generate. If you are using XEB,
+            this must be greater than or equal to the maximum value in `cycle_depths`.
+        q0: The first qubit to use when constructing the circuits.
+        q1: The second qubit to use when constructing the circuits
+        random_state: A random state or seed used to deterministically sample the random circuits.
+        tags: Tags to add to the two qubit operations.
+    """
+    exponents = np.linspace(0, 7 / 4, 8)
+    single_qubit_gates = [
+        ops.PhasedXZGate(x_exponent=0.5, z_exponent=z, axis_phase_exponent=a)
+        for a, z in itertools.product(exponents, repeat=2)
+    ]
+    return _random_rotations_frozen_circuits(
+        qubits=(q0, q1),
+        two_qubit_layers=[circuits.Moment.from_ops(two_qubit_gate(q0, q1).with_tags(*tags))],
+        depth=max_cycle_depth,
+        n_circuits=n_library_circuits,
+        single_qubit_gates=single_qubit_gates,
+        add_final_single_qubit_layer=True,
+        prng=value.parse_random_state(random_state),
+    )
+
+
 def _get_active_pairs(graph: nx.Graph, grid_layer: GridInteractionLayer):
     """Extract pairs of qubits from a device graph and a GridInteractionLayer."""
     for edge in graph.edges:
@@ -608,6 +653,133 @@ def random_rotations_between_grid_interaction_layers_circuit(
     return circuit
 
 
+def random_rotations_between_grid_interaction_layers_circuits(
+    qubits: Iterable[cirq.GridQubit],
+    depth: int,
+    n_circuits: int,
+    *,  # forces keyword arguments
+    two_qubit_gate: cirq.Gate = ops.CZPowGate(),
+    pattern: Sequence[GridInteractionLayer] = GRID_STAGGERED_PATTERN,
+    single_qubit_gates: Sequence[cirq.Gate] = (
+        ops.X**0.5,
+        ops.Y**0.5,
+        ops.PhasedXPowGate(phase_exponent=0.25, exponent=0.5),
+    ),
+    add_final_single_qubit_layer: bool = True,
+    seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
+) -> list[cirq.FrozenCircuit]:
+    """Generate many random quantum circuits of a particular form at once.
+
+    The circuits have the structure of `random_rotations_between_grid_interaction_layers_circuit`
+    with a fixed two-qubit gate: each of the `depth` cycles is a moment of random single-qubit
+    gates followed by a moment of `two_qubit_gate` on the pairs of the next layer of `pattern`,
+    which is left out if none of the pairs of that layer are among `qubits`.
+    The random single-qubit gates of all circuits are drawn at once as an array, and the circuits
+    share their operations and two-qubit moments, which makes generating large numbers of
+    circuits much faster than generating them one by one. The random choices are drawn in a
+    different order, so the circuits differ from the ones of
+    `random_rotations_between_grid_interaction_layers_circuit` for the same `seed`.
+
+    Args:
+        qubits: The qubits to use.
+        depth: The number of cycles.
+        n_circuits: The number of circuits to generate.
+        two_qubit_gate: The two-qubit gate applied to the pairs of each interaction layer.
+        pattern: A sequence of GridInteractionLayers, each of which determine
+            which pairs of qubits are entangled. The layers in a pattern are
+            iterated through sequentially, repeating until `depth` is reached.
+        single_qubit_gates: Single-qubit gates are selected randomly from this
+            sequence. No qubit is acted upon by the same single-qubit gate in
+            consecutive cycles. If only one choice of single-qubit gate is
+            given, then this constraint is not enforced.
+        add_final_single_qubit_layer: Whether to include a final layer of
+            single-qubit gates after the last cycle.
+        seed: A seed or random state to use for the pseudorandom number
+            generator.
+
+    Returns:
+        A list of `n_circuits` FrozenCircuits.
+    """
+    qubits = list(qubits)
+    coupled_qubit_pairs = _coupled_qubit_pairs(qubits)
+    two_qubit_layers = [
+        circuits.Moment.from_ops(
+            *(
+                two_qubit_gate.on(a, b)
+                for a, b in coupled_qubit_pairs
+                if (a, b) in layer or (b, a) in layer
+            )
+        )
+        for layer in pattern
+    ]
+    return _random_rotations_frozen_circuits(
+        qubits=qubits,
+        two_qubit_layers=two_qubit_layers,
+        depth=depth,
+        n_circuits=n_circuits,
+        single_qubit_gates=single_qubit_gates,
+        add_final_single_qubit_layer=add_final_single_qubit_layer,
+        prng=value.parse_random_state(seed),
+    )
+
+
+def _random_rotations_frozen_circuits(
+    qubits: Sequence[cirq.Qid],
+    two_qubit_layers: Sequence[cirq.Moment],
+    depth: int,
+    n_circuits: int,
+    single_qubit_gates: Sequence[cirq.Gate],
+    add_final_single_qubit_layer: bool,
+    prng: np.random.RandomState,
+) -> list[cirq.FrozenCircuit]:
+    """Generates circuits of random single-qubit layers alternating with `two_qubit_layers`.
+
+    The gate indices of all single-qubit layers of all circuits are drawn as one array. Each
+    single-qubit operation is created once per gate and qubit, and identical layers share their
+    moment, so that e.g. each two-qubit layer is a single moment shared by all circuits. Empty
+    two-qubit layers are left out, as when appending them to a circuit.
+    """
+    num_layers = depth + int(add_final_single_qubit_layer)
+    num_gates = len(single_qubit_gates)
+    if len(set(single_qubit_gates)) == 1:
+        choices = np.zeros((n_circuits, num_layers, len(qubits)), dtype=np.intp)
+    else:
+        first = prng.randint(0, num_gates, size=(n_circuits, 1, len(qubits)))
+        # After the first layer, draw one of the gates other than the previous one by drawing
+        # from one gate less and skipping over the previous one.
+        rest = prng.randint(
+            0, num_gates - 1, size=(n_circuits, max(num_layers - 1, 0), len(qubits))
+        )
+        choices = np.concatenate([first, rest], axis=1)[:, :num_layers]
+        for i in range(1, num_layers):
+            choices[:, i] += choices[:, i] >= choices[:, i - 1]
+
+    # [gate index, qubit index] : the operation
+    single_qubit_ops = np.empty((num_gates, len(qubits)), dtype=object)
+    for i, gate in enumerate(single_qubit_gates):
+        single_qubit_ops[i] = [gate.on(q) for q in qubits]
+    # [gate indices of a layer] : the moment, which is shared by all layers with these gates
+    single_qubit_moments: dict[bytes, cirq.Moment] = {}
+    qubit_indices = np.arange(len(qubits))
+
+    frozen_circuits = []
+    for circuit_choices in choices:
+        moments = []
+        for i, layer_choices in enumerate(circuit_choices):
+            key = layer_choices.tobytes()
+            moment = single_qubit_moments.get(key)
+            if moment is None:
+                moment = circuits.Moment.from_ops(*single_qubit_ops[layer_choices, qubit_indices])
+                single_qubit_moments[key] = moment
+            moments.append(moment)
+            if i < depth:
+                two_qubit_layer = two_qubit_layers[i % len(two_qubit_layers)]
+                if two_qubit_layer.operations:
+                    moments.append(two_qubit_layer)
+        frozen_circuits.append(circuits.FrozenCircuit._from_moments(moments, tags=()))
+    return frozen_circuits
+
+
 def _coupled_qubit_pairs(qubits: list[cirq.GridQubit]) -> list[GridQubitPairT]:
     pairs = []
     qubit_set = set(qubits)
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import collections
 import itertools
 from collections.abc import Callable, Iterable, Sequence
 from typing import cast
@@ -26,8 +27,10 @@ import cirq
 from cirq.experiments import (
     GridInteractionLayer,
     random_rotations_between_grid_interaction_layers_circuit,
+    random_rotations_between_grid_interaction_layers_circuits,
 )
 from cirq.experiments.random_quantum_circuit_generation import (
+    generate_frozen_library_of_2q_circuits,
     generate_library_of_2q_circuits,
     get_grid_interaction_layer_circuit,
     get_random_combinations_for_device,
@@ -108,6 +111,50 @@ def test_generate_library_of_2q_circuits_custom_qubits() -> None:
             assert m2.operations[0].gate == cirq.ISWAP**0.5
 
 
+def test_generate_frozen_library_of_2q_circuits() -> None:
+    q0, q1 = cirq.GridQubit(9, 9), cirq.NamedQubit('hi mom')
+    circuits = generate_frozen_library_of_2q_circuits(
+        n_library_circuits=5,
+        two_qubit_gate=cirq.ISWAP**0.5,
+        max_cycle_depth=13,
+        q0=q0,
+        q1=q1,
+        random_state=9,
+        tags=('test_tag',),
+    )
+    assert len(circuits) == 5
+    for circuit in circuits:
+        assert isinstance(circuit, cirq.FrozenCircuit)
+        assert len(circuit) == 13 * 2 + 1
+        assert sorted(circuit.all_qubits()) == [q0, q1]
+        _validate_single_qubit_layers(cast(set[cirq.GridQubit], {q0, q1}), circuit.moments[::2])
+        for moment in circuit.moments[1::2]:
+            assert moment is circuits[0].moments[1]
+            (op,) = moment.operations
+            assert op.gate == cirq.ISWAP**0.5
+            assert op.tags == ('test_tag',)
+    assert circuits == generate_frozen_library_of_2q_circuits(
+        n_library_circuits=5,
+        two_qubit_gate=cirq.ISWAP**0.5,
+        max_cycle_depth=13,
+        q0=q0,
+        q1=q1,
+        random_state=9,
+        tags=('test_tag',),
+    )
+
+
+def test_generate_frozen_library_of_2q_circuits_distribution() -> None:
+    circuits = generate_frozen_library_of_2q_circuits(
+        n_library_circuits=200, two_qubit_gate=cirq.CZ, max_cycle_depth=40, random_state=1
+    )
+    gates = [op.gate for circuit in circuits for op in circuit.all_operations()]
+    counts = collections.Counter(gate for gate in gates if gate != cirq.CZ)
+    # All 64 single-qubit gates are drawn about equally often.
+    assert len(counts) == 64
+    assert max(counts.values()) < 2 * min(counts.values())
+
+
 def _gridqubits_to_graph_device(qubits: Iterable[cirq.GridQubit]):
     # cirq contrib: routing.gridqubits_to_graph_device
     def _manhattan_distance(qubit1: cirq.GridQubit, qubit2: cirq.GridQubit) -> int:
@@ -402,6 +449,128 @@ def test_random_rotations_between_grid_interaction_layers(
     )
 
 
+@pytest.mark.parametrize(
+    'qubits, pattern, single_qubit_gates, add_final_single_qubit_layer',
+    (
+        (
+            (cirq.q(0, 0), cirq.q(0, 1), cirq.q(0, 2)),
+            [[(cirq.q(0, 1), cirq.q(0, 0))], [(cirq.q(0, 1), cirq.q(0, 2))]],
+            (cirq.X**0.5,),
+            True,
+        ),
+        (
+            cirq.GridQubit.rect(4, 3),
+            cirq.experiments.GRID_STAGGERED_PATTERN,
+            (cirq.X**0.5, cirq.Y**0.5, cirq.Z**0.5),
+            True,
+        ),
+        (
+            cirq.GridQubit.rect(5, 5),
+            cirq.experiments.GRID_ALIGNED_PATTERN,
+            (cirq.X**0.5, cirq.Y**0.5, cirq.Z**0.5),
+            False,
+        ),
+    ),
+)
+def test_random_rotations_between_grid_interaction_layers_circuits(
+    qubits: Iterable[cirq.GridQubit],
+    pattern: Sequence[GridInteractionLayer],
+    single_qubit_gates: Sequence[cirq.Gate],
+    add_final_single_qubit_layer: bool,
+) -> None:
+    qubits = set(qubits)
+    depth = 11
+    circuits = random_rotations_between_grid_interaction_layers_circuits(
+        qubits,
+        depth,
+        4,
+        two_qubit_gate=cirq.CZ,
+        pattern=pattern,
+        single_qubit_gates=single_qubit_gates,
+        add_final_single_qubit_layer=add_final_single_qubit_layer,
+        seed=1234,
+    )
+
+    assert len(circuits) == 4
+    for circuit in circuits:
+        assert isinstance(circuit, cirq.FrozenCircuit)
+        assert len(circuit) == 2 * depth + add_final_single_qubit_layer
+        _validate_single_qubit_layers(
+            qubits, circuit.moments[::2], non_repeating_layers=len(set(single_qubit_gates)) > 1
+        )
+        _validate_two_qubit_layers(qubits, circuit.moments[1::2], pattern)
+        for moment in circuit.moments[1::2]:
+            assert all(op.gate == cirq.CZ for op in moment)
+    assert len({circuit.moments[0] for circuit in circuits}) == (
+        1 if len(set(single_qubit_gates)) == 1 else 4
+    )
+
+
+@pytest.mark.parametrize(
+    'qubits, pattern',
+    (
+        (cirq.GridQubit.rect(1, 2), cirq.experiments.GRID_STAGGERED_PATTERN),
+        (cirq.GridQubit.rect(4, 3), cirq.experiments.GRID_STAGGERED_PATTERN),
+        (cirq.GridQubit.rect(3, 3), cirq.experiments.GRID_ALIGNED_PATTERN),
+    ),
+)
+@pytest.mark.parametrize('add_final_single_qubit_layer', (True, False))
+def test_random_rotations_between_grid_interaction_layers_circuits_match_circuit(
+    qubits: Sequence[cirq.GridQubit],
+    pattern: Sequence[GridInteractionLayer],
+    add_final_single_qubit_layer: bool,
+) -> None:
+    depth = 9
+    # With a single choice of single-qubit gate, the circuits are identical.
+    circuit = random_rotations_between_grid_interaction_layers_circuit(
+        qubits,
+        depth,
+        pattern=pattern,
+        single_qubit_gates=(cirq.X**0.5,),
+        add_final_single_qubit_layer=add_final_single_qubit_layer,
+        seed=1234,
+    )
+    circuits = random_rotations_between_grid_interaction_layers_circuits(
+        qubits,
+        depth,
+        2,
+        pattern=pattern,
+        single_qubit_gates=(cirq.X**0.5,),
+        add_final_single_qubit_layer=add_final_single_qubit_layer,
+        seed=1234,
+    )
+    assert [frozen_circuit.unfreeze() for frozen_circuit in circuits] == [circuit] * 2
+
+    # With random single-qubit gates, only the single-qubit gates differ.
+    circuit = random_rotations_between_grid_interaction_layers_circuit(
+        qubits,
+        depth,
+        pattern=pattern,
+        add_final_single_qubit_layer=add_final_single_qubit_layer,
+        seed=1234,
+    )
+    (frozen_circuit,) = random_rotations_between_grid_interaction_layers_circuits(
+        qubits,
+        depth,
+        1,
+        pattern=pattern,
+        add_final_single_qubit_layer=add_final_single_qubit_layer,
+        seed=1234,
+    )
+    assert len(frozen_circuit) == len(circuit)
+    for moment, expected_moment in zip(frozen_circuit, circuit):
+        assert moment.qubits == expected_moment.qubits
+        if any(cirq.num_qubits(op) == 2 for op in expected_moment):
+            assert moment == expected_moment
+
+
+def test_random_rotations_between_grid_interaction_layers_circuits_empty() -> None:
+    circuits = random_rotations_between_grid_interaction_layers_circuits(
+        cirq.GridQubit.rect(2, 2), 0, 3, add_final_single_qubit_layer=False
+    )
+    assert circuits == [cirq.FrozenCircuit()] * 3
+
+
 def test_grid_interaction_layer_repr() -> None:
     layer = GridInteractionLayer(col_offset=0, vertical=True, stagger=False)
     assert repr(layer) == (
@@ -21,11 +21,13 @@ from collections.abc import Sequence
 from typing import Any, cast, TYPE_CHECKING
 
 import numpy as np
-import scipy.optimize
 import sympy
 
 from cirq import circuits, ops, study, vis
 from cirq._compat import proper_repr
+from cirq._import import LazyLoader
+
+optimize = LazyLoader("optimize", globals(), "scipy.optimize")
 
 if TYPE_CHECKING:
     import cirq
@@ -292,7 +294,7 @@ class TensoredConfusionMatrices:
 
         constraints = {'type': 'eq', 'fun': lambda x: sum(result) - sum(x)}
         bounds = tuple((0, sum(result)) for _ in result)
-        res = scipy.optimize.minimize(
+        res = optimize.minimize(
             func, result, method='SLSQP', constraints=constraints, bounds=bounds
         )
         if res.success is False:  # pragma: no cover
@@ -21,18 +21,22 @@ import time
 from collections.abc import Iterable
 from typing import Any, cast, TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
 import sympy
 
 import cirq.vis.heatmap as cirq_heatmap
 import cirq.vis.histogram as cirq_histogram
 from cirq import circuits, ops, study
+from cirq._import import LazyLoader
 from cirq.devices import grid_qubit
 
 if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
     import cirq
 
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
+
 
 @dataclasses.dataclass
 class SingleQubitReadoutCalibrationResult:
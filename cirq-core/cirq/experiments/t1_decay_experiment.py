@@ -19,16 +19,21 @@ from collections.abc import Sequence
 from typing import Any, cast, TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 import sympy
-from matplotlib import pyplot as plt
 
 from cirq import _import, circuits, ops, study, value
 from cirq._compat import proper_repr
+from cirq._import import LazyLoader
 
 if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib import pyplot as plt
+
     import cirq
 
+pd = LazyLoader("pd", globals(), "pandas")
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
+
 # We initialize optimize lazily, otherwise it slows global import speed.
 optimize = _import.LazyLoader("optimize", globals(), "scipy.optimize")
 
@@ -17,16 +17,21 @@ from __future__ import annotations
 import enum
 from typing import Any, TYPE_CHECKING
 
-import pandas as pd
 import sympy
-from matplotlib import pyplot as plt
 
 from cirq import circuits, ops, study, value
 from cirq._compat import proper_repr
+from cirq._import import LazyLoader
 
 if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib import pyplot as plt
+
     import cirq
 
+pd = LazyLoader("pd", globals(), "pandas")
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
+
 
 class ExperimentType(enum.Enum):
     RAMSEY = 1  # Often denoted as t2*
@@ -24,12 +24,11 @@ from dataclasses import dataclass
 from types import MappingProxyType
 from typing import Any, cast, TYPE_CHECKING
 
-import networkx as nx
 import numpy as np
-from matplotlib import pyplot as plt
 
 from cirq import ops, value, vis
 from cirq._compat import cached_method
+from cirq._import import LazyLoader
 from cirq.experiments import random_quantum_circuit_generation as rqcg
 from cirq.experiments.qubit_characterizations import (
     parallel_single_qubit_rb,
@@ -48,9 +47,13 @@ if TYPE_CHECKING:
     import multiprocessing
 
     import pandas as pd
+    from matplotlib import pyplot as plt
 
     import cirq
 
+nx = LazyLoader("nx", globals(), "networkx")
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
+
 
 def _grid_qubits_for_sampler(sampler: cirq.Sampler) -> Sequence[cirq.GridQubit] | None:
     if hasattr(sampler, 'processor'):
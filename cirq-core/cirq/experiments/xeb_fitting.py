@@ -23,19 +23,22 @@ from concurrent import futures
 from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 import sympy
 
 from cirq import _import, circuits, ops, protocols
-from cirq.experiments.xeb_simulation import simulate_2q_xeb_circuits
+from cirq._import import LazyLoader
+from cirq.experiments.xeb_simulation import _Batched2qXEBSimulator, simulate_2q_xeb_circuits
 
 if TYPE_CHECKING:
     import multiprocessing
 
+    import pandas as pd
     import scipy.optimize
 
     import cirq
 
+pd = LazyLoader("pd", globals(), "pandas")
+
 # We initialize these lazily, otherwise they slow global import speed.
 optimize = _import.LazyLoader("optimize", globals(), "scipy.optimize")
 stats = _import.LazyLoader("stats", globals(), "scipy.stats")
@@ -76,21 +79,7 @@ def benchmark_2q_xeb_fidelities(
         ValueError: If `cycle_depths` is not a non-empty array or if the `cycle_depths` provided
             includes some values not available in `sampled_df`.
     """
-    sampled_cycle_depths = (
-        sampled_df.index.get_level_values('cycle_depth').drop_duplicates().sort_values()
-    )
-    if cycle_depths is not None:
-        if len(cycle_depths) == 0:
-            raise ValueError("`cycle_depths` should be a non-empty array_like")
-        not_in_sampled = np.setdiff1d(cycle_depths, sampled_cycle_depths)
-        if len(not_in_sampled) > 0:
-            raise ValueError(
-                f"The `cycle_depths` provided include some not "
-                f"available in `sampled_df`: {not_in_sampled}"
-            )
-        sim_cycle_depths = cycle_depths
-    else:
-        sim_cycle_depths = sampled_cycle_depths
+    sim_cycle_depths = _cycle_depths_to_benchmark(sampled_df, cycle_depths)
     simulated_df = simulate_2q_xeb_circuits(
         circuits=circuits, cycle_depths=sim_cycle_depths, param_resolver=param_resolver, pool=pool
     )
@@ -139,12 +128,76 @@ def benchmark_2q_xeb_fidelities(
         _try_keep('pair')
         return pd.Series(ret)
 
+    groupby_names = _fidelity_groupby_names(df)
+    return df.groupby(groupby_names).apply(per_cycle_depth, include_groups=False).reset_index()
+
+
+def _cycle_depths_to_benchmark(
+    sampled_df: pd.DataFrame, cycle_depths: Sequence[int] | None
+) -> Sequence[int]:
+    sampled_cycle_depths = (
+        sampled_df.index.get_level_values('cycle_depth').drop_duplicates().sort_values()
+    )
+    if cycle_depths is None:
+        return sampled_cycle_depths
+    if len(cycle_depths) == 0:
+        raise ValueError("`cycle_depths` should be a non-empty array_like")
+    not_in_sampled = np.setdiff1d(cycle_depths, sampled_cycle_depths)
+    if len(not_in_sampled) > 0:
+        raise ValueError(
+            f"The `cycle_depths` provided include some not "
+            f"available in `sampled_df`: {not_in_sampled}"
+        )
+    return cycle_depths
+
+
+def _fidelity_groupby_names(df: pd.DataFrame) -> list[str]:
     if 'pair_i' in df.columns:
-        groupby_names = ['layer_i', 'pair_i', 'cycle_depth']
-    else:
-        groupby_names = ['cycle_depth']
+        return ['layer_i', 'pair_i', 'cycle_depth']
+    return ['cycle_depth']
 
-    return df.groupby(groupby_names).apply(per_cycle_depth, include_groups=False).reset_index()
+
+class _MeanXEBFidelity:
+    """The mean fidelity of `benchmark_2q_xeb_fidelities` as a function of circuit parameters.
+
+    This is the objective of the characterization optimizations. It joins `sampled_df` with the
+    simulated cycle depths once, and then simulates all circuits at all cycle depths at once
+    with `_Batched2qXEBSimulator`, which keeps the unitaries of the moments without parameters
+    between evaluations. The fidelities are computed with the same estimator as
+    `benchmark_2q_xeb_fidelities`.
+    """
+
+    def __init__(
+        self,
+        sampled_df: pd.DataFrame,
+        circuits: Sequence[cirq.Circuit],
+        cycle_depths: Sequence[int] | None = None,
+    ):
+        sim_cycle_depths = _cycle_depths_to_benchmark(sampled_df, cycle_depths)
+        self._simulator = _Batched2qXEBSimulator(circuits, sim_cycle_depths)
+        simulated_index = pd.MultiIndex.from_product(
+            [range(len(circuits)), self._simulator.cycle_depths], names=['circuit_i', 'cycle_depth']
+        )
+        simulated_rows = pd.DataFrame(
+            {'simulated_row': np.arange(len(simulated_index))}, index=simulated_index
+        )
+        df = sampled_df.join(simulated_rows, how='inner').reset_index()
+        self._simulated_rows = df['simulated_row'].to_numpy()
+        self._sampled_probs = np.array(df['sampled_probs'].to_list())
+        self._groups = df.groupby(_fidelity_groupby_names(df)).ngroup().to_numpy()
+
+    def __call__(self, param_resolver: cirq.ParamResolverOrSimilarType = None) -> float:
+        D = 4  # two qubits
+        pure_probs = self._simulator.probabilities(param_resolver).reshape((-1, D))
+        pure_probs = pure_probs[self._simulated_rows]
+        e_u = np.sum(pure_probs**2, axis=1)
+        u_u = np.sum(pure_probs, axis=1) / D
+        m_u = np.sum(pure_probs * self._sampled_probs, axis=1)
+        y = m_u - u_u
+        x = e_u - u_u
+        numerator = np.bincount(self._groups, weights=x * y)
+        denominator = np.bincount(self._groups, weights=x**2)
+        return float(np.mean(numerator / denominator))
 
 
 class XEBCharacterizationOptions(ABC):
@@ -471,13 +524,17 @@ def characterize_phased_fsim_parameters_with_xeb(
         fatol: The `fatol` argument for Nelder-Mead. This is the absolute error for convergence
             in the function evaluation.
         verbose: Whether to print progress updates.
-        pool: An optional pool to execute circuit simulations in parallel.
+        pool: An optional pool to execute the simulation of the final benchmark in parallel,
+            as in `simulate_2q_xeb_circuits`. The objective of the optimization is evaluated in
+            this process: it simulates all circuits at all cycle depths in one batched
+            simulation, reusing the unitaries of the moments without parameters.
     """
     (pair,) = sampled_df['pair'].unique()
     initial_simplex, names = options.get_initial_simplex_and_names(
         initial_simplex_step_size=initial_simplex_step_size
     )
     x0 = initial_simplex[0]
+    mean_fidelity = _MeanXEBFidelity(sampled_df, parameterized_circuits, cycle_depths)
 
     def _mean_infidelity(angles):
         params = dict(zip(names, angles))
@@ -486,11 +543,7 @@ def characterize_phased_fsim_parameters_with_xeb(
             for name, val in params.items():
                 params_str += f'{name:5s} = {val:7.3g} '
             print(f"Simulating with {params_str}")
-        fids = benchmark_2q_xeb_fidelities(
-            sampled_df, parameterized_circuits, cycle_depths, param_resolver=params, pool=pool
-        )
-
-        loss = 1 - fids['fidelity'].mean()
+        loss = 1 - mean_fidelity(params)
         if verbose:
             print(f"Loss: {loss:7.3g}", flush=True)
         return loss
@@ -504,7 +557,7 @@ def characterize_phased_fsim_parameters_with_xeb(
 
     final_params: cirq.ParamDictType = dict(zip(names, optimization_result.x))
     fidelities_df = benchmark_2q_xeb_fidelities(
-        sampled_df, parameterized_circuits, cycle_depths, param_resolver=final_params
+        sampled_df, parameterized_circuits, cycle_depths, param_resolver=final_params, pool=pool
     )
     return XEBCharacterizationResult(
         optimization_results={pair: optimization_result},
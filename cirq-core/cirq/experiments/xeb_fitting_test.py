@@ -27,6 +27,7 @@ import cirq
 import cirq.experiments.random_quantum_circuit_generation as rqcg
 from cirq.experiments.xeb_fitting import (
     _fit_exponential_decay,
+    _MeanXEBFidelity,
     before_and_after_characterization,
     benchmark_2q_xeb_fidelities,
     characterize_phased_fsim_parameters_with_xeb,
@@ -208,6 +209,49 @@ X^0.5                                PhX(0.25)^0.5
     )
 
 
+@pytest.mark.parametrize('pass_cycle_depths', (True, False))
+def test_mean_xeb_fidelity(circuits_cycle_depths_sampled_df, pass_cycle_depths) -> None:
+    circuits, cycle_depths, sampled_df = circuits_cycle_depths_sampled_df
+    cycle_depths = cycle_depths[1:] if pass_cycle_depths else None
+    options = SqrtISwapXEBOptions()
+    p_circuits = [parameterize_circuit(circuit, options) for circuit in circuits]
+    mean_fidelity = _MeanXEBFidelity(sampled_df, p_circuits, cycle_depths)
+    _, names = options.get_initial_simplex_and_names()
+    for angles in np.random.RandomState(0).uniform(-np.pi, np.pi, size=(3, len(names))):
+        params = dict(zip(names, angles))
+        fids = benchmark_2q_xeb_fidelities(sampled_df, p_circuits, cycle_depths, params)
+        np.testing.assert_allclose(mean_fidelity(params), fids['fidelity'].mean(), atol=1e-8)
+
+
+def test_mean_xeb_fidelity_parallel() -> None:
+    circuits = rqcg.generate_library_of_2q_circuits(
+        n_library_circuits=5, two_qubit_gate=cirq.ISWAP**0.5, max_cycle_depth=4, random_state=5
+    )
+    cycle_depths = [2, 3, 4]
+    graph = _gridqubits_to_graph_device(cirq.GridQubit.rect(2, 2))
+    combs = rqcg.get_random_combinations_for_device(
+        n_library_circuits=len(circuits), n_combinations=2, device_graph=graph, random_state=10
+    )
+    sampled_df = sample_2q_xeb_circuits(
+        sampler=cirq.Simulator(seed=3),
+        circuits=circuits,
+        cycle_depths=cycle_depths,
+        combinations_by_layer=combs,
+    )
+    mean_fidelity = _MeanXEBFidelity(sampled_df, circuits, cycle_depths)
+    fids = benchmark_2q_xeb_fidelities(sampled_df, circuits, cycle_depths)
+    assert len(fids) == len(cycle_depths) * graph.number_of_edges()
+    np.testing.assert_allclose(mean_fidelity(), fids['fidelity'].mean(), atol=1e-8)
+
+
+def test_mean_xeb_fidelity_validation(circuits_cycle_depths_sampled_df) -> None:
+    circuits, _, sampled_df = circuits_cycle_depths_sampled_df
+    with pytest.raises(ValueError, match='not available'):
+        _MeanXEBFidelity(sampled_df, circuits, [5])
+    with pytest.raises(ValueError, match='non-empty'):
+        _MeanXEBFidelity(sampled_df, circuits, [])
+
+
 def test_get_initial_simplex() -> None:
     options = SqrtISwapXEBOptions()
     simplex, names = options.get_initial_simplex_and_names()
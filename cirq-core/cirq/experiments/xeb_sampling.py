@@ -25,16 +25,20 @@ from dataclasses import dataclass
 from typing import Any, TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 import tqdm
 
 from cirq import devices, ops, protocols, value
+from cirq._import import LazyLoader
 from cirq.circuits import Circuit, Moment
 from cirq.experiments.random_quantum_circuit_generation import CircuitLibraryCombination
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     import cirq
 
+pd = LazyLoader("pd", globals(), "pandas")
+
 
 @dataclass(frozen=True)
 class _Sample2qXEBTask:
@@ -16,21 +16,26 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Sequence
 from concurrent import futures
 from dataclasses import dataclass
 from typing import Any, TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 
-from cirq import sim, value
+from cirq import linalg, ops, protocols, sim, study, value
+from cirq._import import LazyLoader
 
 if TYPE_CHECKING:
     import multiprocessing
 
+    import pandas as pd
+
     import cirq
 
+pd = LazyLoader("pd", globals(), "pandas")
+
 
 @dataclass(frozen=True)
 class _Simulate2qXEBTask:
@@ -82,6 +87,138 @@ class _Simulate_2q_XEB_Circuit:
         return records
 
 
+class _Batched2qXEBSimulator:
+    """Simulates a library of two-qubit XEB circuits at several cycle depths at once.
+
+    The circuits are simulated by multiplying a stack of 4-dimensional state vectors, one per
+    circuit, by the unitaries of their moments, and the probabilities of each cycle depth are
+    read off the stack on the way. The unitaries of moments without parameters, such as the
+    single-qubit layers, are computed once and kept between calls, so simulating the library
+    again with different parameters only recomputes the unitaries of each distinct parameterized
+    moment.
+    """
+
+    def __init__(self, circuits: Sequence[cirq.Circuit], cycle_depths: Sequence[int]):
+        self.cycle_depths = [int(cycle_depth) for cycle_depth in cycle_depths]
+        num_moments = 2 * max(self.cycle_depths) + 1
+        # [circuit_i, moment_i] : the unitary of the moment, if it has no parameters
+        self._unitaries = np.empty((len(circuits), num_moments, 4, 4), dtype=np.complex128)
+        # [(moment, qubits)] : the (circuit_i, moment_i) positions of the parameterized moment
+        positions: dict[tuple[cirq.Moment, tuple[cirq.Qid, ...]], list[tuple[int, int]]] = {}
+        op_unitaries: dict[cirq.Operation, np.ndarray] = {}
+        for circuit_i, circuit in enumerate(circuits):
+            if (len(circuit) - 1) // 2 < max(self.cycle_depths):
+                raise ValueError("`circuit` was not long enough to compute all `cycle_depths`.")
+            qubits = tuple(ops.QubitOrder.DEFAULT.order_for(circuit.all_qubits()))
+            if len(qubits) != 2:
+                raise ValueError(f"`circuit` must act on exactly two qubits, not {qubits}.")
+            for moment_i, moment in enumerate(circuit[:num_moments]):
+                if protocols.is_parameterized(moment):
+                    positions.setdefault((moment, qubits), []).append((circuit_i, moment_i))
+                else:
+                    self._unitaries[circuit_i, moment_i] = _moment_unitary(
+                        moment, qubits, op_unitaries
+                    )
+        self._parameterized_moments = [
+            (moment, qubits, tuple(np.array(positions[moment, qubits]).T))
+            for moment, qubits in positions
+        ]
+
+    def moment_unitaries(
+        self, param_resolver: cirq.ParamResolverOrSimilarType = None
+    ) -> np.ndarray:
+        """Returns the (circuit, moment, 4, 4) array of the resolved unitaries of each moment."""
+        if not self._parameterized_moments:
+            return self._unitaries
+        unitaries = self._unitaries.copy()
+        resolver = study.ParamResolver(param_resolver)
+        for moment, qubits, indices in self._parameterized_moments:
+            unitaries[indices] = _moment_unitary(
+                protocols.resolve_parameters(moment, resolver), qubits
+            )
+        return unitaries
+
+    def probabilities(self, param_resolver: cirq.ParamResolverOrSimilarType = None) -> np.ndarray:
+        """Returns the (circuit, cycle depth, 4) array of pure-state probabilities.
+
+        The cycle depths are the ones given to the constructor, in the same order.
+        """
+        unitaries = self.moment_unitaries(param_resolver)
+        num_circuits, num_moments = unitaries.shape[:2]
+        probs = np.empty((num_circuits, len(self.cycle_depths), 4))
+        states = np.zeros((num_circuits, 4), dtype=np.complex128)
+        states[:, 0] = 1
+        for moment_i in range(num_moments):
+            states = np.einsum('cij,cj->ci', unitaries[:, moment_i], states)
+            # The state after moment_i = 2 * cycle_depth holds the probabilities of cycle_depth.
+            for i, cycle_depth in enumerate(self.cycle_depths):
+                if moment_i == 2 * cycle_depth:
+                    probs[:, i] = np.abs(states) ** 2
+        return probs
+
+
+@dataclass(frozen=True)
+class _SimulateBatched2qXEBTask:
+    """Helper container for simulating a batch of circuits, potentially via multiprocessing."""
+
+    circuits: Sequence[cirq.Circuit]
+    cycle_depths: Sequence[int]
+    param_resolver: cirq.ParamResolverOrSimilarType
+
+
+def _simulate_batched_2q_xeb_circuits(task: _SimulateBatched2qXEBTask) -> np.ndarray:
+    """Returns the (circuit, cycle depth, 4) array of pure-state probabilities of a batch."""
+    return _Batched2qXEBSimulator(task.circuits, task.cycle_depths).probabilities(
+        task.param_resolver
+    )
+
+
+def _cpu_count() -> int:
+    return os.cpu_count() or 1
+
+
+def _can_simulate_batched(
+    circuits: Sequence[cirq.Circuit],
+    num_moments: int,
+    param_resolver: cirq.ParamResolverOrSimilarType,
+) -> bool:
+    """Returns whether `_Batched2qXEBSimulator` can simulate the first moments of `circuits`."""
+    resolver = study.ParamResolver(param_resolver)
+    unitary_ops: set[cirq.Operation] = set()
+    for circuit in circuits:
+        qubits = circuit.all_qubits()
+        if len(qubits) != 2 or any(q.dimension != 2 for q in qubits):
+            return False
+        for op in circuit[:num_moments].all_operations():
+            if op not in unitary_ops:
+                if not protocols.has_unitary(protocols.resolve_parameters(op, resolver)):
+                    return False
+                unitary_ops.add(op)
+    return True
+
+
+def _moment_unitary(
+    moment: cirq.Moment,
+    qubits: Sequence[cirq.Qid],
+    op_unitaries: dict[cirq.Operation, np.ndarray] | None = None,
+) -> np.ndarray:
+    """Returns the unitary of `moment` on `qubits`, composed of the unitaries of its operations.
+
+    The unitaries of the operations are looked up in and added to `op_unitaries`, if given.
+    """
+    unitary = np.eye(2 ** len(qubits), dtype=np.complex128).reshape((2,) * (2 * len(qubits)))
+    for op in moment:
+        op_unitary = None if op_unitaries is None else op_unitaries.get(op)
+        if op_unitary is None:
+            op_unitary = protocols.unitary(op).reshape((2,) * (2 * len(op.qubits)))
+            if op_unitaries is not None:
+                op_unitaries[op] = op_unitary
+        unitary = linalg.targeted_left_multiply(
+            op_unitary, unitary, [qubits.index(q) for q in op.qubits]
+        )
+    return unitary.reshape((2 ** len(qubits),) * 2)
+
+
 def simulate_2q_xeb_circuits(
     circuits: Sequence[cirq.Circuit],
     cycle_depths: Sequence[int],
@@ -101,15 +238,48 @@ def simulate_2q_xeb_circuits(
             to simulate.
         param_resolver: If circuits contain parameters, resolve according to this ParamResolver
             prior to simulation
-        pool: If provided, execute the simulations in parallel.
-        simulator: A noiseless simulator used to simulate the circuits. By default, this is
-            `cirq.Simulator`. The simulator must support the `cirq.SimulatesIntermediateState`
-            interface.
+        pool: If provided, execute the simulations in parallel. By default, the circuits are
+            split into one batch per CPU, and the batches are simulated on the pool.
+        simulator: A noiseless simulator used to simulate the circuits. The simulator must
+            support the `cirq.SimulatesIntermediateState` interface. By default, if all the
+            circuits act on two qubits with unitary moments, they are simulated together by
+            multiplying their states by the unitaries of their moments, which gives the
+            probabilities of `cirq.Simulator` up to floating-point rounding. Otherwise, they
+            are simulated with `cirq.Simulator`.
 
     Returns:
         A dataframe with index ['circuit_i', 'cycle_depth'] and column
         "pure_probs" containing the pure-state probabilities for each row.
     """
+    if len(circuits) == 0:
+        return pd.DataFrame(columns=['circuit_i', 'cycle_depth', 'pure_probs']).set_index(
+            ['circuit_i', 'cycle_depth']
+        )
+    if simulator is None and _can_simulate_batched(
+        circuits, 2 * max(cycle_depths) + 1, param_resolver
+    ):
+        sorted_cycle_depths = sorted(set(cycle_depths))
+        if pool is not None:
+            batches = np.array_split(np.arange(len(circuits)), min(len(circuits), _cpu_count()))
+            batch_tasks = [
+                _SimulateBatched2qXEBTask(
+                    circuits=[circuits[circuit_i] for circuit_i in batch],
+                    cycle_depths=sorted_cycle_depths,
+                    param_resolver=param_resolver,
+                )
+                for batch in batches
+            ]
+            probs = np.concatenate(list(pool.map(_simulate_batched_2q_xeb_circuits, batch_tasks)))
+        else:
+            probs = _Batched2qXEBSimulator(circuits, sorted_cycle_depths).probabilities(
+                param_resolver
+            )
+        return pd.DataFrame(
+            {'circuit_i': circuit_i, 'cycle_depth': cycle_depth, 'pure_probs': probs[circuit_i, i]}
+            for circuit_i in range(len(circuits))
+            for i, cycle_depth in enumerate(sorted_cycle_depths)
+        ).set_index(['circuit_i', 'cycle_depth'])
+
     if simulator is None:
         # Need an actual object; not np.random or else multiprocessing will
         # fail to pickle the closure object:
@@ -16,15 +16,18 @@ from __future__ import annotations
 
 import multiprocessing
 from collections.abc import Iterator, Sequence
+from concurrent import futures
 from typing import Any
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 import pytest
+import sympy
 
 import cirq
 import cirq.experiments.random_quantum_circuit_generation as rqcg
-from cirq.experiments.xeb_simulation import simulate_2q_xeb_circuits
+from cirq.experiments.xeb_simulation import _Batched2qXEBSimulator, simulate_2q_xeb_circuits
 
 _POOL_NUM_PROCESSES = min(4, multiprocessing.cpu_count())
 
@@ -154,3 +157,109 @@ def test_incremental_simulate(request, use_pool) -> None:
     # for (i1, row1), (i2, row2) in zip(df_ref.iterrows(), df.iterrows()):
     #     assert i1 == i2
     #     np.testing.assert_allclose(row1['pure_probs'], row2['pure_probs'], atol=5e-5)
+
+
+def test_batched_2q_xeb_simulator() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    theta, phi = sympy.symbols('theta phi')
+    circuits = [
+        rqcg.random_rotations_between_two_qubit_circuit(
+            q0,
+            q1,
+            depth=10,
+            two_qubit_op_factory=lambda a, b, _: cirq.FSimGate(theta, phi).on(a, b),
+            seed=seed,
+        )
+        for seed in range(3)
+    ]
+    cycle_depths = [7, 0, 3, 10]
+    simulator = _Batched2qXEBSimulator(circuits, cycle_depths)
+    for params in [{'theta': 0.1, 'phi': 0.2}, {'theta': -0.7, 'phi': 1.3}]:
+        probs = simulator.probabilities(params)
+        assert probs.shape == (len(circuits), len(cycle_depths), 4)
+        df = simulate_2q_xeb_circuits(circuits, cycle_depths, param_resolver=params)
+        for circuit_i in range(len(circuits)):
+            for i, cycle_depth in enumerate(cycle_depths):
+                np.testing.assert_allclose(
+                    probs[circuit_i, i], df.loc[(circuit_i, cycle_depth), 'pure_probs'], atol=1e-12
+                )
+
+
+def test_simulate_2q_xeb_circuits_shards_circuits_across_pool() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    circuits = [
+        rqcg.random_rotations_between_two_qubit_circuit(q0, q1, depth=10, seed=seed)
+        for seed in range(5)
+    ]
+    cycle_depths = [3, 10]
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        with mock.patch.object(executor, 'map', wraps=executor.map) as pool_map:
+            df = simulate_2q_xeb_circuits(circuits, cycle_depths, pool=executor)
+    pool_map.assert_called_once()
+    pd.testing.assert_frame_equal(df, simulate_2q_xeb_circuits(circuits, cycle_depths))
+
+
+def test_batched_2q_xeb_simulator_validation() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.X(q0), cirq.CZ(q0, q1), cirq.X(q1))
+    with pytest.raises(ValueError, match='not long enough'):
+        _ = _Batched2qXEBSimulator([circuit], [2])
+    with pytest.raises(ValueError, match='exactly two qubits'):
+        _ = _Batched2qXEBSimulator([circuit + cirq.X(q2)], [1])
+
+
+@pytest.mark.parametrize('use_pool', (True, False))
+def test_simulate_2q_xeb_circuits_with_simulator(request, use_pool) -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    circuits = [
+        rqcg.random_rotations_between_two_qubit_circuit(
+            q0, q1, depth=30, two_qubit_op_factory=lambda a, b, _: cirq.SQRT_ISWAP(a, b), seed=i
+        )
+        for i in range(4)
+    ]
+    cycle_depths = [20, 5, 30, 5]
+
+    # avoid starting worker pool if it is not needed
+    pool = request.getfixturevalue("pool") if use_pool else None
+
+    df = simulate_2q_xeb_circuits(circuits, cycle_depths)
+    df_sim = simulate_2q_xeb_circuits(
+        circuits,
+        cycle_depths,
+        pool=pool,
+        simulator=cirq.Simulator(seed=np.random.RandomState(), dtype=np.complex128),
+    )
+    assert df.index.equals(df_sim.index)
+    np.testing.assert_allclose(
+        np.stack(df['pure_probs'].to_list()), np.stack(df_sim['pure_probs'].to_list()), atol=1e-12
+    )
+
+
+def test_simulate_2q_xeb_circuits_falls_back_to_simulator() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuits = [
+        rqcg.random_rotations_between_two_qubit_circuit(q0, q1, depth=5, seed=seed)
+        for seed in range(2)
+    ]
+    # A non-unitary moment, and a circuit on three qubits.
+    circuits[0][2] = circuits[0][2].with_operation(cirq.amplitude_damp(0).on(q2))
+    circuits[1] = circuits[1] + cirq.amplitude_damp(0).on(q0)
+    cycle_depths = [1, 2, 5]
+    for library in (circuits, circuits[1:]):
+        df = simulate_2q_xeb_circuits(library, cycle_depths)
+        df_sim = simulate_2q_xeb_circuits(
+            library,
+            cycle_depths,
+            simulator=cirq.Simulator(seed=np.random.RandomState(), dtype=np.complex128),
+        )
+        pd.testing.assert_frame_equal(df, df_sim)
+    assert len(simulate_2q_xeb_circuits(circuits, [1]).loc[(0, 1), 'pure_probs']) == 8
+
+
+@pytest.mark.parametrize('use_pool', (True, False))
+def test_simulate_2q_xeb_circuits_without_circuits(use_pool) -> None:
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        df = simulate_2q_xeb_circuits([], [1, 2], pool=executor if use_pool else None)
+    assert len(df) == 0
+    assert list(df.index.names) == ['circuit_i', 'cycle_depth']
+    assert list(df.columns) == ['pure_probs']
@@ -22,14 +22,16 @@ from collections.abc import Sequence
 from concurrent import futures
 from typing import Any, TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from cirq import circuits, ops, protocols
+from cirq._import import LazyLoader
 from cirq.experiments import xeb_fitting
 from cirq.experiments.two_qubit_xeb import parallel_xeb_workflow
 from cirq.transformers import transformer_api
 
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
+
 if TYPE_CHECKING:
     import pandas as pd
 
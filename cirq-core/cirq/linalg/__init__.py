@@ -32,6 +32,7 @@ from cirq.linalg.decompositions import (
     extract_right_diag as extract_right_diag,
     kak_canonicalize_vector as kak_canonicalize_vector,
     kak_decomposition as kak_decomposition,
+    kak_decompositions as kak_decompositions,
     kak_vector as kak_vector,
     KakDecomposition as KakDecomposition,
     kron_factor_4x4_to_2x2s as kron_factor_4x4_to_2x2s,
@@ -49,6 +50,11 @@ from cirq.linalg.diagonalize import (
     diagonalize_real_symmetric_matrix as diagonalize_real_symmetric_matrix,
 )
 
+from cirq.linalg.einsum_path_cache import (
+    EINSUM_PATH_CACHE as EINSUM_PATH_CACHE,
+    EinsumPathCache as EinsumPathCache,
+)
+
 from cirq.linalg.operator_spaces import (
     expand_matrix_in_orthogonal_basis as expand_matrix_in_orthogonal_basis,
     hilbert_schmidt_inner_product as hilbert_schmidt_inner_product,
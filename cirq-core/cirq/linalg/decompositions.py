@@ -21,21 +21,19 @@ import math
 from collections.abc import Callable, Iterable
 from typing import Any, cast, TYPE_CHECKING, TypeVar
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-# this is for older systems with matplotlib <3.2 otherwise 3d projections fail
-from mpl_toolkits import mplot3d
-
 from cirq import protocols, value
 from cirq._compat import proper_repr
 from cirq._import import LazyLoader
 from cirq.linalg import combinators, diagonalize, predicates, transformations
 
 linalg = LazyLoader("linalg", globals(), "scipy.linalg")
-
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
 
 if TYPE_CHECKING:
+    from mpl_toolkits import mplot3d
+
     import cirq
 
 T = TypeVar('T')
@@ -599,7 +597,7 @@ def scatter_plot_normalized_kak_interaction_coefficients(
     show_plot = not ax
     if ax is None:
         fig = plt.figure()
-        ax = cast(mplot3d.axes3d.Axes3D, fig.add_subplot(1, 1, 1, projection='3d'))
+        ax = cast('mplot3d.axes3d.Axes3D', fig.add_subplot(1, 1, 1, projection='3d'))
 
     def coord_transform(
         pts: list[tuple[int, int, int]] | np.ndarray,
@@ -849,6 +847,253 @@ def kak_decomposition(
     )
 
 
+def kak_decompositions(
+    unitaries: Iterable[np.ndarray] | np.ndarray,
+    *,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    check_preconditions: bool = True,
+) -> list[KakDecomposition]:
+    """Decomposes a stack of 2-qubit unitaries into 1-qubit ops and XX/YY/ZZ interactions.
+
+    This is the batched version of `cirq.kak_decomposition`. The magic basis diagonalization,
+    the factoring of the local unitaries and the canonicalization of the interaction coefficients
+    are performed on all matrices at once, so decomposing many unitaries with a single call is
+    much faster than calling `cirq.kak_decomposition` on each of them. The few matrices whose
+    diagonalization is numerically ill-conditioned fall back to `cirq.kak_decomposition`.
+
+    Args:
+        unitaries: A sequence of 4x4 unitary matrices, or an array of shape (N, 4, 4).
+        rtol: Per-matrix-entry relative tolerance on equality.
+        atol: Per-matrix-entry absolute tolerance on equality.
+        check_preconditions: If set, verifies that the input corresponds to 4x4
+            unitaries before decomposing.
+
+    Returns:
+        A list with a `cirq.KakDecomposition` of each of the given unitaries, canonicalized as
+        described in `cirq.kak_decomposition`.
+
+    Raises:
+        ValueError: Bad matrix.
+        ArithmeticError: Failed to perform the decomposition.
+    """
+    mats = np.asarray(unitaries)
+    if mats.size == 0:
+        return []
+    if mats.ndim != 3 or mats.shape[1:] != (4, 4):
+        raise ValueError(f'Expected input unitaries to have shape (N,4,4), but got {mats.shape}.')
+    if check_preconditions:
+        actual = np.einsum('...ba,...bc', mats.conj(), mats)
+        if not np.allclose(actual, np.eye(4), rtol=rtol, atol=atol):
+            raise ValueError(
+                'Input must correspond to a sequence of 4x4 unitary matrices. '
+                f'Received input:\n{mats}'
+            )
+    phases, before, coefficients, after = _kak_decomposition_arrays(mats, rtol=rtol, atol=atol)
+    return [
+        KakDecomposition(
+            interaction_coefficients=(coefficients[i, 0], coefficients[i, 1], coefficients[i, 2]),
+            global_phase=phases[i],
+            single_qubit_operations_before=(before[0, i], before[1, i]),
+            single_qubit_operations_after=(after[0, i], after[1, i]),
+        )
+        for i in range(len(mats))
+    ]
+
+
+# Coefficients c of the real symmetric matrices Re(M) + c·Im(M) which are diagonalized to
+# simultaneously diagonalize Re(M) and Im(M). Several are tried in case of accidental degeneracy.
+_SIMULTANEOUS_DIAGONALIZATION_COEFFICIENTS = (0.5772156649, 1.6180339887, -2.7182818284)
+
+
+def _kak_decomposition_arrays(
+    mats: np.ndarray, *, rtol: float, atol: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized KAK decomposition of an (N, 4, 4) array of unitaries.
+
+    Returns:
+        A tuple (global_phases, before, interaction_coefficients, after) of arrays with shapes
+        (N,), (2, N, 2, 2), (N, 3) and (2, N, 2, 2). `before[0]` and `before[1]` hold b1 and b0,
+        `after[0]` and `after[1]` hold a1 and a0 of each decomposition.
+    """
+    n = len(mats)
+    # Diagonalize in magic basis: left @ magic_mats @ right = diag(d) with left, right in SO(4).
+    magic_mats = KAK_MAGIC_DAG @ mats @ KAK_MAGIC
+    left = np.zeros((n, 4, 4))
+    right = np.zeros((n, 4, 4))
+    d = np.zeros((n, 4), dtype=np.complex128)
+    done = np.zeros(n, dtype=bool)
+    for c in _SIMULTANEOUS_DIAGONALIZATION_COEFFICIENTS:
+        todo = np.flatnonzero(~done)
+        if not len(todo):
+            break
+        l, dd, r, ok = _bidiagonalize_magic_unitaries(magic_mats[todo], c, rtol=rtol, atol=atol)
+        left[todo[ok]], d[todo[ok]], right[todo[ok]] = l[ok], dd[ok], r[ok]
+        done[todo[ok]] = True
+    for i in np.flatnonzero(~done):
+        left[i], d[i], right[i] = diagonalize.bidiagonalize_unitary_with_special_orthogonals(
+            magic_mats[i], atol=atol, rtol=rtol, check_preconditions=False
+        )
+
+    # Recover pieces.
+    a1, a0 = _so4_to_magic_su2s_batch(np.swapaxes(left, -1, -2), rtol=rtol, atol=atol)
+    b1, b0 = _so4_to_magic_su2s_batch(np.swapaxes(right, -1, -2), rtol=rtol, atol=atol)
+    w, x, y, z = KAK_GAMMA @ np.angle(d).T
+    g = np.exp(1j * w)
+
+    # Canonicalize.
+    phases, inner_after, coefficients, inner_before = _kak_canonicalize_vectors(
+        np.stack([x, y, z], axis=-1)
+    )
+    before = np.stack([inner_before[0] @ b1, inner_before[1] @ b0])
+    after = np.stack([a1 @ inner_after[0], a0 @ inner_after[1]])
+    return g * phases, before, coefficients, after
+
+
+def _bidiagonalize_magic_unitaries(
+    mats: np.ndarray, c: float, *, rtol: float, atol: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Finds special orthogonal L, R such that L @ mat @ R is diagonal, for a stack of unitaries.
+
+    Since mat is unitary, mat.T @ mat is symmetric unitary, so its real and imaginary parts are
+    commuting real symmetric matrices. They are simultaneously diagonalized by diagonalizing
+    a real linear combination of them, which is exact unless the combination is accidentally
+    degenerate. The returned boolean mask marks the matrices which were successfully
+    bidiagonalized.
+    """
+    squared = np.swapaxes(mats, -1, -2) @ mats
+    _, right = np.linalg.eigh(squared.real + c * squared.imag)
+    right[np.linalg.det(right) < 0, :, 0] *= -1
+    d = np.sqrt(np.einsum('nji,njk,nki->ni', right, squared, right))
+    left_t = mats @ right / d[:, np.newaxis, :]
+    flip = np.real(np.linalg.det(left_t)) < 0
+    left_t[flip, :, 0] *= -1
+    d[flip, 0] *= -1
+    left = np.swapaxes(left_t.real, -1, -2)
+    ok = np.all(
+        np.isclose(left @ mats @ right, d[:, np.newaxis, :] * np.eye(4), rtol=rtol, atol=atol),
+        axis=(1, 2),
+    )
+    return left, d, right, ok
+
+
+def _so4_to_magic_su2s_batch(
+    mats: np.ndarray, *, rtol: float, atol: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized `cirq.so4_to_magic_su2s` of an (N, 4, 4) array of SO(4) matrices."""
+    ab = MAGIC @ mats @ MAGIC_CONJ_T
+    n = len(ab)
+    rows = np.arange(n)
+
+    # Use the entry with the largest magnitude as a reference point.
+    a, b = np.divmod(np.argmax(np.abs(ab).reshape(n, 16), axis=1), 4)
+
+    # Extract sub-factors touching the reference cell.
+    f1 = np.zeros((n, 2, 2), dtype=np.complex128)
+    f2 = np.zeros((n, 2, 2), dtype=np.complex128)
+    for i in range(2):
+        for j in range(2):
+            f1[rows, (a >> 1) ^ i, (b >> 1) ^ j] = ab[rows, a ^ (i << 1), b ^ (j << 1)]
+            f2[rows, (a & 1) ^ i, (b & 1) ^ j] = ab[rows, a ^ i, b ^ j]
+
+    # Rescale factors to have unit determinants.
+    for f in (f1, f2):
+        s = np.sqrt(np.linalg.det(f))
+        s[s == 0] = 1
+        f /= s[:, np.newaxis, np.newaxis]
+
+    # Determine global phase.
+    g = ab[rows, a, b] / (f1[rows, a >> 1, b >> 1] * f2[rows, a & 1, b & 1])
+    f1[np.real(g) < 0] *= -1
+    g = np.where(np.real(g) < 0, -g, g)
+
+    kron = np.einsum('nij,nkl->nikjl', f1, f2).reshape(n, 4, 4)
+    if not np.allclose(ab, g[:, np.newaxis, np.newaxis] * kron, rtol=rtol, atol=atol):
+        raise ValueError("Invalid 4x4 kronecker product.")
+    return f1, f2
+
+
+# These special-unitary matrices flip the X, Y, and Z axes respectively.
+_FLIPPERS = (
+    np.array([[0, 1], [1, 0]]) * 1j,
+    np.array([[0, -1j], [1j, 0]]) * 1j,
+    np.array([[1, 0], [0, -1]]) * 1j,
+)
+
+# Each of these special-unitary matrices swaps two the roles of two axes.
+# The matrix at index k swaps the *other two* axes.
+_SWAPPERS = (
+    np.array([[1, -1j], [1j, -1]]) * 1j * np.sqrt(0.5),
+    np.array([[1, 1], [1, -1]]) * 1j * np.sqrt(0.5),
+    np.array([[0, 1 - 1j], [1 + 1j, 0]]) * 1j * np.sqrt(0.5),
+)
+
+
+def _kak_canonicalize_vectors(
+    vectors: np.ndarray, atol: float = 1e-9
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized `cirq.kak_canonicalize_vector` of an (N, 3) array of interaction vectors.
+
+    Applies the same sequence of swaps, negations and shifts as `cirq.kak_canonicalize_vector`,
+    masked to the vectors which need them.
+
+    Returns:
+        A tuple (global_phases, after, interaction_coefficients, before) of arrays with shapes
+        (N,), (2, N, 2, 2), (N, 3) and (2, N, 2, 2), in the order of the `cirq.KakDecomposition`
+        attributes returned by `cirq.kak_canonicalize_vector`.
+    """
+    n = len(vectors)
+    v = np.array(vectors, dtype=np.float64)
+    phase = np.ones(n, dtype=np.complex128)
+    left = np.tile(np.eye(2, dtype=np.complex128), (2, n, 1, 1))
+    right = np.tile(np.eye(2, dtype=np.complex128), (2, n, 1, 1))
+
+    def shift(mask, k, step):
+        v[mask, k] += step * np.pi / 2
+        phase[mask] *= 1j**step
+        right[:, mask] = _FLIPPERS[k] ** (step % 4) @ right[:, mask]
+
+    def negate(mask, k1, k2):
+        v[mask, k1] *= -1
+        v[mask, k2] *= -1
+        phase[mask] *= -1
+        s = _FLIPPERS[3 - k1 - k2]
+        left[1, mask] = left[1, mask] @ s
+        right[1, mask] = s @ right[1, mask]
+
+    def swap(mask, k1, k2):
+        v[mask, k1], v[mask, k2] = v[mask, k2], v[mask, k1]
+        s = _SWAPPERS[3 - k1 - k2]
+        left[:, mask] = left[:, mask] @ s
+        right[:, mask] = s @ right[:, mask]
+
+    def canonical_shift(k):
+        while np.any(mask := v[:, k] <= -np.pi / 4):
+            shift(mask, k, +1)
+        while np.any(mask := v[:, k] > np.pi / 4):
+            shift(mask, k, -1)
+
+    def sort():
+        swap(np.abs(v[:, 0]) < np.abs(v[:, 1]), 0, 1)
+        swap(np.abs(v[:, 1]) < np.abs(v[:, 2]), 1, 2)
+        swap(np.abs(v[:, 0]) < np.abs(v[:, 1]), 0, 1)
+
+    canonical_shift(0)
+    canonical_shift(1)
+    canonical_shift(2)
+    sort()
+
+    negate(v[:, 0] < 0, 0, 2)
+    negate(v[:, 1] < 0, 1, 2)
+    canonical_shift(2)
+
+    mask = (v[:, 0] > np.pi / 4 - atol) & (v[:, 2] < 0)
+    shift(mask, 0, -1)
+    negate(mask, 0, 2)
+
+    return phase, left[::-1], v, right[::-1]
+
+
 def kak_vector(
     unitary: Iterable[np.ndarray] | np.ndarray,
     *,
@@ -263,6 +263,35 @@ def test_kak_decomposition(target) -> None:
     np.testing.assert_allclose(cirq.unitary(kak), target, atol=1e-8)
 
 
+def test_kak_decompositions() -> None:
+    targets = [np.eye(4), SWAP, SWAP * 1j, CZ, CNOT, SWAP @ CZ, np.kron(X, H)] + [
+        cirq.testing.random_unitary(4) for _ in range(50)
+    ]
+    kaks = cirq.kak_decompositions(targets)
+    assert len(kaks) == len(targets)
+    for target, kak in zip(targets, kaks):
+        np.testing.assert_allclose(cirq.unitary(kak), target, atol=1e-8)
+        np.testing.assert_allclose(
+            kak.interaction_coefficients,
+            cirq.kak_decomposition(target).interaction_coefficients,
+            atol=1e-8,
+        )
+        for u in (*kak.single_qubit_operations_before, *kak.single_qubit_operations_after):
+            assert cirq.is_special_unitary(u)
+    assert cirq.kak_decompositions(np.array(targets))[-1] == kaks[-1]
+
+
+def test_kak_decompositions_empty() -> None:
+    assert cirq.kak_decompositions([]) == []
+
+
+def test_kak_decompositions_invalid_input() -> None:
+    with pytest.raises(ValueError, match='shape'):
+        _ = cirq.kak_decompositions(np.eye(4))
+    with pytest.raises(ValueError, match='4x4 unitary'):
+        _ = cirq.kak_decompositions([np.eye(4), np.ones((4, 4))])
+
+
 def test_kak_decomposition_unitary_object() -> None:
     op = cirq.ISWAP(*cirq.LineQubit.range(2)) ** 0.5
     kak = cirq.kak_decomposition(op)
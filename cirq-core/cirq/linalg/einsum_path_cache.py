@@ -0,0 +1,177 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A process-wide cache of einsum contraction plans."""
+
+from __future__ import annotations
+
+import collections
+import threading
+
+import numpy as np
+
+from cirq._doc import document
+
+# A contraction step: the positions of the operands it consumes, and its einsum subscripts.
+_Step = tuple[tuple[int, ...], str]
+
+
+class EinsumPathCache:
+    """A bounded cache of einsum contraction plans, keyed on the subscripts and operand shapes.
+
+    `np.einsum` either contracts all operands in a single loop, which is slow for more than two
+    operands, or plans a sequence of pairwise contractions on every call when given `optimize`,
+    which dominates the cost of contracting small tensors. This cache plans the contraction of
+    each combination of subscripts and operand shapes once, with `np.einsum_path`, and
+    afterwards executes the planned pairwise contractions directly. Contractions of at most two
+    operands have nothing to plan, so `einsum` evaluates them directly without using the cache.
+
+    At most `maxsize` plans are kept, evicting the least recently used ones. The numbers of
+    lookups which found and did not find a plan are tracked in `hits` and `misses`. The cache is
+    safe to use from several threads.
+
+    `cirq.EINSUM_PATH_CACHE` is a process-wide instance which callers can share.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Inits EinsumPathCache.
+
+        Args:
+            maxsize: The maximum number of contraction plans to keep.
+
+        Raises:
+            ValueError: If `maxsize` is negative.
+        """
+        if maxsize < 0:
+            raise ValueError(f'maxsize must be non-negative, got {maxsize}.')
+        self._maxsize = maxsize
+        # [(subscripts, operand shapes)] : contraction steps
+        self._plans: collections.OrderedDict[
+            tuple[str, tuple[tuple[int, ...], ...]], list[_Step]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def einsum(
+        self, subscripts: str, *operands: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Evaluates `np.einsum(subscripts, *operands, out=out)` with a cached contraction plan.
+
+        Args:
+            subscripts: The einsum subscripts, with an explicit output after '->'.
+            *operands: The arrays to contract.
+            out: The buffer to store the result in. If not specified or None, a new buffer is
+                used.
+
+        Returns:
+            The contracted array.
+        """
+        if len(operands) <= 2:
+            return np.einsum(subscripts, *operands, out=out)
+        steps = self.plan(subscripts, *(np.shape(operand) for operand in operands))
+        if len(steps) == 1:
+            return np.einsum(subscripts, *operands, out=out)
+        arrays = list(operands)
+        for i, (positions, step_subscripts) in enumerate(steps):
+            step_operands = [arrays.pop(p) for p in positions]
+            last = i == len(steps) - 1
+            arrays.append(np.einsum(step_subscripts, *step_operands, out=out if last else None))
+        return arrays[0]
+
+    def plan(self, subscripts: str, *shapes: tuple[int, ...]) -> list[tuple[tuple[int, ...], str]]:
+        """Returns the contraction plan of operands with the given shapes.
+
+        Args:
+            subscripts: The einsum subscripts, with an explicit output after '->'.
+            *shapes: The shapes of the operands.
+
+        Returns:
+            The list of contraction steps. Each step is a tuple of the decreasing positions of
+            the operands it contracts, which are removed from the list of operands, and the
+            einsum subscripts of the contraction, whose result is appended to the list of
+            operands.
+        """
+        key = (subscripts, shapes)
+        with self._lock:
+            steps = self._plans.get(key)
+            if steps is not None:
+                self._plans.move_to_end(key)
+                self._hits += 1
+                return steps
+            self._misses += 1
+        steps = _plan_contraction(subscripts, shapes)
+        with self._lock:
+            if self._maxsize:
+                self._plans[key] = steps
+                while len(self._plans) > self._maxsize:
+                    self._plans.popitem(last=False)
+        return steps
+
+    def clear(self) -> None:
+        """Removes all plans and resets the statistics."""
+        with self._lock:
+            self._plans.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of contraction plans kept."""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups which found a contraction plan."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups which did not find a contraction plan."""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def __repr__(self) -> str:
+        return f'cirq.EinsumPathCache(maxsize={self._maxsize})'
+
+
+def _plan_contraction(subscripts: str, shapes: tuple[tuple[int, ...], ...]) -> list[_Step]:
+    inputs, output = subscripts.split('->')
+    terms = inputs.split(',')
+    if len(terms) <= 2:
+        return [(tuple(range(len(terms) - 1, -1, -1)), subscripts)]
+    # The plan only depends on the shapes, so zero-strided views stand in for the operands.
+    dummies = [np.broadcast_to(np.zeros(()), shape) for shape in shapes]
+    path, _ = np.einsum_path(
+        subscripts, *dummies, optimize='optimal' if len(terms) <= 4 else 'greedy'
+    )
+    steps: list[_Step] = []
+    for contraction in path[1:]:
+        positions = tuple(sorted(contraction, reverse=True))
+        contracted = [terms.pop(p) for p in positions]
+        if terms:
+            # Keep the indices which are still needed, in order of first appearance.
+            needed = set(''.join(terms)) | set(output)
+            result = ''.join(dict.fromkeys(i for i in ''.join(contracted) if i in needed))
+        else:
+            result = output
+        terms.append(result)
+        steps.append((positions, ','.join(contracted) + '->' + result))
+    return steps
+
+
+EINSUM_PATH_CACHE = EinsumPathCache()
+document(EINSUM_PATH_CACHE, """A process-wide `cirq.EinsumPathCache` which callers can share.""")
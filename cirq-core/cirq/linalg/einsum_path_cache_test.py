@@ -0,0 +1,90 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+@pytest.mark.parametrize(
+    'subscripts, shapes',
+    [
+        ('ij->ji', [(2, 3)]),
+        ('ij,jk->ik', [(2, 3), (3, 4)]),
+        ('ij,jk,kl->il', [(2, 3), (3, 4), (4, 5)]),
+        ('aA,bB,cC,dD->abcdABCD', [(2, 2)] * 4),
+        ('ab,bc,cd,de,ef,fa->', [(2, 3), (3, 4), (4, 2), (2, 3), (3, 2), (2, 2)]),
+    ],
+)
+def test_einsum_matches_numpy(subscripts, shapes) -> None:
+    cache = cirq.EinsumPathCache()
+    prng = np.random.RandomState(0)
+    operands = [prng.normal(size=shape) for shape in shapes]
+    expected = np.einsum(subscripts, *operands)
+    for _ in range(2):
+        np.testing.assert_allclose(cache.einsum(subscripts, *operands), expected)
+    # Contractions of at most two operands don't use the cache.
+    if len(shapes) > 2:
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    else:
+        assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+    out = np.empty_like(expected)
+    assert cache.einsum(subscripts, *operands, out=out) is out
+    np.testing.assert_allclose(out, expected)
+
+
+def test_plan() -> None:
+    cache = cirq.EinsumPathCache()
+    assert cache.plan('ij,jk->ik', (2, 3), (3, 4)) == [((1, 0), 'ij,jk->ik')]
+    steps = cache.plan('ij,jk,kl->il', (2, 10), (10, 10), (10, 2))
+    assert len(steps) == 2
+    assert steps[-1][1].endswith('->il')
+
+
+def test_eviction_and_clear() -> None:
+    cache = cirq.EinsumPathCache(maxsize=2)
+    assert cache.maxsize == 2
+    for n in range(1, 4):
+        cache.plan('ij,jk->ik', (n, n), (n, n))
+    assert len(cache) == 2
+    cache.plan('ij,jk->ik', (3, 3), (3, 3))
+    cache.plan('ij,jk->ik', (1, 1), (1, 1))
+    assert (cache.hits, cache.misses) == (1, 4)
+
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+    disabled = cirq.EinsumPathCache(maxsize=0)
+    disabled.plan('ij,jk->ik', (1, 1), (1, 1))
+    disabled.plan('ij,jk->ik', (1, 1), (1, 1))
+    assert (len(disabled), disabled.hits, disabled.misses) == (0, 0, 2)
+
+    with pytest.raises(ValueError, match='maxsize'):
+        _ = cirq.EinsumPathCache(maxsize=-1)
+
+
+def test_global_cache() -> None:
+    operands = [np.eye(2)] * 3
+    cirq.EINSUM_PATH_CACHE.einsum('ij,jk,kl->il', *operands)
+    hits = cirq.EINSUM_PATH_CACHE.hits
+    np.testing.assert_allclose(cirq.EINSUM_PATH_CACHE.einsum('ij,jk,kl->il', *operands), np.eye(2))
+    assert cirq.EINSUM_PATH_CACHE.hits == hits + 1
+
+
+def test_repr() -> None:
+    assert repr(cirq.EinsumPathCache(maxsize=3)) == 'cirq.EinsumPathCache(maxsize=3)'
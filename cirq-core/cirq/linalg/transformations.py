@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import dataclasses
 import functools
+import string
 from collections.abc import Sequence
 from types import EllipsisType
 from typing import Any
@@ -106,6 +107,9 @@ def targeted_left_multiply(
     right_target: np.ndarray,
     target_axes: Sequence[int],
     out: np.ndarray | None = None,
+    *,
+    left_batched: bool = False,
+    right_batched: bool = False,
 ) -> np.ndarray:
     """Left-multiplies the given axes of the target tensor by the given matrix.
 
@@ -129,12 +133,23 @@ def targeted_left_multiply(
             right_target=old_effect,
             target_axes=[1, 4])
 
+    Either operand can also be a batch, stacked along a new leading axis. If
+    `right_batched` is set, each of the targets `right_target[b]` is multiplied
+    by the matrix, and if `left_batched` is set, the target is multiplied by
+    each of the matrices `left_matrix[b]`. If both are set, target `b` is
+    multiplied by matrix `b`. In each case the result has a leading batch axis.
+
     Args:
         left_matrix: What to left-multiply the target tensor by.
         right_target: A tensor to carefully broadcast a left-multiply over.
-        target_axes: Which axes of the target are being operated on.
+        target_axes: Which axes of the target are being operated on. If the
+            target is batched, these exclude the leading batch axis.
         out: The buffer to store the results in. If not specified or None, a new
-            buffer is used. Must have the same shape as right_target.
+            buffer is used. Must have the same shape as the result, i.e. the
+            shape of right_target, preceded by the batch size if `left_batched`
+            is set and `right_batched` is not.
+        left_batched: Whether the first axis of `left_matrix` is a batch axis.
+        right_batched: Whether the first axis of `right_target` is a batch axis.
 
     Returns:
         The output tensor.
@@ -145,8 +160,27 @@ def targeted_left_multiply(
     if out is right_target or out is left_matrix:
         raise ValueError('out is right_target or out is left_matrix')
 
+    d = right_target.ndim - right_batched
+    subscripts = _targeted_left_multiply_subscripts(
+        d, tuple(target_axes), left_batched, right_batched
+    )
+    return np.einsum(
+        subscripts,
+        left_matrix,
+        right_target,
+        # We would prefer to omit 'optimize=' (it's faster),
+        # but this is a workaround for a bug in numpy:
+        #     https://github.com/numpy/numpy/issues/10926
+        optimize=d + len(target_axes) + (left_batched or right_batched) >= 26,
+        out=out,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _targeted_left_multiply_subscripts(
+    d: int, target_axes: tuple[int, ...], left_batched: bool, right_batched: bool
+) -> str:
     k = len(target_axes)
-    d = len(right_target.shape)
     work_indices = tuple(range(k))
     data_indices = tuple(range(k, k + d))
     used_data_indices = tuple(data_indices[q] for q in target_axes)
@@ -155,20 +189,16 @@ def targeted_left_multiply(
     for w, t in zip(work_indices, target_axes):
         output_indices[t] = w
 
-    all_indices = set(input_indices + data_indices + tuple(output_indices))
+    batch_indices = (k + d,)
+    left_indices = batch_indices * left_batched + input_indices
+    right_indices = batch_indices * right_batched + data_indices
+    if left_batched or right_batched:
+        output_indices = [*batch_indices, *output_indices]
 
-    return np.einsum(
-        left_matrix,
-        input_indices,
-        right_target,
-        data_indices,
-        output_indices,
-        # We would prefer to omit 'optimize=' (it's faster),
-        # but this is a workaround for a bug in numpy:
-        #     https://github.com/numpy/numpy/issues/10926
-        optimize=len(all_indices) >= 26,
-        out=out,
-    )
+    def letters(indices: Sequence[int]) -> str:
+        return ''.join(string.ascii_letters[i] for i in indices)
+
+    return f'{letters(left_indices)},{letters(right_indices)}->{letters(output_indices)}'
 
 
 @dataclasses.dataclass
@@ -312,6 +342,8 @@ def apply_matrix_to_slices(
     slices: Sequence[_TSlice],
     *,
     out: np.ndarray | None = None,
+    target_batched: bool = False,
+    matrix_batched: bool = False,
 ) -> np.ndarray:
     r"""Left-multiplies an NxN matrix onto N slices of a numpy array.
 
@@ -338,6 +370,13 @@ def apply_matrix_to_slices(
                 slices=[1, 2]
             )
 
+    Either operand can also be a batch, stacked along a new leading axis. If
+    `target_batched` is set, the matrix is applied to the slices of each of the
+    targets `target[b]`, and if `matrix_batched` is set, each of the matrices
+    `matrix[b]` is applied to the slices of the target. If both are set, matrix
+    `b` is applied to target `b`. In each case the result has a leading batch
+    axis.
+
     Args:
         target: The input array with slices that need to be left-multiplied.
         matrix: The linear operation to apply to the subspace defined by the
@@ -348,7 +387,11 @@ def apply_matrix_to_slices(
             non-overlapping sections of the input all with the same shape.
         out: Where to write the output. If not specified, a new numpy array is
             created, with the same shape and dtype as the target, to store the
-            output.
+            output. If only `matrix` is batched, the output is preceded by the
+            batch axis.
+        target_batched: Whether the first axis of `target` is a batch axis. The
+            slices then index the remaining axes.
+        matrix_batched: Whether the first axis of `matrix` is a batch axis.
 
     Returns:
         The transformed array.
@@ -360,9 +403,14 @@ def apply_matrix_to_slices(
     # Validate arguments.
     if out is target:
         raise ValueError("Can't write output over the input.")
-    if matrix.shape != (len(slices), len(slices)):
+    if matrix.shape[matrix_batched:] != (len(slices), len(slices)):
         raise ValueError("matrix.shape != (len(slices), len(slices))")
 
+    if target_batched or matrix_batched:
+        return _apply_batched_matrix_to_slices(
+            target, matrix, slices, out, target_batched, matrix_batched
+        )
+
     # Fill in default values and prepare space.
     if out is None:
         out = np.copy(target)
@@ -379,6 +427,40 @@ def apply_matrix_to_slices(
     return out
 
 
+def _apply_batched_matrix_to_slices(
+    target: np.ndarray,
+    matrix: np.ndarray,
+    slices: Sequence[_TSlice],
+    out: np.ndarray | None,
+    target_batched: bool,
+    matrix_batched: bool,
+) -> np.ndarray:
+    if not target_batched:
+        target = target[np.newaxis]
+    batch_size = max(target.shape[0], matrix.shape[0] if matrix_batched else 1)
+    # Index the slices behind the leading batch axis.
+    batch_slices = [(slice(None), *(s if isinstance(s, Sequence) else (s,))) for s in slices]
+    slice_ndim = target[batch_slices[0]].ndim if batch_slices else 1
+    # Broadcast each matrix entry against the batch axis of a slice.
+    coefficients = (
+        matrix.reshape(matrix.shape + (1,) * (slice_ndim - 1))
+        if matrix_batched
+        else matrix[np.newaxis]
+    )
+
+    if out is None:
+        out = np.empty((batch_size, *target.shape[1:]), dtype=target.dtype)
+    out[...] = target
+
+    for i, s_i in enumerate(batch_slices):
+        out[s_i] *= coefficients[:, i, i]
+        for j, s_j in enumerate(batch_slices):
+            if i != j:
+                out[s_i] += target[s_j] * coefficients[:, i, j]
+
+    return out
+
+
 def partial_trace(tensor: np.ndarray, keep_indices: Sequence[int]) -> np.ndarray:
     """Takes the partial trace of a given tensor.
 
@@ -190,6 +190,42 @@ def test_targeted_left_multiply_out() -> None:
     np.testing.assert_allclose(result, np.array([-1, -2]), atol=1e-8)
 
 
+@pytest.mark.parametrize(
+    'left_batched, right_batched', [(True, False), (False, True), (True, True)]
+)
+def test_targeted_left_multiply_batched(left_batched: bool, right_batched: bool) -> None:
+    batch_size = 3
+    lefts = np.stack(
+        [cirq.testing.random_unitary(4, random_state=i).reshape((2,) * 4) for i in range(3)]
+    )
+    rights = np.stack(
+        [cirq.testing.random_superposition(16, random_state=i).reshape((2,) * 4) for i in range(3)]
+    )
+    left = lefts if left_batched else lefts[0]
+    right = rights if right_batched else rights[0]
+
+    expected = np.stack(
+        [
+            cirq.targeted_left_multiply(
+                left[b] if left_batched else left, right[b] if right_batched else right, [3, 1]
+            )
+            for b in range(batch_size)
+        ]
+    )
+    for _ in range(2):
+        result = cirq.targeted_left_multiply(
+            left, right, [3, 1], left_batched=left_batched, right_batched=right_batched
+        )
+        np.testing.assert_allclose(result, expected, atol=1e-8)
+
+    out = np.zeros_like(expected)
+    result = cirq.targeted_left_multiply(
+        left, right, [3, 1], out=out, left_batched=left_batched, right_batched=right_batched
+    )
+    assert result is out
+    np.testing.assert_allclose(out, expected, atol=1e-8)
+
+
 def test_targeted_conjugate_simple() -> None:
     a = np.array([[0, 1j], [0, 0]])
     # yapf: disable
@@ -305,6 +341,48 @@ def test_apply_matrix_to_slices() -> None:
     np.testing.assert_allclose(actual, np.array([1, 13, 31, 4]))
 
 
+@pytest.mark.parametrize(
+    'target_batched, matrix_batched', [(True, False), (False, True), (True, True)]
+)
+def test_apply_matrix_to_slices_batched(target_batched: bool, matrix_batched: bool) -> None:
+    targets = np.arange(24.0).reshape((3, 2, 2, 2))
+    matrices = np.array([[[2, 3], [5, 7]], [[0, 1], [1, 0]], [[1, -1], [2, 0]]])
+    target = targets if target_batched else targets[0]
+    matrix = matrices if matrix_batched else matrices[0]
+    slices = [(0, slice(None), 0), (1, slice(None), 0)]
+
+    expected = np.stack(
+        [
+            cirq.apply_matrix_to_slices(
+                target[b] if target_batched else target,
+                matrix[b] if matrix_batched else matrix,
+                slices,
+            )
+            for b in range(3)
+        ]
+    )
+    result = cirq.apply_matrix_to_slices(
+        target, matrix, slices, target_batched=target_batched, matrix_batched=matrix_batched
+    )
+    np.testing.assert_allclose(result, expected)
+
+    out = np.zeros_like(expected)
+    result = cirq.apply_matrix_to_slices(
+        target,
+        matrix,
+        [0, 1],
+        out=out,
+        target_batched=target_batched,
+        matrix_batched=matrix_batched,
+    )
+    assert result is out
+
+    with pytest.raises(ValueError, match='shape'):
+        _ = cirq.apply_matrix_to_slices(
+            target, matrix, [0, 1, (1, 1)], target_batched=target_batched, matrix_batched=True
+        )
+
+
 def test_partial_trace() -> None:
     a = np.reshape(np.arange(4), (2, 2))
     b = np.reshape(np.arange(9) + 4, (3, 3))
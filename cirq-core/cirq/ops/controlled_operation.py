@@ -169,7 +169,9 @@ class ControlledOperation(raw_types.Operation):
             buffer_view = args.available_buffer[active]
             result = protocols.apply_unitary(
                 self.sub_operation,
-                protocols.ApplyUnitaryArgs(target_view, buffer_view, sub_axes),
+                protocols.ApplyUnitaryArgs(
+                    target_view, buffer_view, sub_axes, batch_axis=args.batch_axis
+                ),
                 default=NotImplemented,
             )
 
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import collections
 from collections.abc import Callable, Hashable, Iterable
 from typing import Any, cast, TYPE_CHECKING
 
@@ -310,8 +311,15 @@ class Gateset:
 
     Gatesets rely on the underlying `cirq.GateFamily` for both description and
     validation purposes.
+
+    The verdicts of containment checks of hashable gates are memoized per gate type, gate value
+    and tags, in a bounded cache, so that validating the many repeated gates of large circuits
+    only checks each distinct gate once.
     """
 
+    # The maximum number of memoized containment verdicts.
+    _MAX_CACHED_VERDICTS = 4096
+
     def __init__(
         self,
         *gates: type[raw_types.Gate] | raw_types.Gate | GateFamily,
@@ -361,6 +369,14 @@ class Gateset:
                     self._gate_families_with_tags.insert(0, g)
         self._unique_gate_list = unique_gate_list
         self._gates = frozenset(unique_gate_list)
+        # Families which do not override `GateFamily.__contains__` only look at the gate and the
+        # tags of an item, so their verdicts can be memoized.
+        self._memoize_verdicts = all(
+            type(g).__contains__ is GateFamily.__contains__ for g in unique_gate_list
+        )
+        self._verdicts: collections.OrderedDict[Hashable, bool] = collections.OrderedDict()
+        # The type gate family matching each gate type, if any, resolved along its mro.
+        self._type_families: dict[type, GateFamily | None] = {}
 
     @property
     def name(self) -> str | None:
@@ -430,14 +446,59 @@ class Gateset:
         g = item if isinstance(item, raw_types.Gate) else item.gate
         assert g is not None, f'`item`: {item} must be a gate or have a valid `item.gate`'
 
+        key = self._verdict_key(item, g)
+        if key is None:
+            return self._contains_gate(item, g)
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            verdict = self._contains_gate(item, g)
+            self._verdicts[key] = verdict
+            while len(self._verdicts) > self._MAX_CACHED_VERDICTS:
+                self._verdicts.popitem(last=False)
+        else:
+            try:
+                self._verdicts.move_to_end(key)
+            except KeyError:
+                # Gatesets are shared across threads, which may have evicted the verdict since.
+                pass
+        return verdict
+
+    def _verdict_key(
+        self, item: raw_types.Gate | raw_types.Operation, g: raw_types.Gate
+    ) -> Hashable | None:
+        """Returns the key of the memoized verdict of `item`, or None if it can't be memoized."""
+        if not self._memoize_verdicts:
+            return None
+        tags: frozenset[Hashable] | None = frozenset()
+        if self._gate_families_with_tags:
+            # Families with tags to accept reject gates, but may accept operations.
+            tags = frozenset(item.tags) if isinstance(item, raw_types.Operation) else None
+        key = (type(g), g, tags)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _contains_gate(self, item: raw_types.Gate | raw_types.Operation, g: raw_types.Gate) -> bool:
         # Check "type" based GateFamily since isinstance is fast
-        for gate_mro_type in type(g).mro():
-            if gate_mro_type in self._type_gate_families:
-                assert item in self._type_gate_families[gate_mro_type], (
-                    f"{g} type {gate_mro_type} matches Type GateFamily:"
-                    f"{self._type_gate_families[gate_mro_type]} but is not accepted by it."
-                )
-                return True
+        gate_type = type(g)
+        if gate_type not in self._type_families:
+            self._type_families[gate_type] = next(
+                (
+                    self._type_gate_families[t]
+                    for t in gate_type.mro()
+                    if t in self._type_gate_families
+                ),
+                None,
+            )
+        type_family = self._type_families[gate_type]
+        if type_family is not None:
+            assert item in type_family, (
+                f"{g} type {type_family.gate} matches Type GateFamily:"
+                f"{type_family} but is not accepted by it."
+            )
+            return True
 
         # Check exact instance equality next (only for hashable gates)
         if isinstance(g, Hashable) and g in self._instance_gate_families:
@@ -473,6 +534,22 @@ class Gateset:
             optree = circuit_or_optree.all_operations()
         return all(self._validate_operation(op) for op in op_tree.flatten_to_ops(optree))
 
+    def validate_many(
+        self, circuits_or_optrees: Iterable[cirq.AbstractCircuit | op_tree.OP_TREE]
+    ) -> list[bool]:
+        """Validates many circuits or `cirq.OP_TREE`s against the Gateset.
+
+        The memoized verdicts of the gates are shared across all the circuits, so each distinct
+        gate is only checked once.
+
+        Args:
+            circuits_or_optrees: The `cirq.Circuit`s or `cirq.OP_TREE`s to validate.
+
+        Returns:
+            Whether each of the circuits or `cirq.OP_TREE`s is valid.
+        """
+        return [self.validate(circuit_or_optree) for circuit_or_optree in circuits_or_optrees]
+
     def _validate_operation(self, op: raw_types.Operation) -> bool:
         """Validates whether the given `cirq.Operation` is contained in this Gateset.
 
@@ -492,12 +569,12 @@ class Gateset:
             op: The `cirq.Operation` instance to check containment for.
         """
 
-        # To avoid circular import.
-        from cirq.circuits import circuit_operation
-
         if op.gate is not None:
             return op in self
 
+        # To avoid circular import.
+        from cirq.circuits import circuit_operation
+
         if isinstance(op, raw_types.TaggedOperation):
             return self._validate_operation(op.sub_operation)
         elif isinstance(op, circuit_operation.CircuitOperation) and self._unroll_circuit_op:
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import collections
 import re
 from collections.abc import Hashable
 from typing import cast
@@ -491,3 +492,66 @@ def test_overlapping_gate_families() -> None:
     assert instance_op_with_tag in gs
     assert type_op_no_tag not in gs
     assert type_op_with_tag in gs
+
+
+def test_gateset_memoizes_verdicts(monkeypatch) -> None:
+    tag = "PhysicalZTag"
+    gs = cirq.Gateset(
+        cirq.GateFamily(cirq.ZPowGate, tags_to_accept=[tag]), cirq.XPowGate, CustomX**0.5
+    )
+    for _ in range(2):
+        assert cirq.Z(q) not in gs
+        assert cirq.Z(q).with_tags(tag) in gs
+        assert cirq.Z not in gs
+        assert cirq.X**0.3 in gs
+        assert (CustomX**0.5).on(q) in gs
+        assert CustomX not in gs
+    assert len(gs._verdicts) == 6
+
+    monkeypatch.setattr(cirq.Gateset, '_MAX_CACHED_VERDICTS', 2)
+    for exponent in [0.1, 0.2, 0.3]:
+        assert cirq.XPowGate(exponent=exponent) in gs
+    assert list(gs._verdicts) == [
+        (cirq.XPowGate, cirq.XPowGate(exponent=e), None) for e in [0.2, 0.3]
+    ]
+
+
+def test_gateset_verdicts_evicted_concurrently() -> None:
+    class EvictingDict(collections.OrderedDict):
+        def move_to_end(self, key, last=True) -> None:
+            # Another thread evicts the verdict between its lookup and its move to the end.
+            self.clear()
+            super().move_to_end(key, last)
+
+    gs = cirq.Gateset(cirq.XPowGate)
+    assert cirq.X in gs
+    gs._verdicts = EvictingDict(gs._verdicts)
+    assert cirq.X in gs
+    assert not gs._verdicts
+
+
+def test_gateset_does_not_memoize_custom_containment() -> None:
+    class OnlyQubitZero(cirq.GateFamily):
+        def __contains__(self, item) -> bool:
+            return isinstance(item, cirq.Operation) and item.qubits == (cirq.q(0),)
+
+    gs = cirq.Gateset(OnlyQubitZero(cirq.X))
+    assert cirq.X(cirq.q(0)) in gs
+    assert cirq.X(cirq.q(1)) not in gs
+    assert not gs._verdicts
+
+
+def test_gateset_validate_many() -> None:
+    gs = cirq.Gateset(cirq.CZ, cirq.PhasedXZGate)
+    qubits = cirq.LineQubit.range(3)
+    valid = cirq.Circuit(
+        cirq.PhasedXZGate(x_exponent=0.5, z_exponent=0, axis_phase_exponent=0).on_each(*qubits),
+        cirq.CZ(*qubits[:2]),
+    )
+    invalid = valid + cirq.CNOT(*qubits[1:])
+    assert gs.validate_many([valid, invalid, [cirq.CZ(*qubits[1:])], []]) == [
+        True,
+        False,
+        True,
+        True,
+    ]
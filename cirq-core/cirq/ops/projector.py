@@ -8,13 +8,17 @@ from collections.abc import Iterable, Mapping
 from typing import Any, TYPE_CHECKING
 
 import numpy as np
-from scipy.sparse import csr_matrix
 
 from cirq import value
+from cirq._import import LazyLoader
 
 if TYPE_CHECKING:
+    from scipy import sparse
+
     import cirq
 
+sparse = LazyLoader("sparse", globals(), "scipy.sparse")
+
 
 def _check_qids_dimension(qids):
     """A utility to check that we only have Qubits."""
@@ -47,7 +51,7 @@ class ProjectorString:
     def coefficient(self) -> complex:
         return self._coefficient
 
-    def matrix(self, projector_qids: Iterable[cirq.Qid] | None = None) -> csr_matrix:
+    def matrix(self, projector_qids: Iterable[cirq.Qid] | None = None) -> sparse.csr_matrix:
         """Returns the matrix of self in computational basis of qubits.
 
         Args:
@@ -77,7 +81,7 @@ class ProjectorString:
                 kron_idx += i * d
             ones_idx.append(kron_idx)
 
-        return csr_matrix(
+        return sparse.csr_matrix(
             ([self._coefficient] * len(ones_idx), (ones_idx, ones_idx)), shape=(total_d, total_d)
         )
 
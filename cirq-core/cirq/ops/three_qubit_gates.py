@@ -439,7 +439,9 @@ class CCXPowGate(gate_features.InterchangeableQubitsGate, eigen_gate.EigenGate):
             controlled_gate.ControlledGate(
                 controlled_gate.ControlledGate(pauli_gates.X**self.exponent)
             ),
-            protocols.ApplyUnitaryArgs(args.target_tensor, args.available_buffer, args.axes),
+            protocols.ApplyUnitaryArgs(
+                args.target_tensor, args.available_buffer, args.axes, batch_axis=args.batch_axis
+            ),
             default=NotImplemented,
         )
 
@@ -580,7 +582,9 @@ class CCYPowGate(gate_features.InterchangeableQubitsGate, eigen_gate.EigenGate):
             controlled_gate.ControlledGate(
                 controlled_gate.ControlledGate(pauli_gates.Y**self.exponent)
             ),
-            protocols.ApplyUnitaryArgs(args.target_tensor, args.available_buffer, args.axes),
+            protocols.ApplyUnitaryArgs(
+                args.target_tensor, args.available_buffer, args.axes, batch_axis=args.batch_axis
+            ),
             default=NotImplemented,
         )
 
@@ -731,7 +735,9 @@ class CSwapGate(gate_features.InterchangeableQubitsGate, raw_types.Gate):
     def _apply_unitary_(self, args: protocols.ApplyUnitaryArgs) -> np.ndarray:
         return protocols.apply_unitary(
             controlled_gate.ControlledGate(swap_gates.SWAP),
-            protocols.ApplyUnitaryArgs(args.target_tensor, args.available_buffer, args.axes),
+            protocols.ApplyUnitaryArgs(
+                args.target_tensor, args.available_buffer, args.axes, batch_axis=args.batch_axis
+            ),
             default=NotImplemented,
         )
 
@@ -62,6 +62,13 @@ from cirq.protocols.control_key_protocol import (
     SupportsControlKey as SupportsControlKey,
 )
 
+from cirq.protocols.binary_serialization import (
+    BinaryWriter as BinaryWriter,
+    iter_binary as iter_binary,
+    read_binary as read_binary,
+    to_binary as to_binary,
+)
+
 from cirq.protocols.circuit_diagram_info_protocol import (
     circuit_diagram_info as circuit_diagram_info,
     CircuitDiagramInfo as CircuitDiagramInfo,
@@ -71,6 +78,7 @@ from cirq.protocols.circuit_diagram_info_protocol import (
 )
 
 from cirq.protocols.decompose_protocol import (
+    DecomposeCache as DecomposeCache,
     decompose as decompose,
     decompose_once as decompose_once,
     decompose_once_with_qubits as decompose_once_with_qubits,
@@ -99,6 +107,7 @@ from cirq.protocols.json_serialization import (
     cirq_type_from_json as cirq_type_from_json,
     DEFAULT_RESOLVERS as DEFAULT_RESOLVERS,
     HasJSONNamespace as HasJSONNamespace,
+    iter_json as iter_json,
     JsonResolver as JsonResolver,
     json_cirq_type as json_cirq_type,
     json_namespace as json_namespace,
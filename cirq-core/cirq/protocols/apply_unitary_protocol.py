@@ -68,6 +68,11 @@ class ApplyUnitaryArgs:
             unitary effect on that axis. Subspaces on each axis must be
             representable as a slice, so the dimensions specified here need to
             have a consistent step size.
+        batch_axis: An optional axis of the target tensor which indexes a batch
+            of independent targets, e.g. a batch of states. It is never one of
+            `axes`, so implementations which only operate on `axes` apply the
+            unitary effect to every target in the batch. Implementations can
+            use it to apply a different effect to each target of the batch.
     """
 
     def __init__(
@@ -76,6 +81,8 @@ class ApplyUnitaryArgs:
         available_buffer: np.ndarray,
         axes: Iterable[int],
         subspaces: Sequence[tuple[int, ...]] | None = None,
+        *,
+        batch_axis: int | None = None,
     ):
         """Inits ApplyUnitaryArgs.
 
@@ -95,14 +102,20 @@ class ApplyUnitaryArgs:
                 the unitary effect on that axis. Subspaces on each axis must be
                 representable as a slice, so the dimensions specified here need
                 to have a consistent step size.
+            batch_axis: An optional axis of the target tensor which indexes a
+                batch of independent targets. Must not be one of `axes`.
         Raises:
             ValueError: If the subspace count does not equal the axis count, if
-                any subspace has zero dimensions, or if any subspace has
-                dimensions specified without a consistent step size.
+                any subspace has zero dimensions, if any subspace has
+                dimensions specified without a consistent step size, or if the
+                batch axis is one of the axes.
         """
         self.target_tensor = target_tensor
         self.available_buffer = available_buffer
         self.axes = tuple(axes)
+        if batch_axis is not None and batch_axis in self.axes:
+            raise ValueError(f'The batch axis {batch_axis} is one of the axes {self.axes}.')
+        self.batch_axis = batch_axis
         if subspaces is not None:
             if len(self.axes) != len(subspaces):
                 raise ValueError('Subspace count does not match axis count.')
@@ -113,16 +126,22 @@ class ApplyUnitaryArgs:
 
     @staticmethod
     def default(
-        num_qubits: int | None = None, *, qid_shape: tuple[int, ...] | None = None
+        num_qubits: int | None = None,
+        *,
+        qid_shape: tuple[int, ...] | None = None,
+        batch_size: int | None = None,
     ) -> ApplyUnitaryArgs:
         """A default instance starting in state |0⟩.
 
-        Specify exactly one argument.
+        Specify exactly one of `num_qubits` and `qid_shape`.
 
         Args:
             num_qubits: The number of qubits to make space for in the state.
             qid_shape: The shape of the state, specifying the dimension of each
                 qid.
+            batch_size: If specified, the target tensor is a batch of this many
+                states, all starting in state |0⟩, stacked along a leading
+                batch axis.
 
         Raises:
             TypeError: If exactly neither `num_qubits` or `qid_shape` is provided or
@@ -135,7 +154,10 @@ class ApplyUnitaryArgs:
         qid_shape = cast(tuple[int, ...], qid_shape)  # Satisfy mypy
         num_qubits = len(qid_shape)
         state = qis.one_hot(index=(0,) * num_qubits, shape=qid_shape, dtype=np.complex128)
-        return ApplyUnitaryArgs(state, np.empty_like(state), range(num_qubits))
+        if batch_size is None:
+            return ApplyUnitaryArgs(state, np.empty_like(state), range(num_qubits))
+        state = np.repeat(state[np.newaxis], batch_size, axis=0)
+        return ApplyUnitaryArgs(state, np.empty_like(state), range(1, num_qubits + 1), batch_axis=0)
 
     @classmethod
     def for_unitary(
@@ -179,7 +201,12 @@ class ApplyUnitaryArgs:
         perm = (*self.axes, *other_axes)
         target_tensor = self.target_tensor.transpose(*perm)
         available_buffer = self.available_buffer.transpose(*perm)
-        return ApplyUnitaryArgs(target_tensor, available_buffer, range(len(self.axes)))
+        return ApplyUnitaryArgs(
+            target_tensor,
+            available_buffer,
+            range(len(self.axes)),
+            batch_axis=self._transposed_batch_axis(perm),
+        )
 
     def _for_operation_with_qid_shape(
         self, indices: Iterable[int], slices: tuple[int | slice, ...]
@@ -211,7 +238,15 @@ class ApplyUnitaryArgs:
         target_tensor = self.target_tensor.transpose(*ordered_axes)[(..., *slices)]
         available_buffer = self.available_buffer.transpose(*ordered_axes)[(..., *slices)]
         new_axes = range(len(other_axes), len(ordered_axes))
-        return ApplyUnitaryArgs(target_tensor, available_buffer, new_axes)
+        return ApplyUnitaryArgs(
+            target_tensor,
+            available_buffer,
+            new_axes,
+            batch_axis=self._transposed_batch_axis(ordered_axes),
+        )
+
+    def _transposed_batch_axis(self, perm: Sequence[int]) -> int | None:
+        return None if self.batch_axis is None else perm.index(self.batch_axis)
 
     def subspace_index(
         self, little_endian_bits_int: int = 0, *, big_endian_bits_int: int = 0
@@ -569,7 +604,9 @@ def apply_unitaries(
     for op in unitary_values:
         indices = [qubit_map[q.with_dimension(1)] for q in op.qubits]
         result = apply_unitary(
-            unitary_value=op, args=ApplyUnitaryArgs(state, buffer, indices), default=None
+            unitary_value=op,
+            args=ApplyUnitaryArgs(state, buffer, indices, batch_axis=args.batch_axis),
+            default=None,
         )
 
         # Handle failure.
@@ -719,6 +719,37 @@ def test_apply_unitary_args_with_axes_transposed_to_start() -> None:
     assert args.available_buffer[1, 2, 3, 4] == 2
 
 
+def test_apply_unitary_args_batch_axis() -> None:
+    args = cirq.ApplyUnitaryArgs.default(3, batch_size=4)
+    assert args.target_tensor.shape == (4, 2, 2, 2)
+    assert args.axes == (1, 2, 3)
+    assert args.batch_axis == 0
+    assert args.with_axes_transposed_to_start().batch_axis == 3
+    assert args._for_operation_with_qid_shape([2], (2,)).batch_axis == 0
+
+    with pytest.raises(ValueError, match='batch axis'):
+        _ = cirq.ApplyUnitaryArgs(args.target_tensor, args.available_buffer, [0, 1], batch_axis=1)
+
+    # Each state of the batch is transformed independently.
+    q = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H.on_each(*q),
+        cirq.CCZ(*q),
+        cirq.CNOT(q[2], q[0]).controlled_by(q[1]),
+        cirq.MatrixGate(cirq.testing.random_unitary(4, random_state=1)).on(q[0], q[2]),
+        cirq.FREDKIN(*q),
+    )
+    states = np.stack(
+        [cirq.testing.random_superposition(8, random_state=i).reshape((2,) * 3) for i in range(4)]
+    )
+    args.target_tensor[...] = states
+    result = cirq.apply_unitaries(circuit.all_operations(), q, args)
+    assert result is not None
+    unitary = circuit.unitary(qubit_order=q)
+    for state, actual in zip(states, result):
+        np.testing.assert_allclose(actual.reshape(8), unitary @ state.reshape(8), atol=1e-8)
+
+
 def test_cast_to_complex() -> None:
     y0: cirq.PauliString[cirq.LineQubit]
     y0 = cirq.PauliString({cirq.LineQubit(0): cirq.Y})
@@ -0,0 +1,540 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A compact binary serialization format for objects supporting the JSON protocol.
+
+The format reuses the `_json_dict_` and `_from_json_dict_` methods of the JSON protocol, and
+deserializes objects into exactly what `cirq.read_json` would return, but it avoids most of
+the overhead of JSON:
+
+- Numbers are stored in binary, and numeric numpy arrays as raw bytes.
+- Each combination of `cirq_type` and field names is written out once, and later objects
+  refer to it by an index. When reading, its factory is resolved once.
+- Qubits, gates, operations and `cirq.SerializableByKey` objects are interned: their
+  repeated occurrences refer to the first one, which is deserialized only once.
+- Short strings are interned.
+
+A file is a header followed by records, each holding a top-level object. The tables of
+types, strings and interned objects are shared by all the records of a file, so that a large
+circuit or a long list of results can be written and read one record at a time.
+"""
+
+from __future__ import annotations
+
+import io
+import pathlib
+import struct
+from collections.abc import Iterator, Sequence
+from typing import Any, cast, IO
+
+import numpy as np
+
+from cirq import ops
+from cirq.protocols.json_serialization import (
+    _json_dict_with_cirq_type,
+    CirqEncoder,
+    DEFAULT_RESOLVERS,
+    factory_from_json,
+    json_cirq_type,
+    JsonResolver,
+    SerializableByKey,
+)
+
+_MAGIC = b'\x93CIRQ\x01'
+
+# Value tags. Bytes from _SMALL_INT up are the non-negative integers below 128.
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3  # A zigzag-encoded varint.
+_FLOAT = 4  # A little-endian double.
+_COMPLEX = 5  # Two little-endian doubles.
+_STR = 6  # A varint length and UTF-8 bytes.
+_STR_NEW = 7  # Like _STR, and appended to the table of strings.
+_STR_REF = 8  # A varint index into the table of strings.
+_LIST = 9  # A varint length and the items.
+_DICT = 10  # A varint length and the keys and values.
+_ARRAY = 11  # The dtype string, the varint ndim and dimensions, and the raw data.
+_SCHEMA = 12  # The cirq_type and field names, appended to the table of schemas, then an object.
+_OBJECT = 13  # A varint index into the table of schemas and the values of the fields.
+_INTERN = 14  # An object, appended to the table of interned objects.
+_REF = 15  # A varint index into the table of interned objects.
+_SMALL_INT = 0x80
+
+# Longer strings, e.g. packed measurement records, are unlikely to repeat.
+_MAX_INTERNED_STR_LEN = 64
+
+_DOUBLE = struct.Struct('<d')
+_COMPLEX_DOUBLES = struct.Struct('<dd')
+
+
+def _write_uint(buf: bytearray, n: int) -> None:
+    while n >= 0x80:
+        buf.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+class _Encoder:
+    """Encodes values into bytes, keeping the tables shared by the records of a file."""
+
+    def __init__(self) -> None:
+        self._strings: dict[str, int] = {}
+        self._schemas: dict[tuple[str, tuple[Any, ...]], int] = {}
+        self._cirq_types: dict[type, str] = {}
+        # Interned objects by their encoding, and by identity. The latter keeps the objects
+        # alive, so that their ids are not reused.
+        self._interned: dict[bytes, int] = {}
+        self._interned_by_id: dict[int, tuple[int, Any]] = {}
+        self._json_encoder = CirqEncoder()
+
+    def encode(self, buf: bytearray, o: Any) -> None:
+        t = type(o)
+        if t is int:
+            if 0 <= o < 0x80:
+                buf.append(_SMALL_INT | o)
+            else:
+                buf.append(_INT)
+                _write_uint(buf, o << 1 if o >= 0 else (-o << 1) - 1)
+        elif t is str:
+            self._encode_str(buf, o)
+        elif t is float:
+            buf.append(_FLOAT)
+            buf += _DOUBLE.pack(o)
+        elif t is list or t is tuple:
+            buf.append(_LIST)
+            _write_uint(buf, len(o))
+            for item in o:
+                self.encode(buf, item)
+        elif o is None:
+            buf.append(_NONE)
+        elif o is True:
+            buf.append(_TRUE)
+        elif o is False:
+            buf.append(_FALSE)
+        elif hasattr(o, '_json_dict_'):
+            self._encode_supports_json(buf, o)
+        elif t is dict:
+            self._encode_dict(buf, o)
+        elif t is complex:
+            buf.append(_COMPLEX)
+            buf += _COMPLEX_DOUBLES.pack(o.real, o.imag)
+        elif isinstance(o, np.ndarray):
+            self._encode_array(buf, o)
+        # Subclasses of the builtin types are written as the builtin types, as JSON does.
+        elif isinstance(o, int):
+            self.encode(buf, int(o))
+        elif isinstance(o, float):
+            self.encode(buf, float(o))
+        elif isinstance(o, str):
+            self.encode(buf, str(o))
+        elif isinstance(o, (list, tuple)):
+            self.encode(buf, list(o))
+        elif isinstance(o, dict):
+            self._encode_dict(buf, o)
+        else:
+            # Sympy, numpy and pandas objects, datetimes, etc.
+            self.encode(buf, self._json_encoder.default(o))
+
+    def _encode_str(self, buf: bytearray, s: str) -> None:
+        index = self._strings.get(s)
+        if index is not None:
+            buf.append(_STR_REF)
+            _write_uint(buf, index)
+            return
+        data = s.encode()
+        if len(s) <= _MAX_INTERNED_STR_LEN:
+            self._strings[s] = len(self._strings)
+            buf.append(_STR_NEW)
+        else:
+            buf.append(_STR)
+        _write_uint(buf, len(data))
+        buf += data
+
+    def _encode_dict(self, buf: bytearray, d: dict) -> None:
+        if 'cirq_type' in d:
+            # As when reading JSON, dictionaries with a cirq_type are objects.
+            fields = dict(d)
+            self._encode_fields(buf, fields.pop('cirq_type'), fields)
+            return
+        buf.append(_DICT)
+        _write_uint(buf, len(d))
+        for key, value in d.items():
+            self.encode(buf, key)
+            self.encode(buf, value)
+
+    def _encode_array(self, buf: bytearray, a: np.ndarray) -> None:
+        if a.dtype.kind not in 'biufc':
+            self.encode(buf, a.tolist())
+            return
+        buf.append(_ARRAY)
+        self._encode_str(buf, a.dtype.str)
+        _write_uint(buf, a.ndim)
+        for n in a.shape:
+            _write_uint(buf, n)
+        buf += np.ascontiguousarray(a).tobytes()
+
+    def _encode_supports_json(self, buf: bytearray, o: Any) -> None:
+        if not isinstance(o, (ops.Qid, ops.Gate, ops.Operation, SerializableByKey)):
+            self._encode_json_dict(buf, o)
+            return
+        entry = self._interned_by_id.get(id(o))
+        if entry is not None:
+            buf.append(_REF)
+            _write_uint(buf, entry[0])
+            return
+        # Equal objects are not necessarily interchangeable (e.g. `cirq.MatrixGate` ignores
+        # names in comparisons), so objects are interned by their encoding instead. An encoding
+        # which matches an earlier one cannot append to the tables, so it can be dropped.
+        table_sizes = self._table_sizes()
+        data = bytearray()
+        self._encode_json_dict(data, o)
+        if self._table_sizes() == table_sizes:
+            index = self._interned.get(bytes(data))
+            if index is not None:
+                buf.append(_REF)
+                _write_uint(buf, index)
+                self._interned_by_id[id(o)] = (index, o)
+                return
+            key = bytes(data)
+        else:
+            # Later equal objects refer to the new table entries instead of defining them, so
+            # they are looked up by the encoding which refers to them.
+            references = bytearray()
+            self._encode_json_dict(references, o)
+            key = bytes(references)
+        index = self._interned[key] = len(self._interned)
+        buf.append(_INTERN)
+        buf += data
+        self._interned_by_id[id(o)] = (index, o)
+
+    def _table_sizes(self) -> tuple[int, int, int]:
+        return len(self._strings), len(self._schemas), len(self._interned)
+
+    def _encode_json_dict(self, buf: bytearray, o: Any) -> None:
+        fields = o._json_dict_()
+        if 'cirq_type' in fields:
+            _json_dict_with_cirq_type(o)  # Raises the JSON protocol's error.
+        cirq_type = self._cirq_types.get(type(o))
+        if cirq_type is None:
+            cirq_type = self._cirq_types[type(o)] = json_cirq_type(type(o))
+        self._encode_fields(buf, cirq_type, fields)
+
+    def _encode_fields(self, buf: bytearray, cirq_type: str, fields: dict[str, Any]) -> None:
+        names = tuple(fields)
+        index = self._schemas.get((cirq_type, names))
+        if index is None:
+            self._schemas[(cirq_type, names)] = len(self._schemas)
+            buf.append(_SCHEMA)
+            self._encode_str(buf, cirq_type)
+            self.encode(buf, names)
+        else:
+            buf.append(_OBJECT)
+            _write_uint(buf, index)
+        for value in fields.values():
+            self.encode(buf, value)
+
+
+class _Decoder:
+    """Decodes values from bytes, keeping the tables shared by the records of a file."""
+
+    def __init__(self, resolvers: Sequence[JsonResolver]) -> None:
+        self._resolvers = resolvers
+        self._strings: list[str] = []
+        # [cirq_type, field names, factory, whether the factory is a _from_json_dict_ method]
+        self._schemas: list[tuple[str, tuple[Any, ...], Any, bool]] = []
+        self._interned: list[Any] = []
+        self._data = b''
+        self._pos = 0
+
+    def decode(self, data: bytes) -> Any:
+        self._data = data
+        self._pos = 0
+        value = self._value()
+        if self._pos != len(data):
+            raise ValueError('Unexpected data after the end of a record.')
+        return value
+
+    def _uint(self) -> int:
+        data = self._data
+        pos = self._pos
+        b = data[pos]
+        pos += 1
+        if b < 0x80:
+            self._pos = pos
+            return b
+        n = b & 0x7F
+        shift = 7
+        while b & 0x80:
+            b = data[pos]
+            pos += 1
+            n |= (b & 0x7F) << shift
+            shift += 7
+        self._pos = pos
+        return n
+
+    def _value(self) -> Any:
+        tag = self._data[self._pos]
+        self._pos += 1
+        if tag >= _SMALL_INT:
+            return tag - _SMALL_INT
+        if tag == _REF:
+            return self._interned[self._uint()]
+        if tag == _OBJECT:
+            return self._object(self._schemas[self._uint()])
+        if tag == _LIST:
+            return [self._value() for _ in range(self._uint())]
+        if tag == _STR_REF:
+            return self._strings[self._uint()]
+        if tag == _FLOAT:
+            pos = self._pos
+            self._pos = pos + 8
+            return _DOUBLE.unpack_from(self._data, pos)[0]
+        if tag == _INTERN:
+            value = self._value()
+            self._interned.append(value)
+            return value
+        if tag == _SCHEMA:
+            return self._object(self._schema())
+        if tag == _STR_NEW:
+            s = self._str()
+            self._strings.append(s)
+            return s
+        if tag == _STR:
+            return self._str()
+        if tag == _INT:
+            n = self._uint()
+            return -((n + 1) >> 1) if n & 1 else n >> 1
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _DICT:
+            return {self._value(): self._value() for _ in range(self._uint())}
+        if tag == _COMPLEX:
+            pos = self._pos
+            self._pos = pos + 16
+            return complex(*_COMPLEX_DOUBLES.unpack_from(self._data, pos))
+        if tag == _ARRAY:
+            return self._array()
+        raise ValueError(f'Invalid tag {tag} in cirq binary data.')
+
+    def _str(self) -> str:
+        n = self._uint()
+        pos = self._pos
+        self._pos = pos + n
+        return self._data[pos : pos + n].decode()
+
+    def _array(self) -> list:
+        dtype = np.dtype(self._value())
+        shape = tuple(self._uint() for _ in range(self._uint()))
+        size = dtype.itemsize * int(np.prod(shape))
+        pos = self._pos
+        self._pos = pos + size
+        return (
+            np.frombuffer(self._data, dtype, count=size // dtype.itemsize, offset=pos)
+            .reshape(shape)
+            .tolist()
+        )
+
+    def _schema(self) -> tuple[str, tuple[Any, ...], Any, bool]:
+        cirq_type = self._value()
+        names = tuple(self._value())
+        factory = factory_from_json(cirq_type, resolvers=self._resolvers)
+        from_json_dict = getattr(factory, '_from_json_dict_', None)
+        if from_json_dict is None:
+            schema = (cirq_type, names, factory, False)
+        else:
+            schema = (cirq_type, names, from_json_dict, True)
+        self._schemas.append(schema)
+        return schema
+
+    def _object(self, schema: tuple[str, tuple[Any, ...], Any, bool]) -> Any:
+        cirq_type, names, factory, is_from_json_dict = schema
+        fields = {name: self._value() for name in names}
+        if is_from_json_dict:
+            return factory(cirq_type=cirq_type, **fields)
+        return factory(**fields)
+
+
+class BinaryWriter:
+    """Writes objects to a file in Cirq's binary serialization format, one record at a time.
+
+    Writing the parts of a large object as separate records, e.g. the moments of a circuit or
+    the results of a sweep, bounds the memory used to serialize and deserialize them. The
+    records can be read back one at a time with `cirq.iter_binary`:
+
+        with cirq.BinaryWriter('circuit.cirqb') as writer:
+            for moment in circuit:
+                writer.write(moment)
+        circuit = cirq.Circuit.from_moments(*cirq.iter_binary('circuit.cirqb'))
+
+    Interned qubits, gates and operations, and the other tables of the format, are shared by
+    all the records of a file.
+    """
+
+    def __init__(self, file_or_fn: IO | pathlib.Path | str):
+        """Inits BinaryWriter and writes the header of the file.
+
+        Args:
+            file_or_fn: A filename (if a string or `pathlib.Path`) to write to, or a binary IO
+                object (such as a file or buffer) to write to.
+        """
+        if isinstance(file_or_fn, (str, pathlib.Path)):
+            self._file: IO = open(file_or_fn, 'wb')
+            self._owns_file = True
+        else:
+            self._file = file_or_fn
+            self._owns_file = False
+        self._encoder = _Encoder()
+        self._file.write(_MAGIC)
+
+    def write(self, obj: Any) -> None:
+        """Writes an object as the next record of the file.
+
+        Args:
+            obj: An object which can be serialized to JSON.
+        """
+        data = bytearray()
+        self._encoder.encode(data, obj)
+        header = bytearray()
+        _write_uint(header, len(data))
+        self._file.write(header)
+        self._file.write(data)
+
+    def close(self) -> None:
+        """Closes the file, if it was opened from a filename."""
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> BinaryWriter:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def to_binary(obj: Any, file_or_fn: None | IO | pathlib.Path | str = None) -> bytes | None:
+    """Serializes an object in Cirq's binary serialization format.
+
+    This supports the same objects as `cirq.to_json`, but is faster to read and write and much
+    more compact. Unlike JSON, it is not meant to be human-readable.
+
+    Args:
+        obj: An object which can be serialized to JSON.
+        file_or_fn: A filename (if a string or `pathlib.Path`) to write to, or a binary IO
+            object (such as a file or buffer) to write to, or `None` to indicate that the
+            method should return the serialized bytes as its result. Defaults to `None`.
+    """
+    if file_or_fn is None:
+        buffer = io.BytesIO()
+        BinaryWriter(buffer).write(obj)
+        return buffer.getvalue()
+    with BinaryWriter(file_or_fn) as writer:
+        writer.write(obj)
+    return None
+
+
+def iter_binary(
+    file_or_fn: None | IO | pathlib.Path | str = None,
+    *,
+    binary: bytes | None = None,
+    resolvers: Sequence[JsonResolver] | None = None,
+) -> Iterator[Any]:
+    """Yields the records of a file in Cirq's binary serialization format, one at a time.
+
+    Args:
+        file_or_fn: A filename (if a string or `pathlib.Path`) to read from, or a binary IO
+            object (such as a file or buffer) to read from, or `None` to indicate that the
+            `binary` argument should be used. Defaults to `None`.
+        binary: The serialized bytes, or else `None` indicating `file_or_fn` should be used.
+            Defaults to `None`.
+        resolvers: A list of functions that are called in order to turn the serialized
+            `cirq_type` strings into constructable classes. See `cirq.read_json`.
+
+    Raises:
+        ValueError: If either none of `file_or_fn` and `binary` is specified, or both are
+            specified, or if the data is not in Cirq's binary serialization format.
+    """
+    if (file_or_fn is None) == (binary is None):
+        raise ValueError('Must specify ONE of "file_or_fn" or "binary".')
+    if binary is not None:
+        yield from _iter_records(io.BytesIO(binary), resolvers)
+    elif isinstance(file_or_fn, (str, pathlib.Path)):
+        with open(file_or_fn, 'rb') as file:
+            yield from _iter_records(file, resolvers)
+    else:
+        yield from _iter_records(cast(IO, file_or_fn), resolvers)
+
+
+def read_binary(
+    file_or_fn: None | IO | pathlib.Path | str = None,
+    *,
+    binary: bytes | None = None,
+    resolvers: Sequence[JsonResolver] | None = None,
+) -> Any:
+    """Reads an object serialized in Cirq's binary serialization format by `cirq.to_binary`.
+
+    Args:
+        file_or_fn: A filename (if a string or `pathlib.Path`) to read from, or a binary IO
+            object (such as a file or buffer) to read from, or `None` to indicate that the
+            `binary` argument should be used. Defaults to `None`.
+        binary: The serialized bytes, or else `None` indicating `file_or_fn` should be used.
+            Defaults to `None`.
+        resolvers: A list of functions that are called in order to turn the serialized
+            `cirq_type` strings into constructable classes. See `cirq.read_json`.
+
+    Raises:
+        ValueError: If either none of `file_or_fn` and `binary` is specified, or both are
+            specified, or if the data is not a single object in Cirq's binary serialization
+            format.
+    """
+    records = list(iter_binary(file_or_fn, binary=binary, resolvers=resolvers))
+    if len(records) != 1:
+        raise ValueError(
+            f'Expected a single record but found {len(records)}. Use cirq.iter_binary to read '
+            'files written by a cirq.BinaryWriter.'
+        )
+    return records[0]
+
+
+def _iter_records(file: IO, resolvers: Sequence[JsonResolver] | None) -> Iterator[Any]:
+    if file.read(len(_MAGIC)) != _MAGIC:
+        raise ValueError('The data is not in the cirq binary serialization format.')
+    decoder = _Decoder(DEFAULT_RESOLVERS if resolvers is None else resolvers)
+    while True:
+        size = _read_uint(file)
+        if size is None:
+            return
+        data = file.read(size)
+        if len(data) != size:
+            raise ValueError('Truncated cirq binary data.')
+        yield decoder.decode(data)
+
+
+def _read_uint(file: IO) -> int | None:
+    n = 0
+    shift = 0
+    while True:
+        b = file.read(1)
+        if not b:
+            if shift:
+                raise ValueError('Truncated cirq binary data.')
+            return None
+        n |= (b[0] & 0x7F) << shift
+        if not b[0] & 0x80:
+            return n
+        shift += 7
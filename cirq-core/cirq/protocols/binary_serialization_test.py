@@ -0,0 +1,248 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import datetime
+import enum
+import io
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import pytest
+import sympy
+
+import cirq
+
+
+def _roundtrip(obj, **kwargs):
+    return cirq.read_binary(binary=cirq.to_binary(obj), **kwargs)
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        None,
+        True,
+        False,
+        0,
+        127,
+        128,
+        -1,
+        -(2**70),
+        2**100,
+        1.5,
+        float('inf'),
+        1 - 2j,
+        '',
+        'qubit',
+        'a' * 1000,
+        [1, [2.5, 'x'], {'a': None}],
+        {'a': 1, 'b': [True, False]},
+        {1: 'one'},
+    ],
+)
+def test_builtins(value) -> None:
+    assert _roundtrip(value) == value
+
+
+class _Str(str):
+    pass
+
+
+class _IntEnum(enum.IntEnum):
+    A = 1
+    B = 2
+
+
+class _Point(NamedTuple):
+    x: int
+    y: int
+
+
+def test_builtins_are_read_as_json_reads_them() -> None:
+    assert _roundtrip((1, (2, 3))) == [1, [2, 3]]
+    assert _roundtrip(np.int64(3)) == 3
+    assert type(_roundtrip(_IntEnum.B)) is int
+    assert type(_roundtrip(np.float64(0.5))) is float
+    assert type(_roundtrip(_Str('s'))) is str
+    assert _roundtrip(_Point(1, 2)) == [1, 2]
+    assert _roundtrip(collections.OrderedDict(a=1)) == {'a': 1}
+    assert _roundtrip(np.float32(0.5)) == 0.5
+    assert _roundtrip(np.bool_(True)) is True
+    assert _roundtrip(np.array([[1, 2], [3, 4]], dtype=np.uint8)) == [[1, 2], [3, 4]]
+    assert _roundtrip(np.array([1j, 2])) == [1j, 2]
+    assert _roundtrip(np.array(['a', 'b'])) == ['a', 'b']
+    assert _roundtrip({'cirq_type': 'LineQubit', 'x': 2}) == cirq.LineQubit(2)
+
+
+def test_sympy_pandas_and_datetime() -> None:
+    t = sympy.Symbol('t')
+    assert _roundtrip(2 * t + sympy.pi) == 2 * t + sympy.pi
+    df = pd.DataFrame({'a': [1, 2], 'b': [3.0, 4.0]}, index=pd.Index([5, 6], name='i'))
+    pd.testing.assert_frame_equal(_roundtrip(df), cirq.read_json(json_text=cirq.to_json(df)))
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    assert _roundtrip(now) == now
+
+
+def test_circuit_roundtrip() -> None:
+    qubits = cirq.GridQubit.rect(3, 3)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=20, op_density=0.8, random_state=1)
+    circuit += cirq.Moment(cirq.XPowGate(exponent=sympy.Symbol('a')).on_each(*qubits))
+    circuit += cirq.measure(*qubits, key='m')
+    assert _roundtrip(circuit) == circuit
+
+
+def test_qubits_gates_and_operations_are_interned() -> None:
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.CZ(a, b), cirq.CZ(cirq.LineQubit(0), cirq.LineQubit(1)), cirq.CZ(b, a), cirq.CZ(b, a)
+    )
+    data = cirq.to_binary(circuit)
+    assert data is not None
+    assert data.count(b'LineQubit') == 1
+    assert data.count(b'CZPowGate') == 1
+
+    result = cirq.read_binary(binary=data)
+    first, second, third, fourth = result.all_operations()
+    assert first.gate is second.gate is third.gate
+    assert first.qubits[0] is second.qubits[0] is third.qubits[1]
+    assert first.qubits[1] is second.qubits[1] is third.qubits[0]
+    assert third is fourth
+
+
+def test_equal_but_distinguishable_objects_are_not_merged() -> None:
+    q = cirq.LineQubit(0)
+    gates = [cirq.MatrixGate(np.eye(2), name='a'), cirq.MatrixGate(np.eye(2), name='b')]
+    assert gates[0] == gates[1]
+    result = _roundtrip([gate.on(q) for gate in gates])
+    assert [op.gate._name for op in result] == ['a', 'b']
+
+
+@dataclasses.dataclass(frozen=True)
+class _SBKImpl(cirq.SerializableByKey):
+    name: str
+    children: tuple = ()
+
+    def _json_dict_(self):
+        return {'name': self.name, 'children': self.children}
+
+    @classmethod
+    def _from_json_dict_(cls, name, children, **kwargs):
+        return cls(name, tuple(children))
+
+
+def _sbk_resolver(cirq_type: str):
+    return _SBKImpl if cirq_type == '_SBKImpl' else None
+
+
+def test_serializable_by_key() -> None:
+    resolvers = [_sbk_resolver, *cirq.DEFAULT_RESOLVERS]
+    leaf = _SBKImpl('leaf')
+    root = _SBKImpl('root', (leaf, leaf, _SBKImpl('leaf')))
+    result = _roundtrip(root, resolvers=resolvers)
+    assert result == root
+    assert result.children[0] is result.children[1] is result.children[2]
+
+
+def test_custom_cirq_type_raises() -> None:
+    class _CustomCirqType:
+        def _json_dict_(self):
+            return {'cirq_type': 'Custom'}
+
+    with pytest.raises(ValueError, match="Found 'cirq_type': 'Custom'"):
+        _ = cirq.to_binary(_CustomCirqType())
+
+
+def test_unserializable_object_raises() -> None:
+    with pytest.raises(TypeError, match='not JSON serializable'):
+        _ = cirq.to_binary(object())
+
+
+def test_unresolvable_type_raises() -> None:
+    data = cirq.to_binary(cirq.LineQubit(0))
+    with pytest.raises(ValueError, match="Could not resolve type 'LineQubit'"):
+        _ = cirq.read_binary(binary=data, resolvers=[])
+
+
+def test_stream_records(tmp_path) -> None:
+    path = tmp_path / 'circuit.cirqb'
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(
+        cirq.H.on_each(*qubits), cirq.CNOT(qubits[0], qubits[1]), cirq.X(qubits[3])
+    )
+    with cirq.BinaryWriter(path) as writer:
+        for moment in circuit:
+            writer.write(moment)
+    assert cirq.Circuit.from_moments(*cirq.iter_binary(path)) == circuit
+    assert cirq.Circuit.from_moments(*cirq.iter_binary(str(path))) == circuit
+    with open(path, 'rb') as file:
+        assert cirq.Circuit.from_moments(*cirq.iter_binary(file)) == circuit
+    with pytest.raises(ValueError, match='Expected a single record but found 2'):
+        _ = cirq.read_binary(path)
+
+
+def test_stream_results() -> None:
+    results = [
+        cirq.ResultDict(
+            params=cirq.ParamResolver({'t': i}),
+            measurements={'m': np.random.RandomState(i).randint(2, size=(100, 3))},
+        )
+        for i in range(3)
+    ]
+    buffer = io.BytesIO()
+    writer = cirq.BinaryWriter(buffer)
+    for result in results:
+        writer.write(result)
+    writer.close()
+    assert not buffer.closed
+    assert list(cirq.iter_binary(binary=buffer.getvalue())) == results
+
+
+def test_file_roundtrip(tmp_path) -> None:
+    op = cirq.rx(0.123).on(cirq.LineQubit(5))
+    cirq.to_binary(op, tmp_path / 'op.cirqb')
+    assert cirq.read_binary(tmp_path / 'op.cirqb') == op
+
+    buffer = io.BytesIO()
+    cirq.to_binary(op, buffer)
+    buffer.seek(0)
+    assert cirq.read_binary(buffer) == op
+
+
+def test_invalid_data() -> None:
+    with pytest.raises(ValueError, match='Must specify ONE'):
+        _ = cirq.read_binary()
+    with pytest.raises(ValueError, match='Must specify ONE'):
+        _ = cirq.read_binary('file', binary=b'')
+    with pytest.raises(ValueError, match='not in the cirq binary serialization format'):
+        _ = cirq.read_binary(binary=cirq.to_json(cirq.X).encode())
+
+    data = cirq.to_binary(list(range(1000)))
+    assert data is not None
+    with pytest.raises(ValueError, match='Truncated'):
+        _ = cirq.read_binary(binary=data[:-1])
+    with pytest.raises(ValueError, match='Truncated'):
+        _ = cirq.read_binary(binary=data[:7])
+
+    data = cirq.to_binary(None)
+    assert data is not None
+    header = data[:-2]
+    with pytest.raises(ValueError, match='Invalid tag 127'):
+        _ = cirq.read_binary(binary=header + b'\x01\x7f')
+    with pytest.raises(ValueError, match='Unexpected data'):
+        _ = cirq.read_binary(binary=header + b'\x02\x00\x00')
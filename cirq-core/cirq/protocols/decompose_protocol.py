@@ -14,11 +14,12 @@
 
 from __future__ import annotations
 
+import collections
 import dataclasses
 import inspect
 import itertools
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
 from types import NotImplementedType
 from typing import Any, overload, Protocol, TYPE_CHECKING, TypeVar, Union
 
@@ -81,6 +82,125 @@ class DecompositionContext:
         return dataclasses.replace(self, extract_global_phases=True)
 
 
+class DecomposeCache:
+    """A bounded memo of the decomposition trees of gate operations, for `cirq.decompose`.
+
+    `cirq.decompose` walks the whole decomposition tree of every operation it encounters, even
+    when the same gate is applied thousands of times on different qubits. When given a
+    `DecomposeCache`, it walks the tree of each `cirq.GateOperation` or
+    `cirq.ControlledOperation` of a hashable gate once per qid shape, stores the resulting
+    operations on canonical `cirq.LineQid`s, and maps them onto the qubits of every later
+    operation applying the same gate. The subtrees are memoized too, so gates which share
+    sub-gates, e.g. different circuits of Toffoli gates, share their decompositions.
+
+    The decomposition trees are memoized separately for each combination of the `keep`,
+    `intercepting_decomposer`, `fallback_decomposer`, `on_stuck_raise` and
+    `preserve_structure` arguments of `cirq.decompose`, compared by identity, and of the
+    `extract_global_phases` flag of the context, so a cache can be shared by calls with
+    different arguments. These functions must only depend on the gate and tags of an
+    operation, and not on its qubits, and the decompositions of the gates must not be random.
+    Decomposition trees which act on qubits other than the ones of the decomposed operation,
+    e.g. on ancillas allocated from the qubit manager of the context, are not memoized.
+
+    At most `maxsize` decomposition trees are kept, evicting the least recently used ones. The
+    numbers of lookups which found and did not find a decomposition tree are tracked in `hits`
+    and `misses`.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Inits DecomposeCache.
+
+        Args:
+            maxsize: The maximum number of decomposition trees to keep.
+
+        Raises:
+            ValueError: If `maxsize` is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError(f'maxsize must be positive, got {maxsize}.')
+        self._maxsize = maxsize
+        # [(operation type, gate, qid shape, decompose arguments)] : leaves on canonical qids
+        self._trees: collections.OrderedDict[Hashable, tuple[cirq.Operation, ...]] = (
+            collections.OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def _key(self, op: cirq.Operation, args: _DecomposeArgs) -> Hashable | None:
+        """Returns the key of the decomposition tree of `op`, or None if it is not memoized."""
+        if type(op) not in _MEMOIZED_OPERATION_TYPES or op.gate is None:
+            return None
+        key = (
+            type(op),
+            op.gate,
+            qid_shape_protocol.qid_shape(op),
+            args.context.extract_global_phases,
+            args.keep,
+            args.intercepting_decomposer,
+            args.fallback_decomposer,
+            args.on_stuck_raise,
+            args.preserve_structure,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _get(self, key: Hashable, qubits: Sequence[cirq.Qid]) -> list[cirq.Operation] | None:
+        """Returns the memoized leaves of a decomposition tree mapped onto `qubits`, if any."""
+        leaves = self._trees.get(key)
+        if leaves is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._trees.move_to_end(key)
+        canonical_qubits = devices.LineQid.for_qid_shape(qid_shape_protocol.qid_shape(qubits))
+        qubit_map: dict[cirq.Qid, cirq.Qid] = dict(zip(canonical_qubits, qubits))
+        return [leaf.transform_qubits(qubit_map) for leaf in leaves]
+
+    def _put(self, key: Hashable, qubits: Sequence[cirq.Qid], leaves: list[cirq.Operation]) -> None:
+        """Memoizes the leaves of a decomposition tree on `qubits`, unless they use others."""
+        qubit_set = frozenset(qubits)
+        if any(not qubit_set.issuperset(leaf.qubits) for leaf in leaves):
+            return
+        canonical_qubits = devices.LineQid.for_qid_shape(qid_shape_protocol.qid_shape(qubits))
+        qubit_map: dict[cirq.Qid, cirq.Qid] = dict(zip(qubits, canonical_qubits))
+        self._trees[key] = tuple(leaf.transform_qubits(qubit_map) for leaf in leaves)
+        while len(self._trees) > self._maxsize:
+            self._trees.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all decomposition trees and resets the statistics."""
+        self._trees.clear()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of decomposition trees kept."""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups which found a decomposition tree."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups which did not find a decomposition tree."""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    def __repr__(self) -> str:
+        return f'cirq.DecomposeCache(maxsize={self._maxsize})'
+
+
+_MEMOIZED_OPERATION_TYPES = (ops.GateOperation, ops.ControlledOperation)
+
+
 class SupportsDecompose(Protocol):
     """An object that can be decomposed into simpler operations.
 
@@ -170,6 +290,7 @@ class _DecomposeArgs:
     keep: Callable[[cirq.Operation], bool] | None
     on_stuck_raise: None | Exception | Callable[[cirq.Operation], Exception | None]
     preserve_structure: bool
+    cache: DecomposeCache | None = None
 
 
 def _decompose_dfs(item: Any, args: _DecomposeArgs) -> Iterator[cirq.Operation]:
@@ -184,7 +305,20 @@ def _decompose_dfs(item: Any, args: _DecomposeArgs) -> Iterator[cirq.Operation]:
         if args.keep is not None and args.keep(item):
             yield item
             return
+        if args.cache is not None:
+            key = args.cache._key(item, args)
+            if key is not None:
+                leaves = args.cache._get(key, item.qubits)
+                if leaves is None:
+                    leaves = [*_decompose_children(item, args)]
+                    args.cache._put(key, item.qubits, leaves)
+                yield from leaves
+                return
+
+    yield from _decompose_children(item, args)
+
 
+def _decompose_children(item: Any, args: _DecomposeArgs) -> Iterator[cirq.Operation]:
     decomposed = _try_op_decomposer(item, args.intercepting_decomposer, context=args.context)
 
     if decomposed is NotImplemented or decomposed is None:
@@ -222,6 +356,7 @@ def decompose(
     ) = _value_error_describing_bad_operation,
     preserve_structure: bool = False,
     context: DecompositionContext | None = None,
+    cache: DecomposeCache | None = None,
 ) -> list[cirq.Operation]:
     """Recursively decomposes a value into `cirq.Operation`s meeting a criteria.
 
@@ -255,6 +390,8 @@ def decompose(
             True, `intercepting_decomposer` cannot be specified.
         context: Decomposition context specifying common configurable options for
             controlling the behavior of decompose.
+        cache: An optional `cirq.DecomposeCache`, in which to memoize the decomposition
+            trees of gate operations across their occurrences.
 
     Returns:
         A list of operations that the given value was decomposed into. If
@@ -295,6 +432,7 @@ def decompose(
         keep=keep,
         on_stuck_raise=on_stuck_raise,
         preserve_structure=preserve_structure,
+        cache=cache,
     )
     return [*_decompose_dfs(val, args)]
 
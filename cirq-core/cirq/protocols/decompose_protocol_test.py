@@ -498,3 +498,116 @@ def test_handling_of_none_vs_notimplemented_return_values() -> None:
     assert op.called_decompose_with_context, 'Should always call _decompose_with_context_'
     assert op.called_decompose, 'Should fall back to _decompose_'
     assert result == 'dummy'
+
+
+def test_decompose_cache_matches_uncached_decomposition() -> None:
+    q = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(
+        cirq.CCZ(*q[:3]),
+        cirq.CCZ(*q[1:]),
+        cirq.qft(*q),
+        cirq.CSWAP(q[3], q[0], q[2]),
+        cirq.CCZ(*q[:3]),
+        cirq.measure(*q, key='m'),
+    )
+    cache = cirq.DecomposeCache()
+    assert cirq.decompose(circuit, cache=cache) == cirq.decompose(circuit)
+    assert cache.hits > 0
+    assert cache.misses == len(cache)
+
+    # A second decomposition only hits the cache.
+    misses = cache.misses
+    assert cirq.decompose(circuit, cache=cache) == cirq.decompose(circuit)
+    assert cache.misses == misses
+
+
+def test_decompose_cache_maps_decomposition_onto_qubits() -> None:
+    a, b, c = cirq.NamedQubit.range(3, prefix='q')
+    qudits = cirq.LineQid.for_qid_shape((3, 3))
+    cache = cirq.DecomposeCache()
+    cirq.decompose(cirq.CCZ(*cirq.GridQubit.rect(1, 3)), cache=cache)
+    misses = cache.misses
+    assert cirq.decompose(cirq.CCZ(c, a, b), cache=cache) == cirq.decompose(cirq.CCZ(c, a, b))
+    assert cache.misses == misses
+
+    # Gates on qudits of other dimensions are cached separately.
+    gate = cirq.IdentityGate(qid_shape=(3, 3))
+    assert cirq.decompose(gate.on(*qudits), cache=cache) == cirq.decompose(gate.on(*qudits))
+    assert cache.misses > misses
+
+
+def test_decompose_cache_respects_keep_and_intercepting_decomposer() -> None:
+    q = cirq.LineQubit.range(3)
+    cache = cirq.DecomposeCache()
+    circuit = cirq.Circuit(cirq.CCZ(*q), cirq.CCX(*q))
+    cirq.decompose(circuit, cache=cache)
+
+    keep = lambda op: op.gate == cirq.CCZ
+    assert cirq.decompose(circuit, keep=keep, on_stuck_raise=None, cache=cache) == cirq.decompose(
+        circuit, keep=keep, on_stuck_raise=None
+    )
+
+    def intercepting_decomposer(op):
+        if op.gate == cirq.CCZ:
+            return cirq.Z.on_each(*op.qubits)
+        return NotImplemented
+
+    assert cirq.decompose(
+        circuit, intercepting_decomposer=intercepting_decomposer, cache=cache
+    ) == cirq.decompose(circuit, intercepting_decomposer=intercepting_decomposer)
+
+
+def test_decompose_cache_respects_extract_global_phases() -> None:
+    q = cirq.LineQubit.range(2)
+    cache = cirq.DecomposeCache()
+    context = cirq.DecompositionContext(cirq.SimpleQubitManager())
+    phased_context = context.extracting_global_phases()
+    op = cirq.CZ(*q) ** 0.5
+    for ctx in [context, phased_context, context, phased_context]:
+        assert cirq.decompose(op, context=ctx, cache=cache) == cirq.decompose(op, context=ctx)
+
+
+def test_decompose_cache_skips_ancillas_and_unhashable_gates() -> None:
+    q = cirq.NamedQubit('q')
+    cache = cirq.DecomposeCache()
+    keep = lambda op: op.gate == cirq.CNOT
+    context = cirq.DecompositionContext(cirq.SimpleQubitManager())
+    assert cirq.decompose(G2()(q), keep=keep, context=context, cache=cache) == [
+        cirq.CNOT(cirq.ops.CleanQubit(0), cirq.ops.CleanQubit(1))
+    ]
+    # The decompositions of G1 and G2 act on ancillas, so they are not cached.
+    assert len(cache) == 0
+    assert cache.misses == 2
+
+    class UnhashableGate(cirq.testing.SingleQubitGate):
+        __hash__ = None  # type: ignore[assignment]
+
+        def _decompose_(self, qubits):
+            return cirq.X.on_each(*qubits)
+
+    assert cirq.decompose(UnhashableGate().on(q), cache=cache) == [cirq.X(q)]
+    assert len(cache) == 0
+
+
+def test_decompose_cache_eviction_and_clear() -> None:
+    with pytest.raises(ValueError, match='maxsize'):
+        _ = cirq.DecomposeCache(maxsize=0)
+    q = cirq.LineQubit.range(3)
+    cache = cirq.DecomposeCache(maxsize=2)
+    assert cache.maxsize == 2
+    cirq.decompose(cirq.Circuit(cirq.CCZ(*q), cirq.CSWAP(*q)), cache=cache)
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == cache.hits == cache.misses == 0
+    assert repr(cache) == 'cirq.DecomposeCache(maxsize=2)'
+
+
+def test_decompose_cache_memoizes_controlled_operations() -> None:
+    q = cirq.LineQubit.range(4)
+    op = cirq.X(q[3]).controlled_by(*q[:3])
+    cache = cirq.DecomposeCache()
+    assert cirq.decompose(op, cache=cache) == cirq.decompose(op)
+    misses = cache.misses
+    op = cirq.X(q[0]).controlled_by(*q[1:])
+    assert cirq.decompose(op, cache=cache) == cirq.decompose(op)
+    assert cache.misses == misses
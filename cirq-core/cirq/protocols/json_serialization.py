@@ -14,22 +14,29 @@
 
 from __future__ import annotations
 
+import collections
 import dataclasses
 import datetime
+import functools
 import gzip
 import json
+import math
 import numbers
 import pathlib
-from collections.abc import Callable, Iterable, Sequence
+import re
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from types import NotImplementedType
 from typing import Any, cast, IO, overload, Protocol
 
 import attrs
 import numpy as np
-import pandas as pd
 import sympy
 
+from cirq import _compat
 from cirq._doc import doc_private
+from cirq._import import LazyLoader
+
+pd = LazyLoader("pd", globals(), "pandas")
 
 ObjectFactory = type | Callable[..., Any]
 
@@ -296,19 +303,20 @@ class CirqEncoder(json.JSONEncoder):
             return o.tolist()
 
         # Pandas object?
-        if isinstance(o, pd.MultiIndex):
-            return {'cirq_type': 'pandas.MultiIndex', 'tuples': list(o), 'names': list(o.names)}
-        if isinstance(o, pd.Index):
-            return {'cirq_type': 'pandas.Index', 'data': list(o), 'name': o.name}
-        if isinstance(o, pd.DataFrame):
-            cols = [o[col].tolist() for col in o.columns]
-            rows = list(zip(*cols))
-            return {
-                'cirq_type': 'pandas.DataFrame',
-                'data': rows,
-                'columns': o.columns,
-                'index': o.index,
-            }
+        if _compat._pandas_is_imported():
+            if isinstance(o, pd.MultiIndex):
+                return {'cirq_type': 'pandas.MultiIndex', 'tuples': list(o), 'names': list(o.names)}
+            if isinstance(o, pd.Index):
+                return {'cirq_type': 'pandas.Index', 'data': list(o), 'name': o.name}
+            if isinstance(o, pd.DataFrame):
+                cols = [o[col].tolist() for col in o.columns]
+                rows = list(zip(*cols))
+                return {
+                    'cirq_type': 'pandas.DataFrame',
+                    'data': rows,
+                    'columns': o.columns,
+                    'index': o.index,
+                }
 
         # datetime
         if isinstance(o, datetime.datetime):
@@ -326,12 +334,19 @@ class ObjectHook:
         self.resolvers = resolvers
         self.memo: dict[int, SerializableByKey] = {}
         self.context_map: dict[int, SerializableByKey] = {}
+        self._constructors = _constructor_table(resolvers)
+        # Gates deserialized by the fast constructors, keyed on their type and fields.
+        self._gates: dict[tuple, Any] = {}
 
     def __call__(self, d):
         cirq_type = d.get('cirq_type')
         if cirq_type is None:
             return d
 
+        constructor = self._constructors.get(cirq_type)
+        if constructor is not None:
+            return constructor(d, self._gates)
+
         if cirq_type == 'VAL':
             obj = d['val']
             self.memo[d['key']] = obj
@@ -351,12 +366,138 @@ class ObjectHook:
                 return d['object_dag'][-1]
 
         cls = factory_from_json(cirq_type, resolvers=self.resolvers)
-        from_json_dict = getattr(cls, '_from_json_dict_', None)
-        if from_json_dict is not None:
-            return from_json_dict(**d)
+        constructor = self._constructors[cirq_type] = _constructor(cls)
+        return constructor(d, self._gates)
+
+
+# A function constructing an object from its JSON dict, given a memo of gates for the file.
+_Constructor = Callable[[dict[str, Any], dict[tuple, Any]], Any]
+
+_MAX_CONSTRUCTOR_TABLES = 16
+_constructor_tables: collections.OrderedDict[tuple[JsonResolver, ...], dict[str, _Constructor]] = (
+    collections.OrderedDict()
+)
+
+
+def _constructor_table(resolvers: Sequence[JsonResolver]) -> dict[str, _Constructor]:
+    """Returns the table of constructors by cirq_type shared by all reads with these resolvers.
 
+    The table is filled as types are resolved. The tables of the most recently used resolver
+    sets are kept.
+    """
+    key = tuple(resolvers)
+    try:
+        table = _constructor_tables.get(key)
+    except TypeError:
+        # Unhashable resolvers.
+        return {}
+    if table is None:
+        table = _constructor_tables[key] = {}
+        while len(_constructor_tables) > _MAX_CONSTRUCTOR_TABLES:
+            _constructor_tables.popitem(last=False)
+    _constructor_tables.move_to_end(key)
+    return table
+
+
+def _constructor(factory: ObjectFactory) -> _Constructor:
+    try:
+        fast_constructor = _fast_constructors().get(factory)
+    except TypeError:
+        # Unhashable factory.
+        fast_constructor = None
+    return fast_constructor or _generic_constructor(factory)
+
+
+def _generic_constructor(factory: ObjectFactory) -> _Constructor:
+    from_json_dict = getattr(factory, '_from_json_dict_', None)
+    if from_json_dict is not None:
+        return lambda d, gates: from_json_dict(**d)
+
+    def construct(d: dict[str, Any], gates: dict[tuple, Any]) -> Any:
         del d['cirq_type']
-        return cls(**d)
+        return factory(**d)
+
+    return construct
+
+
+@functools.cache
+def _fast_constructors() -> dict[ObjectFactory, _Constructor]:
+    """Returns constructors of the most common types which bypass `_from_json_dict_` dispatch.
+
+    Gates whose fields are plain numbers are only constructed once per file. The constructors
+    defer to the generic ones for dicts with other fields, e.g. from newer versions of Cirq.
+    """
+    from cirq import circuits, devices, ops
+
+    generic_grid_qubit = _generic_constructor(devices.GridQubit)
+    generic_line_qubit = _generic_constructor(devices.LineQubit)
+    generic_gate_operation = _generic_constructor(ops.GateOperation)
+
+    def grid_qubit(d: dict[str, Any], gates: dict[tuple, Any]) -> Any:
+        if len(d) == 3 and 'row' in d and 'col' in d:
+            return devices.GridQubit(d['row'], d['col'])
+        return generic_grid_qubit(d, gates)
+
+    def line_qubit(d: dict[str, Any], gates: dict[tuple, Any]) -> Any:
+        if len(d) == 2 and 'x' in d:
+            return devices.LineQubit(d['x'])
+        return generic_line_qubit(d, gates)
+
+    def gate_operation(d: dict[str, Any], gates: dict[tuple, Any]) -> Any:
+        if len(d) == 3 and 'gate' in d and 'qubits' in d:
+            return ops.GateOperation(d['gate'], d['qubits'])
+        return generic_gate_operation(d, gates)
+
+    def moment(d: dict[str, Any], gates: dict[tuple, Any]) -> Any:
+        return circuits.Moment(*d['operations'], tags=d.get('tags', ()))
+
+    def gate_constructor(cls: type, fields: tuple[str, ...]):
+        size = len(fields) + 1
+        generic = _generic_constructor(cls)
+
+        def construct(d: dict[str, Any], gates: dict[tuple, Any]) -> Any:
+            if len(d) != size:
+                return generic(d, gates)
+            key: tuple = (cls,)
+            for field in fields:
+                value = d.get(field)
+                if type(value) is not float and type(value) is not int:
+                    return generic(d, gates)
+                # Keeps 1 and 1.0, and 0.0 and -0.0, apart.
+                key += (value, type(value), math.copysign(1, value))
+            gate = gates.get(key)
+            if gate is None:
+                gate = gates[key] = generic(d, gates)
+            return gate
+
+        return construct
+
+    constructors: dict[ObjectFactory, _Constructor] = {
+        devices.GridQubit: grid_qubit,
+        devices.LineQubit: line_qubit,
+        ops.GateOperation: gate_operation,
+        circuits.Moment: moment,
+    }
+    for cls in (
+        ops.XPowGate,
+        ops.YPowGate,
+        ops.ZPowGate,
+        ops.HPowGate,
+        ops.CZPowGate,
+        ops.CXPowGate,
+        ops.SwapPowGate,
+        ops.ISwapPowGate,
+    ):
+        constructors[cls] = gate_constructor(cls, ('exponent', 'global_shift'))
+    constructors[ops.PhasedXPowGate] = gate_constructor(
+        ops.PhasedXPowGate, ('phase_exponent', 'exponent', 'global_shift')
+    )
+    constructors[ops.PhasedXZGate] = gate_constructor(
+        ops.PhasedXZGate, ('axis_phase_exponent', 'x_exponent', 'z_exponent')
+    )
+    for rotation_cls in (ops.Rx, ops.Ry, ops.Rz):
+        constructors[rotation_cls] = gate_constructor(rotation_cls, ('rads',))
+    return constructors
 
 
 class SerializableByKey(SupportsJSON):
@@ -561,6 +702,102 @@ def read_json(
     return json.load(cast(IO, file_or_fn), object_hook=obj_hook)
 
 
+def iter_json(
+    file_or_fn: IO | pathlib.Path | str, *, resolvers: Sequence[JsonResolver] | None = None
+) -> Iterator[Any]:
+    """Yields the elements of a JSON file containing a list, one at a time.
+
+    Unlike `cirq.read_json`, this reads the file incrementally, so that only the element being
+    deserialized has to be held in memory, e.g. one result of a long list of archived results.
+    Gzipped files can be read by passing `gzip.open(path, 'rt')`.
+
+    Args:
+        file_or_fn: A filename (if a string or `pathlib.Path`) to read from, or
+            a text IO object (such as a file or buffer) to read from.
+        resolvers: A list of functions that are called in order to turn
+            the serialized `cirq_type` string into a constructable class.
+            See `cirq.read_json`.
+
+    Raises:
+        ValueError: If the file does not contain a list.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    obj_hook = ObjectHook(DEFAULT_RESOLVERS if resolvers is None else resolvers)
+    if isinstance(file_or_fn, (str, pathlib.Path)):
+        with open(file_or_fn, 'r') as file:
+            yield from _iter_json_list(file, obj_hook)
+    else:
+        yield from _iter_json_list(file_or_fn, obj_hook)
+
+
+_JSON_CHUNK_SIZE = 1 << 20
+_JSON_NON_WHITESPACE = re.compile(r'[^ \t\n\r]')
+
+
+def _iter_json_list(file: IO, obj_hook: ObjectHook) -> Iterator[Any]:
+    decoder = json.JSONDecoder(object_hook=obj_hook)
+    buffer = ''
+    pos = 0
+    eof = False
+
+    def read_more(size: int) -> None:
+        nonlocal buffer, pos, eof
+        chunk = file.read(size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def next_char() -> str:
+        nonlocal pos
+        while True:
+            match = _JSON_NON_WHITESPACE.search(buffer, pos)
+            if match is not None:
+                pos = match.start()
+                return buffer[pos]
+            if eof:
+                pos = len(buffer)
+                return ''
+            read_more(_JSON_CHUNK_SIZE)
+
+    if next_char() != '[':
+        raise ValueError('The JSON data does not contain a list.')
+    pos += 1
+    if next_char() == ']':
+        pos += 1
+    else:
+        while True:
+            # Elements which do not fit in the buffer are decoded again from a larger buffer.
+            size = _JSON_CHUNK_SIZE
+            while True:
+                try:
+                    obj, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    read_more(size)
+                    size *= 2
+                    continue
+                # The element is only complete if the delimiter after it is in the buffer, e.g.
+                # `1.` and `1.5e` are decoded as numbers but may continue in the next chunk.
+                match = _JSON_NON_WHITESPACE.search(buffer, end)
+                if not eof and (match is None or buffer[match.start()] not in ',]'):
+                    read_more(size)
+                    size *= 2
+                    continue
+                break
+            pos = end
+            yield obj
+            delimiter = next_char()
+            pos += 1
+            if delimiter == ']':
+                break
+            if delimiter != ',':
+                raise ValueError(f"Expected ',' or ']' in the JSON list, got {delimiter!r}.")
+            next_char()
+    if next_char():
+        raise ValueError('Unexpected data after the end of the JSON list.')
+
+
 def to_json_gzip(
     obj: Any,
     file_or_fn: None | IO | pathlib.Path | str = None,
@@ -17,12 +17,15 @@ from __future__ import annotations
 import contextlib
 import dataclasses
 import datetime
+import gzip
 import importlib
 import io
 import json
+import math
 import os
 import pathlib
 import warnings
+from typing import Any
 from unittest import mock
 
 import attrs
@@ -694,6 +697,16 @@ def assert_repr_and_json_test_data_agree(
             f'{json_from_cirq}\n'
         )
 
+        with ctx_manager:
+            binary_obj = cirq.read_binary(binary=cirq.to_binary(repr_obj))
+        assert proper_eq(binary_obj, json_obj), (
+            f'The binary serialization of the repr data from {rel_repr_path} did not parse '
+            f'into an object equivalent to the json data from {rel_json_path}.\n'
+            f'\n'
+            f'binary object: {binary_obj!r}\n'
+            f'json object: {json_obj!r}\n'
+        )
+
 
 @pytest.mark.parametrize(
     'mod_spec, abs_path',
@@ -792,3 +805,165 @@ def test_attrs_json_dict() -> None:
     obj = _TestAttrsClas('test', x=123)
     js = json_serialization.attrs_json_dict(obj)
     assert js == {'name': 'test', 'x': 123}
+
+
+def test_fast_constructors() -> None:
+    q0, q1 = cirq.GridQubit(0, 1), cirq.GridQubit(2, 3)
+    objs = [
+        q0,
+        cirq.LineQubit(4),
+        cirq.CZ(q0, q1),
+        cirq.Moment(cirq.X(q0)),
+        cirq.Moment(cirq.X(q0)).with_tags('tag'),
+        cirq.PhasedXPowGate(phase_exponent=0.25, exponent=0.5),
+        cirq.PhasedXZGate(axis_phase_exponent=0.25, x_exponent=0.5, z_exponent=1),
+        cirq.rx(0.5),
+        cirq.ZPowGate(exponent=0.5, dimension=3),
+        cirq.XPowGate(exponent=sympy.Symbol('t')),
+    ]
+    for obj in objs:
+        assert_json_roundtrip_works(obj)
+    invalid_json_dicts: list[tuple[type, dict[str, Any]]] = [
+        (cirq.GridQubit, {'row': 1}),
+        (cirq.LineQubit, {'x': 1, 'y': 2}),
+        (cirq.GateOperation, {'gate': cirq.X}),
+    ]
+    for cls, json_dict in invalid_json_dicts:
+        text = cirq.to_json({'cirq_type': cls.__name__, **json_dict})
+        with pytest.raises(TypeError):
+            _ = cirq.read_json(json_text=text)
+
+
+def test_fast_constructors_share_gates_within_a_file() -> None:
+    q = cirq.LineQubit(0)
+    gates = [cirq.XPowGate(exponent=1), cirq.XPowGate(exponent=1), cirq.XPowGate(exponent=1.0)]
+    text = cirq.to_json([gate.on(q) for gate in gates] + [cirq.X(q) ** 0.5])
+    ops = cirq.read_json(json_text=text)
+    assert ops[0].gate is ops[1].gate
+    assert ops[2].gate is not ops[0].gate
+    assert type(ops[2].gate.exponent) is float
+    assert ops[3].gate == cirq.X**0.5
+    assert cirq.read_json(json_text=text)[0].gate is not ops[0].gate
+
+
+def test_fast_constructors_keep_the_sign_of_zeros() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.Z(q0) ** 0.0, cirq.Z(q1) ** -0.0)
+    exponents = [op.gate.exponent for op in cirq.read_json(json_text=cirq.to_json(circuit))[0]]
+    assert [math.copysign(1, exponent) for exponent in exponents] == [1, -1]
+
+
+def test_resolvers_override_fast_constructors() -> None:
+    @dataclasses.dataclass
+    class MyQubit:
+        row: int
+        col: int
+
+    def custom_resolver(cirq_type: str):
+        return MyQubit if cirq_type == 'GridQubit' else None
+
+    text = cirq.to_json(cirq.GridQubit(1, 2))
+    assert cirq.read_json(json_text=text, resolvers=[custom_resolver]) == MyQubit(1, 2)
+    assert cirq.read_json(json_text=text) == cirq.GridQubit(1, 2)
+
+
+def test_constructor_table_is_shared_by_resolver_set() -> None:
+    resolvers = list(cirq.DEFAULT_RESOLVERS)
+    table = json_serialization._constructor_table(resolvers)
+    _ = cirq.read_json(json_text=cirq.to_json(cirq.LineQubit(0)), resolvers=resolvers)
+    assert 'LineQubit' in table
+    assert json_serialization._constructor_table(tuple(resolvers)) is table
+
+    for i in range(json_serialization._MAX_CONSTRUCTOR_TABLES):
+        _ = json_serialization._constructor_table([lambda cirq_type: None, *resolvers])
+    assert json_serialization._constructor_table(resolvers) is not table
+
+    class UnhashableResolver:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, cirq_type: str):
+            return None
+
+    unhashable = [UnhashableResolver(), *resolvers]
+    assert cirq.read_json(json_text='{"cirq_type": "LineQubit", "x": 1}', resolvers=unhashable) == (
+        cirq.LineQubit(1)
+    )
+    assert json_serialization._constructor_table(unhashable) == {}
+
+
+def test_unhashable_factory() -> None:
+    class UnhashableFactory:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, x):
+            return x
+
+    def custom_resolver(cirq_type: str):
+        return UnhashableFactory() if cirq_type == 'Unhashable' else None
+
+    text = '{"cirq_type": "Unhashable", "x": 3}'
+    assert cirq.read_json(json_text=text, resolvers=[custom_resolver]) == 3
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 5, 1 << 20])
+def test_iter_json(tmp_path, monkeypatch, chunk_size: int) -> None:
+    monkeypatch.setattr(json_serialization, '_JSON_CHUNK_SIZE', chunk_size)
+    q = cirq.LineQubit(0)
+    sbk = SBKImpl('sbk')
+    objs = [cirq.X(q), 12345, -1.5e-10, 'text', None, [True, False], {'a': 1}, sbk, sbk, q]
+    path = tmp_path / 'objs.json'
+    cirq.to_json(objs, path)
+    resolvers: list[cirq.JsonResolver] = [
+        lambda cirq_type: SBKImpl if cirq_type == 'SBKImpl' else None,
+        *cirq.DEFAULT_RESOLVERS,
+    ]
+    assert list(cirq.iter_json(path, resolvers=resolvers)) == objs
+    assert list(cirq.iter_json(str(path), resolvers=resolvers)) == objs
+    assert list(
+        cirq.iter_json(io.StringIO(cirq.to_json(objs, indent=None)), resolvers=resolvers)
+    ) == (objs)
+
+    gzip_path = tmp_path / 'objs.json.gz'
+    cirq.to_json_gzip(objs, gzip_path)
+    with gzip.open(gzip_path, 'rt') as file:
+        assert list(cirq.iter_json(file, resolvers=resolvers)) == objs
+
+    assert list(cirq.iter_json(io.StringIO(' [ ] \n'))) == []
+    assert list(cirq.iter_json(io.StringIO('[1 ,2 ]'))) == [1, 2]
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 12))
+def test_iter_json_numbers_across_chunks(monkeypatch, chunk_size: int) -> None:
+    monkeypatch.setattr(json_serialization, '_JSON_CHUNK_SIZE', chunk_size)
+    text = '[12345678, 1.5e-7, "x", -0.25, 3E+2 ,7]'
+    assert list(cirq.iter_json(io.StringIO(text))) == json.loads(text)
+
+
+def test_iter_json_number_at_chunk_boundary() -> None:
+    # The first chunk ends after `1.5e`, which is decoded as 1.5 if not read further.
+    text = '["' + 'a' * (json_serialization._JSON_CHUNK_SIZE - 10) + '",  1.5e-7]'
+    assert text[: json_serialization._JSON_CHUNK_SIZE].endswith(' 1.5e')
+    assert list(cirq.iter_json(io.StringIO(text))) == json.loads(text)
+
+
+def test_iter_json_is_incremental() -> None:
+    elements = cirq.iter_json(io.StringIO('[1, 2, oops'))
+    assert next(elements) == 1
+    assert next(elements) == 2
+    with pytest.raises(json.JSONDecodeError):
+        _ = next(elements)
+
+
+@pytest.mark.parametrize(
+    'text, error',
+    [
+        ('{"a": 1}', 'does not contain a list'),
+        ('', 'does not contain a list'),
+        ('[1; 2]', "Expected ',' or ']'"),
+        ('[1, 2] 3', 'Unexpected data'),
+        ('[1, 2', "Expected ',' or ']'"),
+    ],
+)
+def test_iter_json_invalid(text: str, error: str) -> None:
+    with pytest.raises(ValueError, match=error):
+        _ = list(cirq.iter_json(io.StringIO(text)))
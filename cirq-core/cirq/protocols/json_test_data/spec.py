@@ -85,6 +85,7 @@ TestSpec = ModuleJsonTestSpec(
         'MEASUREMENT_KEY_SEPARATOR',
         'PointOptimizer',
         # Transformers
+        'DecompositionCache',
         'DecompositionContext',
         'TransformerLogger',
         'TransformerContext',
@@ -96,8 +97,14 @@ TestSpec = ModuleJsonTestSpec(
         # Qubit Managers,
         'SimpleQubitManager',
         'GreedyQubitManager',
+        # Serialization
+        'BinaryWriter',
+        # Caches of process-local computations
+        'DecomposeCache',
+        'EinsumPathCache',
         # global objects
         'CONTROL_TAG',
+        'EINSUM_PATH_CACHE',
         'PAULI_BASIS',
         'PAULI_STATES',
         # abstract, but not inspect.isabstract():
@@ -23,15 +23,19 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import Any, cast, TYPE_CHECKING, TypeVar, Union
 
 import numpy as np
-import pandas as pd
 
 from cirq import ops, value
 from cirq._compat import proper_repr
+from cirq._import import LazyLoader
 from cirq.study import resolver
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     import cirq
 
+pd = LazyLoader("pd", globals(), "pandas")
+
 T = TypeVar('T')
 TMeasurementKey = Union[str, 'cirq.Qid', Iterable['cirq.Qid']]
 
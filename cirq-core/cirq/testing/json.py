@@ -24,9 +24,11 @@ from types import ModuleType
 from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 
 import cirq
+from cirq._import import LazyLoader
+
+pd = LazyLoader("pd", globals(), "pandas")
 
 if TYPE_CHECKING:
     from cirq.protocols.json_serialization import ObjectFactory
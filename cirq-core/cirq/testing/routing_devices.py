@@ -18,13 +18,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import networkx as nx
-
 from cirq import devices, ops
+from cirq._import import LazyLoader
 
 if TYPE_CHECKING:
+    import networkx as nx
+
     import cirq
 
+nx = LazyLoader("nx", globals(), "networkx")
+
 
 class RoutingTestingDevice(devices.Device):
     """Testing device to be used for testing qubit connectivity in routing procedures."""
@@ -33,6 +33,7 @@ from cirq.transformers.analytical_decompositions import (
     single_qubit_matrix_to_phxz as single_qubit_matrix_to_phxz,
     single_qubit_op_to_framed_phase_form as single_qubit_op_to_framed_phase_form,
     three_qubit_matrix_to_operations as three_qubit_matrix_to_operations,
+    two_qubit_matrices_to_cz_operations as two_qubit_matrices_to_cz_operations,
     two_qubit_matrix_to_cz_isometry as two_qubit_matrix_to_cz_isometry,
     two_qubit_matrix_to_cz_operations as two_qubit_matrix_to_cz_operations,
     two_qubit_matrix_to_diagonal_and_cz_operations as two_qubit_matrix_to_diagonal_and_cz_operations,  # noqa: E501
@@ -72,6 +73,8 @@ from cirq.transformers.expand_composite import expand_composite as expand_compos
 
 from cirq.transformers.eject_phased_paulis import eject_phased_paulis as eject_phased_paulis
 
+from cirq.transformers.decomposition_cache import DecompositionCache as DecompositionCache
+
 from cirq.transformers.optimize_for_target_gateset import (
     optimize_for_target_gateset as optimize_for_target_gateset,
 )
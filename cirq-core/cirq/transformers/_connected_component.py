@@ -19,13 +19,16 @@ from __future__ import annotations
 from collections.abc import Callable, Sequence
 from typing import cast, TYPE_CHECKING
 
-from scipy.cluster.hierarchy import DisjointSet
-
 from cirq import ops, protocols
+from cirq._import import LazyLoader
 
 if TYPE_CHECKING:
+    from scipy.cluster import hierarchy
+
     import cirq
 
+hierarchy = LazyLoader("hierarchy", globals(), "scipy.cluster.hierarchy")
+
 
 class Component:
     """Internal representation for a connected component of operations."""
@@ -82,7 +85,7 @@ class ComponentSet:
 
     _comp_type: type[Component]
 
-    _disjoint_set: DisjointSet
+    _disjoint_set: hierarchy.DisjointSet
 
     # Callable to decide if a component is mergeable
     _is_mergeable: Callable[[cirq.Operation], bool]
@@ -92,7 +95,7 @@ class ComponentSet:
 
     def __init__(self, is_mergeable: Callable[[cirq.Operation], bool]):
         self._is_mergeable = is_mergeable
-        self._disjoint_set = DisjointSet()
+        self._disjoint_set = hierarchy.DisjointSet()
         self._components = []
         self._comp_type = Component
 
@@ -46,6 +46,7 @@ from cirq.transformers.analytical_decompositions.three_qubit_decomposition impor
 )
 
 from cirq.transformers.analytical_decompositions.two_qubit_to_cz import (
+    two_qubit_matrices_to_cz_operations as two_qubit_matrices_to_cz_operations,
     two_qubit_matrix_to_cz_operations as two_qubit_matrix_to_cz_operations,
     two_qubit_matrix_to_diagonal_and_cz_operations as two_qubit_matrix_to_diagonal_and_cz_operations,  # noqa: E501
 )
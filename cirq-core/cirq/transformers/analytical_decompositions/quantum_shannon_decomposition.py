@@ -26,9 +26,9 @@ from typing import cast, TYPE_CHECKING
 
 import attrs
 import numpy as np
-from scipy.linalg import cossin
 
 from cirq import ops
+from cirq._import import LazyLoader
 from cirq.circuits.frozen_circuit import FrozenCircuit
 from cirq.linalg import decompositions, predicates
 from cirq.protocols import unitary_protocol
@@ -37,6 +37,8 @@ from cirq.transformers.analytical_decompositions.two_qubit_to_cz import (
     two_qubit_matrix_to_diagonal_and_cz_operations,
 )
 
+linalg = LazyLoader("linalg", globals(), "scipy.linalg")
+
 if TYPE_CHECKING:
     import cirq
 
@@ -192,7 +194,7 @@ def _recursive_decomposition(qubits: Sequence[cirq.Qid], u: np.ndarray) -> Itera
     # Perform a cosine-sine (linalg) decomposition on u
     #   X   =   [ u1 , 0  ] [ cos(theta) , -sin(theta) ] [ v1 , 0  ]
     #           [ 0  , u2 ] [ sin(theta) ,  cos(theta) ] [ 0  , v2 ]
-    (u1, u2), theta, (v1, v2) = cossin(u, n / 2, n / 2, separate=True)
+    (u1, u2), theta, (v1, v2) = linalg.cossin(u, n / 2, n / 2, separate=True)
 
     # Yield ops from decomposition of multiplexed v1/v2 part
     yield from _msb_demuxer(qubits, v1, v2)
@@ -19,10 +19,12 @@ from __future__ import annotations
 from collections.abc import Sequence
 
 import numpy as np
-import scipy.linalg
 
 import cirq
 from cirq import ops, transformers as opt
+from cirq._import import LazyLoader
+
+linalg = LazyLoader("linalg", globals(), "scipy.linalg")
 
 
 def three_qubit_matrix_to_operations(
@@ -54,7 +56,7 @@ def three_qubit_matrix_to_operations(
     if not cirq.is_unitary(u, atol=atol):
         raise ValueError(f"Matrix is not unitary: {u}")
 
-    (u1, u2), theta, (v1h, v2h) = scipy.linalg.cossin(u, 4, 4, separate=True)
+    (u1, u2), theta, (v1h, v2h) = linalg.cossin(u, 4, 4, separate=True)
 
     cs_ops = _cs_to_ops(q0, q1, q2, theta)
     if len(cs_ops) > 0 and cs_ops[-1] == cirq.CZ(q2, q0):
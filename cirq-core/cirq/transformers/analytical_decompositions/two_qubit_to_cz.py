@@ -77,6 +77,62 @@ def two_qubit_matrix_to_cz_operations(
         ValueError: If allow_partial_czs=False and the matrix requires partial CZs.
     """
     kak = linalg.kak_decomposition(mat, atol=atol)
+    return _kak_decomposition_to_cz_operations(
+        q0, q1, kak, allow_partial_czs, atol=atol, clean_operations=clean_operations
+    )
+
+
+def two_qubit_matrices_to_cz_operations(
+    qubit_pairs: Sequence[tuple[cirq.Qid, cirq.Qid]],
+    mats: Sequence[np.ndarray] | np.ndarray,
+    allow_partial_czs: bool,
+    atol: float = 1e-8,
+    clean_operations: bool = True,
+) -> list[list[ops.Operation]]:
+    """Decomposes many two-qubit operations into Z/XY/CZ gates.
+
+    This is the batched version of `cirq.two_qubit_matrix_to_cz_operations`. The KAK
+    decompositions of all matrices are computed in a single vectorized call to
+    `cirq.kak_decompositions`.
+
+    Args:
+        qubit_pairs: The pair of qubits (q0, q1) operated on by each matrix.
+        mats: The matrices defining the operations to apply to each pair of qubits, either as a
+            sequence of 4x4 matrices or as an array of shape (N, 4, 4).
+        allow_partial_czs: Enables the use of Partial-CZ gates.
+        atol: A limit on the amount of absolute error introduced by the
+            construction.
+        clean_operations: Enables optimizing resulting operation lists by
+            merging operations and ejecting phased Paulis and Z operations.
+
+    Returns:
+        A list with the list of operations implementing each matrix.
+
+    Raises:
+        ValueError: If the number of qubit pairs and matrices differ, or if
+            allow_partial_czs=False and a matrix requires partial CZs.
+    """
+    if len(qubit_pairs) != len(mats):
+        raise ValueError(
+            f'Got {len(qubit_pairs)} qubit pairs but {len(mats)} matrices to decompose.'
+        )
+    kaks = linalg.kak_decompositions(mats, atol=atol)
+    return [
+        _kak_decomposition_to_cz_operations(
+            q0, q1, kak, allow_partial_czs, atol=atol, clean_operations=clean_operations
+        )
+        for (q0, q1), kak in zip(qubit_pairs, kaks)
+    ]
+
+
+def _kak_decomposition_to_cz_operations(
+    q0: cirq.Qid,
+    q1: cirq.Qid,
+    kak: linalg.KakDecomposition,
+    allow_partial_czs: bool,
+    atol: float,
+    clean_operations: bool,
+) -> list[ops.Operation]:
     operations = _kak_decomposition_to_operations(q0, q1, kak, allow_partial_czs, atol=atol)
     if clean_operations:
         if not allow_partial_czs:
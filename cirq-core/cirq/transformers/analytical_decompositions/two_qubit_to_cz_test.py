@@ -166,6 +166,25 @@ def test_two_to_ops_equivalent_and_bounded_for_known_and_random(
     assert_cz_depth_below(operations_with_full, max_full_cz_depth, True)
 
 
+def test_two_qubit_matrices_to_cz_operations() -> None:
+    qubit_pairs = [(cirq.LineQubit(i), cirq.LineQubit(i + 1)) for i in range(5)]
+    effects = [
+        cirq.unitary(cirq.CZ**0.5),
+        cirq.unitary(cirq.SWAP),
+        _random_double_full_cz_effect(),
+        *[cirq.testing.random_unitary(4) for _ in range(2)],
+    ]
+
+    batched = cirq.two_qubit_matrices_to_cz_operations(qubit_pairs, effects, False)
+    assert len(batched) == len(effects)
+    for (q0, q1), effect, operations in zip(qubit_pairs, effects, batched):
+        assert_ops_implement_unitary(q0, q1, operations, effect)
+        assert_cz_depth_below(operations, 3, True)
+
+    with pytest.raises(ValueError, match='qubit pairs'):
+        _ = cirq.two_qubit_matrices_to_cz_operations(qubit_pairs[:2], effects, True)
+
+
 def test_trivial_parity_interaction_corner_case() -> None:
     q0 = cirq.NamedQubit('q0')
     q1 = cirq.NamedQubit('q1')
@@ -0,0 +1,217 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A memo of decompositions of unitary operations into a target gateset."""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import os
+import pathlib
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from cirq import devices, ops, protocols
+
+if TYPE_CHECKING:
+    import cirq
+    from cirq.protocols.decompose_protocol import DecomposeResult
+
+# The prefix of the names of the files written by the cache, so that `clear` only removes those.
+_FILE_PREFIX = 'cirq-decomposition-'
+
+
+class DecompositionCache:
+    """A bounded memo of decompositions of unitary operations into a target gateset.
+
+    Decompositions are keyed on the target gateset and on the unitary of the decomposed
+    operation, rounded to `atol`. Operations with the same unitary acting on different qubits
+    therefore share a cache entry: the decomposition is stored on canonical `cirq.LineQid`s and
+    mapped onto the qubits of each operation when it is looked up. Decompositions which act on
+    other qubits than the ones of the decomposed operation, e.g. on ancillas, are not cached.
+
+    At most `maxsize` entries are kept in memory, evicting the least recently used ones. If a
+    `directory` is given, entries are also written to it as JSON files, so that they can be
+    shared across processes. The on-disk store is not bounded, and `clear` only removes the files
+    written by a cache from the directory.
+
+    The cache can be passed to `cirq.optimize_for_target_gateset`, which reports the number of
+    cache hits and misses of each call to the `cirq.TransformerContext` logger. Only gatesets
+    whose decompositions do not depend on the moment index of the decomposed operation should be
+    used with a cache.
+    """
+
+    def __init__(
+        self, maxsize: int = 1024, *, atol: float = 1e-9, directory: str | os.PathLike | None = None
+    ):
+        """Inits DecompositionCache.
+
+        Args:
+            maxsize: The maximum number of decompositions kept in memory.
+            atol: The resolution to which unitaries are rounded when computing cache keys.
+            directory: An optional directory in which to also store the decompositions as JSON
+                files. It is created if it does not exist.
+
+        Raises:
+            ValueError: If `maxsize` is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError(f'maxsize must be positive, got {maxsize}.')
+        self._maxsize = maxsize
+        self._atol = atol
+        self._directory = pathlib.Path(directory) if directory is not None else None
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+        self._entries: collections.OrderedDict[str, tuple[cirq.Operation, ...]] = (
+            collections.OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def key(self, gateset: cirq.Gateset, op: cirq.Operation) -> str | None:
+        """Returns the cache key of decomposing `op` into `gateset`.
+
+        Args:
+            gateset: The target gateset.
+            op: The operation to decompose.
+
+        Returns:
+            A hex digest of the gateset and the rounded unitary of `op`, or None if `op` has no
+            unitary.
+        """
+        if protocols.is_parameterized(op) or not protocols.has_unitary(op):
+            return None
+        u = protocols.unitary(op)
+        rounded = np.round(np.stack([u.real, u.imag]) / self._atol).astype(np.int64)
+        digest = hashlib.sha256()
+        digest.update(repr(gateset).encode())
+        digest.update(repr(protocols.qid_shape(op)).encode())
+        digest.update(rounded.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str, qubits: Sequence[cirq.Qid]) -> list[cirq.Operation] | None:
+        """Returns the decomposition stored under `key` acting on `qubits`, or None."""
+        result = self._lookup(key, qubits)
+        if result is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return result
+
+    def put(self, key: str, qubits: Sequence[cirq.Qid], operations: cirq.OP_TREE) -> None:
+        """Stores the decomposition `operations` of an operation on `qubits` under `key`.
+
+        Decompositions which act on other qubits than `qubits` are not stored.
+        """
+        entry = self._canonicalize(qubits, operations)
+        if entry is None:
+            return
+        self._store(key, entry)
+        if self._directory is not None:
+            protocols.to_json(list(entry), self._path(key))
+
+    def decomposer(
+        self, gateset: cirq.Gateset, decomposer: Callable[[cirq.Operation, int], DecomposeResult]
+    ) -> Callable[[cirq.Operation, int], DecomposeResult]:
+        """Wraps `decomposer` so that its decompositions into `gateset` are memoized."""
+
+        def cached_decomposer(op: cirq.Operation, moment_idx: int) -> DecomposeResult:
+            key = self.key(gateset, op)
+            if key is None:
+                return decomposer(op, moment_idx)
+            result = self.get(key, op.qubits)
+            if result is not None:
+                return result
+            decomposed = decomposer(op, moment_idx)
+            if decomposed is None or decomposed is NotImplemented:
+                return decomposed
+            operations = [*ops.flatten_to_ops(decomposed)]
+            self.put(key, op.qubits, operations)
+            return operations
+
+        return cached_decomposer
+
+    def clear(self) -> None:
+        """Removes all entries, including the ones on disk, and resets the statistics."""
+        self._entries.clear()
+        if self._directory is not None:
+            for path in self._directory.glob(f'{_FILE_PREFIX}*.json'):
+                path.unlink()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of decompositions kept in memory."""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups which returned a decomposition."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups which did not return a decomposition."""
+        return self._misses
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or (self._directory is not None and self._path(key).exists())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: str, qubits: Sequence[cirq.Qid]) -> list[cirq.Operation] | None:
+        entry = self._entries.get(key)
+        if entry is None and self._directory is not None and self._path(key).exists():
+            entry = tuple(protocols.read_json(self._path(key)))
+        if entry is None:
+            return None
+        self._store(key, entry)
+        return self._map_onto(entry, qubits)
+
+    def _canonicalize(
+        self, qubits: Sequence[cirq.Qid], operations: cirq.OP_TREE
+    ) -> tuple[cirq.Operation, ...] | None:
+        """Maps `operations` on `qubits` onto the canonical qubits of cache entries.
+
+        Returns None if `operations` act on other qubits than `qubits`.
+        """
+        flat_operations = [*ops.flatten_to_ops(operations)]
+        if not set(qubits).issuperset(q for op in flat_operations for q in op.qubits):
+            return None
+        canonical_qubits = devices.LineQid.for_qid_shape(protocols.qid_shape(qubits))
+        qubit_map: dict[cirq.Qid, cirq.Qid] = dict(zip(qubits, canonical_qubits))
+        return tuple(op.transform_qubits(qubit_map) for op in flat_operations)
+
+    def _map_onto(
+        self, entry: Sequence[cirq.Operation], qubits: Sequence[cirq.Qid]
+    ) -> list[cirq.Operation]:
+        """Maps the operations of a cache entry onto `qubits`."""
+        canonical_qubits = devices.LineQid.for_qid_shape(protocols.qid_shape(qubits))
+        qubit_map: dict[cirq.Qid, cirq.Qid] = dict(zip(canonical_qubits, qubits))
+        return [op.transform_qubits(qubit_map) for op in entry]
+
+    def _store(self, key: str, entry: tuple[cirq.Operation, ...]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> pathlib.Path:
+        assert self._directory is not None
+        return self._directory / f'{_FILE_PREFIX}{key}.json'
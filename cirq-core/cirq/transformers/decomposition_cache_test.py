@@ -0,0 +1,278 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from unittest import mock
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+GATESET = cirq.CZTargetGateset()
+
+
+def test_key_is_invariant_under_qubits():
+    a, b, c, d = cirq.LineQubit.range(4)
+    cache = cirq.DecompositionCache()
+    key = cache.key(GATESET, cirq.ISWAP(a, b) ** 0.3)
+    assert key is not None
+    assert key == cache.key(GATESET, cirq.ISWAP(c, d) ** 0.3)
+    assert key == cache.key(
+        GATESET, cirq.MatrixGate(cirq.unitary(cirq.ISWAP**0.3) + 1e-12).on(a, b)
+    )
+
+    other_keys = [
+        cache.key(GATESET, cirq.MatrixGate(1j * cirq.unitary(cirq.ISWAP**0.3)).on(a, b)),
+        cache.key(GATESET, cirq.ISWAP(a, b) ** 0.31),
+        cache.key(GATESET, cirq.CZ(a, b)),
+        cache.key(GATESET, cirq.X(a)),
+        cache.key(cirq.CZTargetGateset(allow_partial_czs=True), cirq.ISWAP(a, b) ** 0.3),
+    ]
+    assert len({key, *other_keys}) == len(other_keys) + 1
+
+    assert cache.key(GATESET, cirq.ISWAP(a, b) ** sympy.Symbol('t')) is None
+    assert cache.key(GATESET, cirq.measure(a)) is None
+
+
+def test_get_and_put_map_qubits():
+    a, b, c, d = cirq.LineQubit.range(4)
+    cache = cirq.DecompositionCache()
+    key = cache.key(GATESET, cirq.CNOT(a, b))
+    assert key is not None
+    assert cache.get(key, (a, b)) is None
+    cache.put(key, (a, b), [cirq.H(b), cirq.CZ(a, b), cirq.H(b)])
+    assert key in cache
+    assert cache.get(key, (c, d)) == [cirq.H(d), cirq.CZ(c, d), cirq.H(d)]
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    cache.clear()
+    assert key not in cache
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_put_skips_decompositions_on_other_qubits():
+    a, b, c = cirq.LineQubit.range(3)
+    cache = cirq.DecompositionCache()
+    key = cache.key(GATESET, cirq.CNOT(a, b))
+    assert key is not None
+    cache.put(key, (a, b), [cirq.CNOT(a, c), cirq.CZ(c, b), cirq.CNOT(a, c)])
+    assert key not in cache
+    assert cache.get(key, (a, b)) is None
+    assert len(cache) == 0
+
+
+def test_maxsize_evicts_least_recently_used():
+    q = cirq.LineQubit(0)
+    cache = cirq.DecompositionCache(maxsize=2)
+    assert cache.maxsize == 2
+    keys = [cache.key(GATESET, gate(q)) for gate in (cirq.X, cirq.Y, cirq.Z)]
+    cache.put(keys[0], (q,), [cirq.X(q)])
+    cache.put(keys[1], (q,), [cirq.Y(q)])
+    assert cache.get(keys[0], (q,)) == [cirq.X(q)]
+    cache.put(keys[2], (q,), [cirq.Z(q)])
+    assert len(cache) == 2
+    assert keys[1] not in cache
+    assert keys[0] in cache and keys[2] in cache
+
+    with pytest.raises(ValueError, match='maxsize'):
+        _ = cirq.DecompositionCache(maxsize=0)
+
+
+def test_directory_persists_entries(tmp_path):
+    a, b = cirq.LineQubit.range(2)
+    cache = cirq.DecompositionCache(directory=tmp_path / 'cache')
+    key = cache.key(GATESET, cirq.CNOT(a, b))
+    cache.put(key, (a, b), [cirq.H(b), cirq.CZ(a, b), cirq.H(b)])
+    assert (tmp_path / 'cache' / f'cirq-decomposition-{key}.json').exists()
+
+    new_cache = cirq.DecompositionCache(directory=tmp_path / 'cache')
+    assert key in new_cache
+    assert new_cache.get(key, (b, a)) == [cirq.H(a), cirq.CZ(b, a), cirq.H(a)]
+    assert len(new_cache) == 1
+
+    (tmp_path / 'cache' / 'other.json').write_text('{}')
+    new_cache.clear()
+    assert key not in new_cache
+    assert [path.name for path in (tmp_path / 'cache').iterdir()] == ['other.json']
+
+
+def test_decomposer_memoizes_results():
+    a, b, c, d = cirq.LineQubit.range(4)
+    cache = cirq.DecompositionCache()
+    decomposer = mock.Mock(wraps=lambda op, _: iter([cirq.H(op.qubits[1]), cirq.CZ(*op.qubits)]))
+    cached_decomposer = cache.decomposer(GATESET, decomposer)
+
+    assert cached_decomposer(cirq.CNOT(a, b) ** 0.5, 0) == [cirq.H(b), cirq.CZ(a, b)]
+    assert cached_decomposer(cirq.CNOT(c, d) ** 0.5, 3) == [cirq.H(d), cirq.CZ(c, d)]
+    assert decomposer.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Operations without a unitary and failed decompositions are not cached.
+    decomposer = mock.Mock(return_value=NotImplemented)
+    cached_decomposer = cache.decomposer(GATESET, decomposer)
+    assert cached_decomposer(cirq.measure(a), 0) is NotImplemented
+    assert cached_decomposer(cirq.SWAP(a, b), 0) is NotImplemented
+    assert cached_decomposer(cirq.SWAP(a, b), 0) is NotImplemented
+    assert decomposer.call_count == 3
+    assert len(cache) == 1
+
+
+def test_decomposer_skips_decompositions_on_other_qubits():
+    a, b, c, d = cirq.LineQubit.range(4)
+    cache = cirq.DecompositionCache()
+    ancilla = cirq.NamedQubit('ancilla')
+    decomposer = mock.Mock(
+        wraps=lambda op, _: [cirq.CNOT(op.qubits[0], ancilla), cirq.CZ(*op.qubits)]
+    )
+    cached_decomposer = cache.decomposer(GATESET, decomposer)
+
+    assert cached_decomposer(cirq.CZ(a, b), 0) == [cirq.CNOT(a, ancilla), cirq.CZ(a, b)]
+    assert cached_decomposer(cirq.CZ(c, d), 0) == [cirq.CNOT(c, ancilla), cirq.CZ(c, d)]
+    assert decomposer.call_count == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize('gateset', [cirq.CZTargetGateset(), cirq.SqrtIswapTargetGateset()])
+def test_optimize_for_target_gateset_with_cache(gateset):
+    q = cirq.LineQubit.range(4)
+    layer = cirq.Circuit(
+        [cirq.ISWAP(q[0], q[1]) ** 0.3, cirq.ISWAP(q[2], q[3]) ** 0.3],
+        [cirq.Y(qubit) ** 0.2 for qubit in q],
+        cirq.CNOT(q[1], q[2]),
+    )
+    circuit = layer * 3
+    cache = cirq.DecompositionCache()
+    logger = mock.MagicMock(spec=cirq.TransformerLogger)
+    context = cirq.TransformerContext(logger=logger)
+
+    expected = cirq.optimize_for_target_gateset(circuit, gateset=gateset)
+    actual = cirq.optimize_for_target_gateset(
+        circuit, gateset=gateset, context=context, decomposition_cache=cache
+    )
+    cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+        actual, circuit, atol=1e-6
+    )
+    assert actual == expected
+    misses = cache.misses
+    assert cache.hits > 0 and misses > 0
+    logger.log.assert_called_once_with(
+        f'Decomposition cache: {cache.hits} hits, {cache.misses} misses.'
+    )
+
+    # A second circuit made of the same blocks on other qubits only hits the cache.
+    shifted = circuit.transform_qubits(lambda qubit: qubit + 4)
+    actual = cirq.optimize_for_target_gateset(shifted, gateset=gateset, decomposition_cache=cache)
+    cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+        actual, shifted, atol=1e-6
+    )
+    assert cache.misses == misses
+
+
+def test_optimize_for_target_gateset_with_cache_and_deep_circuits():
+    q = cirq.LineQubit.range(2)
+    sub_circuit = cirq.FrozenCircuit(cirq.ISWAP(*q) ** 0.3, cirq.X(q[0]) ** 0.2)
+    circuit = cirq.Circuit(
+        cirq.CircuitOperation(sub_circuit), cirq.CircuitOperation(sub_circuit).repeat(2)
+    )
+    cache = cirq.DecompositionCache()
+    actual = cirq.optimize_for_target_gateset(
+        circuit,
+        gateset=cirq.CZTargetGateset(),
+        context=cirq.TransformerContext(deep=True),
+        decomposition_cache=cache,
+    )
+    cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+        actual, circuit, atol=1e-6
+    )
+    assert all(isinstance(op.untagged, cirq.CircuitOperation) for op in actual.all_operations())
+    assert cache.hits > 0
+
+
+def test_optimize_for_target_gateset_with_cache_smaller_than_a_batch():
+    q = cirq.LineQubit.range(6)
+    circuit = cirq.Circuit(
+        cirq.FSimGate(0.1, 0.2)(q[0], q[1]),
+        cirq.FSimGate(0.3, 0.4)(q[2], q[3]),
+        cirq.FSimGate(0.1, 0.2)(q[4], q[5]),
+    )
+    gateset = cirq.CZTargetGateset()
+    cache = cirq.DecompositionCache(maxsize=1)
+    optimized = cirq.optimize_for_target_gateset(
+        circuit, gateset=gateset, decomposition_cache=cache
+    )
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.unitary(optimized), cirq.unitary(circuit), atol=1e-6
+    )
+    assert optimized == cirq.optimize_for_target_gateset(circuit, gateset=gateset)
+
+
+def test_optimize_for_target_gateset_with_cache_and_failed_decompositions():
+    q = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(cirq.FSimGate(0.1, 0.2)(q[0], q[1]), cirq.FSimGate(0.1, 0.2)(q[2], q[3]))
+    cache = cirq.DecompositionCache()
+    with mock.patch.object(
+        cirq.CZTargetGateset,
+        '_decompose_two_qubit_operations',
+        side_effect=lambda ops_and_moments: [NotImplemented] * len(ops_and_moments),
+    ):
+        optimized = cirq.optimize_for_target_gateset(
+            circuit, gateset=cirq.CZTargetGateset(), decomposition_cache=cache
+        )
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.unitary(optimized), cirq.unitary(circuit), atol=1e-6
+    )
+    assert all(op in cirq.CZTargetGateset() for op in optimized.all_operations())
+
+
+def test_optimize_for_target_gateset_with_cache_and_global_phases():
+    q = cirq.LineQubit.range(4)
+    u = cirq.unitary(cirq.FSimGate(0.3, 0.2))
+    circuit = cirq.Circuit(
+        cirq.MatrixGate(u)(q[0], q[1]), cirq.MatrixGate(np.exp(0.7j) * u)(q[2], q[3])
+    )
+    gateset = cirq.CZTargetGateset()
+    cache = cirq.DecompositionCache()
+    optimized = cirq.optimize_for_target_gateset(
+        circuit, gateset=gateset, decomposition_cache=cache
+    )
+    np.testing.assert_allclose(
+        cirq.unitary(optimized),
+        cirq.unitary(cirq.optimize_for_target_gateset(circuit, gateset=gateset)),
+        atol=1e-8,
+    )
+
+
+class AncillaCZTargetGateset(cirq.CZTargetGateset):
+    def _decompose_two_qubit_operations(self, ops_and_moments):
+        return [
+            [cirq.CNOT(op.qubits[0], cirq.NamedQubit('ancilla')), cirq.CZ(*op.qubits)]
+            for op, _ in ops_and_moments
+        ]
+
+
+def test_batch_decomposition_with_cache_and_decompositions_on_other_qubits():
+    a, b, c, d = cirq.LineQubit.range(4)
+    ancilla = cirq.NamedQubit('ancilla')
+    cache = cirq.DecompositionCache()
+    decomposed = AncillaCZTargetGateset()._decompose_two_qubit_operations_with_cache(
+        [(cirq.CZ(a, b), 0), (cirq.CZ(c, d), 1)], cache
+    )
+    assert decomposed == {
+        (cirq.CZ(a, b), 0): [cirq.CNOT(a, ancilla), cirq.CZ(a, b)],
+        (cirq.CZ(c, d), 1): [cirq.CNOT(c, ancilla), cirq.CZ(c, d)],
+    }
+    assert len(cache) == 0
@@ -106,6 +106,7 @@ def optimize_for_target_gateset(
     gateset: cirq.CompilationTargetGateset | None = None,
     ignore_failures: bool = True,
     max_num_passes: int | None = 1,
+    decomposition_cache: cirq.DecompositionCache | None = None,
 ) -> cirq.Circuit:
     """Transforms the given circuit into an equivalent circuit using gates accepted by `gateset`.
 
@@ -128,6 +129,10 @@ def optimize_for_target_gateset(
             conversion failures raise a ValueError.
         max_num_passes: The maximum number of passes to do. A value of `None` means to keep
             iterating until no more changes happen to the number of moments or operations.
+        decomposition_cache: An optional `cirq.DecompositionCache` used to reuse the
+            decompositions of operations whose unitary was already decomposed into `gateset`,
+            in this or in earlier calls. The number of cache hits and misses is reported to the
+            `context` logger.
 
     Returns:
         An equivalent circuit containing gates accepted by `gateset`.
@@ -147,6 +152,8 @@ def optimize_for_target_gateset(
             while True:
                 yield 0
 
+    if decomposition_cache is not None:
+        initial_hits, initial_misses = decomposition_cache.hits, decomposition_cache.misses
     initial_num_moments, initial_num_ops = len(circuit), sum(1 for _ in circuit.all_operations())
     for _ in _outerloop():
         for transformer in gateset.preprocess_transformers:
@@ -155,7 +162,9 @@ def optimize_for_target_gateset(
             circuit,
             context=context,
             gateset=gateset,
-            decomposer=gateset.decompose_to_target_gateset,
+            decomposer=gateset._batch_decomposer(
+                circuit, context.tags_to_ignore if context else (), decomposition_cache
+            ),
             ignore_failures=ignore_failures,
             tags_to_decompose=(gateset._intermediate_result_tag,),
         )
@@ -167,4 +176,9 @@ def optimize_for_target_gateset(
             # Stop early. No further optimizations can be done.
             break
         initial_num_moments, initial_num_ops = num_moments, num_ops
+    if context is not None and decomposition_cache is not None:
+        context.logger.log(
+            f'Decomposition cache: {decomposition_cache.hits - initial_hits} hits, '
+            f'{decomposition_cache.misses - initial_misses} misses.'
+        )
     return circuit.unfreeze(copy=False)
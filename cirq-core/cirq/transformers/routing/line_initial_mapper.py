@@ -35,14 +35,19 @@ from __future__ import annotations
 from collections import deque
 from typing import TYPE_CHECKING
 
-import networkx as nx
+import numpy as np
 
 from cirq import protocols, value
+from cirq._import import LazyLoader
 from cirq.transformers.routing import initial_mapper
 
 if TYPE_CHECKING:
+    import networkx as nx
+
     import cirq
 
+nx = LazyLoader("nx", globals(), "networkx")
+
 
 @value.value_equality
 class LineInitialMapper(initial_mapper.AbstractInitialMapper):
@@ -63,13 +68,20 @@ class LineInitialMapper(initial_mapper.AbstractInitialMapper):
     The expected runtime of this strategy is O(m logn + n^2) where m is the # of operations in the
     given circuit and n is the number of qubits. The first term corresponds to the runtime of
     'make_circuit_graph()' and the second for 'initial_mapping()'.
+
+    If a `seed` is given, ties between equally good center qubits and between neighbors of equal
+    degree are broken at random instead of by the sorted order of the physical qubits. Mappers with
+    different seeds then produce different initial mappings of similar quality, which can be
+    routed as independent trials, e.g. with `cirq.RouteCQC.route_circuit_multi`.
     """
 
-    def __init__(self, device_graph: nx.Graph) -> None:
+    def __init__(self, device_graph: nx.Graph, *, seed: int | None = None) -> None:
         """Initializes a LineInitialMapper.
 
         Args:
             device_graph: device graph
+            seed: optional seed used to randomly break ties. If None, ties are broken
+                deterministically.
         """
         if nx.is_directed(device_graph):
             self.device_graph = nx.DiGraph()
@@ -79,7 +91,13 @@ class LineInitialMapper(initial_mapper.AbstractInitialMapper):
             self.device_graph = nx.Graph()
             self.device_graph.add_nodes_from(sorted(device_graph.nodes(data=True)))
             self.device_graph.add_edges_from(sorted(sorted(edge) for edge in device_graph.edges))
-        self.center = nx.center(self.device_graph)[0]
+        self.seed = seed
+        centers = nx.center(self.device_graph)
+        self.center = (
+            centers[0]
+            if seed is None
+            else centers[np.random.RandomState(seed).randint(len(centers))]
+        )
 
     def _make_circuit_graph(
         self, circuit: cirq.AbstractCircuit
@@ -154,6 +172,7 @@ class LineInitialMapper(initial_mapper.AbstractInitialMapper):
         mapped_physicals: set[cirq.Qid] = set()
         qubit_map: dict[cirq.Qid, cirq.Qid] = {}
         circuit_graph, partners = self._make_circuit_graph(circuit)
+        prng = None if self.seed is None else np.random.RandomState(self.seed)
 
         def next_physical(
             current_physical: cirq.Qid, partner: cirq.Qid, isolated: bool = False
@@ -163,10 +182,11 @@ class LineInitialMapper(initial_mapper.AbstractInitialMapper):
                 return current_physical
             # Greedily map to highest degree neighbor that is available
             if not isolated:
+                neighbors = list(self.device_graph.neighbors(current_physical))
+                if prng is not None:
+                    neighbors = [neighbors[i] for i in prng.permutation(len(neighbors))]
                 sorted_neighbors = sorted(
-                    self.device_graph.neighbors(current_physical),
-                    key=lambda x: self.device_graph.degree(x),
-                    reverse=True,
+                    neighbors, key=lambda x: self.device_graph.degree(x), reverse=True
                 )
                 for neighbor in sorted_neighbors:
                     if neighbor not in mapped_physicals:
@@ -213,8 +233,12 @@ class LineInitialMapper(initial_mapper.AbstractInitialMapper):
             tuple(self.device_graph.nodes),
             tuple(self.device_graph.edges),
             nx.is_directed(self.device_graph),
+            self.seed,
         )
 
     def __repr__(self):
         graph_type = type(self.device_graph).__name__
-        return f'cirq.LineInitialMapper(nx.{graph_type}({dict(self.device_graph.adjacency())}))'
+        seed = '' if self.seed is None else f', seed={self.seed}'
+        return (
+            f'cirq.LineInitialMapper(nx.{graph_type}({dict(self.device_graph.adjacency())}){seed})'
+        )
@@ -189,7 +189,28 @@ def test_large_random_circuits_grid_device(
     assert nx.is_connected(nx.induced_subgraph(glob_device_graph, mapping.values()))
 
 
+def test_seeded_mappers_break_ties_randomly() -> None:
+    c_orig = cirq.testing.random_circuit(qubits=20, n_moments=40, op_density=0.5, random_state=0)
+    mappings = []
+    for seed in range(5):
+        mapper = cirq.LineInitialMapper(glob_device_graph, seed=seed)
+        mapping = mapper.initial_mapping(c_orig)
+        assert mapping == mapper.initial_mapping(c_orig)
+        assert mapping == cirq.LineInitialMapper(glob_device_graph, seed=seed).initial_mapping(
+            c_orig
+        )
+        assert len(set(mapping.values())) == len(mapping.values())
+        assert nx.is_connected(nx.induced_subgraph(glob_device_graph, mapping.values()))
+        mappings.append(mapping)
+    assert len({tuple(sorted(m.items())) for m in mappings}) > 1
+
+
 def test_repr() -> None:
     device_graph = cirq.testing.construct_grid_device(7, 7).metadata.nx_graph
     mapper = cirq.LineInitialMapper(device_graph)
     cirq.testing.assert_equivalent_repr(mapper, setup_code='import cirq\nimport networkx as nx')
+    seeded_mapper = cirq.LineInitialMapper(device_graph, seed=3)
+    cirq.testing.assert_equivalent_repr(
+        seeded_mapper, setup_code='import cirq\nimport networkx as nx'
+    )
+    assert seeded_mapper != mapper
@@ -16,15 +16,49 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
-import networkx as nx
 import numpy as np
 
+from cirq._import import LazyLoader
+
 if TYPE_CHECKING:
+    import networkx as nx
+
     import cirq
 
+nx = LazyLoader("nx", globals(), "networkx")
+
+csgraph = LazyLoader("csgraph", globals(), "scipy.sparse.csgraph")
+sparse = LazyLoader("sparse", globals(), "scipy.sparse")
+
+
+@functools.lru_cache(maxsize=32)
+def _all_pairs_shortest_paths(
+    num_nodes: int, edges: tuple[tuple[int, int], ...], directed: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Computes the distance and predecessor matrices of an unweighted graph on integer nodes.
+
+    The result is cached on the edge list, so that routing many circuits onto the same device
+    graph computes the matrices only once.
+
+    Returns:
+        A (num_nodes, num_nodes) float array with the shortest path lengths (inf if there is no
+        path), and an integer array whose [i, j] entry is the predecessor of node j on a shortest
+        path from node i (negative if there is no path).
+    """
+    rows = [u for u, _ in edges]
+    cols = [v for _, v in edges]
+    adjacency = sparse.csr_matrix((np.ones(len(edges)), (rows, cols)), shape=(num_nodes, num_nodes))
+    distances, predecessors = csgraph.shortest_path(
+        adjacency, directed=directed, unweighted=True, return_predecessors=True
+    )
+    distances.setflags(write=False)
+    predecessors.setflags(write=False)
+    return distances, predecessors
+
 
 class MappingManager:
     """Class that manages the mapping from logical to physical qubits.
@@ -79,20 +113,23 @@ class MappingManager:
             nx.induced_subgraph(device_graph, initial_mapping.values()),
             {q: self._physical_qid_to_int[q] for q in initial_mapping.values()},
         )
-        # Compute floyd warshall dictionary.
-        self._predecessors, self._distances = nx.floyd_warshall_predecessor_and_distance(
-            self._induced_subgraph_int
+        # Compute all pairs shortest path distance and predecessor matrices. SWAPs are symmetric
+        # regardless of underlying gate direction constraints, so for directed graphs also compute
+        # undirected distances and predecessors for swap operations.
+        num_nodes = len(self._int_to_physical_qid)
+        edges = tuple(sorted(self._induced_subgraph_int.edges))
+        self._distances, self._predecessors = _all_pairs_shortest_paths(
+            num_nodes, edges, self._induced_subgraph_int.is_directed()
         )
-        # For directed graphs, compute undirected distances and predecessors for swap operations
-        # (SWAPs are symmetric regardless of underlying gate direction constraints)
         if self._induced_subgraph_int.is_directed():
-            undirected_induced_subgraph_int = self._induced_subgraph_int.to_undirected()
-            self._undirected_predecessors, self._undirected_distances = (
-                nx.floyd_warshall_predecessor_and_distance(undirected_induced_subgraph_int)
+            self._undirected_induced_subgraph_int = self._induced_subgraph_int.to_undirected()
+            self._undirected_distances, self._undirected_predecessors = _all_pairs_shortest_paths(
+                num_nodes, edges, False
             )
         else:
-            self._undirected_predecessors = self._predecessors
+            self._undirected_induced_subgraph_int = self._induced_subgraph_int
             self._undirected_distances = self._distances
+            self._undirected_predecessors = self._predecessors
 
     @property
     def physical_qid_to_int(self) -> dict[cirq.Qid, int]:
@@ -145,7 +182,26 @@ class MappingManager:
         """Induced subgraph on physical qubit integers present in `self.logical_to_physical`."""
         return self._induced_subgraph_int
 
-    def dist_on_device(self, lq1: int, lq2: int, *, undirected=False) -> int:
+    @property
+    def undirected_induced_subgraph_int(self) -> nx.Graph:
+        """Undirected version of `self.induced_subgraph_int`, along which swaps can be applied."""
+        return self._undirected_induced_subgraph_int
+
+    def distance_matrix(self, *, undirected=False) -> np.ndarray:
+        """All pairs shortest path distances between physical qubit integers on the device.
+
+        Entry [i, j] of the returned read-only array is the distance from physical qubit integer
+        `i` to physical qubit integer `j` in `self.induced_subgraph_int`, or inf if there is no
+        path between them. Combined with `self.logical_to_physical`, it gives the distances of
+        many pairs of logical qubits at once.
+
+        Args:
+            undirected: when True compute the distances assuming bidirectional
+                edges between connected qubits.
+        """
+        return self._undirected_distances if undirected else self._distances
+
+    def dist_on_device(self, lq1: int, lq2: int, *, undirected=False) -> float:
         """Finds distance between logical qubits 'lq1' and 'lq2' on the device.
 
         Args:
@@ -155,10 +211,11 @@ class MappingManager:
                 edges between connected qubits.
 
         Returns:
-            The shortest path distance.
+            The shortest path distance, or infinity if there is no path.
         """
         distances = self._undirected_distances if undirected else self._distances
-        return distances[self.logical_to_physical[lq1]][self.logical_to_physical[lq2]]
+        distance = distances[self._logical_to_physical[lq1], self._logical_to_physical[lq2]]
+        return int(distance) if np.isfinite(distance) else float('inf')
 
     def is_adjacent(self, lq1: int, lq2: int) -> bool:
         """Finds whether logical qubits `lq1` and `lq2` are adjacent on the device.
@@ -209,7 +266,7 @@ class MappingManager:
         }
         return op.transform_qubits(qubit_map)
 
-    def shortest_path(self, lq1: int, lq2: int, *, undirected=False) -> Sequence[int]:
+    def shortest_path(self, lq1: int, lq2: int, *, undirected=False) -> np.ndarray:
         """Find the shortest path between two logical qubits on the device, given their mapping.
 
         Args:
@@ -219,9 +276,15 @@ class MappingManager:
                 between connected qubits.
 
         Returns:
-            A sequence of logical qubit integers on the shortest path from `lq1` to `lq2`.
+            An array of the logical qubit integers on the shortest path from `lq1` to `lq2`.
         """
         predecessors = self._undirected_predecessors if undirected else self._predecessors
-        return self.physical_to_logical[
-            nx.reconstruct_path(*self.logical_to_physical[[lq1, lq2]], predecessors)
-        ]
+        source, target = self._logical_to_physical[[lq1, lq2]]
+        if source == target:
+            return self._physical_to_logical[[source]]
+        if predecessors[source, target] < 0:
+            raise nx.NetworkXNoPath(f"No path from {lq1} to {lq2} on the device.")
+        path = [target]
+        while path[-1] != source:
+            path.append(predecessors[source, path[-1]])
+        return self._physical_to_logical[path[::-1]]
@@ -235,3 +235,22 @@ def test_shortest_path_with_directed_graph():
     np.testing.assert_array_equal(
         q_int[::-1], mm.shortest_path(q_int[2], q_int[0], undirected=True)
     )
+
+
+def test_distance_matrix():
+    device_graph, initial_mapping, q = construct_directed_device_graph_and_mapping()
+    mm = cirq.MappingManager(device_graph, initial_mapping)
+    q_int = [mm.logical_qid_to_int[qi] for qi in q]
+
+    for undirected in (False, True):
+        distances = mm.distance_matrix(undirected=undirected)
+        assert not distances.flags.writeable
+        for lq1, lq2 in itertools.product(q_int, repeat=2):
+            assert distances[mm.logical_to_physical[lq1], mm.logical_to_physical[lq2]] == (
+                mm.dist_on_device(lq1, lq2, undirected=undirected)
+            )
+    assert graphs_equal(mm.undirected_induced_subgraph_int, mm.induced_subgraph_int.to_undirected())
+
+    # Mapping managers of the same device graph share the same distance matrix.
+    other_mm = cirq.MappingManager(device_graph, initial_mapping)
+    assert other_mm.distance_matrix() is mm.distance_matrix()
@@ -16,22 +16,55 @@
 
 from __future__ import annotations
 
+import inspect
 import itertools
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from concurrent import futures
 from typing import Any, TYPE_CHECKING
 
-import networkx as nx
+import numpy as np
 
-from cirq import circuits, ops, protocols
+from cirq import circuits, ops, protocols, value
+from cirq._import import LazyLoader
 from cirq.transformers import transformer_api, transformer_primitives
 from cirq.transformers.routing import line_initial_mapper, mapping_manager
 
 if TYPE_CHECKING:
+    import multiprocessing
+
+    import networkx as nx
+
     import cirq
 
+nx = LazyLoader("nx", globals(), "networkx")
+
 QidIntPair = tuple[int, int]
 
 
+def _routing_trial_cost(routed_circuit: cirq.AbstractCircuit) -> tuple[int, int]:
+    """The default cost of a routing trial: the number of operations, then the depth.
+
+    Since all trials route the same circuit, ranking by the number of operations ranks the trials
+    by the number of inserted swaps.
+    """
+    return sum(1 for _ in routed_circuit.all_operations()), len(routed_circuit)
+
+
+def _route_trial(
+    args: tuple[
+        RouteCQC, cirq.AbstractCircuit, int | None, int, bool, cirq.TransformerContext | None
+    ],
+) -> tuple[cirq.AbstractCircuit, dict[cirq.Qid, cirq.Qid], dict[cirq.Qid, cirq.Qid]]:
+    router, circuit, seed, lookahead_radius, tag_inserted_swaps, context = args
+    return router.route_circuit(
+        circuit,
+        lookahead_radius=lookahead_radius,
+        tag_inserted_swaps=tag_inserted_swaps,
+        initial_mapper=line_initial_mapper.LineInitialMapper(router.device_graph, seed=seed),
+        context=context,
+    )
+
+
 def _disjoint_nc2_combinations(
     qubit_pairs: Sequence[QidIntPair],
 ) -> list[tuple[QidIntPair, QidIntPair]]:
@@ -257,6 +290,60 @@ class RouteCQC:
             },
         )
 
+    def route_circuit_multi(
+        self,
+        circuit: cirq.AbstractCircuit,
+        *,
+        num_trials: int = 8,
+        seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
+        cost: Callable[[cirq.AbstractCircuit], Any] = _routing_trial_cost,
+        lookahead_radius: int = 8,
+        tag_inserted_swaps: bool = False,
+        context: cirq.TransformerContext | None = None,
+        pool: multiprocessing.pool.Pool | futures.Executor | None = None,
+    ) -> tuple[cirq.AbstractCircuit, dict[cirq.Qid, cirq.Qid], dict[cirq.Qid, cirq.Qid], list[Any]]:
+        """Routes the circuit in several randomized trials and returns the best routed circuit.
+
+        The first trial uses the default `cirq.LineInitialMapper`, and so gives the same result as
+        `route_circuit`. Every other trial uses a `cirq.LineInitialMapper` with a different seed,
+        which breaks ties in the initial placement at random. The trial whose routed circuit has
+        the lowest `cost` is returned; ties are resolved in favor of the earliest trial.
+
+        Args:
+            circuit: the input circuit to be transformed.
+            num_trials: the number of routing trials.
+            seed: the random state or seed used to generate the seeds of the initial mappers.
+            cost: a function of the routed circuit of a trial, returning a comparable cost.
+                Defaults to the number of operations, i.e. the number of inserted swaps, with
+                ties broken by the depth of the routed circuit.
+            lookahead_radius: the maximum number of succeeding timesteps the algorithm will
+                consider for ranking candidate swaps with the cost cost function.
+            tag_inserted_swaps: whether or not a RoutingSwapTag should be attached to inserted swap
+                operations.
+            context: transformer context storing common configurable options for transformers.
+            pool: If provided, execute the routing trials in parallel.
+
+        Returns:
+            The routed circuit, the initial mapping and the swap mapping of the best trial, as
+                returned by `route_circuit`, followed by the list of costs of all trials.
+
+        Raises:
+            ValueError: if `num_trials` is not positive, or if circuit has operations that act on 3
+                or more qubits, except measurements.
+        """
+        if num_trials < 1:
+            raise ValueError(f"num_trials must be positive, got {num_trials}.")
+        prng = value.parse_random_state(seed)
+        seeds: list[int | None] = [None, *prng.randint(2**31, size=num_trials - 1).tolist()]
+        tasks = [(self, circuit, s, lookahead_radius, tag_inserted_swaps, context) for s in seeds]
+        if pool is not None:
+            results = list(pool.map(_route_trial, tasks))
+        else:
+            results = [_route_trial(task) for task in tasks]
+        costs = [cost(routed_circuit) for routed_circuit, _, _ in results]
+        best = min(range(num_trials), key=lambda i: costs[i])
+        return (*results[best], costs)
+
     @classmethod
     def _get_one_and_two_qubit_ops_as_timesteps(
         cls, circuit: cirq.AbstractCircuit
@@ -381,26 +468,33 @@ class RouteCQC:
             A list of lists corresponding to timesteps of the routed circuit and
             a set of inserted SWAP operations.
         """
-        two_qubit_ops_ints: list[list[QidIntPair]] = [
-            [
-                (mm.logical_qid_to_int[op.qubits[0]], mm.logical_qid_to_int[op.qubits[1]])
-                for op in timestep_ops
-            ]
+        # The logical qubit integers of the two-qubit ops of each timestep, as (n, 2) arrays. Only
+        # the array of the current timestep shrinks as its ops get executed; the arrays of later
+        # timesteps are reused by the lookahead of every candidate swap search.
+        two_qubit_ops_ints: list[np.ndarray] = [
+            np.array(
+                [
+                    (mm.logical_qid_to_int[op.qubits[0]], mm.logical_qid_to_int[op.qubits[1]])
+                    for op in timestep_ops
+                ],
+                dtype=int,
+            ).reshape(-1, 2)
             for timestep_ops in two_qubit_ops
         ]
         routed_ops: list[list[cirq.Operation]] = []
+        distances = mm.distance_matrix()
 
         def process_executable_two_qubit_ops(timestep: int) -> int:
+            physical_ops = mm.logical_to_physical[two_qubit_ops_ints[timestep]]
+            executable = distances[physical_ops[:, 0], physical_ops[:, 1]] == 1
             unexecutable_ops: list[cirq.Operation] = []
-            unexecutable_ops_ints: list[QidIntPair] = []
-            for op, op_ints in zip(two_qubit_ops[timestep], two_qubit_ops_ints[timestep]):
-                if mm.is_adjacent(*op_ints):
+            for op, is_executable in zip(two_qubit_ops[timestep], executable):
+                if is_executable:
                     routed_ops[timestep].append(mm.mapped_op(op))
                 else:
                     unexecutable_ops.append(op)
-                    unexecutable_ops_ints.append(op_ints)
             two_qubit_ops[timestep] = unexecutable_ops
-            two_qubit_ops_ints[timestep] = unexecutable_ops_ints
+            two_qubit_ops_ints[timestep] = two_qubit_ops_ints[timestep][~executable]
             return len(unexecutable_ops)
 
         strats = [cls._choose_single_swap, cls._choose_pair_of_swaps]
@@ -443,7 +537,7 @@ class RouteCQC:
     def _brute_force_strategy(
         cls,
         mm: mapping_manager.MappingManager,
-        two_qubit_ops_ints: Sequence[Sequence[QidIntPair]],
+        two_qubit_ops_ints: Sequence[np.ndarray],
         timestep: int,
     ) -> tuple[QidIntPair, ...]:
         """Inserts SWAPS along the shortest path of the qubits that are the farthest.
@@ -452,9 +546,10 @@ class RouteCQC:
         to achieve the physical swaps (M[q1], M[q2]), (M[q2], M[q3]), ..., (M[q_{i-1}], M[q_i]),
         we must execute the logical swaps (q1, q2), (q1, q3), ..., (q_1, qi).
         """
-        furthest_op = max(
-            two_qubit_ops_ints[timestep], key=lambda op: mm.dist_on_device(*op, undirected=True)
-        )
+        ops_ints = np.asarray(two_qubit_ops_ints[timestep]).reshape(-1, 2)
+        physical_ops = mm.logical_to_physical[ops_ints]
+        distances = mm.distance_matrix(undirected=True)[physical_ops[:, 0], physical_ops[:, 1]]
+        furthest_op = ops_ints[np.argmax(distances)]
         path = mm.shortest_path(*furthest_op, undirected=True)
         return tuple((path[0], path[i + 1]) for i in range(len(path) - 2))
 
@@ -462,7 +557,7 @@ class RouteCQC:
     def _choose_pair_of_swaps(
         cls,
         mm: mapping_manager.MappingManager,
-        two_qubit_ops_ints: Sequence[Sequence[QidIntPair]],
+        two_qubit_ops_ints: Sequence[np.ndarray],
         timestep: int,
         lookahead_radius: int,
     ) -> tuple[QidIntPair, ...] | None:
@@ -478,7 +573,7 @@ class RouteCQC:
     def _choose_single_swap(
         cls,
         mm: mapping_manager.MappingManager,
-        two_qubit_ops_ints: Sequence[Sequence[QidIntPair]],
+        two_qubit_ops_ints: Sequence[np.ndarray],
         timestep: int,
         lookahead_radius: int,
     ) -> tuple[QidIntPair, ...] | None:
@@ -492,7 +587,7 @@ class RouteCQC:
     def _choose_optimal_swap(
         cls,
         mm: mapping_manager.MappingManager,
-        two_qubit_ops_ints: Sequence[Sequence[QidIntPair]],
+        two_qubit_ops_ints: Sequence[np.ndarray],
         timestep: int,
         lookahead_radius: int,
         sigma: Sequence[tuple[QidIntPair, ...]],
@@ -509,9 +604,7 @@ class RouteCQC:
             if len(sigma) <= 1:
                 break
 
-            costs = {}
-            for swaps in sigma:
-                costs[swaps] = cls._cost(mm, swaps, two_qubit_ops_ints[s])
+            costs = dict(zip(sigma, cls._costs(mm, sigma, two_qubit_ops_ints[s])))
             _, min_cost = min(costs.items(), key=lambda x: x[1])
             sigma = [swaps for swaps, cost in costs.items() if cost == min_cost]
 
@@ -523,28 +616,52 @@ class RouteCQC:
 
     @classmethod
     def _initial_candidate_swaps(
-        cls, mm: mapping_manager.MappingManager, two_qubit_ops: Sequence[QidIntPair]
+        cls, mm: mapping_manager.MappingManager, two_qubit_ops: Sequence[QidIntPair] | np.ndarray
     ) -> list[QidIntPair]:
         """Finds all feasible SWAPs between qubits involved in 2-qubit operations."""
         physical_qubits = (mm.logical_to_physical[lq[i]] for lq in two_qubit_ops for i in range(2))
         # For directed graphs, we need undirected edges for swap candidates
         # since SWAPs are symmetric regardless of underlying gate constraints
-        undirected_induced_subgraph_int = (
-            mm.induced_subgraph_int.to_undirected()
-            if mm.induced_subgraph_int.is_directed()
-            else mm.induced_subgraph_int
-        )
-        physical_swaps = undirected_induced_subgraph_int.edges(nbunch=physical_qubits)
+        physical_swaps = mm.undirected_induced_subgraph_int.edges(nbunch=physical_qubits)
         return [
             (mm.physical_to_logical[q1], mm.physical_to_logical[q2]) for q1, q2 in physical_swaps
         ]
 
+    @classmethod
+    def _costs(
+        cls,
+        mm: mapping_manager.MappingManager,
+        sigma: Sequence[tuple[QidIntPair, ...]],
+        two_qubit_ops: Sequence[QidIntPair] | np.ndarray,
+    ) -> list[Any]:
+        """Computes the cost function of each list of candidate swaps in `sigma`.
+
+        Unless `_cost` is overridden, the default cost of all candidates is computed at once from
+        the undirected distance matrix of the device, without applying any swaps.
+        """
+        if inspect.getattr_static(cls, '_cost') is not inspect.getattr_static(RouteCQC, '_cost'):
+            return [cls._cost(mm, swaps, two_qubit_ops) for swaps in sigma]
+        ops_ints = np.asarray(two_qubit_ops, dtype=int).reshape(-1, 2)
+        if not len(ops_ints):
+            return [(0, 0)] * len(sigma)
+        candidates = np.asarray(sigma, dtype=int)
+        rows = np.arange(len(candidates))
+        # The logical to physical mapping after applying each list of candidate swaps.
+        mappings = np.tile(mm.logical_to_physical, (len(candidates), 1))
+        for j in range(candidates.shape[1]):
+            lq1, lq2 = candidates[:, j, 0], candidates[:, j, 1]
+            mappings[rows, lq1], mappings[rows, lq2] = mappings[rows, lq2], mappings[rows, lq1]
+        lengths = mm.distance_matrix(undirected=True)[
+            mappings[:, ops_ints[:, 0]], mappings[:, ops_ints[:, 1]]
+        ]
+        return list(zip(lengths.max(axis=1).tolist(), lengths.sum(axis=1).tolist()))
+
     @classmethod
     def _cost(
         cls,
         mm: mapping_manager.MappingManager,
         swaps: tuple[QidIntPair, ...],
-        two_qubit_ops: Sequence[QidIntPair],
+        two_qubit_ops: Sequence[QidIntPair] | np.ndarray,
     ) -> Any:
         """Computes the cost function for the given list of swaps over the current timestep ops.
 
@@ -553,7 +670,8 @@ class RouteCQC:
         """
         for swap in swaps:
             mm.apply_swap(*swap)
-        max_length, sum_length = 0, 0
+        max_length: float = 0
+        sum_length: float = 0
         for lq in two_qubit_ops:
             # Use undirected distance for routing cost calculations
             dist = mm.dist_on_device(*lq, undirected=True)
@@ -15,6 +15,8 @@
 from __future__ import annotations
 
 import collections
+from concurrent import futures
+from unittest import mock
 
 import networkx as nx
 import pytest
@@ -414,3 +416,83 @@ def test_repr() -> None:
     device_graph = device.metadata.nx_graph
     router = cirq.RouteCQC(device_graph)
     cirq.testing.assert_equivalent_repr(router, setup_code='import cirq\nimport networkx as nx')
+
+
+def test_vectorized_costs_match_cost() -> None:
+    device_graph = cirq.testing.construct_grid_device(4, 4).metadata.nx_graph
+    circuit = cirq.testing.random_circuit(16, 10, 0.8, random_state=3)
+    mm = cirq.MappingManager(
+        device_graph, cirq.LineInitialMapper(device_graph).initial_mapping(circuit)
+    )
+    two_qubit_ops = [
+        (mm.logical_qid_to_int[op.qubits[0]], mm.logical_qid_to_int[op.qubits[1]])
+        for op in circuit.all_operations()
+        if len(op.qubits) == 2
+    ]
+    candidates = cirq.RouteCQC._initial_candidate_swaps(mm, two_qubit_ops)
+    sigma = [(swap,) for swap in candidates] + [
+        (s1, s2) for s1 in candidates for s2 in candidates if not set(s1) & set(s2)
+    ]
+    for swaps_length in (1, 2):
+        swaps_sigma = [swaps for swaps in sigma if len(swaps) == swaps_length]
+        expected = [cirq.RouteCQC._cost(mm, swaps, two_qubit_ops) for swaps in swaps_sigma]
+        assert cirq.RouteCQC._costs(mm, swaps_sigma, two_qubit_ops) == expected
+    assert cirq.RouteCQC._costs(mm, sigma[:2], []) == [(0, 0), (0, 0)]
+
+
+def test_overridden_cost_is_used() -> None:
+    calls: collections.Counter[str] = collections.Counter()
+
+    class CountingRouteCQC(cirq.RouteCQC):
+        @classmethod
+        def _cost(cls, mm, swaps, two_qubit_ops):
+            calls['cost'] += 1
+            return super()._cost(mm, swaps, two_qubit_ops)
+
+    device_graph = cirq.testing.construct_grid_device(4, 4).metadata.nx_graph
+    circuit = cirq.testing.random_circuit(16, 10, 0.8, random_state=3)
+    routed = CountingRouteCQC(device_graph)(circuit)
+    assert calls['cost'] > 0
+    cirq.testing.assert_same_circuits(routed, cirq.RouteCQC(device_graph)(circuit))
+
+
+def test_subclass_without_cost_uses_vectorized_costs() -> None:
+    class SubRouteCQC(cirq.RouteCQC):
+        pass
+
+    device_graph = cirq.testing.construct_grid_device(4, 4).metadata.nx_graph
+    circuit = cirq.testing.random_circuit(16, 10, 0.8, random_state=3)
+    expected = cirq.RouteCQC(device_graph)(circuit)
+    with mock.patch.object(cirq.RouteCQC, '_cost', side_effect=AssertionError('_cost is unused')):
+        cirq.testing.assert_same_circuits(SubRouteCQC(device_graph)(circuit), expected)
+
+
+def test_route_circuit_multi() -> None:
+    device = cirq.testing.construct_grid_device(5, 5)
+    router = cirq.RouteCQC(device.metadata.nx_graph)
+    circuit = cirq.testing.random_circuit(qubits=8, n_moments=20, op_density=0.6, random_state=1)
+
+    routed, imap, swap_map, costs = router.route_circuit_multi(circuit, num_trials=4, seed=2)
+    assert len(costs) == 4
+    assert costs[0] == (sum(1 for _ in router(circuit).all_operations()), len(router(circuit)))
+    assert (sum(1 for _ in routed.all_operations()), len(routed)) == min(costs)
+    device.validate_circuit(routed)
+    cirq.testing.assert_circuits_have_same_unitary_given_final_permutation(
+        routed, circuit.transform_qubits(imap), swap_map
+    )
+
+    # Results are reproducible and can be computed in parallel.
+    with futures.ThreadPoolExecutor(2) as pool:
+        _, _, _, parallel_costs = router.route_circuit_multi(
+            circuit, num_trials=4, seed=2, pool=pool
+        )
+    assert parallel_costs == costs
+
+    routed, _, _, depths = router.route_circuit_multi(circuit, num_trials=3, seed=2, cost=len)
+    assert len(routed) == min(depths)
+
+
+def test_route_circuit_multi_invalid_num_trials() -> None:
+    router = cirq.RouteCQC(cirq.testing.construct_grid_device(2, 2).metadata.nx_graph)
+    with pytest.raises(ValueError, match='num_trials must be positive'):
+        router.route_circuit_multi(cirq.Circuit(), num_trials=0)
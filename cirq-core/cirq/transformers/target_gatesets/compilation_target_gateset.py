@@ -17,8 +17,8 @@
 from __future__ import annotations
 
 import abc
-from collections.abc import Hashable
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Hashable, Sequence
+from typing import cast, TYPE_CHECKING
 
 from cirq import circuits, ops, protocols, transformers
 from cirq.transformers import merge_k_qubit_gates, merge_single_qubit_gates
@@ -186,6 +186,28 @@ class CompilationTargetGateset(ops.Gateset, metaclass=abc.ABCMeta):
             processors.append(transformers.stratified_circuit)
         return processors
 
+    def _batch_decomposer(
+        self,
+        circuit: cirq.AbstractCircuit,
+        tags_to_ignore: Sequence[Hashable] = (),
+        decomposition_cache: cirq.DecompositionCache | None = None,
+    ) -> Callable[[cirq.Operation, int], DecomposeResult]:
+        """Returns a decomposer equivalent to `decompose_to_target_gateset` for `circuit`.
+
+        Gatesets which can decompose many operations at once more efficiently than one by one
+        override this method to decompose all top-level operations of `circuit` up front. The
+        returned callable then looks up the precomputed decompositions and falls back to
+        `decompose_to_target_gateset` for any other operation.
+
+        Args:
+            circuit: The circuit whose operations will be decomposed.
+            tags_to_ignore: Operations tagged with any of these tags are left untouched.
+            decomposition_cache: An optional memo of decompositions to reuse and extend.
+        """
+        if decomposition_cache is None:
+            return self.decompose_to_target_gateset
+        return decomposition_cache.decomposer(self, self.decompose_to_target_gateset)
+
 
 class TwoQubitCompilationTargetGateset(CompilationTargetGateset):
     """Abstract base class to create two-qubit target gatesets.
@@ -230,6 +252,112 @@ class TwoQubitCompilationTargetGateset(CompilationTargetGateset):
         if protocols.num_qubits(op) == 1:
             return self._decompose_single_qubit_operation(op, moment_idx)
         new_optree = self._decompose_two_qubit_operation(op, moment_idx)
+        return self._select_two_qubit_decomposition(op, moment_idx, new_optree)
+
+    def _batch_decomposer(
+        self,
+        circuit: cirq.AbstractCircuit,
+        tags_to_ignore: Sequence[Hashable] = (),
+        decomposition_cache: cirq.DecompositionCache | None = None,
+    ) -> Callable[[cirq.Operation, int], DecomposeResult]:
+        ops_and_moments = [
+            (op, moment_idx)
+            for moment_idx, moment in enumerate(circuit)
+            for op in moment
+            if protocols.num_qubits(op) == 2
+            and set(op.tags).isdisjoint(tags_to_ignore)
+            and (
+                not isinstance(op.untagged, circuits.CircuitOperation)
+                or self._intermediate_result_tag in op.tags
+            )
+            and op not in self
+        ]
+        fallback_decomposer: Callable[[cirq.Operation, int], DecomposeResult] = (
+            self.decompose_to_target_gateset
+        )
+        if decomposition_cache is None:
+            decomposed = dict(
+                zip(ops_and_moments, self._decompose_two_qubit_operations(ops_and_moments))
+            )
+        else:
+            decomposed = self._decompose_two_qubit_operations_with_cache(
+                ops_and_moments, decomposition_cache
+            )
+            fallback_decomposer = decomposition_cache.decomposer(self, fallback_decomposer)
+
+        def decomposer(op: cirq.Operation, moment_idx: int) -> DecomposeResult:
+            key = (op, moment_idx)
+            if key not in decomposed:
+                return fallback_decomposer(op, moment_idx)
+            return self._select_two_qubit_decomposition(op, moment_idx, decomposed[key])
+
+        return decomposer
+
+    def _decompose_two_qubit_operations_with_cache(
+        self,
+        ops_and_moments: Sequence[tuple[cirq.Operation, int]],
+        decomposition_cache: cirq.DecompositionCache,
+    ) -> dict[tuple[cirq.Operation, int], DecomposeResult]:
+        """Batch decomposes the operations whose unitary is not in `decomposition_cache` yet."""
+        decomposed: dict[tuple[cirq.Operation, int], DecomposeResult] = {}
+        keys = {
+            op_and_moment: decomposition_cache.key(self, op_and_moment[0])
+            for op_and_moment in ops_and_moments
+        }
+        # Operations to decompose, with at most one operation for each cache key.
+        pending: dict[Hashable, tuple[cirq.Operation, int]] = {}
+        repeated: list[tuple[cirq.Operation, int]] = []
+        for op_and_moment in ops_and_moments:
+            key = keys[op_and_moment]
+            if key is None:
+                pending[op_and_moment] = op_and_moment
+            elif key in pending:
+                repeated.append(op_and_moment)
+            else:
+                cached = decomposition_cache.get(key, op_and_moment[0].qubits)
+                if cached is None:
+                    pending[key] = op_and_moment
+                else:
+                    decomposed[op_and_moment] = cached
+        # The canonical decompositions of this batch, which the cache may evict before the
+        # repeated operations are looked up when the batch has more than `maxsize` keys.
+        canonical: dict[str, tuple[cirq.Operation, ...]] = {}
+        results = self._decompose_two_qubit_operations(list(pending.values()))
+        for op_and_moment, result in zip(pending.values(), results):
+            key = keys[op_and_moment]
+            if result is not None and result is not NotImplemented:
+                result = [*ops.flatten_to_ops(result)]
+                if key is not None:
+                    qubits = op_and_moment[0].qubits
+                    entry = decomposition_cache._canonicalize(qubits, result)
+                    if entry is not None:
+                        canonical[key] = entry
+                        decomposition_cache.put(key, qubits, result)
+            decomposed[op_and_moment] = result
+        # Repeated operations whose decomposition acts on other qubits, so it can't be reused.
+        uncacheable: list[tuple[cirq.Operation, int]] = []
+        for op_and_moment in repeated:
+            key = cast(str, keys[op_and_moment])
+            qubits = op_and_moment[0].qubits
+            cached = decomposition_cache.get(key, qubits)
+            first_result = decomposed[pending[key]]
+            if cached is not None:
+                decomposed[op_and_moment] = cached
+            elif key in canonical:
+                decomposed[op_and_moment] = decomposition_cache._map_onto(canonical[key], qubits)
+            elif first_result is None or first_result is NotImplemented:
+                decomposed[op_and_moment] = first_result
+            else:
+                uncacheable.append(op_and_moment)
+        if uncacheable:
+            results = self._decompose_two_qubit_operations(uncacheable)
+            decomposed.update(zip(uncacheable, results))
+        return decomposed
+
+    def _select_two_qubit_decomposition(
+        self, op: cirq.Operation, moment_idx: int, new_optree: DecomposeResult
+    ) -> DecomposeResult:
+        """Picks between `new_optree` and the original (connected component of) 2-qubit `op`."""
         if new_optree is NotImplemented or new_optree is None:
             return new_optree
         new_optree = [*ops.flatten_to_ops_or_moments(new_optree)]
@@ -299,6 +427,26 @@ class TwoQubitCompilationTargetGateset(CompilationTargetGateset):
         """
         return NotImplemented
 
+    def _decompose_two_qubit_operations(
+        self, ops_and_moments: Sequence[tuple[cirq.Operation, int]]
+    ) -> list[DecomposeResult]:
+        """Decomposes many (connected components of) 2-qubit operations at once.
+
+        By default, calls `self._decompose_two_qubit_operation` on each operation. Derived classes
+        can override this method to decompose all operations in a single vectorized pass.
+
+        Args:
+            ops_and_moments: Pairs of a two-qubit operation and the index of the moment in which
+                it occurs.
+
+        Returns:
+            A list with the result of `self._decompose_two_qubit_operation` for each operation.
+        """
+        return [
+            self._decompose_two_qubit_operation(op, moment_idx)
+            for op, moment_idx in ops_and_moments
+        ]
+
     @abc.abstractmethod
     def _decompose_two_qubit_operation(
         self, op: cirq.Operation, moment_idx: int
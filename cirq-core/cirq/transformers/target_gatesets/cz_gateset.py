@@ -25,6 +25,7 @@ from cirq.transformers.target_gatesets import compilation_target_gateset
 
 if TYPE_CHECKING:
     import cirq
+    from cirq.protocols.decompose_protocol import DecomposeResult
 
 
 class CZTargetGateset(compilation_target_gateset.TwoQubitCompilationTargetGateset):
@@ -97,6 +98,30 @@ class CZTargetGateset(compilation_target_gateset.TwoQubitCompilationTargetGatese
             atol=self.atol,
         )
 
+    def _decompose_two_qubit_operations(
+        self, ops_and_moments: Sequence[tuple[cirq.Operation, int]]
+    ) -> list[DecomposeResult]:
+        if (
+            type(self)._decompose_two_qubit_operation
+            is not CZTargetGateset._decompose_two_qubit_operation
+        ):
+            # Derived classes which customize the decomposition of each operation keep it.
+            return super()._decompose_two_qubit_operations(ops_and_moments)
+        results: list[DecomposeResult] = [NotImplemented] * len(ops_and_moments)
+        unitary_indices = [
+            i for i, (op, _) in enumerate(ops_and_moments) if protocols.has_unitary(op)
+        ]
+        unitary_ops = [ops_and_moments[i][0] for i in unitary_indices]
+        decomposed = two_qubit_to_cz.two_qubit_matrices_to_cz_operations(
+            [(op.qubits[0], op.qubits[1]) for op in unitary_ops],
+            [protocols.unitary(op) for op in unitary_ops],
+            allow_partial_czs=self.allow_partial_czs,
+            atol=self.atol,
+        )
+        for i, operations in zip(unitary_indices, decomposed):
+            results[i] = operations
+        return results
+
     def __repr__(self) -> str:
         return (
             f'cirq.CZTargetGateset('
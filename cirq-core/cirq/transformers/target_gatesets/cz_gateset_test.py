@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -99,6 +100,49 @@ def test_convert_to_cz_preserving_moment_structure() -> None:
     )
 
 
+def test_decomposes_merged_two_qubit_blocks_in_one_batch() -> None:
+    q = cirq.LineQubit.range(4)
+    c_orig = cirq.Circuit(
+        [cirq.ISWAP(q[0], q[1]) ** 0.3, cirq.SWAP(q[2], q[3]) ** 0.2],
+        cirq.H.on_each(*q),
+        [cirq.CNOT(q[1], q[2]), cirq.FSimGate(0.1, 0.2).on(q[3], q[0])],
+    )
+    with mock.patch(
+        'cirq.transformers.analytical_decompositions.two_qubit_to_cz'
+        '.two_qubit_matrices_to_cz_operations',
+        wraps=cirq.two_qubit_matrices_to_cz_operations,
+    ) as batch_decomposition:
+        c_new = cirq.optimize_for_target_gateset(
+            c_orig, gateset=cirq.CZTargetGateset(), ignore_failures=False
+        )
+    batch_decomposition.assert_called_once()
+    assert len(batch_decomposition.call_args.args[0]) == 4
+    cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(c_orig, c_new, atol=1e-6)
+    assert all(all_gates_of_type(m, cirq.Gateset(cirq.PhasedXZGate, cirq.CZ)) for m in c_new)
+
+
+def test_subclass_decomposition_of_each_operation_is_kept() -> None:
+    class CountingCZTargetGateset(cirq.CZTargetGateset):
+        num_calls = 0
+
+        def _decompose_two_qubit_operation(self, op: cirq.Operation, moment_idx: int):
+            self.num_calls += 1
+            return super()._decompose_two_qubit_operation(op, moment_idx)
+
+    q = cirq.LineQubit.range(4)
+    c_orig = cirq.Circuit(cirq.ISWAP(q[0], q[1]) ** 0.3, cirq.FSimGate(0.1, 0.2).on(q[2], q[3]))
+    gateset = CountingCZTargetGateset()
+    with mock.patch(
+        'cirq.transformers.analytical_decompositions.two_qubit_to_cz'
+        '.two_qubit_matrices_to_cz_operations',
+        wraps=cirq.two_qubit_matrices_to_cz_operations,
+    ) as batch_decomposition:
+        c_new = cirq.optimize_for_target_gateset(c_orig, gateset=gateset, ignore_failures=False)
+    batch_decomposition.assert_not_called()
+    assert gateset.num_calls == 2
+    cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(c_orig, c_new, atol=1e-6)
+
+
 def test_clears_paired_cnot() -> None:
     a, b = cirq.LineQubit.range(2)
     assert_optimizes(
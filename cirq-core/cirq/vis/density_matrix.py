@@ -16,12 +16,20 @@
 
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
+
 import numpy as np
-from matplotlib import lines, patches
 
+from cirq._import import LazyLoader
 from cirq.qis.states import validate_density_matrix
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
+lines = LazyLoader("lines", globals(), "matplotlib.lines")
+patches = LazyLoader("patches", globals(), "matplotlib.patches")
+
 
 def _plot_element_of_density_matrix(ax, x, y, r, phase, show_rect=False, show_text=False):
     """Plots a single element of a density matrix
@@ -17,17 +17,24 @@ from __future__ import annotations
 import copy
 from collections.abc import Mapping, Sequence
 from dataclasses import astuple, dataclass
-from typing import Any, cast, overload, SupportsFloat
+from typing import Any, cast, overload, SupportsFloat, TYPE_CHECKING
 
-import matplotlib as mpl
-import matplotlib.collections as mpl_collections
-import matplotlib.pyplot as plt
 import numpy as np
-from mpl_toolkits import axes_grid1
 
+from cirq._import import LazyLoader
 from cirq.devices import grid_qubit
 from cirq.vis import vis_utils
 
+if TYPE_CHECKING:
+    import matplotlib as mpl
+    import matplotlib.collections as mpl_collections
+    import matplotlib.pyplot as plt
+
+axes_grid1 = LazyLoader("axes_grid1", globals(), "mpl_toolkits.axes_grid1")
+mpl = LazyLoader("mpl", globals(), "matplotlib")
+mpl_collections = LazyLoader("mpl_collections", globals(), "matplotlib.collections")
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
+
 QubitTuple = tuple[grid_qubit.GridQubit, ...]
 
 Polygon = Sequence[tuple[float, float]]
@@ -15,10 +15,16 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
-from typing import Any, SupportsFloat
+from typing import Any, SupportsFloat, TYPE_CHECKING
 
 import numpy as np
-from matplotlib import pyplot as plt
+
+from cirq._import import LazyLoader
+
+if TYPE_CHECKING:
+    from matplotlib import pyplot as plt
+
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
 
 
 def integrated_histogram(
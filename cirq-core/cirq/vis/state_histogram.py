@@ -18,12 +18,17 @@ from __future__ import annotations
 
 import collections
 from collections.abc import Sequence
-from typing import SupportsFloat
+from typing import SupportsFloat, TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 import cirq.study.result as result
+from cirq._import import LazyLoader
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+plt = LazyLoader("plt", globals(), "matplotlib.pyplot")
 
 
 def get_state_histogram(result: result.Result) -> np.ndarray:
@@ -24,11 +24,11 @@ from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 import sympy
 
 from cirq import circuits, ops, protocols, study, value
 from cirq._doc import document
+from cirq._import import LazyLoader
 from cirq.work.observable_grouping import group_settings_greedy, GROUPER_T
 from cirq.work.observable_measurement_data import (
     BitstringAccumulator,
@@ -37,6 +37,8 @@ from cirq.work.observable_measurement_data import (
 )
 from cirq.work.observable_settings import _MeasurementSpec, InitObsSetting, observables_to_settings
 
+pd = LazyLoader("pd", globals(), "pandas")
+
 if TYPE_CHECKING:
     import cirq
     from cirq.value.product_state import _NamedOneQubitState
@@ -21,9 +21,9 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING, TypeVar
 
 import duet
-import pandas as pd
 
 from cirq import ops, protocols, study, value
+from cirq._import import LazyLoader
 from cirq.work.observable_measurement import (
     CheckpointFileOptions,
     measure_observables,
@@ -32,8 +32,12 @@ from cirq.work.observable_measurement import (
 from cirq.work.observable_settings import _hashable_param
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     import cirq
 
+pd = LazyLoader("pd", globals(), "pandas")
+
 T = TypeVar('T')
 
 
@@ -36,6 +36,7 @@ from cirq_google.engine import (
     EngineResult as EngineResult,
     ProtoVersion as ProtoVersion,
     ProcessorSampler as ProcessorSampler,
+    ResultCache as ResultCache,
     ValidatingSampler as ValidatingSampler,
     get_engine as get_engine,
     get_engine_calibration as get_engine_calibration,
@@ -103,6 +104,7 @@ from cirq_google.workflow import (
     CouldNotPlaceError as CouldNotPlaceError,
     NaiveQubitPlacer as NaiveQubitPlacer,
     RandomDevicePlacer as RandomDevicePlacer,
+    CalibrationAwareDevicePlacer as CalibrationAwareDevicePlacer,
     HardcodedQubitPlacer as HardcodedQubitPlacer,
     ProcessorRecord as ProcessorRecord,
     EngineProcessorRecord as EngineProcessorRecord,
@@ -73,6 +73,8 @@ from cirq_google.engine.runtime_estimator import (
     estimate_run_time as estimate_run_time,
     estimate_run_batch_time as estimate_run_batch_time,
     estimate_run_sweep_time as estimate_run_sweep_time,
+    RuntimeModel as RuntimeModel,
+    RuntimeSample as RuntimeSample,
 )
 
 from cirq_google.engine.validating_sampler import ValidatingSampler as ValidatingSampler
@@ -94,4 +96,6 @@ from cirq_google.engine.engine_result import EngineResult as EngineResult
 
 from cirq_google.engine.processor_sampler import ProcessorSampler as ProcessorSampler
 
+from cirq_google.engine.result_cache import ResultCache as ResultCache
+
 from cirq_google.engine.processor_config import ProcessorConfig as ProcessorConfig
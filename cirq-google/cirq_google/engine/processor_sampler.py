@@ -23,6 +23,7 @@ import cirq
 
 if TYPE_CHECKING:
     import cirq_google as cg
+    from cirq_google.engine.result_cache import ResultCache
 
 
 class ProcessorSampler(cirq.Sampler):
@@ -36,6 +37,7 @@ class ProcessorSampler(cirq.Sampler):
         snapshot_id: str = "",
         device_config_name: str = "",
         max_concurrent_jobs: int = 100,
+        result_cache: ResultCache | None = None,
     ):
         """Inits ProcessorSampler.
 
@@ -56,6 +58,12 @@ class ProcessorSampler(cirq.Sampler):
                 concurrently to the Engine. This client-side throttle can be
                 used to proactively reduce load to the backends and avoid quota
                 violations when pipelining circuit executions.
+            result_cache: An optional cache of results. If set, running a circuit with the same
+                sweep, repetitions and device configuration as an earlier run returns the cached
+                results instead of creating a new job, until they expire after the `ttl` of the
+                cache. Without a `snapshot_id`, cached results may predate a recalibration of
+                the device, so the `ttl` should be short. Circuits which cannot be serialized
+                are run without the cache.
 
         Raises:
             ValueError: If  only one of `run_name` and `device_config_name` are specified.
@@ -68,9 +76,35 @@ class ProcessorSampler(cirq.Sampler):
         self._snapshot_id = snapshot_id
         self._device_config_name = device_config_name
         self._concurrent_job_limiter = duet.Limiter(max_concurrent_jobs)
+        self._result_cache = result_cache
 
     async def run_sweep_async(
         self, program: cirq.AbstractCircuit, params: cirq.Sweepable, repetitions: int = 1
+    ) -> Sequence[cg.EngineResult]:
+        if self._result_cache is None:
+            return await self._run_job(program, params, repetitions)
+
+        try:
+            cache_key = self._result_cache.key(
+                program,
+                params,
+                repetitions,
+                processor_id=getattr(self._processor, 'processor_id', ''),
+                run_name=self._run_name,
+                snapshot_id=self._snapshot_id,
+                device_config_name=self._device_config_name,
+            )
+        except ValueError:
+            # The circuit cannot be serialized, e.g. for a simulated processor.
+            return await self._run_job(program, params, repetitions)
+        results = self._result_cache.get(cache_key)
+        if results is None:
+            results = list(await self._run_job(program, params, repetitions))
+            self._result_cache.put(cache_key, results)
+        return results
+
+    async def _run_job(
+        self, program: cirq.AbstractCircuit, params: cirq.Sweepable, repetitions: int
     ) -> Sequence[cg.EngineResult]:
         async with self._concurrent_job_limiter:
             job = await self._processor.run_sweep_async(
@@ -115,6 +149,10 @@ class ProcessorSampler(cirq.Sampler):
     def device_config_name(self) -> str:
         return self._device_config_name
 
+    @property
+    def result_cache(self) -> ResultCache | None:
+        return self._result_cache
+
     @property
     def max_concurrent_jobs(self) -> int:
         assert self._concurrent_job_limiter.capacity is not None
@@ -18,6 +18,7 @@ from unittest import mock
 
 import duet
 import pytest
+import sympy
 
 import cirq
 import cirq_google as cg
@@ -245,6 +246,45 @@ def test_with_local_processor():
     assert r.measurements['z'] == [[0]]
 
 
+def test_with_local_processor_and_result_cache():
+    processor = cg.engine.SimulatedLocalProcessor(processor_id='my-fancy-processor')
+    result_cache = cg.ResultCache()
+    sampler = cg.ProcessorSampler(processor=processor, result_cache=result_cache)
+    assert sampler.result_cache is result_cache
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('t'), cirq.measure(q, key='z'))
+    sweep = cirq.Points('t', [0, 1])
+
+    results = sampler.run_sweep(circuit, sweep, repetitions=3)
+    cached_results = sampler.run_sweep(circuit, sweep, repetitions=3)
+    assert cached_results == results
+    assert result_cache.hits == 1
+    assert result_cache.misses == 1
+    assert len(processor.list_programs()) == 1
+
+    # A different sweep, number of repetitions or circuit is a new job.
+    sampler.run_sweep(circuit, cirq.Points('t', [1, 0]), repetitions=3)
+    sampler.run_sweep(circuit, sweep, repetitions=4)
+    sampler.run_sweep(circuit + cirq.Circuit(cirq.measure(q, key='y')), sweep, repetitions=3)
+    assert result_cache.hits == 1
+    assert result_cache.misses == 4
+    assert len(processor.list_programs()) == 4
+
+
+def test_with_local_processor_and_result_cache_runs_unserializable_circuits_uncached():
+    processor = cg.engine.SimulatedLocalProcessor(processor_id='my-fancy-processor')
+    result_cache = cg.ResultCache()
+    sampler = cg.ProcessorSampler(processor=processor, result_cache=result_cache)
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.MatrixGate(cirq.unitary(cirq.X)).on(q), cirq.measure(q, key='z'))
+
+    assert sampler.run(circuit).measurements['z'] == [[1]]
+    assert sampler.run(circuit).measurements['z'] == [[1]]
+    assert len(result_cache) == 0
+    assert (result_cache.hits, result_cache.misses) == (0, 0)
+    assert len(processor.list_programs()) == 2
+
+
 @pytest.mark.parametrize(
     'run_name, device_config_name', [('run_name', ''), ('', 'device_config_name')]
 )
@@ -0,0 +1,180 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A content-addressed cache of results for `cg.ProcessorSampler`."""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import os
+import pathlib
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import cirq
+from cirq_google.api import v2
+from cirq_google.serialization.circuit_serializer import CIRCUIT_SERIALIZER
+
+if TYPE_CHECKING:
+    import cirq_google as cg
+
+# The prefix of the names of the files written by the cache, so that `clear` only removes those.
+_FILE_PREFIX = 'cirq-google-result-'
+# The default time after which entries expire, so that results taken before a recalibration of
+# the device are not returned for long.
+_DEFAULT_TTL = datetime.timedelta(hours=1)
+
+
+class ResultCache:
+    """A cache of sampler results, keyed on the serialized program and its run context.
+
+    Results are stored under a key derived from the hash of the serialized program proto, the
+    serialized sweep and repetitions, and the processor and device configuration that the program
+    ran with. Running the identical program with the identical run context therefore returns the
+    stored results instead of creating a new program and job.
+
+    Entries are kept in memory, and optionally also written to a directory on disk so that they
+    survive across processes. `clear` only removes the files written by a cache from the
+    directory. Since the `snapshot_id` and `run_name` are part of the key, results taken with a
+    different calibration snapshot or automation run are never returned. Runs without them use
+    the current calibration of the device, which the key cannot capture, so entries expire after
+    `ttl`, one hour by default.
+
+    The number of cache hits and misses is tracked in `hits` and `misses`.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: datetime.timedelta | None = _DEFAULT_TTL,
+        directory: str | os.PathLike | None = None,
+    ):
+        """Inits ResultCache.
+
+        Args:
+            ttl: The time after which an entry expires, one hour by default. If None, entries
+                never expire, which is only safe if the runs select an immutable calibration
+                snapshot with a `snapshot_id`.
+            directory: An optional directory in which to also store entries as JSON files. It is
+                created if it does not exist.
+        """
+        self._ttl = ttl
+        self._directory = pathlib.Path(directory) if directory is not None else None
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+        # [key] : (creation time in seconds since the epoch, results)
+        self._entries: dict[str, tuple[float, list[cg.EngineResult]]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(
+        program: cirq.AbstractCircuit,
+        params: cirq.Sweepable,
+        repetitions: int,
+        *,
+        processor_id: str = "",
+        run_name: str = "",
+        snapshot_id: str = "",
+        device_config_name: str = "",
+    ) -> str:
+        """Returns the cache key of a program run with the given context.
+
+        Args:
+            program: The circuit to run.
+            params: The parameters to sweep the circuit over.
+            repetitions: The number of repetitions of each sweep point.
+            processor_id: The id of the processor running the circuit.
+            run_name: The automation run which selects the device configuration.
+            snapshot_id: The snapshot which selects the device configuration.
+            device_config_name: The name of the device configuration.
+
+        Returns:
+            A hex digest identifying the program and its run context.
+        """
+        program_proto = CIRCUIT_SERIALIZER.serialize(program)
+        run_context = v2.run_context_to_proto(params, repetitions)
+        digest = hashlib.sha256()
+        digest.update(program_proto.SerializeToString(deterministic=True))
+        digest.update(run_context.SerializeToString(deterministic=True))
+        for field in (processor_id, run_name, snapshot_id, device_config_name):
+            digest.update(b'\0' + field.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> list[cg.EngineResult] | None:
+        """Returns the results stored under `key`, or None if there are none or they expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._load(key)
+        if entry is not None and self._expired(entry[0]):
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries[key] = entry
+        self._hits += 1
+        return list(entry[1])
+
+    def put(self, key: str, results: Sequence[cg.EngineResult]) -> None:
+        """Stores the results under `key`, replacing any results already stored there."""
+        entry = (time.time(), list(results))
+        self._entries[key] = entry
+        if self._directory is not None:
+            cirq.to_json(entry[1], self._path(key))
+
+    def clear(self) -> None:
+        """Removes all entries, including the ones on disk, and resets the statistics."""
+        for key in list(self._entries):
+            self._remove(key)
+        if self._directory is not None:
+            for path in self._directory.glob(f'{_FILE_PREFIX}*.json'):
+                path.unlink()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of `get` calls which returned results."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of `get` calls which did not return results."""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, created: float) -> bool:
+        return self._ttl is not None and time.time() - created > self._ttl.total_seconds()
+
+    def _path(self, key: str) -> pathlib.Path:
+        assert self._directory is not None
+        return self._directory / f'{_FILE_PREFIX}{key}.json'
+
+    def _load(self, key: str) -> tuple[float, list[cg.EngineResult]] | None:
+        if self._directory is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        return path.stat().st_mtime, cirq.read_json(path)
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._directory is not None:
+            self._path(key).unlink(missing_ok=True)
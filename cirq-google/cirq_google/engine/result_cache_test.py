@@ -0,0 +1,129 @@
+# Copyright 2026 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import datetime
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import cirq
+import cirq_google as cg
+
+Q = cirq.LineQubit(0)
+CIRCUIT = cirq.Circuit(cirq.X(Q), cirq.measure(Q, key='m'))
+RESULTS = [
+    cg.EngineResult(
+        params=cirq.ParamResolver({}),
+        records={'m': np.array([[[1]], [[1]]], dtype=np.int8)},
+        job_id='projects/proj/programs/prog/jobs/job0',
+    )
+]
+
+
+def test_key_depends_on_program_and_run_context():
+    key = cg.ResultCache.key(CIRCUIT, None, 2)
+    assert key == cg.ResultCache.key(CIRCUIT.freeze(), None, 2)
+    assert key == cg.ResultCache.key(CIRCUIT, [cirq.ParamResolver({})], 2)
+
+    other_keys = [
+        cg.ResultCache.key(CIRCUIT, None, 3),
+        cg.ResultCache.key(CIRCUIT[:1], None, 2),
+        cg.ResultCache.key(CIRCUIT, cirq.Points('t', [0]), 2),
+        cg.ResultCache.key(CIRCUIT, None, 2, processor_id='proc'),
+        cg.ResultCache.key(CIRCUIT, None, 2, run_name='run', device_config_name='config'),
+        cg.ResultCache.key(CIRCUIT, None, 2, snapshot_id='snap', device_config_name='config'),
+    ]
+    assert len({key, *other_keys}) == len(other_keys) + 1
+
+
+def test_get_and_put():
+    cache = cg.ResultCache()
+    key = cache.key(CIRCUIT, None, 2)
+    assert cache.get(key) is None
+    cache.put(key, RESULTS)
+    assert cache.get(key) == RESULTS
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.clear()
+    assert cache.get(key) is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_ttl_expires_entries():
+    cache = cg.ResultCache(ttl=datetime.timedelta(minutes=10))
+    key = cache.key(CIRCUIT, None, 2)
+    with mock.patch('time.time', return_value=1000.0):
+        cache.put(key, RESULTS)
+    with mock.patch('time.time', return_value=1000.0 + 9 * 60):
+        assert cache.get(key) == RESULTS
+    with mock.patch('time.time', return_value=1000.0 + 11 * 60):
+        assert cache.get(key) is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_expire_after_an_hour_by_default():
+    cache = cg.ResultCache()
+    key = cache.key(CIRCUIT, None, 2)
+    with mock.patch('time.time', return_value=1000.0):
+        cache.put(key, RESULTS)
+    with mock.patch('time.time', return_value=1000.0 + 59 * 60):
+        assert cache.get(key) == RESULTS
+    with mock.patch('time.time', return_value=1000.0 + 61 * 60):
+        assert cache.get(key) is None
+
+
+def test_entries_never_expire_without_ttl():
+    cache = cg.ResultCache(ttl=None)
+    key = cache.key(CIRCUIT, None, 2)
+    with mock.patch('time.time', return_value=1000.0):
+        cache.put(key, RESULTS)
+    with mock.patch('time.time', return_value=1000.0 + 365 * 24 * 3600):
+        assert cache.get(key) == RESULTS
+
+
+def test_directory_persists_entries(tmp_path):
+    directory = tmp_path / 'results'
+    cache = cg.ResultCache(directory=directory)
+    key = cache.key(CIRCUIT, None, 2)
+    cache.put(key, RESULTS)
+    assert (directory / f'cirq-google-result-{key}.json').exists()
+
+    new_cache = cg.ResultCache(directory=directory)
+    assert new_cache.get(key) == RESULTS
+    assert new_cache.get(cache.key(CIRCUIT, None, 3)) is None
+    assert (new_cache.hits, new_cache.misses) == (1, 1)
+
+    (directory / 'other.json').write_text('{}')
+    new_cache.clear()
+    assert [path.name for path in directory.iterdir()] == ['other.json']
+    assert cg.ResultCache(directory=directory).get(key) is None
+
+
+@pytest.mark.parametrize('age_minutes, expected', [(5, RESULTS), (15, None)])
+def test_directory_entries_expire(tmp_path, age_minutes, expected):
+    cache = cg.ResultCache(directory=tmp_path)
+    key = cache.key(CIRCUIT, None, 2)
+    cache.put(key, RESULTS)
+
+    new_cache = cg.ResultCache(directory=tmp_path, ttl=datetime.timedelta(minutes=10))
+    modified_time = (tmp_path / f'cirq-google-result-{key}.json').stat().st_mtime
+    with mock.patch('time.time', return_value=modified_time + age_minutes * 60):
+        assert new_cache.get(key) == expected
+    assert (tmp_path / f'cirq-google-result-{key}.json').exists() == (expected is not None)
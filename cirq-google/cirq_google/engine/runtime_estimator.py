@@ -28,13 +28,28 @@ the rep rate calculator, see:
 
 Model was then fitted by hand, correcting for anomalies and outliers
 when possible.
+
+For more accurate estimates, a `RuntimeModel` can be fitted to
+`RuntimeSample`s recorded from your own jobs.  Samples and fitted models
+can be stored locally with `cirq.to_json` and reloaded with
+`cirq.read_json`.
 """
 
 from __future__ import annotations
 
+import dataclasses
 from collections.abc import Sequence
+from typing import Any, TYPE_CHECKING
+
+import numpy as np
+import scipy.optimize
 
 import cirq
+from cirq._compat import dataclass_repr
+from cirq_google.serialization.circuit_serializer import CIRCUIT_SERIALIZER
+
+if TYPE_CHECKING:
+    from cirq_google.engine.abstract_job import AbstractJob
 
 # Estimated end-to-end latency of circuits through the system
 _BASE_LATENCY = 1.5
@@ -206,3 +221,310 @@ def estimate_run_batch_time(
         )
 
     return total_time + latency
+
+
+def _serialized_size(program: cirq.AbstractCircuit) -> int:
+    return CIRCUIT_SERIALIZER.serialize(program).ByteSize()
+
+
+def _execution_time(job: AbstractJob) -> float | None:
+    """Returns the seconds an `EngineJob` spent executing, if Quantum Engine reported them."""
+    from cirq_google.engine.engine_job import EngineJob
+
+    if not isinstance(job, EngineJob):
+        return None
+    timing = job._refresh_job().execution_status.timing
+    if timing.started_time is None or timing.completed_time is None:
+        return None
+    return (timing.completed_time - timing.started_time).total_seconds()
+
+
+def _run_time_features(
+    width: int, depth: int, sweeps: int, repetitions: int, serialized_size: int
+) -> np.ndarray:
+    """Features of the run time model, excluding the constant latency term."""
+    total_reps = sweeps * repetitions
+    return np.array(
+        [
+            sweeps,
+            width * depth * sweeps,
+            total_reps,
+            total_reps * width,
+            total_reps * depth,
+            serialized_size,
+        ],
+        dtype=float,
+    )
+
+
+def _serialization_features(serialized_size: int) -> np.ndarray:
+    return np.array([serialized_size], dtype=float)
+
+
+def _result_parsing_features(width: int, sweeps: int, repetitions: int) -> np.ndarray:
+    return np.array([sweeps, sweeps * repetitions * width], dtype=float)
+
+
+def _program_features(
+    program: cirq.AbstractCircuit, params: cirq.Sweepable, repetitions: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the run time, serialization and result parsing features of a program."""
+    width = len(program.all_qubits())
+    sweeps = len(list(cirq.to_resolvers(params)))
+    size = _serialized_size(program)
+    return (
+        _run_time_features(width, len(program), sweeps, repetitions, size),
+        _serialization_features(size),
+        _result_parsing_features(width, sweeps, repetitions),
+    )
+
+
+def _fit_coefficients(features: np.ndarray, times: np.ndarray) -> tuple[float, ...]:
+    """Fits non-negative coefficients, the first of which is a constant term."""
+    design = np.hstack([np.ones((len(features), 1)), features])
+    coefficients, _ = scipy.optimize.nnls(design, times)
+    return tuple(float(c) for c in coefficients)
+
+
+def _predict(coefficients: tuple[float, ...], features: np.ndarray) -> float:
+    return coefficients[0] + float(np.dot(coefficients[1:], features))
+
+
+@dataclasses.dataclass(frozen=True)
+class RuntimeSample:
+    """The measured times of running one circuit on Quantum Engine.
+
+    Samples are used to fit a `RuntimeModel`.
+
+    Args:
+        width: Number of qubits of the circuit.
+        depth: Number of moments of the circuit.
+        sweeps: Number of parameter resolvers the circuit was run with.
+        repetitions: Number of repetitions per parameter resolver.
+        serialized_size: Size in bytes of the serialized circuit.
+        run_time: Seconds the job spent executing.
+        serialization_time: Seconds spent serializing the circuit client-side.
+        result_parsing_time: Seconds spent parsing the results client-side.
+    """
+
+    width: int
+    depth: int
+    sweeps: int
+    repetitions: int
+    serialized_size: int
+    run_time: float
+    serialization_time: float = 0.0
+    result_parsing_time: float = 0.0
+
+    @classmethod
+    def from_job(
+        cls,
+        job: AbstractJob,
+        program: cirq.AbstractCircuit,
+        *,
+        run_time: float | None = None,
+        serialization_time: float = 0.0,
+        result_parsing_time: float = 0.0,
+    ) -> RuntimeSample:
+        """Creates a sample from a completed job running `program`.
+
+        Unless `run_time` is given, the run time of an `EngineJob` is the time between the start
+        and the completion of its execution reported by Quantum Engine. For other jobs, and
+        engine jobs without execution timestamps, it is the time between the creation and the
+        last update of the job. That includes the time the job waited in the queue, so it
+        overestimates the run time and biases the fitted model towards longer runs; pass the
+        measured `run_time` instead where possible.
+
+        Args:
+            job: A completed job running a single circuit.
+            program: The circuit the job ran.
+            run_time: Seconds the job spent executing, if measured.
+            serialization_time: Seconds spent serializing the circuit client-side, if measured.
+            result_parsing_time: Seconds spent parsing the results client-side, if measured.
+        """
+        repetitions, sweeps = job.get_repetitions_and_sweeps()
+        if run_time is None:
+            run_time = _execution_time(job)
+        if run_time is None:
+            run_time = (job.update_time() - job.create_time()).total_seconds()
+        return cls(
+            width=len(program.all_qubits()),
+            depth=len(program),
+            sweeps=sum(len(sweep) for sweep in sweeps),
+            repetitions=repetitions,
+            serialized_size=_serialized_size(program),
+            run_time=run_time,
+            serialization_time=serialization_time,
+            result_parsing_time=result_parsing_time,
+        )
+
+    def __repr__(self) -> str:
+        return dataclass_repr(self, namespace='cirq_google.engine')
+
+    @classmethod
+    def _json_namespace_(cls) -> str:
+        return 'cirq.google'
+
+    def _json_dict_(self) -> dict[str, Any]:
+        return cirq.dataclass_json_dict(self)
+
+
+@dataclasses.dataclass(frozen=True)
+class RuntimeModel:
+    """A linear model of the time to run circuits on Quantum Engine, fitted to measured samples.
+
+    The model predicts three times, each as a non-negative combination of features of the
+    circuits and their run context:
+
+    * The run time on Engine, from a constant latency and terms in the number of sweeps, the
+      circuit size times the number of sweeps, the total repetitions (also scaled by width and
+      depth), and the serialized size.
+    * The client-side serialization time, from a constant and the serialized size.
+    * The client-side result parsing time, from a constant and terms in the number of sweeps and
+      the number of measured bits.
+
+    Use `RuntimeModel.fit` to create a model from `RuntimeSample`s.
+
+    Args:
+        run_time_coefficients: Coefficients of the run time features, constant first.
+        serialization_coefficients: Coefficients of the serialization features, constant first.
+        result_parsing_coefficients: Coefficients of the result parsing features, constant first.
+    """
+
+    run_time_coefficients: tuple[float, ...]
+    serialization_coefficients: tuple[float, ...]
+    result_parsing_coefficients: tuple[float, ...]
+
+    @classmethod
+    def fit(cls, samples: Sequence[RuntimeSample]) -> RuntimeModel:
+        """Fits a model to the measured samples by non-negative least squares.
+
+        Raises:
+            ValueError: If no samples are given.
+        """
+        if not samples:
+            raise ValueError('At least one sample is needed to fit a RuntimeModel.')
+        run_time_features = np.array(
+            [
+                _run_time_features(s.width, s.depth, s.sweeps, s.repetitions, s.serialized_size)
+                for s in samples
+            ]
+        )
+        serialization_features = np.array(
+            [_serialization_features(s.serialized_size) for s in samples]
+        )
+        result_parsing_features = np.array(
+            [_result_parsing_features(s.width, s.sweeps, s.repetitions) for s in samples]
+        )
+        return cls(
+            run_time_coefficients=_fit_coefficients(
+                run_time_features, np.array([s.run_time for s in samples])
+            ),
+            serialization_coefficients=_fit_coefficients(
+                serialization_features, np.array([s.serialization_time for s in samples])
+            ),
+            result_parsing_coefficients=_fit_coefficients(
+                result_parsing_features, np.array([s.result_parsing_time for s in samples])
+            ),
+        )
+
+    def estimate_run_sweep_time(
+        self, program: cirq.AbstractCircuit, params: cirq.Sweepable = None, repetitions: int = 1000
+    ) -> float:
+        """Estimates the seconds to serialize, run and parse the results of a parameter sweep."""
+        return self.estimate_run_batch_time([program], [params], repetitions)
+
+    def estimate_run_batch_time(
+        self,
+        programs: Sequence[cirq.AbstractCircuit],
+        params_list: Sequence[cirq.Sweepable],
+        repetitions: int = 1000,
+    ) -> float:
+        """Estimates the seconds to serialize, run and parse the results of a batch of programs.
+
+        The constant latency of each of the three parts is only counted once for the batch.
+        """
+        features = [
+            _program_features(program, params, repetitions)
+            for program, params in zip(programs, params_list)
+        ]
+        return self._estimate([np.sum(f, axis=0) for f in zip(*features)] if features else None)
+
+    def batch_sizes_for_deadline(
+        self,
+        programs: Sequence[cirq.AbstractCircuit],
+        params_list: Sequence[cirq.Sweepable],
+        deadline: float,
+        repetitions: int = 1000,
+    ) -> list[int]:
+        """Splits a batch of programs into consecutive batches which each meet a deadline.
+
+        Batches are filled greedily in order, so that each batch is estimated to complete in at
+        most `deadline` seconds, including serialization and result parsing.
+
+        Args:
+            programs: The circuits to run, in order.
+            params_list: A parameter sweep for each circuit.
+            deadline: The maximum estimated seconds for each batch.
+            repetitions: Number of repetitions per parameter resolver.
+
+        Returns:
+            The number of programs in each batch, in order.
+
+        Raises:
+            ValueError: If a single program cannot be run within the deadline.
+        """
+        sizes: list[int] = []
+        batch_features: list[np.ndarray] | None = None
+        for idx, (program, params) in enumerate(zip(programs, params_list)):
+            features = _program_features(program, params, repetitions)
+            if batch_features is not None:
+                extended = [b + f for b, f in zip(batch_features, features)]
+                if self._estimate(extended) <= deadline:
+                    batch_features = extended
+                    sizes[-1] += 1
+                    continue
+            time = self._estimate(list(features))
+            if time > deadline:
+                raise ValueError(
+                    f'Program {idx} is estimated to take {time:.3f} seconds, '
+                    f'which exceeds the deadline of {deadline} seconds.'
+                )
+            batch_features = list(features)
+            sizes.append(1)
+        return sizes
+
+    def _estimate(self, features: Sequence[np.ndarray] | None) -> float:
+        """Estimates the total time from summed run time, serialization and parsing features."""
+        coefficients = (
+            self.run_time_coefficients,
+            self.serialization_coefficients,
+            self.result_parsing_coefficients,
+        )
+        if features is None:
+            return sum(c[0] for c in coefficients)
+        return sum(_predict(c, f) for c, f in zip(coefficients, features))
+
+    def __repr__(self) -> str:
+        return dataclass_repr(self, namespace='cirq_google.engine')
+
+    @classmethod
+    def _json_namespace_(cls) -> str:
+        return 'cirq.google'
+
+    def _json_dict_(self) -> dict[str, Any]:
+        return cirq.dataclass_json_dict(self)
+
+    @classmethod
+    def _from_json_dict_(
+        cls,
+        run_time_coefficients,
+        serialization_coefficients,
+        result_parsing_coefficients,
+        **kwargs,
+    ) -> RuntimeModel:
+        return cls(
+            run_time_coefficients=tuple(run_time_coefficients),
+            serialization_coefficients=tuple(serialization_coefficients),
+            result_parsing_coefficients=tuple(result_parsing_coefficients),
+        )
@@ -14,11 +14,21 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
+import numpy as np
 import pytest
 import sympy
+from google.protobuf import timestamp_pb2
 
 import cirq
+import cirq_google
 import cirq_google.engine.runtime_estimator as runtime_estimator
+from cirq_google.api import v2
+from cirq_google.cloud import quantum
+from cirq_google.engine import util
+from cirq_google.engine.engine import EngineContext
+from cirq_google.serialization.circuit_serializer import CIRCUIT_SERIALIZER
 
 
 def _assert_about_equal(actual: float, expected: float):
@@ -182,3 +192,140 @@ def test_estimate_run_batch_time_average_depths():
     )
     assert depth_20_and_40 == depth_30
     assert depth_20_and_40 < depth_40
+
+
+def _samples_from_model(
+    model: runtime_estimator.RuntimeModel,
+) -> list[runtime_estimator.RuntimeSample]:
+    samples = []
+    for width in (2, 10, 30):
+        for depth in (5, 50, 500):
+            for sweeps in (1, 4):
+                for repetitions in (100, 5000):
+                    for size in (1000, 80000):
+                        features = runtime_estimator._run_time_features(
+                            width, depth, sweeps, repetitions, size
+                        )
+                        samples.append(
+                            runtime_estimator.RuntimeSample(
+                                width=width,
+                                depth=depth,
+                                sweeps=sweeps,
+                                repetitions=repetitions,
+                                serialized_size=size,
+                                run_time=runtime_estimator._predict(
+                                    model.run_time_coefficients, features
+                                ),
+                                serialization_time=runtime_estimator._predict(
+                                    model.serialization_coefficients,
+                                    runtime_estimator._serialization_features(size),
+                                ),
+                                result_parsing_time=runtime_estimator._predict(
+                                    model.result_parsing_coefficients,
+                                    runtime_estimator._result_parsing_features(
+                                        width, sweeps, repetitions
+                                    ),
+                                ),
+                            )
+                        )
+    return samples
+
+
+MODEL = runtime_estimator.RuntimeModel(
+    run_time_coefficients=(1.5, 0.1, 1e-4, 4e-5, 1e-6, 0.0, 2e-7),
+    serialization_coefficients=(1e-3, 1e-6),
+    result_parsing_coefficients=(2e-3, 1e-4, 1e-8),
+)
+
+
+def test_runtime_model_fit_recovers_coefficients():
+    fitted = runtime_estimator.RuntimeModel.fit(_samples_from_model(MODEL))
+    for actual, expected in [
+        (fitted.run_time_coefficients, MODEL.run_time_coefficients),
+        (fitted.serialization_coefficients, MODEL.serialization_coefficients),
+        (fitted.result_parsing_coefficients, MODEL.result_parsing_coefficients),
+    ]:
+        assert np.allclose(actual, expected, rtol=1e-6, atol=1e-12)
+
+
+def test_runtime_model_fit_without_samples():
+    with pytest.raises(ValueError, match='At least one sample'):
+        runtime_estimator.RuntimeModel.fit([])
+
+
+def test_runtime_model_estimates():
+    qubits = cirq.LineQubit.range(10)
+    circuit = cirq.Circuit(*[cirq.X(q) ** sympy.Symbol('t') for q in qubits], cirq.measure(*qubits))
+    sweep = cirq.Linspace('t', 0, 1, 10)
+
+    single = MODEL.estimate_run_sweep_time(circuit, sweep, repetitions=1000)
+    assert single > MODEL.run_time_coefficients[0]
+    assert MODEL.estimate_run_batch_time([circuit], [sweep], repetitions=1000) == single
+    # The constant latencies are only paid once per batch.
+    latency = (
+        MODEL.run_time_coefficients[0]
+        + MODEL.serialization_coefficients[0]
+        + MODEL.result_parsing_coefficients[0]
+    )
+    batch = MODEL.estimate_run_batch_time([circuit] * 3, [sweep] * 3, repetitions=1000)
+    assert np.isclose(batch, 3 * single - 2 * latency)
+    assert MODEL.estimate_run_batch_time([], [], repetitions=1000) == latency
+
+
+def test_runtime_model_batch_sizes_for_deadline():
+    qubits = cirq.LineQubit.range(10)
+    circuit = cirq.Circuit(*[cirq.X(q) ** sympy.Symbol('t') for q in qubits], cirq.measure(*qubits))
+    sweep = cirq.Linspace('t', 0, 1, 10)
+    single = MODEL.estimate_run_sweep_time(circuit, sweep, repetitions=1000)
+    two = MODEL.estimate_run_batch_time([circuit] * 2, [sweep] * 2, repetitions=1000)
+
+    sizes = MODEL.batch_sizes_for_deadline([circuit] * 5, [sweep] * 5, deadline=two)
+    assert sizes == [2, 2, 1]
+    assert MODEL.batch_sizes_for_deadline([circuit] * 5, [sweep] * 5, deadline=single) == [1] * 5
+    assert MODEL.batch_sizes_for_deadline([], [], deadline=single) == []
+    with pytest.raises(ValueError, match='Program 0 is estimated'):
+        _ = MODEL.batch_sizes_for_deadline([circuit], [sweep], deadline=single / 2)
+
+
+def test_runtime_sample_from_job():
+    processor = cirq_google.engine.SimulatedLocalProcessor(processor_id='test_proc')
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(*[cirq.X(q) ** sympy.Symbol('t') for q in qubits], cirq.measure(*qubits))
+    job = processor.run_sweep(circuit, params=cirq.Linspace('t', 0, 1, 4), repetitions=100)
+    _ = job.results()
+
+    sample = runtime_estimator.RuntimeSample.from_job(job, circuit, serialization_time=0.5)
+    assert sample.width == 3
+    assert sample.depth == 2
+    assert sample.sweeps == 4
+    assert sample.repetitions == 100
+    assert sample.serialized_size == CIRCUIT_SERIALIZER.serialize(circuit).ByteSize()
+    assert sample.run_time >= 0
+    assert sample.serialization_time == 0.5
+    assert sample.result_parsing_time == 0
+
+
+@pytest.mark.parametrize('has_timing, expected_run_time', [(True, 7.0), (False, 30.0)])
+@mock.patch('cirq_google.engine.engine_client.EngineClient.get_job_async')
+def test_runtime_sample_from_engine_job(get_job, has_timing, expected_run_time):
+    timing = quantum.ExecutionStatus.Timing(
+        started_time=timestamp_pb2.Timestamp(seconds=1000020),
+        completed_time=timestamp_pb2.Timestamp(seconds=1000027),
+    )
+    get_job.return_value = quantum.QuantumJob(
+        create_time=timestamp_pb2.Timestamp(seconds=1000000),
+        update_time=timestamp_pb2.Timestamp(seconds=1000030),
+        execution_status=quantum.ExecutionStatus(timing=timing if has_timing else None),
+        run_context=util.pack_any(
+            v2.run_context_pb2.RunContext(
+                parameter_sweeps=[v2.run_context_pb2.ParameterSweep(repetitions=10)]
+            )
+        ),
+    )
+    job = cirq_google.EngineJob('a', 'b', 'c', EngineContext())
+    circuit = cirq.Circuit(cirq.measure(cirq.LineQubit(0)))
+
+    # The queueing time before the execution started is not part of the run time.
+    sample = runtime_estimator.RuntimeSample.from_job(job, circuit)
+    assert sample.run_time == expected_run_time
+    assert runtime_estimator.RuntimeSample.from_job(job, circuit, run_time=2.5).run_time == 2.5
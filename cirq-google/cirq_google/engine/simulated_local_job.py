@@ -18,6 +18,7 @@ and a provided sampler to execute circuits."""
 from __future__ import annotations
 
 import concurrent.futures
+import threading
 from collections.abc import Sequence
 from typing import cast
 
@@ -56,12 +57,21 @@ class SimulatedLocalJob(AbstractLocalJob):
     once the appropriate results method is called.  Other methods will
     be added later.
 
+    If the simulation type is ASYNCHRONOUS and an executor is provided,
+    every sweep point of every circuit in the batch is submitted to the
+    executor as a separate task when the job is created, so that they
+    can run in parallel with each other and with other jobs sharing
+    the executor.
+
     This does not support calibration requests.
     `
     Attributes:
         sampler: Sampler to call for results.
         simulation_type:  Whether sampler execution should be
             synchronous or asynchronous.
+        executor: An optional executor to run the sweep points on for
+            asynchronous execution.  If this is a process pool, the
+            sampler and circuits must be picklable.
     """
 
     def __init__(
@@ -69,6 +79,7 @@ class SimulatedLocalJob(AbstractLocalJob):
         *args,
         sampler: cirq.Sampler | None = None,
         simulation_type: LocalSimulationType = LocalSimulationType.SYNCHRONOUS,
+        executor: concurrent.futures.Executor | None = None,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -78,7 +89,13 @@ class SimulatedLocalJob(AbstractLocalJob):
         self._type = simulation_type
         self._failure_code = ''
         self._failure_message = ''
-        if self._type == LocalSimulationType.ASYNCHRONOUS:
+        self._point_futures: list[concurrent.futures.Future[Sequence[cirq.Result]]] = []
+        # Guards `_state` against the callbacks of the sweep points, which run on the threads
+        # of the executor.
+        self._state_lock = threading.Lock()
+        if self._type == LocalSimulationType.ASYNCHRONOUS and executor is not None:
+            self._future = self._submit_sweep_points(executor)
+        elif self._type == LocalSimulationType.ASYNCHRONOUS:
             # If asynchronous mode, just kick off a new task and move on.
             self._thread = concurrent.futures.ThreadPoolExecutor(max_workers=1)
             try:
@@ -101,7 +118,10 @@ class SimulatedLocalJob(AbstractLocalJob):
 
     def cancel(self) -> None:
         """Cancel the job."""
-        self._state = quantum.ExecutionStatus.State.CANCELLED
+        for future in self._point_futures:
+            future.cancel()
+        with self._state_lock:
+            self._state = quantum.ExecutionStatus.State.CANCELLED
 
     def delete(self) -> None:
         """Deletes the job and result, if any."""
@@ -136,6 +156,73 @@ class SimulatedLocalJob(AbstractLocalJob):
             self._state = quantum.ExecutionStatus.State.FAILURE
             raise e
 
+    def _submit_sweep_points(
+        self, executor: concurrent.futures.Executor
+    ) -> duet.AwaitableFuture[Sequence[Sequence[EngineResult]]]:
+        """Submits each sweep point of each circuit to the executor.
+
+        Returns: a future for the results, which completes once every
+            sweep point has been executed, or as soon as one fails.
+        """
+        reps, sweeps = self.get_repetitions_and_sweeps()
+        parent = self.program()
+        batch_futures = [
+            [
+                executor.submit(self._sampler.run_sweep, parent.get_circuit(n), resolver, reps)
+                for resolver in cirq.to_resolvers(cast(cirq.Sweepable, sweeps[n]))
+            ]
+            for n in range(parent.batch_size())
+        ]
+        self._point_futures = [future for futures in batch_futures for future in futures]
+        self._state = quantum.ExecutionStatus.State.RUNNING
+
+        results_future: duet.AwaitableFuture[Sequence[Sequence[EngineResult]]] = (
+            duet.AwaitableFuture()
+        )
+        lock = threading.Lock()
+        num_pending = len(self._point_futures)
+
+        def point_done(future: concurrent.futures.Future[Sequence[cirq.Result]]) -> None:
+            nonlocal num_pending
+            if future.cancelled():
+                results_future.cancel()
+                return
+            error = future.exception()
+            if error is not None:
+                with self._state_lock:
+                    if (
+                        results_future.try_set_exception(error)
+                        and self._state == quantum.ExecutionStatus.State.RUNNING
+                    ):
+                        self._failure_code = '500'
+                        self._failure_message = str(error)
+                        self._state = quantum.ExecutionStatus.State.FAILURE
+                return
+            with lock:
+                num_pending -= 1
+                if num_pending:
+                    return
+            finish()
+
+        def finish() -> None:
+            batch_results = [
+                [result for future in futures for result in future.result()]
+                for futures in batch_futures
+            ]
+            engine_results = _to_engine_results(batch_results, job_id=self.id())
+            with self._state_lock:
+                if (
+                    results_future.try_set_result(engine_results)
+                    and self._state == quantum.ExecutionStatus.State.RUNNING
+                ):
+                    self._state = quantum.ExecutionStatus.State.SUCCESS
+
+        if not self._point_futures:
+            finish()
+        for future in self._point_futures:
+            future.add_done_callback(point_done)
+        return results_future
+
     async def results_async(self) -> Sequence[EngineResult]:
         """Returns the job results, blocking until the job is complete."""
         if self._type == LocalSimulationType.SYNCHRONOUS:
@@ -16,6 +16,9 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import threading
+
 import numpy as np
 import pytest
 import sympy
@@ -113,3 +116,128 @@ def test_run_async():
     )
     _ = job.results()
     assert job.execution_status() == quantum.ExecutionStatus.State.SUCCESS
+
+
+def test_run_async_with_executor():
+    program = ParentProgram(
+        [
+            cirq.Circuit(cirq.X(Q) ** sympy.Symbol('t'), cirq.measure(Q, key='m')),
+            cirq.Circuit(cirq.measure(Q, key='m')),
+        ],
+        None,
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        job = SimulatedLocalJob(
+            job_id='test_job',
+            processor_id='test1',
+            parent_program=program,
+            repetitions=100,
+            sweeps=[cirq.Points(key='t', points=[1, 0, 1]), {}],
+            simulation_type=LocalSimulationType.ASYNCHRONOUS,
+            executor=executor,
+        )
+        results = job.results()
+    assert [np.all(result.measurements['m'] == 1) for result in results] == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert [result.params['t'] for result in results[:3]] == [1, 0, 1]
+    assert all(result.job_id == 'test_job' for result in results)
+    assert job.execution_status() == quantum.ExecutionStatus.State.SUCCESS
+
+
+def test_run_async_with_executor_empty_sweep():
+    program = ParentProgram([cirq.Circuit(cirq.measure(Q, key='m'))], None)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        job = SimulatedLocalJob(
+            job_id='test_job',
+            processor_id='test1',
+            parent_program=program,
+            repetitions=100,
+            sweeps=[cirq.Points(key='t', points=[])],
+            simulation_type=LocalSimulationType.ASYNCHRONOUS,
+            executor=executor,
+        )
+        assert job.results() == []
+    assert job.execution_status() == quantum.ExecutionStatus.State.SUCCESS
+
+
+def test_run_async_with_executor_failure():
+    program = ParentProgram([cirq.Circuit(cirq.X(Q) ** sympy.Symbol('t'))], None)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        job = SimulatedLocalJob(
+            job_id='test_job',
+            processor_id='test1',
+            parent_program=program,
+            repetitions=100,
+            sweeps=[{}],
+            simulation_type=LocalSimulationType.ASYNCHRONOUS,
+            executor=executor,
+        )
+        with pytest.raises(ValueError, match='no measurements'):
+            job.results()
+    assert job.execution_status() == quantum.ExecutionStatus.State.FAILURE
+    assert job.failure() is not None and job.failure()[0] == '500'
+
+
+def test_cancel_async_with_executor():
+    started = threading.Event()
+    release = threading.Event()
+
+    class BlockingSampler(cirq.Simulator):
+        def run_sweep(self, program, params, repetitions=1):
+            started.set()
+            release.wait()
+            return super().run_sweep(program, params, repetitions)
+
+    program = ParentProgram([cirq.Circuit(cirq.X(Q), cirq.measure(Q, key='m'))], None)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        job = SimulatedLocalJob(
+            job_id='test_job',
+            processor_id='test1',
+            parent_program=program,
+            repetitions=100,
+            sweeps=[cirq.Points(key='t', points=[0, 1])],
+            sampler=BlockingSampler(),
+            simulation_type=LocalSimulationType.ASYNCHRONOUS,
+            executor=executor,
+        )
+        started.wait()
+        job.cancel()
+        release.set()
+        with pytest.raises(concurrent.futures.CancelledError):
+            job.results()
+    assert job.execution_status() == quantum.ExecutionStatus.State.CANCELLED
+
+
+def test_cancel_async_with_executor_is_not_overridden_by_failure():
+    started = threading.Event()
+    release = threading.Event()
+
+    class FailingSampler(cirq.Simulator):
+        def run_sweep(self, program, params, repetitions=1):
+            started.set()
+            release.wait()
+            raise ValueError('failed after cancel')
+
+    program = ParentProgram([cirq.Circuit(cirq.X(Q), cirq.measure(Q, key='m'))], None)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        job = SimulatedLocalJob(
+            job_id='test_job',
+            processor_id='test1',
+            parent_program=program,
+            repetitions=100,
+            sweeps=[{}],
+            sampler=FailingSampler(),
+            simulation_type=LocalSimulationType.ASYNCHRONOUS,
+            executor=executor,
+        )
+        started.wait()
+        job.cancel()
+        release.set()
+        with pytest.raises(ValueError, match='failed after cancel'):
+            job.results()
+    assert job.execution_status() == quantum.ExecutionStatus.State.CANCELLED
+    assert job.failure() == ('', '')
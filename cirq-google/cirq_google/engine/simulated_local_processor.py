@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import datetime
 from typing import TYPE_CHECKING
 
@@ -68,6 +69,11 @@ class SimulatedLocalProcessor(AbstractLocalProcessor):
             based on the given serializer.
         simulation_type:  Whether sampler execution should be
             synchronous or asynchronous.
+        executor: An optional executor shared by all jobs of this processor
+            for asynchronous execution.  Each sweep point of each job is run
+            as a separate task on the executor, so that a thread or process
+            pool executes them in parallel.  Circuits are validated against
+            the device and validator when the job is created.
         calibrations: A dictionary of calibration metrics keyed by epoch seconds
             that can be returned by the processor.
         processor_id: Unique string id of the processor.
@@ -91,6 +97,7 @@ class SimulatedLocalProcessor(AbstractLocalProcessor):
         validator: validating_sampler.VALIDATOR_TYPE | None = None,
         program_validator: engine_validator.PROGRAM_VALIDATOR_TYPE | None = None,
         simulation_type: LocalSimulationType = LocalSimulationType.SYNCHRONOUS,
+        executor: concurrent.futures.Executor | None = None,
         calibrations: dict[int, calibration.Calibration] | None = None,
         device_specification: v2.device_pb2.DeviceSpecification | None = None,
         **kwargs,
@@ -99,6 +106,8 @@ class SimulatedLocalProcessor(AbstractLocalProcessor):
         self._calibrations = calibrations or {}
         self._device = device
         self._simulation_type = simulation_type
+        self._executor = executor
+        self._unvalidated_sampler = sampler
         self._program_validator = program_validator or (lambda a, b, c, d: None)
         self._validator = validator
         self._sampler = validating_sampler.ValidatingSampler(
@@ -217,6 +226,13 @@ class SimulatedLocalProcessor(AbstractLocalProcessor):
         if job_id is None:
             job_id = self._create_id(id_type='job')
         self._program_validator([program], [params], repetitions, CIRCUIT_SERIALIZER)
+        sampler: cirq.Sampler = self._sampler
+        if self._simulation_type == LocalSimulationType.ASYNCHRONOUS and self._executor is not None:
+            # The job splits the sweep into separate tasks, so validate the whole sweep here.
+            self._device.validate_circuit(program)
+            if self._validator:
+                self._validator([program], [params], repetitions)
+            sampler = self._unvalidated_sampler
         self._programs[program_id] = SimulatedLocalProgram(
             program_id=program_id,
             simulation_type=self._simulation_type,
@@ -230,8 +246,9 @@ class SimulatedLocalProcessor(AbstractLocalProcessor):
             parent_program=self._programs[program_id],
             repetitions=repetitions,
             sweeps=[params],
-            sampler=self._sampler,
+            sampler=sampler,
             simulation_type=self._simulation_type,
+            executor=self._executor,
         )
         self._programs[program_id].add_job(job_id, job)
         return job
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import datetime
 
 import numpy as np
@@ -26,6 +27,7 @@ import cirq
 import cirq_google
 from cirq_google.api import v2
 from cirq_google.cloud import quantum
+from cirq_google.engine.local_simulation_type import LocalSimulationType
 from cirq_google.engine.simulated_local_processor import SimulatedLocalProcessor, VALID_LANGUAGES
 
 
@@ -203,6 +205,45 @@ def test_additional_validation():
         _ = proc.get_sampler().run_sweep(circuit, params=sweep, repetitions=100)
 
 
+def test_run_sweep_with_executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        proc = SimulatedLocalProcessor(
+            processor_id='test_proc',
+            simulation_type=LocalSimulationType.ASYNCHRONOUS,
+            executor=executor,
+        )
+        q = cirq.GridQubit(5, 4)
+        circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('t'), cirq.measure(q, key='m'))
+        sweep = cirq.Points(key='t', points=[1, 0])
+        jobs = [proc.run_sweep(circuit, params=sweep, repetitions=100) for _ in range(3)]
+        for job in jobs:
+            results = job.results()
+            assert np.all(results[0].measurements['m'] == 1)
+            assert np.all(results[1].measurements['m'] == 0)
+            assert job.execution_status() == quantum.ExecutionStatus.State.SUCCESS
+
+
+def test_validation_with_executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        proc = SimulatedLocalProcessor(
+            processor_id='test_proc',
+            device=cirq_google.Sycamore23,
+            validator=_no_y_gates,
+            simulation_type=LocalSimulationType.ASYNCHRONOUS,
+            executor=executor,
+        )
+        sweep = cirq.Points(key='t', points=[1, 0])
+        q = cirq.GridQubit(2, 2)
+        circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('t'), cirq.measure(q, key='m'))
+        with pytest.raises(ValueError, match='Qubit not on device'):
+            _ = proc.run_sweep(circuit, params=sweep, repetitions=100)
+
+        q = cirq.GridQubit(5, 4)
+        circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('t'), cirq.Y(q), cirq.measure(q, key='m'))
+        with pytest.raises(ValueError, match='No Y gates allowed!'):
+            _ = proc.run_sweep(circuit, params=sweep, repetitions=100)
+
+
 def test_device_specification():
     proc = SimulatedLocalProcessor(processor_id='test_proc')
     assert proc.get_device_specification() is None
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
@@ -94,6 +95,29 @@ class ResponseDemux:
         self._subscribers.clear()
 
 
+class _Stream:
+    """The management resources of a single QuantumRunStream opened by StreamManager."""
+
+    def __init__(
+        self, request_queue: asyncio.Queue[quantum.QuantumRunStreamRequest | None]
+    ) -> None:
+        # Used to determine whether the stream coroutine is actively running, and provides a way to
+        # cancel it.
+        self.manage_stream_loop_future: duet.AwaitableFuture[None] | None = None
+        # TODO(#5996) consider making the scope of response futures local to the relevant tasks
+        # rather than all of the stream.
+        # Currently, this field is being written to from both duet and asyncio threads. While the
+        # ResponseDemux implementation does support this, it does not guarantee thread safety in its
+        # interface.
+        self.response_demux = ResponseDemux()
+        self.request_queue = request_queue
+        # The number of submitted jobs assigned to this stream which have not completed yet.
+        self.num_jobs = 0
+        # Set when the stream is stopped, so that jobs still waiting for an in-flight slot are
+        # cancelled instead of sending requests to the stopped stream.
+        self.stopped = False
+
+
 class StreamManager:
     """Manages communication with Quantum Engine via QuantumRunStream, a bi-directional stream RPC.
 
@@ -102,26 +126,51 @@ class StreamManager:
     failed. The submitted job can also be cancelled by calling `cancel()` on the future returned by
     `submit()`.
 
-    A new stream is opened during the first `submit()` call, and it stays open. If the stream is
-    unused, users can close the stream and free management resources by calling `stop()`.
+    Jobs can be spread over several parallel streams. Each submitted job is assigned to the stream
+    with the fewest outstanding jobs, and a stream is opened during the first `submit()` call which
+    uses it, and it stays open. When a stream breaks, only the jobs assigned to that stream are
+    retried; jobs on the other streams are unaffected. If the streams are unused, users can close
+    them and free management resources by calling `stop()`.
 
+    The number of jobs which have requests outstanding on the streams can be bounded by
+    `max_in_flight_jobs`. Jobs submitted beyond that limit wait client-side until an in-flight job
+    completes, which keeps a burst of submissions from flooding the streams.
     """
 
-    def __init__(self, grpc_client: quantum.QuantumEngineServiceAsyncClient):
+    def __init__(
+        self,
+        grpc_client: quantum.QuantumEngineServiceAsyncClient,
+        *,
+        num_streams: int = 1,
+        max_in_flight_jobs: int | None = None,
+    ):
+        """Initializes the StreamManager.
+
+        Args:
+            grpc_client: The client used to open streams and cancel jobs.
+            num_streams: The number of parallel QuantumRunStreams to spread jobs over.
+            max_in_flight_jobs: The maximum number of jobs whose requests are outstanding on the
+                streams at any one time. If None, the number of in-flight jobs is unbounded.
+
+        Raises:
+            ValueError: if `num_streams` or `max_in_flight_jobs` is less than 1.
+        """
+        if num_streams < 1:
+            raise ValueError(f'num_streams must be at least 1, but got {num_streams}.')
+        if max_in_flight_jobs is not None and max_in_flight_jobs < 1:
+            raise ValueError(
+                f'max_in_flight_jobs must be at least 1 or None, but got {max_in_flight_jobs}.'
+            )
         self._grpc_client = grpc_client
-        # Used to determine whether the stream coroutine is actively running, and provides a way to
-        # cancel it.
-        self._manage_stream_loop_future: duet.AwaitableFuture[None] | None = None
-        # TODO(#5996) consider making the scope of response futures local to the relevant tasks
-        # rather than all of StreamManager.
-        # Currently, this field is being written to from both duet and asyncio threads. While the
-        # ResponseDemux implementation does support this, it does not guarantee thread safety in its
-        # interface.
-        self._response_demux = ResponseDemux()
+        self._num_streams = num_streams
+        self._max_in_flight_jobs = max_in_flight_jobs
+        # Guards stream assignment, which happens in the duet thread, against job completion,
+        # which happens in the asyncio thread.
+        self._lock = threading.Lock()
         self._next_available_message_id = 0
-        # Construct queue in AsyncioExecutor to ensure it binds to the correct event loop, since it
-        # is used by asyncio coroutines.
-        self._request_queue = self._executor.submit(self._make_request_queue).result()
+        self._streams: list[_Stream] = []
+        self._in_flight_limiter: asyncio.Semaphore | None = None
+        self._reset()
 
     async def _make_request_queue(self) -> asyncio.Queue[quantum.QuantumRunStreamRequest | None]:
         """Returns a queue used to back the request iterator passed to the stream.
@@ -130,13 +179,31 @@ class StreamManager:
         """
         return asyncio.Queue(maxsize=100)
 
+    async def _make_in_flight_limiter(self) -> asyncio.Semaphore | None:
+        """Returns a semaphore bounding the number of in-flight jobs, or None if unbounded."""
+        if self._max_in_flight_jobs is None:
+            return None
+        return asyncio.Semaphore(self._max_in_flight_jobs)
+
+    @property
+    def num_streams(self) -> int:
+        """The number of parallel streams jobs are spread over."""
+        return self._num_streams
+
+    @property
+    def max_in_flight_jobs(self) -> int | None:
+        """The maximum number of jobs with outstanding requests, or None if unbounded."""
+        return self._max_in_flight_jobs
+
     def submit(
         self, project_name: str, program: quantum.QuantumProgram, job: quantum.QuantumJob
     ) -> duet.AwaitableFuture[quantum.QuantumResult | quantum.QuantumJob]:
-        """Submits a job over the stream and returns a future for the result.
+        """Submits a job over a stream and returns a future for the result.
 
-        If submit() is called for the first time since StreamManager instantiation or since the last
-        time stop() was called, it will create a new long-running stream.
+        The job is assigned to the stream with the fewest outstanding jobs. If that stream is not
+        open, either because submit() is called for the first time since StreamManager
+        instantiation or since the last time stop() was called, a new long-running stream is
+        created.
 
         The job can be cancelled by calling `cancel()` on the returned future.
 
@@ -159,29 +226,38 @@ class StreamManager:
         if 'name' not in program:
             raise ValueError('Program name must be set.')
 
-        if self._manage_stream_loop_future is None or self._manage_stream_loop_future.done():
-            self._manage_stream_loop_future = self._executor.submit(
-                self._manage_stream, self._request_queue
-            )
+        with self._lock:
+            stream = min(self._streams, key=lambda s: s.num_jobs)
+            stream.num_jobs += 1
+        if stream.manage_stream_loop_future is None or stream.manage_stream_loop_future.done():
+            stream.manage_stream_loop_future = self._executor.submit(self._manage_stream, stream)
         return self._executor.submit(
-            self._manage_execution, self._request_queue, project_name, program, job
+            self._manage_execution, stream, self._in_flight_limiter, project_name, program, job
         )
 
     def stop(self) -> None:
-        """Closes the open stream and resets all management resources."""
-        if (
-            self._manage_stream_loop_future is not None
-            and not self._manage_stream_loop_future.done()
-        ):
-            self._manage_stream_loop_future.cancel()
-        self._response_demux.publish_exception(asyncio.CancelledError())
+        """Closes the open streams and resets all management resources."""
+        for stream in self._streams:
+            stream.stopped = True
+            if (
+                stream.manage_stream_loop_future is not None
+                and not stream.manage_stream_loop_future.done()
+            ):
+                stream.manage_stream_loop_future.cancel()
+            stream.response_demux.publish_exception(asyncio.CancelledError())
         self._reset()
 
     def _reset(self):
         """Resets the manager state."""
-        self._manage_stream_loop_future = None
-        self._response_demux = ResponseDemux()
-        self._request_queue = self._executor.submit(self._make_request_queue).result()
+        # Construct queues and the semaphore in AsyncioExecutor to ensure they bind to the correct
+        # event loop, since they are used by asyncio coroutines.
+        streams = [
+            _Stream(self._executor.submit(self._make_request_queue).result())
+            for _ in range(self._num_streams)
+        ]
+        with self._lock:
+            self._streams = streams
+        self._in_flight_limiter = self._executor.submit(self._make_in_flight_limiter).result()
 
     @property
     def _executor(self) -> AsyncioExecutor:
@@ -189,21 +265,21 @@ class StreamManager:
         # clients: https://github.com/grpc/grpc/issues/25364.
         return AsyncioExecutor.instance()
 
-    async def _manage_stream(
-        self, request_queue: asyncio.Queue[quantum.QuantumRunStreamRequest | None]
-    ) -> None:
+    async def _manage_stream(self, stream: _Stream) -> None:
         """The stream coroutine, an asyncio coroutine to manage QuantumRunStream.
 
-        This coroutine reads responses from the stream and forwards them to the ResponseDemux, where
-        the corresponding execution coroutine `_manage_request()` is notified.
+        This coroutine reads responses from the stream and forwards them to the stream's
+        ResponseDemux, where the corresponding execution coroutine `_manage_request()` is notified.
 
-        When the stream breaks, the stream is reopened, and all execution coroutines are notified.
+        When the stream breaks, the stream is reopened, and all execution coroutines assigned to
+        this stream are notified.
 
-        There is at most a single instance of this coroutine running.
+        There is at most a single instance of this coroutine running per stream.
 
         Args:
-            request_queue: The queue holding requests from the execution coroutine.
+            stream: The stream to manage.
         """
+        request_queue = stream.request_queue
         while True:
             try:
                 response_iterable = await self._grpc_client.quantum_run_stream(
@@ -211,18 +287,19 @@ class StreamManager:
                     timeout=None,  # Persist the stream indefinitely.
                 )
                 async for response in response_iterable:
-                    self._response_demux.publish(response)
+                    stream.response_demux.publish(response)
             except asyncio.CancelledError:
                 await request_queue.put(None)
                 break
             except BaseException as e:
                 # Note: the message ID counter is not reset upon a new stream.
                 await request_queue.put(None)
-                self._response_demux.publish_exception(e)  # Raise to all request tasks
+                stream.response_demux.publish_exception(e)  # Raise to this stream's request tasks
 
     async def _manage_execution(
         self,
-        request_queue: asyncio.Queue[quantum.QuantumRunStreamRequest | None],
+        stream: _Stream,
+        in_flight_limiter: asyncio.Semaphore | None,
         project_name: str,
         program: quantum.QuantumProgram,
         job: quantum.QuantumJob,
@@ -235,10 +312,13 @@ class StreamManager:
         It initially sends a CreateQuantumProgramAndJobRequest, and retries if there is a retryable
         error by sending another request. The exact request type depends on the error.
 
-        There is one execution coroutine per running job submission.
+        There is one execution coroutine per running job submission. If `in_flight_limiter` is
+        set, the coroutine waits for it before sending any request, and holds it until the job
+        completes. Jobs still waiting for it when the stream is stopped are cancelled.
 
         Args:
-            request_queue: The queue used to send requests to the stream coroutine.
+            stream: The stream the job is assigned to.
+            in_flight_limiter: The semaphore bounding the number of in-flight jobs, if any.
             project_name: The full project ID resource path associated with the job.
             program: The Quantum Engine program representing the circuit to be executed.
             job: The Quantum Engine job to be executed.
@@ -250,6 +330,25 @@ class StreamManager:
                 error.
             ValueError: if the response is of a type which is not recognized by this client.
         """
+        try:
+            if in_flight_limiter is None:
+                return await self._execute(stream, project_name, program, job)
+            async with in_flight_limiter:
+                if stream.stopped:
+                    raise asyncio.CancelledError()
+                return await self._execute(stream, project_name, program, job)
+        finally:
+            with self._lock:
+                stream.num_jobs -= 1
+
+    async def _execute(
+        self,
+        stream: _Stream,
+        project_name: str,
+        program: quantum.QuantumProgram,
+        job: quantum.QuantumJob,
+    ) -> quantum.QuantumResult | quantum.QuantumJob:
+        """Sends the job's requests over the given stream until the job completes."""
         create_program_and_job_request = quantum.QuantumRunStreamRequest(
             parent=project_name,
             create_quantum_program_and_job=quantum.CreateQuantumProgramAndJobRequest(
@@ -258,11 +357,12 @@ class StreamManager:
         )
 
         current_request = create_program_and_job_request
+        response_future: asyncio.Future | None = None
         while True:
             try:
                 current_request.message_id = self._generate_message_id()
-                response_future = self._response_demux.subscribe(current_request.message_id)
-                await request_queue.put(current_request)
+                response_future = stream.response_demux.subscribe(current_request.message_id)
+                await stream.request_queue.put(current_request)
                 response = await response_future
 
             # Broken stream
@@ -61,9 +61,15 @@ def setup_client(client_constructor):
     return fake_client
 
 
-def setup(client_constructor):
+def setup(client_constructor, **kwargs):
     fake_client = setup_client(client_constructor)
-    return fake_client, StreamManager(fake_client)
+    return fake_client, StreamManager(fake_client, **kwargs)
+
+
+def setup_multi_stream(client_constructor, **kwargs):
+    fake_client = FakeMultiQuantumRunStream()
+    client_constructor.return_value = fake_client
+    return fake_client, StreamManager(fake_client, **kwargs)
 
 
 class FakeQuantumRunStream:
@@ -175,6 +181,84 @@ class FakeQuantumRunStream:
         self._request_iterator_stopped = duet.AwaitableFuture()
 
 
+class FakeMultiQuantumRunStream:
+    """A fake Quantum Engine client which supports several concurrent QuantumRunStreams.
+
+    Every call to `quantum_run_stream()` opens a new stream, identified by its index in the order
+    the streams were opened. Requests are recorded along with the index of the stream they were
+    sent on, and responses and exceptions are sent to a specific stream.
+    """
+
+    def __init__(self) -> None:
+        self.all_stream_requests: list[tuple[int, quantum.QuantumRunStreamRequest]] = []
+        self._executor = AsyncioExecutor.instance()
+        self._request_buffer = duet.AsyncCollector[tuple[int, quantum.QuantumRunStreamRequest]]()
+        self._response_queues: list[
+            asyncio.Queue[quantum.QuantumRunStreamResponse | BaseException]
+        ] = []
+
+    async def quantum_run_stream(
+        self, requests: AsyncIterator[quantum.QuantumRunStreamRequest], **kwargs
+    ) -> Awaitable[AsyncIterable[quantum.QuantumRunStreamResponse]]:
+        """Fakes the QuantumRunStream RPC.
+
+        This is called from the asyncio thread.
+        """
+        stream_index = len(self._response_queues)
+        responses_and_exceptions: asyncio.Queue[
+            quantum.QuantumRunStreamResponse | BaseException
+        ] = asyncio.Queue()
+        self._response_queues.append(responses_and_exceptions)
+
+        async def read_requests():
+            async for request in requests:
+                self.all_stream_requests.append((stream_index, request))
+                self._request_buffer.add((stream_index, request))
+
+        async def response_iterator():
+            asyncio.create_task(read_requests())
+            while True:
+                message = await responses_and_exceptions.get()
+                if isinstance(message, BaseException):
+                    raise message
+                yield message
+
+        return response_iterator()
+
+    async def cancel_quantum_job(self, request: quantum.CancelQuantumJobRequest) -> None:
+        await asyncio.sleep(0)  # pragma: no cover
+
+    async def wait_for_requests(
+        self, num_requests=1
+    ) -> Sequence[tuple[int, quantum.QuantumRunStreamRequest]]:
+        """Wait til `num_requests` number of requests are received on any stream.
+
+        This must be called from the duet thread.
+
+        Returns:
+            The received requests along with the index of the stream each was sent on.
+        """
+        requests = []
+        for _ in range(num_requests):
+            requests.append(await self._request_buffer.__anext__())
+        return requests
+
+    async def reply(
+        self,
+        stream_index: int,
+        response_or_exception: quantum.QuantumRunStreamResponse | BaseException,
+    ):
+        """Sends a response or raises an exception on the stream with the given index.
+
+        This must be called from the duet thread.
+        """
+
+        async def send():
+            await self._response_queues[stream_index].put(response_or_exception)
+
+        await self._executor.submit(send)
+
+
 class TestResponseDemux:
     @pytest.fixture
     def demux(self) -> ResponseDemux:
@@ -909,3 +993,181 @@ class TestStreamManager:
                 assert actual_result1 == expected_result1
 
         duet.run(test)
+
+    @pytest.mark.parametrize(
+        'kwargs', [{'num_streams': 0}, {'max_in_flight_jobs': 0}, {'max_in_flight_jobs': -1}]
+    )
+    @mock.patch.object(quantum, 'QuantumEngineServiceAsyncClient', autospec=True)
+    def test_init_with_invalid_limits_raises(self, client_constructor, kwargs):
+        with pytest.raises(ValueError, match='must be at least 1'):
+            setup(client_constructor, **kwargs)
+
+    @mock.patch.object(quantum, 'QuantumEngineServiceAsyncClient', autospec=True)
+    def test_init_limits(self, client_constructor):
+        _, manager = setup(client_constructor)
+        assert manager.num_streams == 1
+        assert manager.max_in_flight_jobs is None
+
+        _, manager = setup(client_constructor, num_streams=3, max_in_flight_jobs=5)
+        assert manager.num_streams == 3
+        assert manager.max_in_flight_jobs == 5
+
+    @mock.patch.object(quantum, 'QuantumEngineServiceAsyncClient', autospec=True)
+    def test_submit_beyond_max_in_flight_jobs_waits_for_completion(self, client_constructor):
+        expected_result0 = quantum.QuantumResult(parent='projects/proj/programs/prog/jobs/job0')
+        expected_result1 = quantum.QuantumResult(parent='projects/proj/programs/prog/jobs/job1')
+        fake_client, manager = setup(client_constructor, max_in_flight_jobs=1)
+
+        async def test():
+            async with duet.timeout_scope(5):
+                actual_result0_future = manager.submit(
+                    REQUEST_PROJECT_NAME, REQUEST_PROGRAM, REQUEST_JOB0
+                )
+                actual_result1_future = manager.submit(
+                    REQUEST_PROJECT_NAME, REQUEST_PROGRAM, REQUEST_JOB1
+                )
+                await fake_client.wait_for_requests()
+                await duet.sleep(0.1)  # Give the second job a chance to send a request.
+                assert len(fake_client.all_stream_requests) == 1
+
+                await fake_client.reply(quantum.QuantumRunStreamResponse(result=expected_result0))
+                actual_result0 = await actual_result0_future
+                await fake_client.wait_for_requests()
+                await fake_client.reply(quantum.QuantumRunStreamResponse(result=expected_result1))
+                actual_result1 = await actual_result1_future
+                manager.stop()
+
+                assert actual_result0 == expected_result0
+                assert actual_result1 == expected_result1
+                assert len(fake_client.all_stream_requests) == 2
+                requests = fake_client.all_stream_requests
+                assert requests[0].create_quantum_program_and_job.quantum_job == REQUEST_JOB0
+                assert requests[1].create_quantum_program_and_job.quantum_job == REQUEST_JOB1
+
+        duet.run(test)
+
+    @mock.patch.object(quantum, 'QuantumEngineServiceAsyncClient', autospec=True)
+    def test_cancel_job_waiting_for_in_flight_slot(self, client_constructor):
+        expected_result = quantum.QuantumResult(parent='projects/proj/programs/prog/jobs/job1')
+        fake_client, manager = setup(client_constructor, max_in_flight_jobs=1)
+
+        async def test():
+            async with duet.timeout_scope(5):
+                actual_result0_future = manager.submit(
+                    REQUEST_PROJECT_NAME, REQUEST_PROGRAM, REQUEST_JOB0
+                )
+                await fake_client.wait_for_requests()
+                actual_result0_future.cancel()
+                await duet.sleep(0.1)  # Let cancellation complete asynchronously
+                actual_result1_future = manager.submit(
+                    REQUEST_PROJECT_NAME, REQUEST_PROGRAM, REQUEST_JOB1
+                )
+                await fake_client.wait_for_requests()
+                await fake_client.reply(quantum.QuantumRunStreamResponse(result=expected_result))
+                actual_result1 = await actual_result1_future
+                manager.stop()
+
+                assert actual_result1 == expected_result
+
+        duet.run(test)
+
+    @mock.patch.object(quantum, 'QuantumEngineServiceAsyncClient', autospec=True)
+    def test_stop_cancels_jobs_waiting_for_in_flight_slot(self, client_constructor):
+        fake_client, manager = setup(client_constructor, max_in_flight_jobs=1)
+
+        async def test():
+            async with duet.timeout_scope(5):
+                actual_result0_future = manager.submit(
+                    REQUEST_PROJECT_NAME, REQUEST_PROGRAM, REQUEST_JOB0
+                )
+                actual_result1_future = manager.submit(
+                    REQUEST_PROJECT_NAME, REQUEST_PROGRAM, REQUEST_JOB1
+                )
+                await fake_client.wait_for_requests()
+                manager.stop()
+
+                with pytest.raises(concurrent.futures.CancelledError):
+                    await actual_result0_future
+                with pytest.raises(concurrent.futures.CancelledError):
+                    await actual_result1_future
+                assert len(fake_client.all_stream_requests) == 1
+
+        duet.run(test)
+
+    @mock.patch.object(quantum, 'QuantumEngineServiceAsyncClient', autospec=True)
+    def test_submit_with_multiple_streams_assigns_least_loaded_stream(self, client_constructor):
+        fake_client, manager = setup_multi_stream(client_constructor, num_streams=2)
+        jobs = [
+            quantum.QuantumJob(name=f'projects/proj/programs/prog/jobs/job{i}') for i in range(3)
+        ]
+
+        async def test():
+            async with duet.timeout_scope(5):
+                futures = [
+                    manager.submit(REQUEST_PROJECT_NAME, REQUEST_PROGRAM, job) for job in jobs[:2]
+                ]
+                requests = await fake_client.wait_for_requests(num_requests=2)
+                # The two jobs are spread over both streams.
+                assert {stream_index for stream_index, _ in requests} == {0, 1}
+                stream_of_job = {
+                    request.create_quantum_program_and_job.quantum_job.name: stream_index
+                    for stream_index, request in requests
+                }
+
+                # Completing job0 frees up its stream, which then receives job2.
+                result0 = quantum.QuantumResult(parent=jobs[0].name)
+                job0_request = next(r for i, r in requests if i == stream_of_job[jobs[0].name])
+                await fake_client.reply(
+                    stream_of_job[jobs[0].name],
+                    quantum.QuantumRunStreamResponse(
+                        message_id=job0_request.message_id, result=result0
+                    ),
+                )
+                assert await futures[0] == result0
+                futures.append(manager.submit(REQUEST_PROJECT_NAME, REQUEST_PROGRAM, jobs[2]))
+                (stream_index, _), *_ = await fake_client.wait_for_requests()
+                assert stream_index == stream_of_job[jobs[0].name]
+                manager.stop()
+
+        duet.run(test)
+
+    @mock.patch.object(quantum, 'QuantumEngineServiceAsyncClient', autospec=True)
+    def test_broken_stream_only_retries_jobs_on_that_stream(self, client_constructor):
+        fake_client, manager = setup_multi_stream(client_constructor, num_streams=2)
+
+        async def test():
+            async with duet.timeout_scope(5):
+                future0 = manager.submit(REQUEST_PROJECT_NAME, REQUEST_PROGRAM, REQUEST_JOB0)
+                future1 = manager.submit(REQUEST_PROJECT_NAME, REQUEST_PROGRAM, REQUEST_JOB1)
+                requests = dict(await fake_client.wait_for_requests(num_requests=2))
+
+                await fake_client.reply(0, google_exceptions.ServiceUnavailable('unavailable'))
+                (retry_stream_index, retry_request), *_ = await fake_client.wait_for_requests()
+                # Only the job on the broken stream is retried, on a reopened stream.
+                assert retry_stream_index == 2
+                assert 'get_quantum_result' in retry_request
+                job_on_broken_stream = requests[0].create_quantum_program_and_job.quantum_job
+                assert retry_request.get_quantum_result.parent == job_on_broken_stream.name
+
+                result_on_broken_stream = quantum.QuantumResult(parent=job_on_broken_stream.name)
+                await fake_client.reply(
+                    2,
+                    quantum.QuantumRunStreamResponse(
+                        message_id=retry_request.message_id, result=result_on_broken_stream
+                    ),
+                )
+                job_on_healthy_stream = requests[1].create_quantum_program_and_job.quantum_job
+                result_on_healthy_stream = quantum.QuantumResult(parent=job_on_healthy_stream.name)
+                await fake_client.reply(
+                    1,
+                    quantum.QuantumRunStreamResponse(
+                        message_id=requests[1].message_id, result=result_on_healthy_stream
+                    ),
+                )
+                results = {(await future0).parent, (await future1).parent}
+                manager.stop()
+
+                assert results == {REQUEST_JOB0.name, REQUEST_JOB1.name}
+                assert len(fake_client.all_stream_requests) == 3
+
+        duet.run(test)
@@ -79,11 +79,14 @@ def _class_resolver_dictionary() -> dict[str, ObjectFactory]:
         'cirq.google.QuantumRuntimeConfiguration': cirq_google.QuantumRuntimeConfiguration,
         'cirq.google.NaiveQubitPlacer': cirq_google.NaiveQubitPlacer,
         'cirq.google.RandomDevicePlacer': cirq_google.RandomDevicePlacer,
+        'cirq.google.CalibrationAwareDevicePlacer': cirq_google.CalibrationAwareDevicePlacer,
         'cirq.google.EngineProcessorRecord': cirq_google.EngineProcessorRecord,
         'cirq.google.SimulatedProcessorRecord': cirq_google.SimulatedProcessorRecord,
         'cirq.google.SimulatedProcessorWithLocalDeviceRecord': cirq_google.SimulatedProcessorWithLocalDeviceRecord,  # noqa: E501
         'cirq.google.HardcodedQubitPlacer': cirq_google.HardcodedQubitPlacer,
         'cirq.google.EngineResult': cirq_google.EngineResult,
+        'cirq.google.RuntimeModel': cirq_google.engine.RuntimeModel,
+        'cirq.google.RuntimeSample': cirq_google.engine.RuntimeSample,
         'cirq.google.GridDevice': cirq_google.GridDevice,
         'cirq.google.GoogleCZTargetGateset': cirq_google.GoogleCZTargetGateset,
         'cirq.google.DeviceParameter': cirq_google.study.device_parameter.DeviceParameter,
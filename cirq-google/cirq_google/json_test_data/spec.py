@@ -27,6 +27,7 @@ TestSpec = ModuleJsonTestSpec(
         'ProtoVersion',
         'GreedySequenceSearchStrategy',
         'ProcessorSampler',
+        'ResultCache',
         'ValidatingSampler',
         'CouldNotPlaceError',
         # Abstract:
@@ -47,6 +48,7 @@ TestSpec = ModuleJsonTestSpec(
             'ExecutableGroupResultFilesystemRecord',
             'NaiveQubitPlacer',
             'RandomDevicePlacer',
+            'CalibrationAwareDevicePlacer',
             'HardcodedQubitPlacer',
             'EngineProcessorRecord',
             'SimulatedProcessorRecord',
@@ -40,6 +40,7 @@ from cirq_google.workflow.qubit_placement import (
     CouldNotPlaceError as CouldNotPlaceError,
     NaiveQubitPlacer as NaiveQubitPlacer,
     RandomDevicePlacer as RandomDevicePlacer,
+    CalibrationAwareDevicePlacer as CalibrationAwareDevicePlacer,
     HardcodedQubitPlacer as HardcodedQubitPlacer,
 )
 
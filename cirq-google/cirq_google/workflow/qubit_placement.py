@@ -18,10 +18,12 @@ from __future__ import annotations
 
 import abc
 import dataclasses
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Hashable, Mapping
 from functools import lru_cache
 from typing import Any, TYPE_CHECKING
 
+import numpy as np
+
 import cirq
 from cirq import _compat
 from cirq.devices.named_topologies import get_placements, NamedTopology
@@ -29,8 +31,6 @@ from cirq.protocols import obj_to_dict_helper
 from cirq_google.workflow._device_shim import _Device_dot_get_nx_graph
 
 if TYPE_CHECKING:
-    import numpy as np
-
     import cirq_google as cg
 
 
@@ -309,3 +309,175 @@ class RandomDevicePlacer(QubitPlacer):
     def __eq__(self, other):
         if isinstance(other, RandomDevicePlacer):
             return True
+
+
+@dataclasses.dataclass(frozen=True)
+class _PlacementTable:
+    """All placements of a problem topology onto a device, as arrays of device qubit indices.
+
+    Attributes:
+        nodes: The topology nodes, in the order of the columns of `placements`.
+        qubits: The device qubits indexed by `placements` and `edges`.
+        placements: An integer array of shape (n_placements, n_nodes). Entry [i, j] is the index
+            of the device qubit that `nodes[j]` is placed on by the i-th placement.
+        edges: An integer array of shape (n_placements, n_edges, 2) holding the device qubit
+            indices at the ends of each topology edge, for each placement.
+    """
+
+    nodes: tuple[Any, ...]
+    qubits: tuple[cirq.Qid, ...]
+    placements: np.ndarray
+    edges: np.ndarray
+
+
+@lru_cache()
+def _cached_placement_table(
+    problem_topo: cirq.NamedTopology, device: cirq.Device
+) -> _PlacementTable:
+    """Cache all placements of `problem_topo` onto the specific device as index arrays."""
+    placements = _cached_get_placements(problem_topo, device)
+    nodes = tuple(problem_topo.graph.nodes)
+    qubits = tuple(sorted(_Device_dot_get_nx_graph(device).nodes))
+    qubit_index = {q: i for i, q in enumerate(qubits)}
+    node_index = {node: i for i, node in enumerate(nodes)}
+    placement_array = np.array(
+        [[qubit_index[placement[node]] for node in nodes] for placement in placements],
+        dtype=np.intp,
+    ).reshape(len(placements), len(nodes))
+    edge_columns = np.array(
+        [[node_index[a], node_index[b]] for a, b in problem_topo.graph.edges], dtype=np.intp
+    ).reshape(-1, 2)
+    return _PlacementTable(
+        nodes=nodes,
+        qubits=qubits,
+        placements=placement_array,
+        edges=placement_array[:, edge_columns],
+    )
+
+
+class CalibrationAwareDevicePlacer(QubitPlacer):
+    def __init__(
+        self,
+        qubit_errors: Mapping[cirq.Qid, float] | None = None,
+        pair_errors: Mapping[tuple[cirq.Qid, cirq.Qid], float] | None = None,
+        topo_node_to_qubit_func: Callable[[Any], cirq.Qid] = default_topo_node_to_qubit,
+    ):
+        """A placement strategy that places circuits onto the qubits with the lowest errors.
+
+        Every placement of the problem topology onto the device is scored by the estimated
+        fidelity of its qubits and couplers, i.e. the product of `1 - error` over the qubits
+        and the pairs of qubits connected by a topology edge. The placement with the highest
+        score is chosen, breaking ties randomly.
+
+        All placements of a topology onto a device are found once and cached as arrays, so that
+        the placements of every executable in a `cg.QuantumExecutableGroup` are scored in a
+        single vectorized step.
+
+        Args:
+            qubit_errors: The error of each device qubit, for instance its readout error.
+                Qubits without an error are assumed to be perfect.
+            pair_errors: The error of each pair of device qubits, for instance the Pauli
+                error of the two-qubit gate. Either ordering of the pair may be given. Pairs
+                without an error are assumed to be perfect.
+            topo_node_to_qubit_func: A function that maps from `cirq.NamedTopology` nodes
+                to `cirq.Qid`. There is a correspondence between nodes and the "abstract" Qids
+                used to construct the un-placed circuit. By default: nodes which are tuples
+                correspond to `cirq.GridQubit`s; otherwise `cirq.LineQubit`.
+
+        Note:
+            The attribute `topo_node_to_qubit_func` is not preserved in JSON serialization. This
+            bit of plumbing does not affect the placement behavior.
+        """
+        self._qubit_errors = dict(qubit_errors or {})
+        self._pair_errors = dict(pair_errors or {})
+        self.topo_node_to_qubit_func = topo_node_to_qubit_func
+
+    def _cost_tables(self, qubits: tuple[cirq.Qid, ...]) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the negative log fidelity of each qubit and of each pair of qubits."""
+        qubit_index = {q: i for i, q in enumerate(qubits)}
+        qubit_cost = np.zeros(len(qubits))
+        for q, error in self._qubit_errors.items():
+            if q in qubit_index:
+                qubit_cost[qubit_index[q]] = -np.log1p(-error)
+        pair_cost = np.zeros((len(qubits), len(qubits)))
+        for (a, b), error in self._pair_errors.items():
+            if a in qubit_index and b in qubit_index:
+                i, j = qubit_index[a], qubit_index[b]
+                pair_cost[i, j] = pair_cost[j, i] = -np.log1p(-error)
+        return qubit_cost, pair_cost
+
+    def place_circuit(
+        self,
+        circuit: cirq.AbstractCircuit,
+        problem_topology: cirq.NamedTopology,
+        shared_rt_info: cg.SharedRuntimeInfo,
+        rs: np.random.RandomState,
+    ) -> tuple[cirq.FrozenCircuit, dict[Any, cirq.Qid]]:
+        """Place a circuit with a given topology onto the qubits of a device with lowest errors.
+
+        This requires device information to be present in `shared_rt_info`.
+
+        Args:
+            circuit: The circuit.
+            problem_topology: The topologies (i.e. connectivity) of the circuit.
+            shared_rt_info: A `cg.SharedRuntimeInfo` object that contains a `device` attribute
+                of type `cirq.Device` to enable placement.
+            rs: A `RandomState` as a source of randomness for breaking ties.
+
+        Returns:
+            A tuple of a new frozen circuit with the qubits placed and a mapping from input
+            qubits or nodes to output qubits.
+
+        Raises:
+            ValueError: If `shared_rt_info` does not have a device field.
+            CouldNotPlaceError: If the problem topology cannot be placed on the device.
+        """
+        device = shared_rt_info.device
+        if device is None:
+            raise ValueError(
+                "CalibrationAwareDevicePlacer requires shared_rt_info.device to be a "
+                "`cirq.Device`. This should have been set during the initialization phase of "
+                "`cg.execute`."
+            )
+        table = _cached_placement_table(problem_topology, device)
+        if len(table.placements) == 0:
+            raise CouldNotPlaceError
+        qubit_cost, pair_cost = self._cost_tables(table.qubits)
+        costs = qubit_cost[table.placements].sum(axis=1)
+        costs += pair_cost[table.edges[..., 0], table.edges[..., 1]].sum(axis=1)
+        best = np.flatnonzero(np.isclose(costs, costs.min()))
+        chosen = table.placements[best[rs.randint(len(best))]]
+        placement = {
+            self.topo_node_to_qubit_func(node): table.qubits[i]
+            for node, i in zip(table.nodes, chosen)
+        }
+        return circuit.unfreeze().transform_qubits(placement).freeze(), placement
+
+    def __repr__(self) -> str:
+        return (
+            f'cirq_google.CalibrationAwareDevicePlacer('
+            f'qubit_errors={_compat.proper_repr(self._qubit_errors)}, '
+            f'pair_errors={_compat.proper_repr(self._pair_errors)})'
+        )
+
+    @classmethod
+    def _json_namespace_(cls) -> str:
+        return 'cirq.google'
+
+    def _json_dict_(self) -> dict[str, Any]:
+        d = obj_to_dict_helper(self, attribute_names=[])
+        d['qubit_errors'] = list(self._qubit_errors.items())
+        d['pair_errors'] = [[a, b, error] for (a, b), error in self._pair_errors.items()]
+        return d
+
+    @classmethod
+    def _from_json_dict_(cls, qubit_errors, pair_errors, **kwargs) -> CalibrationAwareDevicePlacer:
+        return cls(
+            qubit_errors={q: error for q, error in qubit_errors},
+            pair_errors={(a, b): error for a, b, error in pair_errors},
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, CalibrationAwareDevicePlacer):
+            return NotImplemented
+        return self._qubit_errors == other._qubit_errors and self._pair_errors == other._pair_errors
@@ -217,3 +217,96 @@ def test_hqp_equality():
         {cirq.LineTopology(5): dict(enumerate(cirq.LineQubit.range(1, 5 + 1)))}
     )
     assert hqp != hqp3
+
+
+def test_calibration_aware_device_placer_line():
+    topo = cirq.LineTopology(3)
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.CZ(qubits[0], qubits[1]), cirq.CZ(qubits[1], qubits[2]))
+    good_qubits = [cirq.GridQubit(7, 4), cirq.GridQubit(7, 5), cirq.GridQubit(7, 6)]
+    qubit_errors = {q: 0.1 for q in cg.Sycamore23.metadata.qubit_set}
+    for q in good_qubits:
+        qubit_errors[q] = 0.001
+
+    qp = cg.CalibrationAwareDevicePlacer(qubit_errors=qubit_errors)
+    circuit2, mapping = qp.place_circuit(
+        circuit,
+        problem_topology=topo,
+        shared_rt_info=cg.SharedRuntimeInfo(run_id='1', device=cg.Sycamore23),
+        rs=np.random.RandomState(1),
+    )
+    assert set(mapping.values()) == set(good_qubits)
+    assert circuit2.all_qubits() == set(good_qubits)
+    assert all(mapping[a].is_adjacent(mapping[b]) for a, b in zip(qubits, qubits[1:]))
+
+
+def test_calibration_aware_device_placer_pair_errors():
+    topo = cirq.LineTopology(2)
+    qubits = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.CZ(*qubits))
+    best_pair = (cirq.GridQubit(6, 5), cirq.GridQubit(7, 5))
+    device_graph = cg.Sycamore23.metadata.nx_graph
+    pair_errors = {edge: 0.05 for edge in device_graph.edges}
+    pair_errors[best_pair[::-1]] = 0.001
+
+    qp = cg.CalibrationAwareDevicePlacer(pair_errors=pair_errors)
+    _, mapping = qp.place_circuit(
+        circuit,
+        problem_topology=topo,
+        shared_rt_info=cg.SharedRuntimeInfo(run_id='1', device=cg.Sycamore23),
+        rs=np.random.RandomState(1),
+    )
+    assert set(mapping.values()) == set(best_pair)
+
+
+def test_calibration_aware_device_placer_breaks_ties_randomly():
+    topo = cirq.TiltedSquareLattice(2, 2)
+    qubits = sorted(topo.nodes_to_gridqubits().values())
+    circuit = cirq.Circuit(cirq.H.on_each(qubits))
+    qp = cg.CalibrationAwareDevicePlacer()
+    shared_rt_info = cg.SharedRuntimeInfo(run_id='1', device=cg.Sycamore23)
+    rs = np.random.RandomState(1)
+    placements = {
+        frozenset(qp.place_circuit(circuit, topo, shared_rt_info, rs)[1].values())
+        for _ in range(20)
+    }
+    assert len(placements) > 1
+    for placement in placements:
+        assert placement <= cg.Sycamore23.metadata.qubit_set
+
+
+def test_calibration_aware_device_placer_bad_device():
+    topo = cirq.LineTopology(8)
+    circuit = cirq.testing.random_circuit(cirq.LineQubit.range(8), n_moments=8, op_density=1.0)
+    qp = cg.CalibrationAwareDevicePlacer()
+    with pytest.raises(ValueError, match=r'.*shared_rt_info\.device.*'):
+        qp.place_circuit(
+            circuit,
+            problem_topology=topo,
+            shared_rt_info=cg.SharedRuntimeInfo(run_id='1'),
+            rs=np.random.RandomState(1),
+        )
+    with pytest.raises(cg.CouldNotPlaceError):
+        qp.place_circuit(
+            circuit,
+            problem_topology=cirq.TiltedSquareLattice(3, 3),
+            shared_rt_info=cg.SharedRuntimeInfo(run_id='1', device=FakeDevice()),
+            rs=np.random.RandomState(1),
+        )
+
+
+def test_calibration_aware_device_placer_repr_and_equality():
+    qp = cg.CalibrationAwareDevicePlacer(
+        qubit_errors={cirq.GridQubit(5, 4): 0.01},
+        pair_errors={(cirq.GridQubit(5, 4), cirq.GridQubit(5, 5)): 0.005},
+    )
+    cirq.testing.assert_equivalent_repr(qp, global_vals={'cirq_google': cg})
+    eq = cirq.testing.EqualsTester()
+    eq.add_equality_group(
+        qp,
+        cg.CalibrationAwareDevicePlacer(
+            qubit_errors={cirq.GridQubit(5, 4): 0.01},
+            pair_errors={(cirq.GridQubit(5, 4), cirq.GridQubit(5, 5)): 0.005},
+        ),
+    )
+    eq.add_equality_group(cg.CalibrationAwareDevicePlacer())